@@ -0,0 +1 @@
+Search.setIndex({"alltitles": {"Aio plexapi.aio": [[4, null]], "Alert plexapi.alert": [[5, null]], "Audio plexapi.audio": [[6, null]], "Base plexapi.base": [[7, null]], "Cache plexapi.cache": [[8, null]], "Client plexapi.client": [[9, null]], "Collection plexapi.collection": [[10, null]], "Common Questions": [[3, "common-questions"]], "Config plexapi.config": [[11, null]], "Configuration": [[0, null]], "Controlling Sonos speakers": [[3, "controlling-sonos-speakers"]], "Environment Variables": [[0, "environment-variables"]], "Exceptions plexapi.exceptions": [[12, null]], "Gdm plexapi.gdm": [[13, null]], "Getting a PlexServer Instance": [[3, "getting-a-plexserver-instance"]], "Installation & Documentation": [[3, "installation-documentation"]], "Library plexapi.library": [[14, null]], "Media plexapi.media": [[15, null]], "Metrics plexapi.metrics": [[16, null]], "Mixins plexapi.mixins": [[17, null]], "Modules": [[2, null]], "MyPlex plexapi.myplex": [[18, null]], "Overview": [[2, null], [3, "overview"]], "Photo plexapi.photo": [[19, null]], "Playlist plexapi.playlist": [[20, null]], "Playqueue plexapi.playqueue": [[21, null]], "Python-PlexAPI": [[3, null]], "Running tests over PlexAPI": [[3, "running-tests-over-plexapi"]], "Section [auth] Options": [[0, "section-auth-options"]], "Section [header] Options": [[0, "section-header-options"]], "Section [log] Options": [[0, "section-log-options"]], "Section [plexapi] Options": [[0, "section-plexapi-options"]], "Server plexapi.server": [[22, null]], "Settings plexapi.settings": [[23, null]], "Sonos plexapi.sonos": [[24, null]], "Sync plexapi.sync": [[25, null]], "Table of Contents": [[2, null]], "Transport plexapi.transport": [[26, null]], "Usage & Contributions": [[2, "usage-contributions"]], "Usage Examples": [[3, "usage-examples"]], "Utils plexapi.utils": [[27, null]], "Video plexapi.video": [[28, null]]}, "docnames": ["configuration", "global", "index", "introduction", "modules/aio", "modules/alert", "modules/audio", "modules/base", "modules/cache", "modules/client", "modules/collection", "modules/config", "modules/exceptions", "modules/gdm", "modules/library", "modules/media", "modules/metrics", "modules/mixins", "modules/myplex", "modules/photo", "modules/playlist", "modules/playqueue", "modules/server", "modules/settings", "modules/sonos", "modules/sync", "modules/transport", "modules/utils", "modules/video", "settingslist"], "envversion": {"sphinx": 64, "sphinx.domains.c": 3, "sphinx.domains.changeset": 1, "sphinx.domains.citation": 1, "sphinx.domains.cpp": 9, "sphinx.domains.index": 1, "sphinx.domains.javascript": 3, "sphinx.domains.math": 2, "sphinx.domains.python": 4, "sphinx.domains.rst": 2, "sphinx.domains.std": 2, "sphinx.ext.viewcode": 1}, "filenames": ["configuration.rst", "global.rst", "index.rst", "introduction.rst", "modules/aio.rst", "modules/alert.rst", "modules/audio.rst", "modules/base.rst", "modules/cache.rst", "modules/client.rst", "modules/collection.rst", "modules/config.rst", "modules/exceptions.rst", "modules/gdm.rst", "modules/library.rst", "modules/media.rst", "modules/metrics.rst", "modules/mixins.rst", "modules/myplex.rst", "modules/photo.rst", "modules/playlist.rst", "modules/playqueue.rst", "modules/server.rst", "modules/settings.rst", "modules/sonos.rst", "modules/sync.rst", "modules/transport.rst", "modules/utils.rst", "modules/video.rst", "settingslist.rst"], "indexentries": {"acceptinvite() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.acceptInvite", false]], "account (class in plexapi.server)": [[22, "plexapi.server.Account", false]], "account() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.account", false]], "account() (plexapi.server.statisticsbandwidth method)": [[22, "plexapi.server.StatisticsBandwidth.account", false]], "accountoptout (class in plexapi.myplex)": [[18, "plexapi.myplex.AccountOptOut", false]], "activities (plexapi.server.plexserver property)": [[22, "plexapi.server.PlexServer.activities", false]], "activity (class in plexapi.server)": [[22, "plexapi.server.Activity", false]], "actors (plexapi.video.episode property)": [[28, "plexapi.video.Episode.actors", false]], "actors (plexapi.video.movie property)": [[28, "plexapi.video.Movie.actors", false]], "actors (plexapi.video.show property)": [[28, "plexapi.video.Show.actors", false]], "adapter() (plexapi.transport.transportconfig method)": [[26, "plexapi.transport.TransportConfig.adapter", false]], "add() (plexapi.library.library method)": [[14, "plexapi.library.Library.add", false]], "addcollection() (plexapi.mixins.collectionmixin method)": [[17, "plexapi.mixins.CollectionMixin.addCollection", false]], "addcountry() (plexapi.mixins.countrymixin method)": [[17, "plexapi.mixins.CountryMixin.addCountry", false]], "adddirector() (plexapi.mixins.directormixin method)": [[17, "plexapi.mixins.DirectorMixin.addDirector", false]], "addedatmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.AddedAtMixin", false]], "addgenre() (plexapi.mixins.genremixin method)": [[17, "plexapi.mixins.GenreMixin.addGenre", false]], "additem() (plexapi.playqueue.playqueue method)": [[21, "plexapi.playqueue.PlayQueue.addItem", false]], "additems() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.addItems", false]], "additems() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.addItems", false]], "addlabel() (plexapi.mixins.labelmixin method)": [[17, "plexapi.mixins.LabelMixin.addLabel", false]], "addlistener() (in module plexapi.metrics)": [[16, "plexapi.metrics.addListener", false]], "addlocations() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.addLocations", false]], "addmood() (plexapi.mixins.moodmixin method)": [[17, "plexapi.mixins.MoodMixin.addMood", false]], "addproducer() (plexapi.mixins.producermixin method)": [[17, "plexapi.mixins.ProducerMixin.addProducer", false]], "addsimilarartist() (plexapi.mixins.similarartistmixin method)": [[17, "plexapi.mixins.SimilarArtistMixin.addSimilarArtist", false]], "addstyle() (plexapi.mixins.stylemixin method)": [[17, "plexapi.mixins.StyleMixin.addStyle", false]], "addtag() (plexapi.mixins.tagmixin method)": [[17, "plexapi.mixins.TagMixin.addTag", false]], "addtowatchlist() (plexapi.mixins.watchlistmixin method)": [[17, "plexapi.mixins.WatchlistMixin.addToWatchlist", false]], "addtowatchlist() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.addToWatchlist", false]], "addwriter() (plexapi.mixins.writermixin method)": [[17, "plexapi.mixins.WriterMixin.addWriter", false]], "advancedsettingsmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.AdvancedSettingsMixin", false]], "agent (class in plexapi.media)": [[15, "plexapi.media.Agent", false]], "agentmediatype (class in plexapi.media)": [[15, "plexapi.media.AgentMediaType", false]], "agents() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.agents", false]], "agents() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.agents", false]], "agerating (class in plexapi.media)": [[15, "plexapi.media.AgeRating", false]], "album (class in plexapi.audio)": [[6, "plexapi.audio.Album", false]], "album() (plexapi.audio.artist method)": [[6, "plexapi.audio.Artist.album", false]], "album() (plexapi.audio.track method)": [[6, "plexapi.audio.Track.album", false]], "album() (plexapi.photo.photoalbum method)": [[19, "plexapi.photo.Photoalbum.album", false]], "albumeditmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.AlbumEditMixins", false]], "albummixins (class in plexapi.mixins)": [[17, "plexapi.mixins.AlbumMixins", false]], "albums() (plexapi.audio.artist method)": [[6, "plexapi.audio.Artist.albums", false]], "albums() (plexapi.library.musicsection method)": [[14, "plexapi.library.MusicSection.albums", false]], "albums() (plexapi.photo.photoalbum method)": [[19, "plexapi.photo.Photoalbum.albums", false]], "alertlistener (class in plexapi.alert)": [[5, "plexapi.alert.AlertListener", false]], "all() (plexapi.aio.asynclibrarysection method)": [[4, "plexapi.aio.AsyncLibrarySection.all", false]], "all() (plexapi.gdm.gdm method)": [[13, "plexapi.gdm.GDM.all", false]], "all() (plexapi.library.library method)": [[14, "plexapi.library.Library.all", false]], "all() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.all", false]], "all() (plexapi.library.photosection method)": [[14, "plexapi.library.PhotoSection.all", false]], "all() (plexapi.settings.settings method)": [[23, "plexapi.settings.Settings.all", false]], "allsubfolders() (plexapi.library.folder method)": [[14, "plexapi.library.Folder.allSubfolders", false]], "analyze() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.analyze", false]], "analyze() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.analyze", false]], "aperture (class in plexapi.library)": [[14, "plexapi.library.Aperture", false]], "art (class in plexapi.library)": [[14, "plexapi.library.Art", false]], "art (class in plexapi.media)": [[15, "plexapi.media.Art", false]], "artist (class in plexapi.audio)": [[6, "plexapi.audio.Artist", false]], "artist() (plexapi.audio.album method)": [[6, "plexapi.audio.Album.artist", false]], "artist() (plexapi.audio.track method)": [[6, "plexapi.audio.Track.artist", false]], "artisteditmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.ArtistEditMixins", false]], "artistmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.ArtistMixins", false]], "artlockmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.ArtLockMixin", false]], "artmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.ArtMixin", false]], "arts() (plexapi.mixins.artmixin method)": [[17, "plexapi.mixins.ArtMixin.arts", false]], "arturl (plexapi.mixins.arturlmixin property)": [[17, "plexapi.mixins.ArtUrlMixin.artUrl", false]], "arturlmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.ArtUrlMixin", false]], "asynclibrary (class in plexapi.aio)": [[4, "plexapi.aio.AsyncLibrary", false]], "asynclibrarysection (class in plexapi.aio)": [[4, "plexapi.aio.AsyncLibrarySection", false]], "asyncplexserver (class in plexapi.aio)": [[4, "plexapi.aio.AsyncPlexServer", false]], "audienceratingmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.AudienceRatingMixin", false]], "audio (class in plexapi.audio)": [[6, "plexapi.audio.Audio", false]], "audiostream (class in plexapi.media)": [[15, "plexapi.media.AudioStream", false]], "audiostreams() (plexapi.base.playable method)": [[7, "plexapi.base.Playable.audioStreams", false]], "audiostreams() (plexapi.media.mediapart method)": [[15, "plexapi.media.MediaPart.audioStreams", false]], "augmentation() (plexapi.video.video method)": [[28, "plexapi.video.Video.augmentation", false]], "authenticationtoken (plexapi.myplex.myplexaccount property)": [[18, "plexapi.myplex.MyPlexAccount.authenticationToken", false]], "autotag (class in plexapi.library)": [[14, "plexapi.library.Autotag", false]], "availability (class in plexapi.media)": [[15, "plexapi.media.Availability", false]], "badrequest": [[12, "plexapi.exceptions.BadRequest", false]], "bandwidth() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.bandwidth", false]], "baseresource (class in plexapi.media)": [[15, "plexapi.media.BaseResource", false]], "batchedits() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.batchEdits", false]], "batchmultiedits() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.batchMultiEdits", false]], "browse() (plexapi.library.path method)": [[14, "plexapi.library.Path.browse", false]], "browse() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.browse", false]], "butlertask (class in plexapi.server)": [[22, "plexapi.server.ButlerTask", false]], "butlertasks() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.butlerTasks", false]], "cached_data_property (class in plexapi.base)": [[7, "plexapi.base.cached_data_property", false]], "cacheentry (class in plexapi.cache)": [[8, "plexapi.cache.CacheEntry", false]], "cachekey() (plexapi.cache.responsecache method)": [[8, "plexapi.cache.ResponseCache.cacheKey", false]], "cancelinvite() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.cancelInvite", false]], "cancelupdate() (plexapi.library.library method)": [[14, "plexapi.library.Library.cancelUpdate", false]], "cancelupdate() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.cancelUpdate", false]], "caninstallupdate() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.canInstallUpdate", false]], "cast() (in module plexapi.utils)": [[27, "plexapi.utils.cast", false]], "chapter (class in plexapi.library)": [[14, "plexapi.library.Chapter", false]], "chapter (class in plexapi.media)": [[15, "plexapi.media.Chapter", false]], "checkforupdate() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.checkForUpdate", false]], "checklogin() (plexapi.myplex.myplexjwtlogin method)": [[18, "plexapi.myplex.MyPlexJWTLogin.checkLogin", false]], "checklogin() (plexapi.myplex.myplexpinlogin method)": [[18, "plexapi.myplex.MyPlexPinLogin.checkLogin", false]], "choose() (in module plexapi.utils)": [[27, "plexapi.utils.choose", false]], "claim() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.claim", false]], "claimtoken() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.claimToken", false]], "cleanbundles() (plexapi.library.library method)": [[14, "plexapi.library.Library.cleanBundles", false]], "clear() (plexapi.cache.diskcache method)": [[8, "plexapi.cache.DiskCache.clear", false]], "clear() (plexapi.cache.memorycache method)": [[8, "plexapi.cache.MemoryCache.clear", false]], "clear() (plexapi.cache.responsecache method)": [[8, "plexapi.cache.ResponseCache.clear", false]], "clear() (plexapi.playqueue.playqueue method)": [[21, "plexapi.playqueue.PlayQueue.clear", false]], "client() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.client", false]], "clients() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.clients", false]], "clienttimeline (class in plexapi.client)": [[9, "plexapi.client.ClientTimeline", false]], "clip (class in plexapi.video)": [[28, "plexapi.video.Clip", false]], "clip() (plexapi.photo.photoalbum method)": [[19, "plexapi.photo.Photoalbum.clip", false]], "cliphistory (class in plexapi.video)": [[28, "plexapi.video.ClipHistory", false]], "clipmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.ClipMixins", false]], "clips() (plexapi.photo.photoalbum method)": [[19, "plexapi.photo.Photoalbum.clips", false]], "clipsession (class in plexapi.video)": [[28, "plexapi.video.ClipSession", false]], "close() (plexapi.aio.asyncplexserver method)": [[4, "plexapi.aio.AsyncPlexServer.close", false]], "close() (plexapi.transport.replayadapter method)": [[26, "plexapi.transport.ReplayAdapter.close", false]], "collection (class in plexapi.collection)": [[10, "plexapi.collection.Collection", false]], "collection (class in plexapi.library)": [[14, "plexapi.library.Collection", false]], "collection (class in plexapi.media)": [[15, "plexapi.media.Collection", false]], "collection() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.collection", false]], "collection() (plexapi.media.collection method)": [[15, "plexapi.media.Collection.collection", false]], "collectioneditmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.CollectionEditMixins", false]], "collectionmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.CollectionMixin", false]], "collectionmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.CollectionMixins", false]], "collections() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.collections", false]], "collections() (plexapi.library.photosection method)": [[14, "plexapi.library.PhotoSection.collections", false]], "common (class in plexapi.library)": [[14, "plexapi.library.Common", false]], "common() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.common", false]], "commonsensemedia (class in plexapi.media)": [[15, "plexapi.media.CommonSenseMedia", false]], "commontype (plexapi.library.common property)": [[14, "plexapi.library.Common.commonType", false]], "concert (class in plexapi.library)": [[14, "plexapi.library.Concert", false]], "connect() (plexapi.aio.asyncplexserver method)": [[4, "plexapi.aio.AsyncPlexServer.connect", false]], "connect() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.connect", false]], "connect() (plexapi.myplex.myplexdevice method)": [[18, "plexapi.myplex.MyPlexDevice.connect", false]], "connect() (plexapi.myplex.myplexresource method)": [[18, "plexapi.myplex.MyPlexResource.connect", false]], "contentratingmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.ContentRatingMixin", false]], "contextmenu() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.contextMenu", false]], "continuewatching() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.continueWatching", false]], "continuewatching() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.continueWatching", false]], "conversion (class in plexapi.media)": [[15, "plexapi.media.Conversion", false]], "conversions() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.conversions", false]], "copytouser() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.copyToUser", false]], "country (class in plexapi.library)": [[14, "plexapi.library.Country", false]], "country (class in plexapi.media)": [[15, "plexapi.media.Country", false]], "countrymixin (class in plexapi.mixins)": [[17, "plexapi.mixins.CountryMixin", false]], "create() (plexapi.collection.collection class method)": [[10, "plexapi.collection.Collection.create", false]], "create() (plexapi.playlist.playlist class method)": [[20, "plexapi.playlist.Playlist.create", false]], "create() (plexapi.playqueue.playqueue class method)": [[21, "plexapi.playqueue.PlayQueue.create", false]], "create() (plexapi.sync.policy static method)": [[25, "plexapi.sync.Policy.create", false]], "createcollection() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.createCollection", false]], "createcollection() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.createCollection", false]], "createexistinguser() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.createExistingUser", false]], "createhomeuser() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.createHomeUser", false]], "createmusic() (plexapi.sync.mediasettings static method)": [[25, "plexapi.sync.MediaSettings.createMusic", false]], "createmyplexdevice() (in module plexapi.utils)": [[27, "plexapi.utils.createMyPlexDevice", false]], "createphoto() (plexapi.sync.mediasettings static method)": [[25, "plexapi.sync.MediaSettings.createPhoto", false]], "createplaylist() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.createPlaylist", false]], "createplaylist() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.createPlaylist", false]], "createplayqueue() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.createPlayQueue", false]], "createplayqueue() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.createPlayQueue", false]], "createtoken() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.createToken", false]], "createvideo() (plexapi.sync.mediasettings static method)": [[25, "plexapi.sync.MediaSettings.createVideo", false]], "criticratingmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.CriticRatingMixin", false]], "currentbackgroundprocess() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.currentBackgroundProcess", false]], "data() (plexapi.cache.responsecache method)": [[8, "plexapi.cache.ResponseCache.data", false]], "data_field (class in plexapi.base)": [[7, "plexapi.base.data_field", false]], "decode() (plexapi.base.data_field method)": [[7, "plexapi.base.data_field.decode", false]], "decodedjwt (plexapi.myplex.myplexjwtlogin property)": [[18, "plexapi.myplex.MyPlexJWTLogin.decodedJWT", false]], "decodeplexjwt() (plexapi.myplex.myplexjwtlogin method)": [[18, "plexapi.myplex.MyPlexJWTLogin.decodePlexJWT", false]], "defaultadvanced() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.defaultAdvanced", false]], "defaultadvanced() (plexapi.mixins.advancedsettingsmixin method)": [[17, "plexapi.mixins.AdvancedSettingsMixin.defaultAdvanced", false]], "delete() (plexapi.base.plexhistory method)": [[7, "plexapi.base.PlexHistory.delete", false]], "delete() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.delete", false]], "delete() (plexapi.cache.diskcache method)": [[8, "plexapi.cache.DiskCache.delete", false]], "delete() (plexapi.cache.memorycache method)": [[8, "plexapi.cache.MemoryCache.delete", false]], "delete() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.delete", false]], "delete() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.delete", false]], "delete() (plexapi.myplex.myplexdevice method)": [[18, "plexapi.myplex.MyPlexDevice.delete", false]], "delete() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.delete", false]], "delete() (plexapi.sync.syncitem method)": [[25, "plexapi.sync.SyncItem.delete", false]], "deleteart() (plexapi.mixins.artmixin method)": [[17, "plexapi.mixins.ArtMixin.deleteArt", false]], "deletelogo() (plexapi.mixins.logomixin method)": [[17, "plexapi.mixins.LogoMixin.deleteLogo", false]], "deletemediapreviews() (plexapi.library.library method)": [[14, "plexapi.library.Library.deleteMediaPreviews", false]], "deletemediapreviews() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.deleteMediaPreviews", false]], "deleteposter() (plexapi.mixins.postermixin method)": [[17, "plexapi.mixins.PosterMixin.deletePoster", false]], "deletesquareart() (plexapi.mixins.squareartmixin method)": [[17, "plexapi.mixins.SquareArtMixin.deleteSquareArt", false]], "deletetheme() (plexapi.mixins.thememixin method)": [[17, "plexapi.mixins.ThemeMixin.deleteTheme", false]], "demotehome() (plexapi.library.managedhub method)": [[14, "plexapi.library.ManagedHub.demoteHome", false]], "demoterecommended() (plexapi.library.managedhub method)": [[14, "plexapi.library.ManagedHub.demoteRecommended", false]], "demoteshared() (plexapi.library.managedhub method)": [[14, "plexapi.library.ManagedHub.demoteShared", false]], "device (class in plexapi.library)": [[14, "plexapi.library.Device", false]], "device() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.device", false]], "device() (plexapi.server.statisticsbandwidth method)": [[22, "plexapi.server.StatisticsBandwidth.device", false]], "devices() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.devices", false]], "director (class in plexapi.library)": [[14, "plexapi.library.Director", false]], "director (class in plexapi.media)": [[15, "plexapi.media.Director", false]], "directormixin (class in plexapi.mixins)": [[17, "plexapi.mixins.DirectorMixin", false]], "disableviewstatesync() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.disableViewStateSync", false]], "diskcache (class in plexapi.cache)": [[8, "plexapi.cache.DiskCache", false]], "do() (plexapi.transport.singleflight method)": [[26, "plexapi.transport.SingleFlight.do", false]], "download() (in module plexapi.utils)": [[27, "plexapi.utils.download", false]], "download() (plexapi.audio.album method)": [[6, "plexapi.audio.Album.download", false]], "download() (plexapi.audio.artist method)": [[6, "plexapi.audio.Artist.download", false]], "download() (plexapi.base.playable method)": [[7, "plexapi.base.Playable.download", false]], "download() (plexapi.photo.photoalbum method)": [[19, "plexapi.photo.Photoalbum.download", false]], "download() (plexapi.video.season method)": [[28, "plexapi.video.Season.download", false]], "download() (plexapi.video.show method)": [[28, "plexapi.video.Show.download", false]], "downloaddatabases() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.downloadDatabases", false]], "downloadlogs() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.downloadLogs", false]], "downloadsessionimages() (in module plexapi.utils)": [[27, "plexapi.utils.downloadSessionImages", false]], "downloadsubtitles() (plexapi.video.video method)": [[28, "plexapi.video.Video.downloadSubtitles", false]], "edit() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.edit", false]], "edit() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.edit", false]], "editaddedat() (plexapi.mixins.addedatmixin method)": [[17, "plexapi.mixins.AddedAtMixin.editAddedAt", false]], "editadvanced() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.editAdvanced", false]], "editadvanced() (plexapi.mixins.advancedsettingsmixin method)": [[17, "plexapi.mixins.AdvancedSettingsMixin.editAdvanced", false]], "editaudiencerating() (plexapi.mixins.audienceratingmixin method)": [[17, "plexapi.mixins.AudienceRatingMixin.editAudienceRating", false]], "editcapturedtime() (plexapi.mixins.photocapturedtimemixin method)": [[17, "plexapi.mixins.PhotoCapturedTimeMixin.editCapturedTime", false]], "editcontentrating() (plexapi.mixins.contentratingmixin method)": [[17, "plexapi.mixins.ContentRatingMixin.editContentRating", false]], "editcriticrating() (plexapi.mixins.criticratingmixin method)": [[17, "plexapi.mixins.CriticRatingMixin.editCriticRating", false]], "editdiscnumber() (plexapi.mixins.trackdiscnumbermixin method)": [[17, "plexapi.mixins.TrackDiscNumberMixin.editDiscNumber", false]], "editeditiontitle() (plexapi.mixins.editiontitlemixin method)": [[17, "plexapi.mixins.EditionTitleMixin.editEditionTitle", false]], "editfield() (plexapi.mixins.editfieldmixin method)": [[17, "plexapi.mixins.EditFieldMixin.editField", false]], "editfieldmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.EditFieldMixin", false]], "editiontitlemixin (class in plexapi.mixins)": [[17, "plexapi.mixins.EditionTitleMixin", false]], "editoriginallyavailable() (plexapi.mixins.originallyavailablemixin method)": [[17, "plexapi.mixins.OriginallyAvailableMixin.editOriginallyAvailable", false]], "editoriginaltitle() (plexapi.mixins.originaltitlemixin method)": [[17, "plexapi.mixins.OriginalTitleMixin.editOriginalTitle", false]], "editsorttitle() (plexapi.mixins.sorttitlemixin method)": [[17, "plexapi.mixins.SortTitleMixin.editSortTitle", false]], "editstudio() (plexapi.mixins.studiomixin method)": [[17, "plexapi.mixins.StudioMixin.editStudio", false]], "editsummary() (plexapi.mixins.summarymixin method)": [[17, "plexapi.mixins.SummaryMixin.editSummary", false]], "edittagline() (plexapi.mixins.taglinemixin method)": [[17, "plexapi.mixins.TaglineMixin.editTagline", false]], "edittags() (plexapi.mixins.edittagsmixin method)": [[17, "plexapi.mixins.EditTagsMixin.editTags", false]], "edittagsmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.EditTagsMixin", false]], "edittitle() (plexapi.mixins.titlemixin method)": [[17, "plexapi.mixins.TitleMixin.editTitle", false]], "edittrackartist() (plexapi.mixins.trackartistmixin method)": [[17, "plexapi.mixins.TrackArtistMixin.editTrackArtist", false]], "edittracknumber() (plexapi.mixins.tracknumbermixin method)": [[17, "plexapi.mixins.TrackNumberMixin.editTrackNumber", false]], "edituserrating() (plexapi.mixins.userratingmixin method)": [[17, "plexapi.mixins.UserRatingMixin.editUserRating", false]], "emit() (in module plexapi.metrics)": [[16, "plexapi.metrics.emit", false]], "emptytrash() (plexapi.library.library method)": [[14, "plexapi.library.Library.emptyTrash", false]], "emptytrash() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.emptyTrash", false]], "enabled() (in module plexapi.metrics)": [[16, "plexapi.metrics.enabled", false]], "enableviewstatesync() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.enableViewStateSync", false]], "endpointtemplate() (in module plexapi.metrics)": [[16, "plexapi.metrics.endpointTemplate", false]], "episode (class in plexapi.video)": [[28, "plexapi.video.Episode", false]], "episode() (plexapi.video.season method)": [[28, "plexapi.video.Season.episode", false]], "episode() (plexapi.video.show method)": [[28, "plexapi.video.Show.episode", false]], "episodeeditmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.EpisodeEditMixins", false]], "episodehistory (class in plexapi.video)": [[28, "plexapi.video.EpisodeHistory", false]], "episodemixins (class in plexapi.mixins)": [[17, "plexapi.mixins.EpisodeMixins", false]], "episodenumber (plexapi.video.episode property)": [[28, "plexapi.video.Episode.episodeNumber", false]], "episodes() (plexapi.video.season method)": [[28, "plexapi.video.Season.episodes", false]], "episodes() (plexapi.video.show method)": [[28, "plexapi.video.Show.episodes", false]], "episodesession (class in plexapi.video)": [[28, "plexapi.video.EpisodeSession", false]], "exposure (class in plexapi.library)": [[14, "plexapi.library.Exposure", false]], "extend() (plexapi.base.mediacontainer method)": [[7, "plexapi.base.MediaContainer.extend", false]], "extra (class in plexapi.video)": [[28, "plexapi.video.Extra", false]], "extras() (plexapi.mixins.extrasmixin method)": [[17, "plexapi.mixins.ExtrasMixin.extras", false]], "extrasmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.ExtrasMixin", false]], "fetchevent (class in plexapi.metrics)": [[16, "plexapi.metrics.FetchEvent", false]], "fetchitem() (plexapi.aio.asyncplexserver method)": [[4, "plexapi.aio.AsyncPlexServer.fetchItem", false]], "fetchitem() (plexapi.base.plexobject method)": [[7, "plexapi.base.PlexObject.fetchItem", false]], "fetchitems() (plexapi.aio.asyncplexserver method)": [[4, "plexapi.aio.AsyncPlexServer.fetchItems", false]], "fetchitems() (plexapi.base.plexobject method)": [[7, "plexapi.base.PlexObject.fetchItems", false]], "field (class in plexapi.media)": [[15, "plexapi.media.Field", false]], "fieldtypes() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.fieldTypes", false]], "file (class in plexapi.library)": [[14, "plexapi.library.File", false]], "filter() (plexapi.utils.secretsfilter method)": [[27, "plexapi.utils.SecretsFilter.filter", false]], "filterchoice (class in plexapi.library)": [[14, "plexapi.library.FilterChoice", false]], "filteringfield (class in plexapi.library)": [[14, "plexapi.library.FilteringField", false]], "filteringfieldtype (class in plexapi.library)": [[14, "plexapi.library.FilteringFieldType", false]], "filteringfilter (class in plexapi.library)": [[14, "plexapi.library.FilteringFilter", false]], "filteringoperator (class in plexapi.library)": [[14, "plexapi.library.FilteringOperator", false]], "filteringsort (class in plexapi.library)": [[14, "plexapi.library.FilteringSort", false]], "filteringtype (class in plexapi.library)": [[14, "plexapi.library.FilteringType", false]], "filters() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.filters", false]], "filters() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.filters", false]], "filtertypes() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.filterTypes", false]], "filteruserupdate() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.filterUserUpdate", false]], "find_by_content_type() (plexapi.gdm.gdm method)": [[13, "plexapi.gdm.GDM.find_by_content_type", false]], "find_by_data() (plexapi.gdm.gdm method)": [[13, "plexapi.gdm.GDM.find_by_data", false]], "finditem() (plexapi.base.plexobject method)": [[7, "plexapi.base.PlexObject.findItem", false]], "finditems() (plexapi.base.plexobject method)": [[7, "plexapi.base.PlexObject.findItems", false]], "first (plexapi.media.marker property)": [[15, "plexapi.media.Marker.first", false]], "firstattr() (plexapi.base.plexobject method)": [[7, "plexapi.base.PlexObject.firstAttr", false]], "firstcharacter (class in plexapi.library)": [[14, "plexapi.library.FirstCharacter", false]], "fixmatch() (plexapi.mixins.unmatchmatchmixin method)": [[17, "plexapi.mixins.UnmatchMatchMixin.fixMatch", false]], "folder (class in plexapi.library)": [[14, "plexapi.library.Folder", false]], "folders() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.folders", false]], "format (class in plexapi.library)": [[14, "plexapi.library.Format", false]], "format (class in plexapi.media)": [[15, "plexapi.media.Format", false]], "fromstationkey() (plexapi.playqueue.playqueue class method)": [[21, "plexapi.playqueue.PlayQueue.fromStationKey", false]], "fromxmlstring() (in module plexapi.utils)": [[27, "plexapi.utils.fromXMLString", false]], "gdm (class in plexapi.gdm)": [[13, "plexapi.gdm.GDM", false]], "generatekeypair() (plexapi.myplex.myplexjwtlogin method)": [[18, "plexapi.myplex.MyPlexJWTLogin.generateKeypair", false]], "genre (class in plexapi.library)": [[14, "plexapi.library.Genre", false]], "genre (class in plexapi.media)": [[15, "plexapi.media.Genre", false]], "genremixin (class in plexapi.mixins)": [[17, "plexapi.mixins.GenreMixin", false]], "geoip() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.geoip", false]], "geolocation (class in plexapi.myplex)": [[18, "plexapi.myplex.GeoLocation", false]], "get() (plexapi.aio.asynclibrarysection method)": [[4, "plexapi.aio.AsyncLibrarySection.get", false]], "get() (plexapi.audio.album method)": [[6, "plexapi.audio.Album.get", false]], "get() (plexapi.audio.artist method)": [[6, "plexapi.audio.Artist.get", false]], "get() (plexapi.cache.diskcache method)": [[8, "plexapi.cache.DiskCache.get", false]], "get() (plexapi.cache.memorycache method)": [[8, "plexapi.cache.MemoryCache.get", false]], "get() (plexapi.cache.responsecache method)": [[8, "plexapi.cache.ResponseCache.get", false]], "get() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.get", false]], "get() (plexapi.config.plexconfig method)": [[11, "plexapi.config.PlexConfig.get", false]], "get() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.get", false]], "get() (plexapi.photo.photoalbum method)": [[19, "plexapi.photo.Photoalbum.get", false]], "get() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.get", false]], "get() (plexapi.playqueue.playqueue class method)": [[21, "plexapi.playqueue.PlayQueue.get", false]], "get() (plexapi.settings.settings method)": [[23, "plexapi.settings.Settings.get", false]], "get() (plexapi.video.season method)": [[28, "plexapi.video.Season.get", false]], "get() (plexapi.video.show method)": [[28, "plexapi.video.Show.get", false]], "getagentidentifier() (in module plexapi.utils)": [[27, "plexapi.utils.getAgentIdentifier", false]], "getfieldtype() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.getFieldType", false]], "getfiltertype() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.getFilterType", false]], "getguid() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.getGuid", false]], "getmedia() (plexapi.sync.syncitem method)": [[25, "plexapi.sync.SyncItem.getMedia", false]], "getmyplexaccount() (in module plexapi.utils)": [[27, "plexapi.utils.getMyPlexAccount", false]], "getplexobject() (in module plexapi.utils)": [[27, "plexapi.utils.getPlexObject", false]], "getqueueitem() (plexapi.playqueue.playqueue method)": [[21, "plexapi.playqueue.PlayQueue.getQueueItem", false]], "getstreamurl() (plexapi.base.playable method)": [[7, "plexapi.base.Playable.getStreamURL", false]], "getweburl() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.getWebURL", false]], "getweburl() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.getWebURL", false]], "getweburl() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.getWebURL", false]], "goback() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.goBack", false]], "gotohome() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.goToHome", false]], "gotomedia() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.goToMedia", false]], "gotomusic() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.goToMusic", false]], "group() (plexapi.settings.settings method)": [[23, "plexapi.settings.Settings.group", false]], "groups() (plexapi.settings.settings method)": [[23, "plexapi.settings.Settings.groups", false]], "guid (class in plexapi.library)": [[14, "plexapi.library.Guid", false]], "guid (class in plexapi.media)": [[15, "plexapi.media.Guid", false]], "hascommercialmarker (plexapi.video.episode property)": [[28, "plexapi.video.Episode.hasCommercialMarker", false]], "hascreditsmarker (plexapi.video.episode property)": [[28, "plexapi.video.Episode.hasCreditsMarker", false]], "hascreditsmarker (plexapi.video.movie property)": [[28, "plexapi.video.Movie.hasCreditsMarker", false]], "hasintromarker (plexapi.video.episode property)": [[28, "plexapi.video.Episode.hasIntroMarker", false]], "haspreviewthumbnails (plexapi.media.mediapart property)": [[15, "plexapi.media.MediaPart.hasPreviewThumbnails", false]], "haspreviewthumbnails (plexapi.video.episode property)": [[28, "plexapi.video.Episode.hasPreviewThumbnails", false]], "haspreviewthumbnails (plexapi.video.movie property)": [[28, "plexapi.video.Movie.hasPreviewThumbnails", false]], "hassonicanalysis (plexapi.audio.audio property)": [[6, "plexapi.audio.Audio.hasSonicAnalysis", false]], "hasvoiceactivity (plexapi.video.episode property)": [[28, "plexapi.video.Episode.hasVoiceActivity", false]], "hasvoiceactivity (plexapi.video.movie property)": [[28, "plexapi.video.Movie.hasVoiceActivity", false]], "histogram (class in plexapi.metrics)": [[16, "plexapi.metrics.Histogram", false]], "history() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.history", false]], "history() (plexapi.library.library method)": [[14, "plexapi.library.Library.history", false]], "history() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.history", false]], "history() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.history", false]], "history() (plexapi.myplex.myplexservershare method)": [[18, "plexapi.myplex.MyPlexServerShare.history", false]], "history() (plexapi.myplex.myplexuser method)": [[18, "plexapi.myplex.MyPlexUser.history", false]], "history() (plexapi.myplex.section method)": [[18, "plexapi.myplex.Section.history", false]], "history() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.history", false]], "hub (class in plexapi.library)": [[14, "plexapi.library.Hub", false]], "hubs() (plexapi.library.library method)": [[14, "plexapi.library.Library.hubs", false]], "hubs() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.hubs", false]], "hubs() (plexapi.mixins.hubsmixin method)": [[17, "plexapi.mixins.HubsMixin.hubs", false]], "hubsearch() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.hubSearch", false]], "hubsmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.HubsMixin", false]], "identity (class in plexapi.server)": [[22, "plexapi.server.Identity", false]], "identity() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.identity", false]], "image (class in plexapi.media)": [[15, "plexapi.media.Image", false]], "install() (plexapi.metrics.metricscollector method)": [[16, "plexapi.metrics.MetricsCollector.install", false]], "installupdate() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.installUpdate", false]], "invitefriend() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.inviteFriend", false]], "isaudio (plexapi.collection.collection property)": [[10, "plexapi.collection.Collection.isAudio", false]], "isaudio (plexapi.playlist.playlist property)": [[20, "plexapi.playlist.Playlist.isAudio", false]], "isbrowsable() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.isBrowsable", false]], "isfresh() (plexapi.cache.cacheentry method)": [[8, "plexapi.cache.CacheEntry.isFresh", false]], "isfullobject() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.isFullObject", false]], "islatest() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.isLatest", false]], "islocked() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.isLocked", false]], "iso (class in plexapi.library)": [[14, "plexapi.library.ISO", false]], "isoptimizedversion (plexapi.media.media property)": [[15, "plexapi.media.Media.isOptimizedVersion", false]], "ispartialobject() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.isPartialObject", false]], "isphoto (plexapi.collection.collection property)": [[10, "plexapi.collection.Collection.isPhoto", false]], "isphoto (plexapi.playlist.playlist property)": [[20, "plexapi.playlist.Playlist.isPhoto", false]], "isplayed (plexapi.mixins.playedunplayedmixin property)": [[17, "plexapi.mixins.PlayedUnplayedMixin.isPlayed", false]], "isplayed (plexapi.video.season property)": [[28, "plexapi.video.Season.isPlayed", false]], "isplayed (plexapi.video.show property)": [[28, "plexapi.video.Show.isPlayed", false]], "isplayed() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.isPlayed", false]], "isplayingmedia() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.isPlayingMedia", false]], "isvideo (plexapi.collection.collection property)": [[10, "plexapi.collection.Collection.isVideo", false]], "isvideo (plexapi.playlist.playlist property)": [[20, "plexapi.playlist.Playlist.isVideo", false]], "iswatched (plexapi.mixins.playedunplayedmixin property)": [[17, "plexapi.mixins.PlayedUnplayedMixin.isWatched", false]], "item() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.item", false]], "item() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.item", false]], "items() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.items", false]], "items() (plexapi.library.common method)": [[14, "plexapi.library.Common.items", false]], "items() (plexapi.library.filterchoice method)": [[14, "plexapi.library.FilterChoice.items", false]], "items() (plexapi.library.hub method)": [[14, "plexapi.library.Hub.items", false]], "items() (plexapi.library.librarymediatag method)": [[14, "plexapi.library.LibraryMediaTag.items", false]], "items() (plexapi.media.mediatag method)": [[15, "plexapi.media.MediaTag.items", false]], "items() (plexapi.media.optimized method)": [[15, "plexapi.media.Optimized.items", false]], "items() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.items", false]], "iteritems() (plexapi.base.plexobject method)": [[7, "plexapi.base.PlexObject.iterItems", false]], "iterparts() (plexapi.base.playable method)": [[7, "plexapi.base.Playable.iterParts", false]], "itersearch() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.iterSearch", false]], "iterxmlbfs() (in module plexapi.utils)": [[27, "plexapi.utils.iterXMLBFS", false]], "iterxmlelements() (in module plexapi.utils)": [[27, "plexapi.utils.iterXMLElements", false]], "joinargs() (in module plexapi.utils)": [[27, "plexapi.utils.joinArgs", false]], "label (class in plexapi.library)": [[14, "plexapi.library.Label", false]], "label (class in plexapi.media)": [[15, "plexapi.media.Label", false]], "labelmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.LabelMixin", false]], "lens (class in plexapi.library)": [[14, "plexapi.library.Lens", false]], "level (class in plexapi.media)": [[15, "plexapi.media.Level", false]], "levels() (plexapi.media.audiostream method)": [[15, "plexapi.media.AudioStream.levels", false]], "library (class in plexapi.library)": [[14, "plexapi.library.Library", false]], "library (plexapi.aio.asyncplexserver property)": [[4, "plexapi.aio.AsyncPlexServer.library", false]], "library (plexapi.server.plexserver property)": [[22, "plexapi.server.PlexServer.library", false]], "librarymediatag (class in plexapi.library)": [[14, "plexapi.library.LibraryMediaTag", false]], "librarysection (class in plexapi.library)": [[14, "plexapi.library.LibrarySection", false]], "librarytimeline (class in plexapi.library)": [[14, "plexapi.library.LibraryTimeline", false]], "link() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.link", false]], "listattrs() (plexapi.base.plexobject method)": [[7, "plexapi.base.PlexObject.listAttrs", false]], "listfields() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.listFields", false]], "listfilterchoices() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.listFilterChoices", false]], "listfilters() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.listFilters", false]], "listoperators() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.listOperators", false]], "listsorts() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.listSorts", false]], "listtype (plexapi.collection.collection property)": [[10, "plexapi.collection.Collection.listType", false]], "location (class in plexapi.library)": [[14, "plexapi.library.Location", false]], "locations (plexapi.audio.track property)": [[6, "plexapi.audio.Track.locations", false]], "locations (plexapi.photo.photo property)": [[19, "plexapi.photo.Photo.locations", false]], "locations (plexapi.video.clip property)": [[28, "plexapi.video.Clip.locations", false]], "locations (plexapi.video.episode property)": [[28, "plexapi.video.Episode.locations", false]], "locations (plexapi.video.movie property)": [[28, "plexapi.video.Movie.locations", false]], "lockallfield() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.lockAllField", false]], "lockart() (plexapi.mixins.artlockmixin method)": [[17, "plexapi.mixins.ArtLockMixin.lockArt", false]], "locklogo() (plexapi.mixins.logolockmixin method)": [[17, "plexapi.mixins.LogoLockMixin.lockLogo", false]], "lockposter() (plexapi.mixins.posterlockmixin method)": [[17, "plexapi.mixins.PosterLockMixin.lockPoster", false]], "locksquareart() (plexapi.mixins.squareartlockmixin method)": [[17, "plexapi.mixins.SquareArtLockMixin.lockSquareArt", false]], "locktheme() (plexapi.mixins.themelockmixin method)": [[17, "plexapi.mixins.ThemeLockMixin.lockTheme", false]], "logo (class in plexapi.media)": [[15, "plexapi.media.Logo", false]], "logo (plexapi.mixins.logourlmixin property)": [[17, "plexapi.mixins.LogoUrlMixin.logo", false]], "logolockmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.LogoLockMixin", false]], "logomixin (class in plexapi.mixins)": [[17, "plexapi.mixins.LogoMixin", false]], "logos() (plexapi.mixins.logomixin method)": [[17, "plexapi.mixins.LogoMixin.logos", false]], "logourl (plexapi.mixins.logourlmixin property)": [[17, "plexapi.mixins.LogoUrlMixin.logoUrl", false]], "logourlmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.LogoUrlMixin", false]], "lyricstream (class in plexapi.media)": [[15, "plexapi.media.LyricStream", false]], "lyricstreams() (plexapi.base.playable method)": [[7, "plexapi.base.Playable.lyricStreams", false]], "lyricstreams() (plexapi.media.mediapart method)": [[15, "plexapi.media.MediaPart.lyricStreams", false]], "main() (in module plexapi.gdm)": [[13, "plexapi.gdm.main", false]], "make (class in plexapi.library)": [[14, "plexapi.library.Make", false]], "managedhub (class in plexapi.library)": [[14, "plexapi.library.ManagedHub", false]], "managedhubs() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.managedHubs", false]], "markdownloaded() (plexapi.sync.syncitem method)": [[25, "plexapi.sync.SyncItem.markDownloaded", false]], "marker (class in plexapi.library)": [[14, "plexapi.library.Marker", false]], "marker (class in plexapi.media)": [[15, "plexapi.media.Marker", false]], "markplayed() (plexapi.mixins.playedunplayedmixin method)": [[17, "plexapi.mixins.PlayedUnplayedMixin.markPlayed", false]], "markplayed() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.markPlayed", false]], "markunplayed() (plexapi.mixins.playedunplayedmixin method)": [[17, "plexapi.mixins.PlayedUnplayedMixin.markUnplayed", false]], "markunplayed() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.markUnplayed", false]], "markunwatched() (plexapi.mixins.playedunplayedmixin method)": [[17, "plexapi.mixins.PlayedUnplayedMixin.markUnwatched", false]], "markwatched() (plexapi.mixins.playedunplayedmixin method)": [[17, "plexapi.mixins.PlayedUnplayedMixin.markWatched", false]], "matches() (plexapi.mixins.unmatchmatchmixin method)": [[17, "plexapi.mixins.UnmatchMatchMixin.matches", false]], "mean (plexapi.metrics.histogram property)": [[16, "plexapi.metrics.Histogram.mean", false]], "media (class in plexapi.media)": [[15, "plexapi.media.Media", false]], "mediacontainer (class in plexapi.base)": [[7, "plexapi.base.MediaContainer", false]], "mediapart (class in plexapi.media)": [[15, "plexapi.media.MediaPart", false]], "mediapartstream (class in plexapi.media)": [[15, "plexapi.media.MediaPartStream", false]], "mediaprocessingtarget (class in plexapi.library)": [[14, "plexapi.library.MediaProcessingTarget", false]], "mediasettings (class in plexapi.sync)": [[25, "plexapi.sync.MediaSettings", false]], "mediatag (class in plexapi.media)": [[15, "plexapi.media.MediaTag", false]], "memorycache (class in plexapi.cache)": [[8, "plexapi.cache.MemoryCache", false]], "merge() (plexapi.mixins.splitmergemixin method)": [[17, "plexapi.mixins.SplitMergeMixin.merge", false]], "metadatadirectory (plexapi.audio.album property)": [[6, "plexapi.audio.Album.metadataDirectory", false]], "metadatadirectory (plexapi.audio.artist property)": [[6, "plexapi.audio.Artist.metadataDirectory", false]], "metadatadirectory (plexapi.audio.track property)": [[6, "plexapi.audio.Track.metadataDirectory", false]], "metadatadirectory (plexapi.collection.collection property)": [[10, "plexapi.collection.Collection.metadataDirectory", false]], "metadatadirectory (plexapi.photo.photo property)": [[19, "plexapi.photo.Photo.metadataDirectory", false]], "metadatadirectory (plexapi.photo.photoalbum property)": [[19, "plexapi.photo.Photoalbum.metadataDirectory", false]], "metadatadirectory (plexapi.playlist.playlist property)": [[20, "plexapi.playlist.Playlist.metadataDirectory", false]], "metadatadirectory (plexapi.video.clip property)": [[28, "plexapi.video.Clip.metadataDirectory", false]], "metadatadirectory (plexapi.video.episode property)": [[28, "plexapi.video.Episode.metadataDirectory", false]], "metadatadirectory (plexapi.video.movie property)": [[28, "plexapi.video.Movie.metadataDirectory", false]], "metadatadirectory (plexapi.video.season property)": [[28, "plexapi.video.Season.metadataDirectory", false]], "metadatadirectory (plexapi.video.show property)": [[28, "plexapi.video.Show.metadataDirectory", false]], "metadatatype (plexapi.collection.collection property)": [[10, "plexapi.collection.Collection.metadataType", false]], "metadatatype (plexapi.playlist.playlist property)": [[20, "plexapi.playlist.Playlist.metadataType", false]], "metricscollector (class in plexapi.metrics)": [[16, "plexapi.metrics.MetricsCollector", false]], "millisecondtohumanstr() (in module plexapi.utils)": [[27, "plexapi.utils.millisecondToHumanstr", false]], "model (class in plexapi.library)": [[14, "plexapi.library.Model", false]], "modeupdate() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.modeUpdate", false]], "module": [[4, "module-plexapi.aio", false], [5, "module-plexapi.alert", false], [6, "module-plexapi.audio", false], [7, "module-plexapi.base", false], [8, "module-plexapi.cache", false], [9, "module-plexapi.client", false], [10, "module-plexapi.collection", false], [11, "module-plexapi.config", false], [12, "module-plexapi.exceptions", false], [13, "module-plexapi.gdm", false], [14, "module-plexapi.library", false], [15, "module-plexapi.media", false], [16, "module-plexapi.metrics", false], [17, "module-plexapi.mixins", false], [18, "module-plexapi.myplex", false], [19, "module-plexapi.photo", false], [20, "module-plexapi.playlist", false], [21, "module-plexapi.playqueue", false], [22, "module-plexapi.server", false], [23, "module-plexapi.settings", false], [24, "module-plexapi.sonos", false], [25, "module-plexapi.sync", false], [26, "module-plexapi.transport", false], [27, "module-plexapi.utils", false], [28, "module-plexapi.video", false]], "mood (class in plexapi.library)": [[14, "plexapi.library.Mood", false]], "mood (class in plexapi.media)": [[15, "plexapi.media.Mood", false]], "moodmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.MoodMixin", false]], "mount() (plexapi.transport.transportconfig method)": [[26, "plexapi.transport.TransportConfig.mount", false]], "move() (plexapi.library.managedhub method)": [[14, "plexapi.library.ManagedHub.move", false]], "move() (plexapi.media.conversion method)": [[15, "plexapi.media.Conversion.move", false]], "movedown() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.moveDown", false]], "moveitem() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.moveItem", false]], "moveitem() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.moveItem", false]], "moveitem() (plexapi.playqueue.playqueue method)": [[21, "plexapi.playqueue.PlayQueue.moveItem", false]], "moveleft() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.moveLeft", false]], "moveright() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.moveRight", false]], "moveup() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.moveUp", false]], "movie (class in plexapi.video)": [[28, "plexapi.video.Movie", false]], "movieeditmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.MovieEditMixins", false]], "moviehistory (class in plexapi.video)": [[28, "plexapi.video.MovieHistory", false]], "moviemixins (class in plexapi.mixins)": [[17, "plexapi.mixins.MovieMixins", false]], "moviesection (class in plexapi.library)": [[14, "plexapi.library.MovieSection", false]], "moviesession (class in plexapi.video)": [[28, "plexapi.video.MovieSession", false]], "multiedit() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.multiEdit", false]], "musicsection (class in plexapi.library)": [[14, "plexapi.library.MusicSection", false]], "myplexaccount (class in plexapi.myplex)": [[18, "plexapi.myplex.MyPlexAccount", false]], "myplexaccount() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.myPlexAccount", false]], "myplexdevice (class in plexapi.myplex)": [[18, "plexapi.myplex.MyPlexDevice", false]], "myplexinvite (class in plexapi.myplex)": [[18, "plexapi.myplex.MyPlexInvite", false]], "myplexjwtlogin (class in plexapi.myplex)": [[18, "plexapi.myplex.MyPlexJWTLogin", false]], "myplexpinlogin (class in plexapi.myplex)": [[18, "plexapi.myplex.MyPlexPinLogin", false]], "myplexresource (class in plexapi.myplex)": [[18, "plexapi.myplex.MyPlexResource", false]], "myplexservershare (class in plexapi.myplex)": [[18, "plexapi.myplex.MyPlexServerShare", false]], "myplexuser (class in plexapi.myplex)": [[18, "plexapi.myplex.MyPlexUser", false]], "network (class in plexapi.library)": [[14, "plexapi.library.Network", false]], "nextletter() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.nextLetter", false]], "notfound": [[12, "plexapi.exceptions.NotFound", false]], "oauthurl() (plexapi.myplex.myplexjwtlogin method)": [[18, "plexapi.myplex.MyPlexJWTLogin.oauthUrl", false]], "oauthurl() (plexapi.myplex.myplexpinlogin method)": [[18, "plexapi.myplex.MyPlexPinLogin.oauthUrl", false]], "observe() (plexapi.metrics.histogram method)": [[16, "plexapi.metrics.Histogram.observe", false]], "ondeck() (plexapi.library.library method)": [[14, "plexapi.library.Library.onDeck", false]], "ondeck() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.onDeck", false]], "ondeck() (plexapi.video.season method)": [[28, "plexapi.video.Season.onDeck", false]], "ondeck() (plexapi.video.show method)": [[28, "plexapi.video.Show.onDeck", false]], "onlinemediasources() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.onlineMediaSources", false]], "onwatchlist() (plexapi.mixins.watchlistmixin method)": [[17, "plexapi.mixins.WatchlistMixin.onWatchlist", false]], "onwatchlist() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.onWatchlist", false]], "optimize() (plexapi.library.library method)": [[14, "plexapi.library.Library.optimize", false]], "optimize() (plexapi.video.video method)": [[28, "plexapi.video.Video.optimize", false]], "optimized (class in plexapi.media)": [[15, "plexapi.media.Optimized", false]], "optimizeditems() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.optimizedItems", false]], "optin() (plexapi.myplex.accountoptout method)": [[18, "plexapi.myplex.AccountOptOut.optIn", false]], "optout() (plexapi.myplex.accountoptout method)": [[18, "plexapi.myplex.AccountOptOut.optOut", false]], "optout() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.optOut", false]], "optoutmanaged() (plexapi.myplex.accountoptout method)": [[18, "plexapi.myplex.AccountOptOut.optOutManaged", false]], "originallyavailablemixin (class in plexapi.mixins)": [[17, "plexapi.mixins.OriginallyAvailableMixin", false]], "originaltitlemixin (class in plexapi.mixins)": [[17, "plexapi.mixins.OriginalTitleMixin", false]], "pagedown() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.pageDown", false]], "pageup() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.pageUp", false]], "parentaladvisorytopic (class in plexapi.media)": [[15, "plexapi.media.ParentalAdvisoryTopic", false]], "parentkey (plexapi.video.episode property)": [[28, "plexapi.video.Episode.parentKey", false]], "parentratingkey (plexapi.video.episode property)": [[28, "plexapi.video.Episode.parentRatingKey", false]], "parentthumb (plexapi.video.episode property)": [[28, "plexapi.video.Episode.parentThumb", false]], "parse() (plexapi.metrics.queryevent method)": [[16, "plexapi.metrics.QueryEvent.parse", false]], "parsexmlstring() (in module plexapi.utils)": [[27, "plexapi.utils.parseXMLString", false]], "path (class in plexapi.library)": [[14, "plexapi.library.Path", false]], "pause() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.pause", false]], "pendinginvite() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.pendingInvite", false]], "pendinginvites() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.pendingInvites", false]], "photo (class in plexapi.photo)": [[19, "plexapi.photo.Photo", false]], "photo() (plexapi.photo.photoalbum method)": [[19, "plexapi.photo.Photoalbum.photo", false]], "photoalbum (class in plexapi.photo)": [[19, "plexapi.photo.Photoalbum", false]], "photoalbum() (plexapi.photo.photo method)": [[19, "plexapi.photo.Photo.photoalbum", false]], "photoalbumeditmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.PhotoalbumEditMixins", false]], "photoalbummixins (class in plexapi.mixins)": [[17, "plexapi.mixins.PhotoalbumMixins", false]], "photocapturedtimemixin (class in plexapi.mixins)": [[17, "plexapi.mixins.PhotoCapturedTimeMixin", false]], "photoeditmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.PhotoEditMixins", false]], "photomixins (class in plexapi.mixins)": [[17, "plexapi.mixins.PhotoMixins", false]], "photos() (plexapi.photo.photoalbum method)": [[19, "plexapi.photo.Photoalbum.photos", false]], "photosection (class in plexapi.library)": [[14, "plexapi.library.PhotoSection", false]], "photosession (class in plexapi.photo)": [[19, "plexapi.photo.PhotoSession", false]], "pin (plexapi.myplex.myplexjwtlogin property)": [[18, "plexapi.myplex.MyPlexJWTLogin.pin", false]], "pin (plexapi.myplex.myplexpinlogin property)": [[18, "plexapi.myplex.MyPlexPinLogin.pin", false]], "ping() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.ping", false]], "place (class in plexapi.library)": [[14, "plexapi.library.Place", false]], "play() (plexapi.base.playable method)": [[7, "plexapi.base.Playable.play", false]], "play() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.play", false]], "playable (class in plexapi.base)": [[7, "plexapi.base.Playable", false]], "playedunplayedmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.PlayedUnplayedMixin", false]], "playlist (class in plexapi.playlist)": [[20, "plexapi.playlist.Playlist", false]], "playlist() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.playlist", false]], "playlist() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.playlist", false]], "playlisteditmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.PlaylistEditMixins", false]], "playlistmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.PlaylistMixins", false]], "playlists() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.playlists", false]], "playlists() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.playlists", false]], "playmedia() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.playMedia", false]], "playmedia() (plexapi.sonos.plexsonosclient method)": [[24, "plexapi.sonos.PlexSonosClient.playMedia", false]], "playqueue (class in plexapi.playqueue)": [[21, "plexapi.playqueue.PlayQueue", false]], "playqueue() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.playQueue", false]], "plexapi.aio": [[4, "module-plexapi.aio", false]], "plexapi.alert": [[5, "module-plexapi.alert", false]], "plexapi.audio": [[6, "module-plexapi.audio", false]], "plexapi.base": [[7, "module-plexapi.base", false]], "plexapi.cache": [[8, "module-plexapi.cache", false]], "plexapi.client": [[9, "module-plexapi.client", false]], "plexapi.collection": [[10, "module-plexapi.collection", false]], "plexapi.config": [[11, "module-plexapi.config", false]], "plexapi.exceptions": [[12, "module-plexapi.exceptions", false]], "plexapi.gdm": [[13, "module-plexapi.gdm", false]], "plexapi.library": [[14, "module-plexapi.library", false]], "plexapi.media": [[15, "module-plexapi.media", false]], "plexapi.metrics": [[16, "module-plexapi.metrics", false]], "plexapi.mixins": [[17, "module-plexapi.mixins", false]], "plexapi.myplex": [[18, "module-plexapi.myplex", false]], "plexapi.photo": [[19, "module-plexapi.photo", false]], "plexapi.playlist": [[20, "module-plexapi.playlist", false]], "plexapi.playqueue": [[21, "module-plexapi.playqueue", false]], "plexapi.server": [[22, "module-plexapi.server", false]], "plexapi.settings": [[23, "module-plexapi.settings", false]], "plexapi.sonos": [[24, "module-plexapi.sonos", false]], "plexapi.sync": [[25, "module-plexapi.sync", false]], "plexapi.transport": [[26, "module-plexapi.transport", false]], "plexapi.utils": [[27, "module-plexapi.utils", false]], "plexapi.video": [[28, "module-plexapi.video", false]], "plexapiexception": [[12, "plexapi.exceptions.PlexApiException", false]], "plexclient (class in plexapi.client)": [[9, "plexapi.client.PlexClient", false]], "plexconfig (class in plexapi.config)": [[11, "plexapi.config.PlexConfig", false]], "plexhistory (class in plexapi.base)": [[7, "plexapi.base.PlexHistory", false]], "plexjwtauth() (in module plexapi.utils)": [[27, "plexapi.utils.plexJWTAuth", false]], "plexoauth() (in module plexapi.utils)": [[27, "plexapi.utils.plexOAuth", false]], "plexobject (class in plexapi.base)": [[7, "plexapi.base.PlexObject", false]], "plexobjectmeta (class in plexapi.base)": [[7, "plexapi.base.PlexObjectMeta", false]], "plexpartialobject (class in plexapi.base)": [[7, "plexapi.base.PlexPartialObject", false]], "plexserver (class in plexapi.server)": [[22, "plexapi.server.PlexServer", false]], "plexsession (class in plexapi.base)": [[7, "plexapi.base.PlexSession", false]], "plexsonosclient (class in plexapi.sonos)": [[24, "plexapi.sonos.PlexSonosClient", false]], "policy (class in plexapi.sync)": [[25, "plexapi.sync.Policy", false]], "populartracks() (plexapi.audio.artist method)": [[6, "plexapi.audio.Artist.popularTracks", false]], "poster (class in plexapi.library)": [[14, "plexapi.library.Poster", false]], "poster (class in plexapi.media)": [[15, "plexapi.media.Poster", false]], "posterlockmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.PosterLockMixin", false]], "postermixin (class in plexapi.mixins)": [[17, "plexapi.mixins.PosterMixin", false]], "posters() (plexapi.mixins.postermixin method)": [[17, "plexapi.mixins.PosterMixin.posters", false]], "posterurl (plexapi.mixins.posterurlmixin property)": [[17, "plexapi.mixins.PosterUrlMixin.posterUrl", false]], "posterurlmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.PosterUrlMixin", false]], "preference() (plexapi.mixins.advancedsettingsmixin method)": [[17, "plexapi.mixins.AdvancedSettingsMixin.preference", false]], "preferences (class in plexapi.settings)": [[23, "plexapi.settings.Preferences", false]], "preferences() (plexapi.mixins.advancedsettingsmixin method)": [[17, "plexapi.mixins.AdvancedSettingsMixin.preferences", false]], "preferred_connections() (plexapi.myplex.myplexresource method)": [[18, "plexapi.myplex.MyPlexResource.preferred_connections", false]], "previousletter() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.previousLetter", false]], "producer (class in plexapi.library)": [[14, "plexapi.library.Producer", false]], "producer (class in plexapi.media)": [[15, "plexapi.media.Producer", false]], "producermixin (class in plexapi.mixins)": [[17, "plexapi.mixins.ProducerMixin", false]], "promotehome() (plexapi.library.managedhub method)": [[14, "plexapi.library.ManagedHub.promoteHome", false]], "promoterecommended() (plexapi.library.managedhub method)": [[14, "plexapi.library.ManagedHub.promoteRecommended", false]], "promoteshared() (plexapi.library.managedhub method)": [[14, "plexapi.library.ManagedHub.promoteShared", false]], "proxythroughserver() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.proxyThroughServer", false]], "publicip() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.publicIP", false]], "quantile() (plexapi.metrics.histogram method)": [[16, "plexapi.metrics.Histogram.quantile", false]], "query() (plexapi.aio.asyncplexserver method)": [[4, "plexapi.aio.AsyncPlexServer.query", false]], "query() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.query", false]], "query() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.query", false]], "queryevent (class in plexapi.metrics)": [[16, "plexapi.metrics.QueryEvent", false]], "rate() (plexapi.mixins.ratingmixin method)": [[17, "plexapi.mixins.RatingMixin.rate", false]], "rating (class in plexapi.media)": [[15, "plexapi.media.Rating", false]], "ratingimage (class in plexapi.library)": [[14, "plexapi.library.RatingImage", false]], "ratingkeys (plexapi.library.common property)": [[14, "plexapi.library.Common.ratingKeys", false]], "ratingmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.RatingMixin", false]], "received() (plexapi.metrics.queryevent method)": [[16, "plexapi.metrics.QueryEvent.received", false]], "recentlyadded() (plexapi.library.library method)": [[14, "plexapi.library.Library.recentlyAdded", false]], "recentlyadded() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.recentlyAdded", false]], "recentlyaddedalbums() (plexapi.library.musicsection method)": [[14, "plexapi.library.MusicSection.recentlyAddedAlbums", false]], "recentlyaddedalbums() (plexapi.library.photosection method)": [[14, "plexapi.library.PhotoSection.recentlyAddedAlbums", false]], "recentlyaddedartists() (plexapi.library.musicsection method)": [[14, "plexapi.library.MusicSection.recentlyAddedArtists", false]], "recentlyaddedepisodes() (plexapi.library.showsection method)": [[14, "plexapi.library.ShowSection.recentlyAddedEpisodes", false]], "recentlyaddedmovies() (plexapi.library.moviesection method)": [[14, "plexapi.library.MovieSection.recentlyAddedMovies", false]], "recentlyaddedseasons() (plexapi.library.showsection method)": [[14, "plexapi.library.ShowSection.recentlyAddedSeasons", false]], "recentlyaddedshows() (plexapi.library.showsection method)": [[14, "plexapi.library.ShowSection.recentlyAddedShows", false]], "recentlyaddedtracks() (plexapi.library.musicsection method)": [[14, "plexapi.library.MusicSection.recentlyAddedTracks", false]], "recordbuild() (in module plexapi.metrics)": [[16, "plexapi.metrics.recordBuild", false]], "recordingadapter (class in plexapi.transport)": [[26, "plexapi.transport.RecordingAdapter", false]], "recordingkey() (in module plexapi.transport)": [[26, "plexapi.transport.recordingKey", false]], "refresh() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.refresh", false]], "refresh() (plexapi.cache.responsecache method)": [[8, "plexapi.cache.ResponseCache.refresh", false]], "refresh() (plexapi.library.library method)": [[14, "plexapi.library.Library.refresh", false]], "refresh() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.refresh", false]], "refresh() (plexapi.playqueue.playqueue method)": [[21, "plexapi.playqueue.PlayQueue.refresh", false]], "refreshcontent() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.refreshContent", false]], "refreshjwt() (plexapi.myplex.myplexjwtlogin method)": [[18, "plexapi.myplex.MyPlexJWTLogin.refreshJWT", false]], "refreshplayqueue() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.refreshPlayQueue", false]], "refreshsync() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.refreshSync", false]], "refreshsynclist() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.refreshSynclist", false]], "registerdevice() (plexapi.myplex.myplexjwtlogin method)": [[18, "plexapi.myplex.MyPlexJWTLogin.registerDevice", false]], "registerplexobject() (in module plexapi.utils)": [[27, "plexapi.utils.registerPlexObject", false]], "release (class in plexapi.server)": [[22, "plexapi.server.Release", false]], "reload() (plexapi.base.plexobject method)": [[7, "plexapi.base.PlexObject.reload", false]], "reload() (plexapi.base.plexsession method)": [[7, "plexapi.base.PlexSession.reload", false]], "reload() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.reload", false]], "remove() (plexapi.library.managedhub method)": [[14, "plexapi.library.ManagedHub.remove", false]], "remove() (plexapi.media.conversion method)": [[15, "plexapi.media.Conversion.remove", false]], "remove() (plexapi.media.optimized method)": [[15, "plexapi.media.Optimized.remove", false]], "removecollection() (plexapi.mixins.collectionmixin method)": [[17, "plexapi.mixins.CollectionMixin.removeCollection", false]], "removecountry() (plexapi.mixins.countrymixin method)": [[17, "plexapi.mixins.CountryMixin.removeCountry", false]], "removedirector() (plexapi.mixins.directormixin method)": [[17, "plexapi.mixins.DirectorMixin.removeDirector", false]], "removefriend() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.removeFriend", false]], "removefromcontinuewatching() (plexapi.video.episode method)": [[28, "plexapi.video.Episode.removeFromContinueWatching", false]], "removefromcontinuewatching() (plexapi.video.movie method)": [[28, "plexapi.video.Movie.removeFromContinueWatching", false]], "removefromwatchlist() (plexapi.mixins.watchlistmixin method)": [[17, "plexapi.mixins.WatchlistMixin.removeFromWatchlist", false]], "removefromwatchlist() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.removeFromWatchlist", false]], "removegenre() (plexapi.mixins.genremixin method)": [[17, "plexapi.mixins.GenreMixin.removeGenre", false]], "removehomeuser() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.removeHomeUser", false]], "removeitem() (plexapi.playqueue.playqueue method)": [[21, "plexapi.playqueue.PlayQueue.removeItem", false]], "removeitems() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.removeItems", false]], "removeitems() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.removeItems", false]], "removelabel() (plexapi.mixins.labelmixin method)": [[17, "plexapi.mixins.LabelMixin.removeLabel", false]], "removelistener() (in module plexapi.metrics)": [[16, "plexapi.metrics.removeListener", false]], "removelocations() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.removeLocations", false]], "removemanageduserpin() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.removeManagedUserPin", false]], "removemood() (plexapi.mixins.moodmixin method)": [[17, "plexapi.mixins.MoodMixin.removeMood", false]], "removepin() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.removePin", false]], "removeproducer() (plexapi.mixins.producermixin method)": [[17, "plexapi.mixins.ProducerMixin.removeProducer", false]], "removesimilarartist() (plexapi.mixins.similarartistmixin method)": [[17, "plexapi.mixins.SimilarArtistMixin.removeSimilarArtist", false]], "removestyle() (plexapi.mixins.stylemixin method)": [[17, "plexapi.mixins.StyleMixin.removeStyle", false]], "removesubtitles() (plexapi.video.video method)": [[28, "plexapi.video.Video.removeSubtitles", false]], "removetag() (plexapi.mixins.tagmixin method)": [[17, "plexapi.mixins.TagMixin.removeTag", false]], "removewriter() (plexapi.mixins.writermixin method)": [[17, "plexapi.mixins.WriterMixin.removeWriter", false]], "rename() (plexapi.media.optimized method)": [[15, "plexapi.media.Optimized.rename", false]], "replayadapter (class in plexapi.transport)": [[26, "plexapi.transport.ReplayAdapter", false]], "reprocess() (plexapi.media.optimized method)": [[15, "plexapi.media.Optimized.reprocess", false]], "requestkey() (in module plexapi.transport)": [[26, "plexapi.transport.requestKey", false]], "reset() (plexapi.metrics.metricscollector method)": [[16, "plexapi.metrics.MetricsCollector.reset", false]], "reset_base_headers() (in module plexapi.config)": [[11, "plexapi.config.reset_base_headers", false]], "resetmanagedhubs() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.resetManagedHubs", false]], "resetselectedsubtitlestream() (plexapi.media.mediapart method)": [[15, "plexapi.media.MediaPart.resetSelectedSubtitleStream", false]], "resource() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.resource", false]], "resourceconnection (class in plexapi.myplex)": [[18, "plexapi.myplex.ResourceConnection", false]], "resourcefilepath (plexapi.media.baseresource property)": [[15, "plexapi.media.BaseResource.resourceFilepath", false]], "resources() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.resources", false]], "resources() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.resources", false]], "responsecache (class in plexapi.cache)": [[8, "plexapi.cache.ResponseCache", false]], "retry() (plexapi.transport.transportconfig method)": [[26, "plexapi.transport.TransportConfig.retry", false]], "reversesearchtype() (in module plexapi.utils)": [[27, "plexapi.utils.reverseSearchType", false]], "reversetagtype() (in module plexapi.utils)": [[27, "plexapi.utils.reverseTagType", false]], "review (class in plexapi.library)": [[14, "plexapi.library.Review", false]], "review (class in plexapi.media)": [[15, "plexapi.media.Review", false]], "reviews() (plexapi.video.movie method)": [[28, "plexapi.video.Movie.reviews", false]], "rget() (in module plexapi.utils)": [[27, "plexapi.utils.rget", false]], "role (class in plexapi.library)": [[14, "plexapi.library.Role", false]], "role (class in plexapi.media)": [[15, "plexapi.media.Role", false]], "run() (plexapi.alert.alertlistener method)": [[5, "plexapi.alert.AlertListener.run", false]], "run() (plexapi.myplex.myplexjwtlogin method)": [[18, "plexapi.myplex.MyPlexJWTLogin.run", false]], "run() (plexapi.myplex.myplexpinlogin method)": [[18, "plexapi.myplex.MyPlexPinLogin.run", false]], "runbutlertask() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.runButlerTask", false]], "save() (plexapi.settings.settings method)": [[23, "plexapi.settings.Settings.save", false]], "saveedits() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.saveEdits", false]], "savemultiedits() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.saveMultiEdits", false]], "scan() (plexapi.gdm.gdm method)": [[13, "plexapi.gdm.GDM.scan", false]], "search() (plexapi.aio.asynclibrarysection method)": [[4, "plexapi.aio.AsyncLibrarySection.search", false]], "search() (plexapi.library.library method)": [[14, "plexapi.library.Library.search", false]], "search() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.search", false]], "search() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.search", false]], "searchalbums() (plexapi.library.musicsection method)": [[14, "plexapi.library.MusicSection.searchAlbums", false]], "searchalbums() (plexapi.library.photosection method)": [[14, "plexapi.library.PhotoSection.searchAlbums", false]], "searchartists() (plexapi.library.musicsection method)": [[14, "plexapi.library.MusicSection.searchArtists", false]], "searchdiscover() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.searchDiscover", false]], "searchepisodes() (plexapi.library.showsection method)": [[14, "plexapi.library.ShowSection.searchEpisodes", false]], "searchmovies() (plexapi.library.moviesection method)": [[14, "plexapi.library.MovieSection.searchMovies", false]], "searchphotos() (plexapi.library.photosection method)": [[14, "plexapi.library.PhotoSection.searchPhotos", false]], "searchresult (class in plexapi.media)": [[15, "plexapi.media.SearchResult", false]], "searchseasons() (plexapi.library.showsection method)": [[14, "plexapi.library.ShowSection.searchSeasons", false]], "searchshows() (plexapi.library.showsection method)": [[14, "plexapi.library.ShowSection.searchShows", false]], "searchsubtitles() (plexapi.video.video method)": [[28, "plexapi.video.Video.searchSubtitles", false]], "searchtracks() (plexapi.library.musicsection method)": [[14, "plexapi.library.MusicSection.searchTracks", false]], "searchtype() (in module plexapi.utils)": [[27, "plexapi.utils.searchType", false]], "season (class in plexapi.video)": [[28, "plexapi.video.Season", false]], "season() (plexapi.video.episode method)": [[28, "plexapi.video.Episode.season", false]], "season() (plexapi.video.show method)": [[28, "plexapi.video.Show.season", false]], "seasoneditmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.SeasonEditMixins", false]], "seasonepisode (plexapi.video.episode property)": [[28, "plexapi.video.Episode.seasonEpisode", false]], "seasonmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.SeasonMixins", false]], "seasonnumber (plexapi.video.episode property)": [[28, "plexapi.video.Episode.seasonNumber", false]], "seasonnumber (plexapi.video.season property)": [[28, "plexapi.video.Season.seasonNumber", false]], "seasons() (plexapi.video.show method)": [[28, "plexapi.video.Show.seasons", false]], "secretsfilter (class in plexapi.utils)": [[27, "plexapi.utils.SecretsFilter", false]], "section (class in plexapi.myplex)": [[18, "plexapi.myplex.Section", false]], "section (plexapi.aio.asynclibrarysection property)": [[4, "plexapi.aio.AsyncLibrarySection.section", false]], "section() (plexapi.aio.asynclibrary method)": [[4, "plexapi.aio.AsyncLibrary.section", false]], "section() (plexapi.base.plexpartialobject method)": [[7, "plexapi.base.PlexPartialObject.section", false]], "section() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.section", false]], "section() (plexapi.library.hub method)": [[14, "plexapi.library.Hub.section", false]], "section() (plexapi.library.library method)": [[14, "plexapi.library.Library.section", false]], "section() (plexapi.myplex.myplexservershare method)": [[18, "plexapi.myplex.MyPlexServerShare.section", false]], "section() (plexapi.photo.photo method)": [[19, "plexapi.photo.Photo.section", false]], "section() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.section", false]], "sectionbyid() (plexapi.aio.asynclibrary method)": [[4, "plexapi.aio.AsyncLibrary.sectionByID", false]], "sectionbyid() (plexapi.library.library method)": [[14, "plexapi.library.Library.sectionByID", false]], "sections() (plexapi.aio.asynclibrary method)": [[4, "plexapi.aio.AsyncLibrary.sections", false]], "sections() (plexapi.library.library method)": [[14, "plexapi.library.Library.sections", false]], "sections() (plexapi.myplex.myplexservershare method)": [[18, "plexapi.myplex.MyPlexServerShare.sections", false]], "seekto() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.seekTo", false]], "select() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.select", false]], "send() (plexapi.transport.recordingadapter method)": [[26, "plexapi.transport.RecordingAdapter.send", false]], "send() (plexapi.transport.replayadapter method)": [[26, "plexapi.transport.ReplayAdapter.send", false]], "sendcommand() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.sendCommand", false]], "server (plexapi.aio.asyncplexserver property)": [[4, "plexapi.aio.AsyncPlexServer.server", false]], "server() (plexapi.myplex.myplexuser method)": [[18, "plexapi.myplex.MyPlexUser.server", false]], "server() (plexapi.sync.syncitem method)": [[25, "plexapi.sync.SyncItem.server", false]], "session (class in plexapi.media)": [[15, "plexapi.media.Session", false]], "session() (plexapi.transport.transportconfig method)": [[26, "plexapi.transport.TransportConfig.session", false]], "sessions() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.sessions", false]], "set() (plexapi.cache.diskcache method)": [[8, "plexapi.cache.DiskCache.set", false]], "set() (plexapi.cache.memorycache method)": [[8, "plexapi.cache.MemoryCache.set", false]], "set() (plexapi.cache.responsecache method)": [[8, "plexapi.cache.ResponseCache.set", false]], "set() (plexapi.settings.setting method)": [[23, "plexapi.settings.Setting.set", false]], "setart() (plexapi.mixins.artmixin method)": [[17, "plexapi.mixins.ArtMixin.setArt", false]], "setaudiostream() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.setAudioStream", false]], "setdatetimetimezone() (in module plexapi.utils)": [[27, "plexapi.utils.setDatetimeTimezone", false]], "setlogo() (plexapi.mixins.logomixin method)": [[17, "plexapi.mixins.LogoMixin.setLogo", false]], "setmanageduserpin() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.setManagedUserPin", false]], "setparameters() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.setParameters", false]], "setpin() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.setPin", false]], "setposter() (plexapi.mixins.postermixin method)": [[17, "plexapi.mixins.PosterMixin.setPoster", false]], "setrepeat() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.setRepeat", false]], "setselected() (plexapi.media.audiostream method)": [[15, "plexapi.media.AudioStream.setSelected", false]], "setselected() (plexapi.media.subtitlestream method)": [[15, "plexapi.media.SubtitleStream.setSelected", false]], "setselectedaudiostream() (plexapi.media.mediapart method)": [[15, "plexapi.media.MediaPart.setSelectedAudioStream", false]], "setselectedsubtitlestream() (plexapi.media.mediapart method)": [[15, "plexapi.media.MediaPart.setSelectedSubtitleStream", false]], "setshuffle() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.setShuffle", false]], "setsquareart() (plexapi.mixins.squareartmixin method)": [[17, "plexapi.mixins.SquareArtMixin.setSquareArt", false]], "setstreams() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.setStreams", false]], "setsubtitlestream() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.setSubtitleStream", false]], "settheme() (plexapi.mixins.thememixin method)": [[17, "plexapi.mixins.ThemeMixin.setTheme", false]], "setting (class in plexapi.settings)": [[23, "plexapi.settings.Setting", false]], "settings (class in plexapi.settings)": [[23, "plexapi.settings.Settings", false]], "settings (plexapi.server.plexserver property)": [[22, "plexapi.server.PlexServer.settings", false]], "settings() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.settings", false]], "setvideostream() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.setVideoStream", false]], "setvolume() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.setVolume", false]], "setxmlparser() (in module plexapi.utils)": [[27, "plexapi.utils.setXMLParser", false]], "sha1hash() (in module plexapi.utils)": [[27, "plexapi.utils.sha1hash", false]], "show (class in plexapi.video)": [[28, "plexapi.video.Show", false]], "show() (plexapi.video.episode method)": [[28, "plexapi.video.Episode.show", false]], "show() (plexapi.video.season method)": [[28, "plexapi.video.Season.show", false]], "showeditmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.ShowEditMixins", false]], "showmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.ShowMixins", false]], "showsection (class in plexapi.library)": [[14, "plexapi.library.ShowSection", false]], "signout() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.signout", false]], "similar (class in plexapi.library)": [[14, "plexapi.library.Similar", false]], "similar (class in plexapi.media)": [[15, "plexapi.media.Similar", false]], "similarartistmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.SimilarArtistMixin", false]], "singleflight (class in plexapi.transport)": [[26, "plexapi.transport.SingleFlight", false]], "skipnext() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.skipNext", false]], "skipprevious() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.skipPrevious", false]], "skipto() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.skipTo", false]], "smartfiltermixin (class in plexapi.mixins)": [[17, "plexapi.mixins.SmartFilterMixin", false]], "snapshot() (plexapi.metrics.metricscollector method)": [[16, "plexapi.metrics.MetricsCollector.snapshot", false]], "sonicadventure() (plexapi.audio.track method)": [[6, "plexapi.audio.Track.sonicAdventure", false]], "sonicadventure() (plexapi.library.musicsection method)": [[14, "plexapi.library.MusicSection.sonicAdventure", false]], "sonicallysimilar() (plexapi.audio.audio method)": [[6, "plexapi.audio.Audio.sonicallySimilar", false]], "sorttitlemixin (class in plexapi.mixins)": [[17, "plexapi.mixins.SortTitleMixin", false]], "sortupdate() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.sortUpdate", false]], "source() (plexapi.base.plexhistory method)": [[7, "plexapi.base.PlexHistory.source", false]], "source() (plexapi.base.plexsession method)": [[7, "plexapi.base.PlexSession.source", false]], "split() (plexapi.mixins.splitmergemixin method)": [[17, "plexapi.mixins.SplitMergeMixin.split", false]], "splitmergemixin (class in plexapi.mixins)": [[17, "plexapi.mixins.SplitMergeMixin", false]], "squareart (class in plexapi.media)": [[15, "plexapi.media.SquareArt", false]], "squareart (plexapi.mixins.squarearturlmixin property)": [[17, "plexapi.mixins.SquareArtUrlMixin.squareArt", false]], "squareartlockmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.SquareArtLockMixin", false]], "squareartmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.SquareArtMixin", false]], "squarearts() (plexapi.mixins.squareartmixin method)": [[17, "plexapi.mixins.SquareArtMixin.squareArts", false]], "squarearturl (plexapi.mixins.squarearturlmixin property)": [[17, "plexapi.mixins.SquareArtUrlMixin.squareArtUrl", false]], "squarearturlmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.SquareArtUrlMixin", false]], "startalertlistener() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.startAlertListener", false]], "station() (plexapi.audio.artist method)": [[6, "plexapi.audio.Artist.station", false]], "stations() (plexapi.library.musicsection method)": [[14, "plexapi.library.MusicSection.stations", false]], "statisticsbandwidth (class in plexapi.server)": [[22, "plexapi.server.StatisticsBandwidth", false]], "statisticsresources (class in plexapi.server)": [[22, "plexapi.server.StatisticsResources", false]], "status (class in plexapi.sync)": [[25, "plexapi.sync.Status", false]], "stepback() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.stepBack", false]], "stepforward() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.stepForward", false]], "stop() (plexapi.alert.alertlistener method)": [[5, "plexapi.alert.AlertListener.stop", false]], "stop() (plexapi.base.plexsession method)": [[7, "plexapi.base.PlexSession.stop", false]], "stop() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.stop", false]], "stop() (plexapi.myplex.myplexjwtlogin method)": [[18, "plexapi.myplex.MyPlexJWTLogin.stop", false]], "stop() (plexapi.myplex.myplexpinlogin method)": [[18, "plexapi.myplex.MyPlexPinLogin.stop", false]], "streamingservices() (plexapi.mixins.watchlistmixin method)": [[17, "plexapi.mixins.WatchlistMixin.streamingServices", false]], "streamitems() (plexapi.base.plexobject method)": [[7, "plexapi.base.PlexObject.streamItems", false]], "streamquery() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.streamQuery", false]], "studio (class in plexapi.library)": [[14, "plexapi.library.Studio", false]], "studiomixin (class in plexapi.mixins)": [[17, "plexapi.mixins.StudioMixin", false]], "style (class in plexapi.library)": [[14, "plexapi.library.Style", false]], "style (class in plexapi.media)": [[15, "plexapi.media.Style", false]], "stylemixin (class in plexapi.mixins)": [[17, "plexapi.mixins.StyleMixin", false]], "subfolders() (plexapi.library.folder method)": [[14, "plexapi.library.Folder.subfolders", false]], "subformat (class in plexapi.media)": [[15, "plexapi.media.Subformat", false]], "subtitlestream (class in plexapi.media)": [[15, "plexapi.media.SubtitleStream", false]], "subtitlestreams() (plexapi.base.playable method)": [[7, "plexapi.base.Playable.subtitleStreams", false]], "subtitlestreams() (plexapi.media.mediapart method)": [[15, "plexapi.media.MediaPart.subtitleStreams", false]], "summarymixin (class in plexapi.mixins)": [[17, "plexapi.mixins.SummaryMixin", false]], "switchhomeuser() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.switchHomeUser", false]], "switchuser() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.switchUser", false]], "sync() (plexapi.audio.audio method)": [[6, "plexapi.audio.Audio.sync", false]], "sync() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.sync", false]], "sync() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.sync", false]], "sync() (plexapi.library.moviesection method)": [[14, "plexapi.library.MovieSection.sync", false]], "sync() (plexapi.library.musicsection method)": [[14, "plexapi.library.MusicSection.sync", false]], "sync() (plexapi.library.photosection method)": [[14, "plexapi.library.PhotoSection.sync", false]], "sync() (plexapi.library.showsection method)": [[14, "plexapi.library.ShowSection.sync", false]], "sync() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.sync", false]], "sync() (plexapi.photo.photo method)": [[19, "plexapi.photo.Photo.sync", false]], "sync() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.sync", false]], "sync() (plexapi.video.video method)": [[28, "plexapi.video.Video.sync", false]], "syncitem (class in plexapi.sync)": [[25, "plexapi.sync.SyncItem", false]], "syncitems() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.syncItems", false]], "syncitems() (plexapi.myplex.myplexdevice method)": [[18, "plexapi.myplex.MyPlexDevice.syncItems", false]], "synclist (class in plexapi.sync)": [[25, "plexapi.sync.SyncList", false]], "systemaccount (class in plexapi.server)": [[22, "plexapi.server.SystemAccount", false]], "systemaccount() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.systemAccount", false]], "systemaccounts() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.systemAccounts", false]], "systemdevice (class in plexapi.server)": [[22, "plexapi.server.SystemDevice", false]], "systemdevice() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.systemDevice", false]], "systemdevices() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.systemDevices", false]], "tag (class in plexapi.library)": [[14, "plexapi.library.Tag", false]], "tag (class in plexapi.media)": [[15, "plexapi.media.Tag", false]], "taglinemixin (class in plexapi.mixins)": [[17, "plexapi.mixins.TaglineMixin", false]], "tagmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.TagMixin", false]], "tags() (plexapi.library.library method)": [[14, "plexapi.library.Library.tags", false]], "tagtype() (in module plexapi.utils)": [[27, "plexapi.utils.tagType", false]], "talkingpoint (class in plexapi.media)": [[15, "plexapi.media.TalkingPoint", false]], "theme (class in plexapi.library)": [[14, "plexapi.library.Theme", false]], "theme (class in plexapi.media)": [[15, "plexapi.media.Theme", false]], "themelockmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.ThemeLockMixin", false]], "thememixin (class in plexapi.mixins)": [[17, "plexapi.mixins.ThemeMixin", false]], "themes() (plexapi.mixins.thememixin method)": [[17, "plexapi.mixins.ThemeMixin.themes", false]], "themeurl (plexapi.mixins.themeurlmixin property)": [[17, "plexapi.mixins.ThemeUrlMixin.themeUrl", false]], "themeurlmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.ThemeUrlMixin", false]], "threaded() (in module plexapi.utils)": [[27, "plexapi.utils.threaded", false]], "thumb (plexapi.playlist.playlist property)": [[20, "plexapi.playlist.Playlist.thumb", false]], "thumburl (plexapi.mixins.posterurlmixin property)": [[17, "plexapi.mixins.PosterUrlMixin.thumbUrl", false]], "tidal() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.tidal", false]], "timeline (plexapi.client.plexclient property)": [[9, "plexapi.client.PlexClient.timeline", false]], "timeline() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.timeline", false]], "timelines() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.timelines", false]], "timeout() (plexapi.transport.transportconfig method)": [[26, "plexapi.transport.TransportConfig.timeout", false]], "titlemixin (class in plexapi.mixins)": [[17, "plexapi.mixins.TitleMixin", false]], "todatetime() (in module plexapi.utils)": [[27, "plexapi.utils.toDatetime", false]], "todict() (plexapi.metrics.histogram method)": [[16, "plexapi.metrics.Histogram.toDict", false]], "toggleosd() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.toggleOSD", false]], "tojson() (in module plexapi.utils)": [[27, "plexapi.utils.toJson", false]], "tolist() (in module plexapi.utils)": [[27, "plexapi.utils.toList", false]], "toprometheus() (plexapi.metrics.metricscollector method)": [[16, "plexapi.metrics.MetricsCollector.toPrometheus", false]], "totalduration (plexapi.library.librarysection property)": [[14, "plexapi.library.LibrarySection.totalDuration", false]], "totalsize (plexapi.library.librarysection property)": [[14, "plexapi.library.LibrarySection.totalSize", false]], "totalstorage (plexapi.library.librarysection property)": [[14, "plexapi.library.LibrarySection.totalStorage", false]], "totalviewsize() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.totalViewSize", false]], "tourl() (plexapi.settings.setting method)": [[23, "plexapi.settings.Setting.toUrl", false]], "track (class in plexapi.audio)": [[6, "plexapi.audio.Track", false]], "track() (plexapi.audio.album method)": [[6, "plexapi.audio.Album.track", false]], "track() (plexapi.audio.artist method)": [[6, "plexapi.audio.Artist.track", false]], "trackartistmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.TrackArtistMixin", false]], "trackdiscnumbermixin (class in plexapi.mixins)": [[17, "plexapi.mixins.TrackDiscNumberMixin", false]], "trackeditmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.TrackEditMixins", false]], "trackhistory (class in plexapi.audio)": [[6, "plexapi.audio.TrackHistory", false]], "trackmixins (class in plexapi.mixins)": [[17, "plexapi.mixins.TrackMixins", false]], "tracknumber (plexapi.audio.track property)": [[6, "plexapi.audio.Track.trackNumber", false]], "tracknumbermixin (class in plexapi.mixins)": [[17, "plexapi.mixins.TrackNumberMixin", false]], "tracks() (plexapi.audio.album method)": [[6, "plexapi.audio.Album.tracks", false]], "tracks() (plexapi.audio.artist method)": [[6, "plexapi.audio.Artist.tracks", false]], "tracksession (class in plexapi.audio)": [[6, "plexapi.audio.TrackSession", false]], "transcodeimage() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.transcodeImage", false]], "transcodejob (class in plexapi.media)": [[15, "plexapi.media.TranscodeJob", false]], "transcodesession (class in plexapi.media)": [[15, "plexapi.media.TranscodeSession", false]], "transcodesessions() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.transcodeSessions", false]], "transportconfig (class in plexapi.transport)": [[26, "plexapi.transport.TransportConfig", false]], "ttl() (plexapi.cache.responsecache method)": [[8, "plexapi.cache.ResponseCache.ttl", false]], "twofactorrequired": [[12, "plexapi.exceptions.TwoFactorRequired", false]], "ultrablurcolors (class in plexapi.media)": [[15, "plexapi.media.UltraBlurColors", false]], "unauthorized": [[12, "plexapi.exceptions.Unauthorized", false]], "unclaim() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.unclaim", false]], "uninstall() (plexapi.metrics.metricscollector method)": [[16, "plexapi.metrics.MetricsCollector.uninstall", false]], "unknowntype": [[12, "plexapi.exceptions.UnknownType", false]], "unlockallfield() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.unlockAllField", false]], "unlockart() (plexapi.mixins.artlockmixin method)": [[17, "plexapi.mixins.ArtLockMixin.unlockArt", false]], "unlocklogo() (plexapi.mixins.logolockmixin method)": [[17, "plexapi.mixins.LogoLockMixin.unlockLogo", false]], "unlockposter() (plexapi.mixins.posterlockmixin method)": [[17, "plexapi.mixins.PosterLockMixin.unlockPoster", false]], "unlocksquareart() (plexapi.mixins.squareartlockmixin method)": [[17, "plexapi.mixins.SquareArtLockMixin.unlockSquareArt", false]], "unlocktheme() (plexapi.mixins.themelockmixin method)": [[17, "plexapi.mixins.ThemeLockMixin.unlockTheme", false]], "unmatch() (plexapi.mixins.unmatchmatchmixin method)": [[17, "plexapi.mixins.UnmatchMatchMixin.unmatch", false]], "unmatchmatchmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.UnmatchMatchMixin", false]], "unsupported": [[12, "plexapi.exceptions.Unsupported", false]], "unwatched() (plexapi.video.season method)": [[28, "plexapi.video.Season.unwatched", false]], "unwatched() (plexapi.video.show method)": [[28, "plexapi.video.Show.unwatched", false]], "update() (plexapi.gdm.gdm method)": [[13, "plexapi.gdm.GDM.update", false]], "update() (plexapi.library.library method)": [[14, "plexapi.library.Library.update", false]], "update() (plexapi.library.librarysection method)": [[14, "plexapi.library.LibrarySection.update", false]], "updatefilters() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.updateFilters", false]], "updatefilters() (plexapi.playlist.playlist method)": [[20, "plexapi.playlist.Playlist.updateFilters", false]], "updatefriend() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.updateFriend", false]], "updateprogress() (plexapi.base.playable method)": [[7, "plexapi.base.Playable.updateProgress", false]], "updatetimeline() (plexapi.base.playable method)": [[7, "plexapi.base.Playable.updateTimeline", false]], "updatevisibility() (plexapi.library.managedhub method)": [[14, "plexapi.library.ManagedHub.updateVisibility", false]], "uploadart() (plexapi.mixins.artmixin method)": [[17, "plexapi.mixins.ArtMixin.uploadArt", false]], "uploadlogo() (plexapi.mixins.logomixin method)": [[17, "plexapi.mixins.LogoMixin.uploadLogo", false]], "uploadposter() (plexapi.mixins.postermixin method)": [[17, "plexapi.mixins.PosterMixin.uploadPoster", false]], "uploadsquareart() (plexapi.mixins.squareartmixin method)": [[17, "plexapi.mixins.SquareArtMixin.uploadSquareArt", false]], "uploadsubtitles() (plexapi.video.video method)": [[28, "plexapi.video.Video.uploadSubtitles", false]], "uploadtheme() (plexapi.mixins.thememixin method)": [[17, "plexapi.mixins.ThemeMixin.uploadTheme", false]], "url() (plexapi.audio.audio method)": [[6, "plexapi.audio.Audio.url", false]], "url() (plexapi.client.plexclient method)": [[9, "plexapi.client.PlexClient.url", false]], "url() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.url", false]], "url() (plexapi.video.video method)": [[28, "plexapi.video.Video.url", false]], "user (plexapi.base.plexsession property)": [[7, "plexapi.base.PlexSession.user", false]], "user() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.user", false]], "userratingmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.UserRatingMixin", false]], "users() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.users", false]], "userstate (class in plexapi.myplex)": [[18, "plexapi.myplex.UserState", false]], "userstate() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.userState", false]], "validators() (plexapi.cache.cacheentry method)": [[8, "plexapi.cache.CacheEntry.validators", false]], "verifyjwt() (plexapi.myplex.myplexjwtlogin method)": [[18, "plexapi.myplex.MyPlexJWTLogin.verifyJWT", false]], "video (class in plexapi.video)": [[28, "plexapi.video.Video", false]], "videoondemand() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.videoOnDemand", false]], "videostream (class in plexapi.media)": [[15, "plexapi.media.VideoStream", false]], "videostreams() (plexapi.base.playable method)": [[7, "plexapi.base.Playable.videoStreams", false]], "videostreams() (plexapi.media.mediapart method)": [[15, "plexapi.media.MediaPart.videoStreams", false]], "viewstatesync (plexapi.myplex.myplexaccount property)": [[18, "plexapi.myplex.MyPlexAccount.viewStateSync", false]], "visibility() (plexapi.collection.collection method)": [[10, "plexapi.collection.Collection.visibility", false]], "waitforlogin() (plexapi.myplex.myplexjwtlogin method)": [[18, "plexapi.myplex.MyPlexJWTLogin.waitForLogin", false]], "waitforlogin() (plexapi.myplex.myplexpinlogin method)": [[18, "plexapi.myplex.MyPlexPinLogin.waitForLogin", false]], "walk() (plexapi.library.path method)": [[14, "plexapi.library.Path.walk", false]], "walk() (plexapi.server.plexserver method)": [[22, "plexapi.server.PlexServer.walk", false]], "watched() (plexapi.video.season method)": [[28, "plexapi.video.Season.watched", false]], "watched() (plexapi.video.show method)": [[28, "plexapi.video.Show.watched", false]], "watchlist() (plexapi.myplex.myplexaccount method)": [[18, "plexapi.myplex.MyPlexAccount.watchlist", false]], "watchlistmixin (class in plexapi.mixins)": [[17, "plexapi.mixins.WatchlistMixin", false]], "writer (class in plexapi.library)": [[14, "plexapi.library.Writer", false]], "writer (class in plexapi.media)": [[15, "plexapi.media.Writer", false]], "writermixin (class in plexapi.mixins)": [[17, "plexapi.mixins.WriterMixin", false]]}, "objects": {"plexapi": [[4, 0, 0, "-", "aio"], [5, 0, 0, "-", "alert"], [6, 0, 0, "-", "audio"], [7, 0, 0, "-", "base"], [8, 0, 0, "-", "cache"], [9, 0, 0, "-", "client"], [10, 0, 0, "-", "collection"], [11, 0, 0, "-", "config"], [12, 0, 0, "-", "exceptions"], [13, 0, 0, "-", "gdm"], [14, 0, 0, "-", "library"], [15, 0, 0, "-", "media"], [16, 0, 0, "-", "metrics"], [17, 0, 0, "-", "mixins"], [18, 0, 0, "-", "myplex"], [19, 0, 0, "-", "photo"], [20, 0, 0, "-", "playlist"], [21, 0, 0, "-", "playqueue"], [22, 0, 0, "-", "server"], [23, 0, 0, "-", "settings"], [24, 0, 0, "-", "sonos"], [25, 0, 0, "-", "sync"], [26, 0, 0, "-", "transport"], [27, 0, 0, "-", "utils"], [28, 0, 0, "-", "video"]], "plexapi.aio": [[4, 1, 1, "", "AsyncLibrary"], [4, 1, 1, "", "AsyncLibrarySection"], [4, 1, 1, "", "AsyncPlexServer"]], "plexapi.aio.AsyncLibrary": [[4, 2, 1, "", "section"], [4, 2, 1, "", "sectionByID"], [4, 2, 1, "", "sections"]], "plexapi.aio.AsyncLibrarySection": [[4, 2, 1, "", "all"], [4, 2, 1, "", "get"], [4, 2, 1, "", "search"], [4, 3, 1, "", "section"]], "plexapi.aio.AsyncPlexServer": [[4, 2, 1, "", "close"], [4, 2, 1, "", "connect"], [4, 2, 1, "", "fetchItem"], [4, 2, 1, "", "fetchItems"], [4, 3, 1, "", "library"], [4, 2, 1, "", "query"], [4, 3, 1, "", "server"]], "plexapi.alert": [[5, 1, 1, "", "AlertListener"]], "plexapi.alert.AlertListener": [[5, 2, 1, "", "run"], [5, 2, 1, "", "stop"]], "plexapi.audio": [[6, 1, 1, "", "Album"], [6, 1, 1, "", "Artist"], [6, 1, 1, "", "Audio"], [6, 1, 1, "", "Track"], [6, 1, 1, "", "TrackHistory"], [6, 1, 1, "", "TrackSession"]], "plexapi.audio.Album": [[6, 2, 1, "", "artist"], [6, 2, 1, "", "download"], [6, 2, 1, "", "get"], [6, 3, 1, "", "metadataDirectory"], [6, 2, 1, "", "track"], [6, 2, 1, "", "tracks"]], "plexapi.audio.Artist": [[6, 2, 1, "", "album"], [6, 2, 1, "", "albums"], [6, 2, 1, "", "download"], [6, 2, 1, "", "get"], [6, 3, 1, "", "metadataDirectory"], [6, 2, 1, "", "popularTracks"], [6, 2, 1, "", "station"], [6, 2, 1, "", "track"], [6, 2, 1, "", "tracks"]], "plexapi.audio.Audio": [[6, 3, 1, "", "hasSonicAnalysis"], [6, 2, 1, "", "sonicallySimilar"], [6, 2, 1, "", "sync"], [6, 2, 1, "", "url"]], "plexapi.audio.Track": [[6, 2, 1, "", "album"], [6, 2, 1, "", "artist"], [6, 3, 1, "", "locations"], [6, 3, 1, "", "metadataDirectory"], [6, 2, 1, "", "sonicAdventure"], [6, 3, 1, "", "trackNumber"]], "plexapi.base": [[7, 1, 1, "", "MediaContainer"], [7, 1, 1, "", "Playable"], [7, 1, 1, "", "PlexHistory"], [7, 1, 1, "", "PlexObject"], [7, 1, 1, "", "PlexObjectMeta"], [7, 1, 1, "", "PlexPartialObject"], [7, 1, 1, "", "PlexSession"], [7, 1, 1, "", "cached_data_property"], [7, 1, 1, "", "data_field"]], "plexapi.base.MediaContainer": [[7, 2, 1, "", "extend"]], "plexapi.base.Playable": [[7, 2, 1, "", "audioStreams"], [7, 2, 1, "", "download"], [7, 2, 1, "", "getStreamURL"], [7, 2, 1, "", "iterParts"], [7, 2, 1, "", "lyricStreams"], [7, 2, 1, "", "play"], [7, 2, 1, "", "subtitleStreams"], [7, 2, 1, "", "updateProgress"], [7, 2, 1, "", "updateTimeline"], [7, 2, 1, "", "videoStreams"]], "plexapi.base.PlexHistory": [[7, 2, 1, "", "delete"], [7, 2, 1, "", "source"]], "plexapi.base.PlexObject": [[7, 2, 1, "", "fetchItem"], [7, 2, 1, "", "fetchItems"], [7, 2, 1, "", "findItem"], [7, 2, 1, "", "findItems"], [7, 2, 1, "", "firstAttr"], [7, 2, 1, "", "iterItems"], [7, 2, 1, "", "listAttrs"], [7, 2, 1, "", "reload"], [7, 2, 1, "", "streamItems"]], "plexapi.base.PlexPartialObject": [[7, 2, 1, "", "analyze"], [7, 2, 1, "", "batchEdits"], [7, 2, 1, "", "delete"], [7, 2, 1, "", "edit"], [7, 2, 1, "", "getWebURL"], [7, 2, 1, "", "history"], [7, 2, 1, "", "isFullObject"], [7, 2, 1, "", "isLocked"], [7, 2, 1, "", "isPartialObject"], [7, 2, 1, "", "playQueue"], [7, 2, 1, "", "refresh"], [7, 2, 1, "", "saveEdits"], [7, 2, 1, "", "section"]], "plexapi.base.PlexSession": [[7, 2, 1, "", "reload"], [7, 2, 1, "", "source"], [7, 2, 1, "", "stop"], [7, 3, 1, "", "user"]], "plexapi.base.data_field": [[7, 2, 1, "", "decode"]], "plexapi.cache": [[8, 1, 1, "", "CacheEntry"], [8, 1, 1, "", "DiskCache"], [8, 1, 1, "", "MemoryCache"], [8, 1, 1, "", "ResponseCache"]], "plexapi.cache.CacheEntry": [[8, 2, 1, "", "isFresh"], [8, 2, 1, "", "validators"]], "plexapi.cache.DiskCache": [[8, 2, 1, "", "clear"], [8, 2, 1, "", "delete"], [8, 2, 1, "", "get"], [8, 2, 1, "", "set"]], "plexapi.cache.MemoryCache": [[8, 2, 1, "", "clear"], [8, 2, 1, "", "delete"], [8, 2, 1, "", "get"], [8, 2, 1, "", "set"]], "plexapi.cache.ResponseCache": [[8, 2, 1, "", "cacheKey"], [8, 2, 1, "", "clear"], [8, 2, 1, "", "data"], [8, 2, 1, "", "get"], [8, 2, 1, "", "refresh"], [8, 2, 1, "", "set"], [8, 2, 1, "", "ttl"]], "plexapi.client": [[9, 1, 1, "", "ClientTimeline"], [9, 1, 1, "", "PlexClient"]], "plexapi.client.PlexClient": [[9, 2, 1, "", "connect"], [9, 2, 1, "", "contextMenu"], [9, 2, 1, "", "createPlayQueue"], [9, 2, 1, "", "goBack"], [9, 2, 1, "", "goToHome"], [9, 2, 1, "", "goToMedia"], [9, 2, 1, "", "goToMusic"], [9, 2, 1, "", "isPlayingMedia"], [9, 2, 1, "", "moveDown"], [9, 2, 1, "", "moveLeft"], [9, 2, 1, "", "moveRight"], [9, 2, 1, "", "moveUp"], [9, 2, 1, "", "nextLetter"], [9, 2, 1, "", "pageDown"], [9, 2, 1, "", "pageUp"], [9, 2, 1, "", "pause"], [9, 2, 1, "", "play"], [9, 2, 1, "", "playMedia"], [9, 2, 1, "", "previousLetter"], [9, 2, 1, "", "proxyThroughServer"], [9, 2, 1, "", "query"], [9, 2, 1, "", "refreshPlayQueue"], [9, 2, 1, "", "reload"], [9, 2, 1, "", "seekTo"], [9, 2, 1, "", "select"], [9, 2, 1, "", "sendCommand"], [9, 2, 1, "", "setAudioStream"], [9, 2, 1, "", "setParameters"], [9, 2, 1, "", "setRepeat"], [9, 2, 1, "", "setShuffle"], [9, 2, 1, "", "setStreams"], [9, 2, 1, "", "setSubtitleStream"], [9, 2, 1, "", "setVideoStream"], [9, 2, 1, "", "setVolume"], [9, 2, 1, "", "skipNext"], [9, 2, 1, "", "skipPrevious"], [9, 2, 1, "", "skipTo"], [9, 2, 1, "", "stepBack"], [9, 2, 1, "", "stepForward"], [9, 2, 1, "", "stop"], [9, 3, 1, "", "timeline"], [9, 2, 1, "", "timelines"], [9, 2, 1, "", "toggleOSD"], [9, 2, 1, "", "url"]], "plexapi.collection": [[10, 1, 1, "", "Collection"]], "plexapi.collection.Collection": [[10, 2, 1, "", "addItems"], [10, 2, 1, "", "create"], [10, 2, 1, "", "delete"], [10, 2, 1, "", "filterUserUpdate"], [10, 2, 1, "", "filters"], [10, 2, 1, "", "get"], [10, 3, 1, "", "isAudio"], [10, 3, 1, "", "isPhoto"], [10, 3, 1, "", "isVideo"], [10, 2, 1, "", "item"], [10, 2, 1, "", "items"], [10, 3, 1, "", "listType"], [10, 3, 1, "", "metadataDirectory"], [10, 3, 1, "", "metadataType"], [10, 2, 1, "", "modeUpdate"], [10, 2, 1, "", "moveItem"], [10, 2, 1, "", "removeItems"], [10, 2, 1, "", "section"], [10, 2, 1, "", "sortUpdate"], [10, 2, 1, "", "sync"], [10, 2, 1, "", "updateFilters"], [10, 2, 1, "", "visibility"]], "plexapi.config": [[11, 1, 1, "", "PlexConfig"], [11, 4, 1, "", "reset_base_headers"]], "plexapi.config.PlexConfig": [[11, 2, 1, "", "get"]], "plexapi.exceptions": [[12, 5, 1, "", "BadRequest"], [12, 5, 1, "", "NotFound"], [12, 5, 1, "", "PlexApiException"], [12, 5, 1, "", "TwoFactorRequired"], [12, 5, 1, "", "Unauthorized"], [12, 5, 1, "", "UnknownType"], [12, 5, 1, "", "Unsupported"]], "plexapi.gdm": [[13, 1, 1, "", "GDM"], [13, 4, 1, "", "main"]], "plexapi.gdm.GDM": [[13, 2, 1, "", "all"], [13, 2, 1, "", "find_by_content_type"], [13, 2, 1, "", "find_by_data"], [13, 2, 1, "", "scan"], [13, 2, 1, "", "update"]], "plexapi.library": [[14, 1, 1, "", "Aperture"], [14, 1, 1, "", "Art"], [14, 1, 1, "", "Autotag"], [14, 1, 1, "", "Chapter"], [14, 1, 1, "", "Collection"], [14, 1, 1, "", "Common"], [14, 1, 1, "", "Concert"], [14, 1, 1, "", "Country"], [14, 1, 1, "", "Device"], [14, 1, 1, "", "Director"], [14, 1, 1, "", "Exposure"], [14, 1, 1, "", "File"], [14, 1, 1, "", "FilterChoice"], [14, 1, 1, "", "FilteringField"], [14, 1, 1, "", "FilteringFieldType"], [14, 1, 1, "", "FilteringFilter"], [14, 1, 1, "", "FilteringOperator"], [14, 1, 1, "", "FilteringSort"], [14, 1, 1, "", "FilteringType"], [14, 1, 1, "", "FirstCharacter"], [14, 1, 1, "", "Folder"], [14, 1, 1, "", "Format"], [14, 1, 1, "", "Genre"], [14, 1, 1, "", "Guid"], [14, 1, 1, "", "Hub"], [14, 1, 1, "", "ISO"], [14, 1, 1, "", "Label"], [14, 1, 1, "", "Lens"], [14, 1, 1, "", "Library"], [14, 1, 1, "", "LibraryMediaTag"], [14, 1, 1, "", "LibrarySection"], [14, 1, 1, "", "LibraryTimeline"], [14, 1, 1, "", "Location"], [14, 1, 1, "", "Make"], [14, 1, 1, "", "ManagedHub"], [14, 1, 1, "", "Marker"], [14, 1, 1, "", "MediaProcessingTarget"], [14, 1, 1, "", "Model"], [14, 1, 1, "", "Mood"], [14, 1, 1, "", "MovieSection"], [14, 1, 1, "", "MusicSection"], [14, 1, 1, "", "Network"], [14, 1, 1, "", "Path"], [14, 1, 1, "", "PhotoSection"], [14, 1, 1, "", "Place"], [14, 1, 1, "", "Poster"], [14, 1, 1, "", "Producer"], [14, 1, 1, "", "RatingImage"], [14, 1, 1, "", "Review"], [14, 1, 1, "", "Role"], [14, 1, 1, "", "ShowSection"], [14, 1, 1, "", "Similar"], [14, 1, 1, "", "Studio"], [14, 1, 1, "", "Style"], [14, 1, 1, "", "Tag"], [14, 1, 1, "", "Theme"], [14, 1, 1, "", "Writer"]], "plexapi.library.Common": [[14, 3, 1, "", "commonType"], [14, 2, 1, "", "items"], [14, 3, 1, "", "ratingKeys"]], "plexapi.library.FilterChoice": [[14, 2, 1, "", "items"]], "plexapi.library.Folder": [[14, 2, 1, "", "allSubfolders"], [14, 2, 1, "", "subfolders"]], "plexapi.library.Hub": [[14, 2, 1, "", "items"], [14, 2, 1, "", "section"]], "plexapi.library.Library": [[14, 2, 1, "", "add"], [14, 2, 1, "", "all"], [14, 2, 1, "", "cancelUpdate"], [14, 2, 1, "", "cleanBundles"], [14, 2, 1, "", "deleteMediaPreviews"], [14, 2, 1, "", "emptyTrash"], [14, 2, 1, "", "history"], [14, 2, 1, "", "hubs"], [14, 2, 1, "", "onDeck"], [14, 2, 1, "", "optimize"], [14, 2, 1, "", "recentlyAdded"], [14, 2, 1, "", "refresh"], [14, 2, 1, "", "search"], [14, 2, 1, "", "section"], [14, 2, 1, "", "sectionByID"], [14, 2, 1, "", "sections"], [14, 2, 1, "", "tags"], [14, 2, 1, "", "update"]], "plexapi.library.LibraryMediaTag": [[14, 2, 1, "", "items"]], "plexapi.library.LibrarySection": [[14, 2, 1, "", "addLocations"], [14, 2, 1, "", "agents"], [14, 2, 1, "", "all"], [14, 2, 1, "", "analyze"], [14, 2, 1, "", "batchMultiEdits"], [14, 2, 1, "", "cancelUpdate"], [14, 2, 1, "", "collection"], [14, 2, 1, "", "collections"], [14, 2, 1, "", "common"], [14, 2, 1, "", "continueWatching"], [14, 2, 1, "", "createCollection"], [14, 2, 1, "", "createPlaylist"], [14, 2, 1, "", "defaultAdvanced"], [14, 2, 1, "", "delete"], [14, 2, 1, "", "deleteMediaPreviews"], [14, 2, 1, "", "edit"], [14, 2, 1, "", "editAdvanced"], [14, 2, 1, "", "emptyTrash"], [14, 2, 1, "", "fieldTypes"], [14, 2, 1, "", "filterTypes"], [14, 2, 1, "", "folders"], [14, 2, 1, "", "get"], [14, 2, 1, "", "getFieldType"], [14, 2, 1, "", "getFilterType"], [14, 2, 1, "", "getGuid"], [14, 2, 1, "", "getWebURL"], [14, 2, 1, "", "history"], [14, 2, 1, "", "hubSearch"], [14, 2, 1, "", "hubs"], [14, 2, 1, "", "iterSearch"], [14, 2, 1, "", "listFields"], [14, 2, 1, "", "listFilterChoices"], [14, 2, 1, "", "listFilters"], [14, 2, 1, "", "listOperators"], [14, 2, 1, "", "listSorts"], [14, 2, 1, "", "lockAllField"], [14, 2, 1, "", "managedHubs"], [14, 2, 1, "", "multiEdit"], [14, 2, 1, "", "onDeck"], [14, 2, 1, "", "playlist"], [14, 2, 1, "", "playlists"], [14, 2, 1, "", "recentlyAdded"], [14, 2, 1, "", "refresh"], [14, 2, 1, "", "removeLocations"], [14, 2, 1, "", "resetManagedHubs"], [14, 2, 1, "", "saveMultiEdits"], [14, 2, 1, "", "search"], [14, 2, 1, "", "settings"], [14, 2, 1, "", "sync"], [14, 2, 1, "", "timeline"], [14, 3, 1, "", "totalDuration"], [14, 3, 1, "", "totalSize"], [14, 3, 1, "", "totalStorage"], [14, 2, 1, "", "totalViewSize"], [14, 2, 1, "", "unlockAllField"], [14, 2, 1, "", "update"]], "plexapi.library.ManagedHub": [[14, 2, 1, "", "demoteHome"], [14, 2, 1, "", "demoteRecommended"], [14, 2, 1, "", "demoteShared"], [14, 2, 1, "", "move"], [14, 2, 1, "", "promoteHome"], [14, 2, 1, "", "promoteRecommended"], [14, 2, 1, "", "promoteShared"], [14, 2, 1, "", "remove"], [14, 2, 1, "", "updateVisibility"]], "plexapi.library.MovieSection": [[14, 2, 1, "", "recentlyAddedMovies"], [14, 2, 1, "", "searchMovies"], [14, 2, 1, "", "sync"]], "plexapi.library.MusicSection": [[14, 2, 1, "", "albums"], [14, 2, 1, "", "recentlyAddedAlbums"], [14, 2, 1, "", "recentlyAddedArtists"], [14, 2, 1, "", "recentlyAddedTracks"], [14, 2, 1, "", "searchAlbums"], [14, 2, 1, "", "searchArtists"], [14, 2, 1, "", "searchTracks"], [14, 2, 1, "", "sonicAdventure"], [14, 2, 1, "", "stations"], [14, 2, 1, "", "sync"]], "plexapi.library.Path": [[14, 2, 1, "", "browse"], [14, 2, 1, "", "walk"]], "plexapi.library.PhotoSection": [[14, 2, 1, "", "all"], [14, 2, 1, "", "collections"], [14, 2, 1, "", "recentlyAddedAlbums"], [14, 2, 1, "", "searchAlbums"], [14, 2, 1, "", "searchPhotos"], [14, 2, 1, "", "sync"]], "plexapi.library.ShowSection": [[14, 2, 1, "", "recentlyAddedEpisodes"], [14, 2, 1, "", "recentlyAddedSeasons"], [14, 2, 1, "", "recentlyAddedShows"], [14, 2, 1, "", "searchEpisodes"], [14, 2, 1, "", "searchSeasons"], [14, 2, 1, "", "searchShows"], [14, 2, 1, "", "sync"]], "plexapi.media": [[15, 1, 1, "", "AgeRating"], [15, 1, 1, "", "Agent"], [15, 1, 1, "", "AgentMediaType"], [15, 1, 1, "", "Art"], [15, 1, 1, "", "AudioStream"], [15, 1, 1, "", "Availability"], [15, 1, 1, "", "BaseResource"], [15, 1, 1, "", "Chapter"], [15, 1, 1, "", "Collection"], [15, 1, 1, "", "CommonSenseMedia"], [15, 1, 1, "", "Conversion"], [15, 1, 1, "", "Country"], [15, 1, 1, "", "Director"], [15, 1, 1, "", "Field"], [15, 1, 1, "", "Format"], [15, 1, 1, "", "Genre"], [15, 1, 1, "", "Guid"], [15, 1, 1, "", "Image"], [15, 1, 1, "", "Label"], [15, 1, 1, "", "Level"], [15, 1, 1, "", "Logo"], [15, 1, 1, "", "LyricStream"], [15, 1, 1, "", "Marker"], [15, 1, 1, "", "Media"], [15, 1, 1, "", "MediaPart"], [15, 1, 1, "", "MediaPartStream"], [15, 1, 1, "", "MediaTag"], [15, 1, 1, "", "Mood"], [15, 1, 1, "", "Optimized"], [15, 1, 1, "", "ParentalAdvisoryTopic"], [15, 1, 1, "", "Poster"], [15, 1, 1, "", "Producer"], [15, 1, 1, "", "Rating"], [15, 1, 1, "", "Review"], [15, 1, 1, "", "Role"], [15, 1, 1, "", "SearchResult"], [15, 1, 1, "", "Session"], [15, 1, 1, "", "Similar"], [15, 1, 1, "", "SquareArt"], [15, 1, 1, "", "Style"], [15, 1, 1, "", "Subformat"], [15, 1, 1, "", "SubtitleStream"], [15, 1, 1, "", "Tag"], [15, 1, 1, "", "TalkingPoint"], [15, 1, 1, "", "Theme"], [15, 1, 1, "", "TranscodeJob"], [15, 1, 1, "", "TranscodeSession"], [15, 1, 1, "", "UltraBlurColors"], [15, 1, 1, "", "VideoStream"], [15, 1, 1, "", "Writer"]], "plexapi.media.AudioStream": [[15, 2, 1, "", "levels"], [15, 2, 1, "", "setSelected"]], "plexapi.media.BaseResource": [[15, 3, 1, "", "resourceFilepath"]], "plexapi.media.Collection": [[15, 2, 1, "", "collection"]], "plexapi.media.Conversion": [[15, 2, 1, "", "move"], [15, 2, 1, "", "remove"]], "plexapi.media.Marker": [[15, 3, 1, "", "first"]], "plexapi.media.Media": [[15, 3, 1, "", "isOptimizedVersion"]], "plexapi.media.MediaPart": [[15, 2, 1, "", "audioStreams"], [15, 3, 1, "", "hasPreviewThumbnails"], [15, 2, 1, "", "lyricStreams"], [15, 2, 1, "", "resetSelectedSubtitleStream"], [15, 2, 1, "", "setSelectedAudioStream"], [15, 2, 1, "", "setSelectedSubtitleStream"], [15, 2, 1, "", "subtitleStreams"], [15, 2, 1, "", "videoStreams"]], "plexapi.media.MediaTag": [[15, 2, 1, "", "items"]], "plexapi.media.Optimized": [[15, 2, 1, "", "items"], [15, 2, 1, "", "remove"], [15, 2, 1, "", "rename"], [15, 2, 1, "", "reprocess"]], "plexapi.media.SubtitleStream": [[15, 2, 1, "", "setSelected"]], "plexapi.metrics": [[16, 1, 1, "", "FetchEvent"], [16, 1, 1, "", "Histogram"], [16, 1, 1, "", "MetricsCollector"], [16, 1, 1, "", "QueryEvent"], [16, 4, 1, "", "addListener"], [16, 4, 1, "", "emit"], [16, 4, 1, "", "enabled"], [16, 4, 1, "", "endpointTemplate"], [16, 4, 1, "", "recordBuild"], [16, 4, 1, "", "removeListener"]], "plexapi.metrics.Histogram": [[16, 3, 1, "", "mean"], [16, 2, 1, "", "observe"], [16, 2, 1, "", "quantile"], [16, 2, 1, "", "toDict"]], "plexapi.metrics.MetricsCollector": [[16, 2, 1, "", "install"], [16, 2, 1, "", "reset"], [16, 2, 1, "", "snapshot"], [16, 2, 1, "", "toPrometheus"], [16, 2, 1, "", "uninstall"]], "plexapi.metrics.QueryEvent": [[16, 2, 1, "", "parse"], [16, 2, 1, "", "received"]], "plexapi.mixins": [[17, 1, 1, "", "AddedAtMixin"], [17, 1, 1, "", "AdvancedSettingsMixin"], [17, 1, 1, "", "AlbumEditMixins"], [17, 1, 1, "", "AlbumMixins"], [17, 1, 1, "", "ArtLockMixin"], [17, 1, 1, "", "ArtMixin"], [17, 1, 1, "", "ArtUrlMixin"], [17, 1, 1, "", "ArtistEditMixins"], [17, 1, 1, "", "ArtistMixins"], [17, 1, 1, "", "AudienceRatingMixin"], [17, 1, 1, "", "ClipMixins"], [17, 1, 1, "", "CollectionEditMixins"], [17, 1, 1, "", "CollectionMixin"], [17, 1, 1, "", "CollectionMixins"], [17, 1, 1, "", "ContentRatingMixin"], [17, 1, 1, "", "CountryMixin"], [17, 1, 1, "", "CriticRatingMixin"], [17, 1, 1, "", "DirectorMixin"], [17, 1, 1, "", "EditFieldMixin"], [17, 1, 1, "", "EditTagsMixin"], [17, 1, 1, "", "EditionTitleMixin"], [17, 1, 1, "", "EpisodeEditMixins"], [17, 1, 1, "", "EpisodeMixins"], [17, 1, 1, "", "ExtrasMixin"], [17, 1, 1, "", "GenreMixin"], [17, 1, 1, "", "HubsMixin"], [17, 1, 1, "", "LabelMixin"], [17, 1, 1, "", "LogoLockMixin"], [17, 1, 1, "", "LogoMixin"], [17, 1, 1, "", "LogoUrlMixin"], [17, 1, 1, "", "MoodMixin"], [17, 1, 1, "", "MovieEditMixins"], [17, 1, 1, "", "MovieMixins"], [17, 1, 1, "", "OriginalTitleMixin"], [17, 1, 1, "", "OriginallyAvailableMixin"], [17, 1, 1, "", "PhotoCapturedTimeMixin"], [17, 1, 1, "", "PhotoEditMixins"], [17, 1, 1, "", "PhotoMixins"], [17, 1, 1, "", "PhotoalbumEditMixins"], [17, 1, 1, "", "PhotoalbumMixins"], [17, 1, 1, "", "PlayedUnplayedMixin"], [17, 1, 1, "", "PlaylistEditMixins"], [17, 1, 1, "", "PlaylistMixins"], [17, 1, 1, "", "PosterLockMixin"], [17, 1, 1, "", "PosterMixin"], [17, 1, 1, "", "PosterUrlMixin"], [17, 1, 1, "", "ProducerMixin"], [17, 1, 1, "", "RatingMixin"], [17, 1, 1, "", "SeasonEditMixins"], [17, 1, 1, "", "SeasonMixins"], [17, 1, 1, "", "ShowEditMixins"], [17, 1, 1, "", "ShowMixins"], [17, 1, 1, "", "SimilarArtistMixin"], [17, 1, 1, "", "SmartFilterMixin"], [17, 1, 1, "", "SortTitleMixin"], [17, 1, 1, "", "SplitMergeMixin"], [17, 1, 1, "", "SquareArtLockMixin"], [17, 1, 1, "", "SquareArtMixin"], [17, 1, 1, "", "SquareArtUrlMixin"], [17, 1, 1, "", "StudioMixin"], [17, 1, 1, "", "StyleMixin"], [17, 1, 1, "", "SummaryMixin"], [17, 1, 1, "", "TagMixin"], [17, 1, 1, "", "TaglineMixin"], [17, 1, 1, "", "ThemeLockMixin"], [17, 1, 1, "", "ThemeMixin"], [17, 1, 1, "", "ThemeUrlMixin"], [17, 1, 1, "", "TitleMixin"], [17, 1, 1, "", "TrackArtistMixin"], [17, 1, 1, "", "TrackDiscNumberMixin"], [17, 1, 1, "", "TrackEditMixins"], [17, 1, 1, "", "TrackMixins"], [17, 1, 1, "", "TrackNumberMixin"], [17, 1, 1, "", "UnmatchMatchMixin"], [17, 1, 1, "", "UserRatingMixin"], [17, 1, 1, "", "WatchlistMixin"], [17, 1, 1, "", "WriterMixin"]], "plexapi.mixins.AddedAtMixin": [[17, 2, 1, "", "editAddedAt"]], "plexapi.mixins.AdvancedSettingsMixin": [[17, 2, 1, "", "defaultAdvanced"], [17, 2, 1, "", "editAdvanced"], [17, 2, 1, "", "preference"], [17, 2, 1, "", "preferences"]], "plexapi.mixins.ArtLockMixin": [[17, 2, 1, "", "lockArt"], [17, 2, 1, "", "unlockArt"]], "plexapi.mixins.ArtMixin": [[17, 2, 1, "", "arts"], [17, 2, 1, "", "deleteArt"], [17, 2, 1, "", "setArt"], [17, 2, 1, "", "uploadArt"]], "plexapi.mixins.ArtUrlMixin": [[17, 3, 1, "", "artUrl"]], "plexapi.mixins.AudienceRatingMixin": [[17, 2, 1, "", "editAudienceRating"]], "plexapi.mixins.CollectionMixin": [[17, 2, 1, "", "addCollection"], [17, 2, 1, "", "removeCollection"]], "plexapi.mixins.ContentRatingMixin": [[17, 2, 1, "", "editContentRating"]], "plexapi.mixins.CountryMixin": [[17, 2, 1, "", "addCountry"], [17, 2, 1, "", "removeCountry"]], "plexapi.mixins.CriticRatingMixin": [[17, 2, 1, "", "editCriticRating"]], "plexapi.mixins.DirectorMixin": [[17, 2, 1, "", "addDirector"], [17, 2, 1, "", "removeDirector"]], "plexapi.mixins.EditFieldMixin": [[17, 2, 1, "", "editField"]], "plexapi.mixins.EditTagsMixin": [[17, 2, 1, "", "editTags"]], "plexapi.mixins.EditionTitleMixin": [[17, 2, 1, "", "editEditionTitle"]], "plexapi.mixins.ExtrasMixin": [[17, 2, 1, "", "extras"]], "plexapi.mixins.GenreMixin": [[17, 2, 1, "", "addGenre"], [17, 2, 1, "", "removeGenre"]], "plexapi.mixins.HubsMixin": [[17, 2, 1, "", "hubs"]], "plexapi.mixins.LabelMixin": [[17, 2, 1, "", "addLabel"], [17, 2, 1, "", "removeLabel"]], "plexapi.mixins.LogoLockMixin": [[17, 2, 1, "", "lockLogo"], [17, 2, 1, "", "unlockLogo"]], "plexapi.mixins.LogoMixin": [[17, 2, 1, "", "deleteLogo"], [17, 2, 1, "", "logos"], [17, 2, 1, "", "setLogo"], [17, 2, 1, "", "uploadLogo"]], "plexapi.mixins.LogoUrlMixin": [[17, 3, 1, "", "logo"], [17, 3, 1, "", "logoUrl"]], "plexapi.mixins.MoodMixin": [[17, 2, 1, "", "addMood"], [17, 2, 1, "", "removeMood"]], "plexapi.mixins.OriginalTitleMixin": [[17, 2, 1, "", "editOriginalTitle"]], "plexapi.mixins.OriginallyAvailableMixin": [[17, 2, 1, "", "editOriginallyAvailable"]], "plexapi.mixins.PhotoCapturedTimeMixin": [[17, 2, 1, "", "editCapturedTime"]], "plexapi.mixins.PlayedUnplayedMixin": [[17, 3, 1, "", "isPlayed"], [17, 3, 1, "", "isWatched"], [17, 2, 1, "", "markPlayed"], [17, 2, 1, "", "markUnplayed"], [17, 2, 1, "", "markUnwatched"], [17, 2, 1, "", "markWatched"]], "plexapi.mixins.PosterLockMixin": [[17, 2, 1, "", "lockPoster"], [17, 2, 1, "", "unlockPoster"]], "plexapi.mixins.PosterMixin": [[17, 2, 1, "", "deletePoster"], [17, 2, 1, "", "posters"], [17, 2, 1, "", "setPoster"], [17, 2, 1, "", "uploadPoster"]], "plexapi.mixins.PosterUrlMixin": [[17, 3, 1, "", "posterUrl"], [17, 3, 1, "", "thumbUrl"]], "plexapi.mixins.ProducerMixin": [[17, 2, 1, "", "addProducer"], [17, 2, 1, "", "removeProducer"]], "plexapi.mixins.RatingMixin": [[17, 2, 1, "", "rate"]], "plexapi.mixins.SimilarArtistMixin": [[17, 2, 1, "", "addSimilarArtist"], [17, 2, 1, "", "removeSimilarArtist"]], "plexapi.mixins.SortTitleMixin": [[17, 2, 1, "", "editSortTitle"]], "plexapi.mixins.SplitMergeMixin": [[17, 2, 1, "", "merge"], [17, 2, 1, "", "split"]], "plexapi.mixins.SquareArtLockMixin": [[17, 2, 1, "", "lockSquareArt"], [17, 2, 1, "", "unlockSquareArt"]], "plexapi.mixins.SquareArtMixin": [[17, 2, 1, "", "deleteSquareArt"], [17, 2, 1, "", "setSquareArt"], [17, 2, 1, "", "squareArts"], [17, 2, 1, "", "uploadSquareArt"]], "plexapi.mixins.SquareArtUrlMixin": [[17, 3, 1, "", "squareArt"], [17, 3, 1, "", "squareArtUrl"]], "plexapi.mixins.StudioMixin": [[17, 2, 1, "", "editStudio"]], "plexapi.mixins.StyleMixin": [[17, 2, 1, "", "addStyle"], [17, 2, 1, "", "removeStyle"]], "plexapi.mixins.SummaryMixin": [[17, 2, 1, "", "editSummary"]], "plexapi.mixins.TagMixin": [[17, 2, 1, "", "addTag"], [17, 2, 1, "", "removeTag"]], "plexapi.mixins.TaglineMixin": [[17, 2, 1, "", "editTagline"]], "plexapi.mixins.ThemeLockMixin": [[17, 2, 1, "", "lockTheme"], [17, 2, 1, "", "unlockTheme"]], "plexapi.mixins.ThemeMixin": [[17, 2, 1, "", "deleteTheme"], [17, 2, 1, "", "setTheme"], [17, 2, 1, "", "themes"], [17, 2, 1, "", "uploadTheme"]], "plexapi.mixins.ThemeUrlMixin": [[17, 3, 1, "", "themeUrl"]], "plexapi.mixins.TitleMixin": [[17, 2, 1, "", "editTitle"]], "plexapi.mixins.TrackArtistMixin": [[17, 2, 1, "", "editTrackArtist"]], "plexapi.mixins.TrackDiscNumberMixin": [[17, 2, 1, "", "editDiscNumber"]], "plexapi.mixins.TrackNumberMixin": [[17, 2, 1, "", "editTrackNumber"]], "plexapi.mixins.UnmatchMatchMixin": [[17, 2, 1, "", "fixMatch"], [17, 2, 1, "", "matches"], [17, 2, 1, "", "unmatch"]], "plexapi.mixins.UserRatingMixin": [[17, 2, 1, "", "editUserRating"]], "plexapi.mixins.WatchlistMixin": [[17, 2, 1, "", "addToWatchlist"], [17, 2, 1, "", "onWatchlist"], [17, 2, 1, "", "removeFromWatchlist"], [17, 2, 1, "", "streamingServices"]], "plexapi.mixins.WriterMixin": [[17, 2, 1, "", "addWriter"], [17, 2, 1, "", "removeWriter"]], "plexapi.myplex": [[18, 1, 1, "", "AccountOptOut"], [18, 1, 1, "", "GeoLocation"], [18, 1, 1, "", "MyPlexAccount"], [18, 1, 1, "", "MyPlexDevice"], [18, 1, 1, "", "MyPlexInvite"], [18, 1, 1, "", "MyPlexJWTLogin"], [18, 1, 1, "", "MyPlexPinLogin"], [18, 1, 1, "", "MyPlexResource"], [18, 1, 1, "", "MyPlexServerShare"], [18, 1, 1, "", "MyPlexUser"], [18, 1, 1, "", "ResourceConnection"], [18, 1, 1, "", "Section"], [18, 1, 1, "", "UserState"]], "plexapi.myplex.AccountOptOut": [[18, 2, 1, "", "optIn"], [18, 2, 1, "", "optOut"], [18, 2, 1, "", "optOutManaged"]], "plexapi.myplex.MyPlexAccount": [[18, 2, 1, "", "acceptInvite"], [18, 2, 1, "", "addToWatchlist"], [18, 3, 1, "", "authenticationToken"], [18, 2, 1, "", "cancelInvite"], [18, 2, 1, "", "claimToken"], [18, 2, 1, "", "createExistingUser"], [18, 2, 1, "", "createHomeUser"], [18, 2, 1, "", "device"], [18, 2, 1, "", "devices"], [18, 2, 1, "", "disableViewStateSync"], [18, 2, 1, "", "enableViewStateSync"], [18, 2, 1, "", "geoip"], [18, 2, 1, "", "history"], [18, 2, 1, "", "inviteFriend"], [18, 2, 1, "", "isPlayed"], [18, 2, 1, "", "link"], [18, 2, 1, "", "markPlayed"], [18, 2, 1, "", "markUnplayed"], [18, 2, 1, "", "onWatchlist"], [18, 2, 1, "", "onlineMediaSources"], [18, 2, 1, "", "optOut"], [18, 2, 1, "", "pendingInvite"], [18, 2, 1, "", "pendingInvites"], [18, 2, 1, "", "ping"], [18, 2, 1, "", "publicIP"], [18, 2, 1, "", "removeFriend"], [18, 2, 1, "", "removeFromWatchlist"], [18, 2, 1, "", "removeHomeUser"], [18, 2, 1, "", "removeManagedUserPin"], [18, 2, 1, "", "removePin"], [18, 2, 1, "", "resource"], [18, 2, 1, "", "resources"], [18, 2, 1, "", "searchDiscover"], [18, 2, 1, "", "setManagedUserPin"], [18, 2, 1, "", "setPin"], [18, 2, 1, "", "signout"], [18, 2, 1, "", "switchHomeUser"], [18, 2, 1, "", "sync"], [18, 2, 1, "", "syncItems"], [18, 2, 1, "", "tidal"], [18, 2, 1, "", "updateFriend"], [18, 2, 1, "", "user"], [18, 2, 1, "", "userState"], [18, 2, 1, "", "users"], [18, 2, 1, "", "videoOnDemand"], [18, 3, 1, "", "viewStateSync"], [18, 2, 1, "", "watchlist"]], "plexapi.myplex.MyPlexDevice": [[18, 2, 1, "", "connect"], [18, 2, 1, "", "delete"], [18, 2, 1, "", "syncItems"]], "plexapi.myplex.MyPlexJWTLogin": [[18, 2, 1, "", "checkLogin"], [18, 2, 1, "", "decodePlexJWT"], [18, 3, 1, "", "decodedJWT"], [18, 2, 1, "", "generateKeypair"], [18, 2, 1, "", "oauthUrl"], [18, 3, 1, "", "pin"], [18, 2, 1, "", "refreshJWT"], [18, 2, 1, "", "registerDevice"], [18, 2, 1, "", "run"], [18, 2, 1, "", "stop"], [18, 2, 1, "", "verifyJWT"], [18, 2, 1, "", "waitForLogin"]], "plexapi.myplex.MyPlexPinLogin": [[18, 2, 1, "", "checkLogin"], [18, 2, 1, "", "oauthUrl"], [18, 3, 1, "", "pin"], [18, 2, 1, "", "run"], [18, 2, 1, "", "stop"], [18, 2, 1, "", "waitForLogin"]], "plexapi.myplex.MyPlexResource": [[18, 2, 1, "", "connect"], [18, 2, 1, "", "preferred_connections"]], "plexapi.myplex.MyPlexServerShare": [[18, 2, 1, "", "history"], [18, 2, 1, "", "section"], [18, 2, 1, "", "sections"]], "plexapi.myplex.MyPlexUser": [[18, 2, 1, "", "history"], [18, 2, 1, "", "server"]], "plexapi.myplex.Section": [[18, 2, 1, "", "history"]], "plexapi.photo": [[19, 1, 1, "", "Photo"], [19, 1, 1, "", "PhotoSession"], [19, 1, 1, "", "Photoalbum"]], "plexapi.photo.Photo": [[19, 3, 1, "", "locations"], [19, 3, 1, "", "metadataDirectory"], [19, 2, 1, "", "photoalbum"], [19, 2, 1, "", "section"], [19, 2, 1, "", "sync"]], "plexapi.photo.Photoalbum": [[19, 2, 1, "", "album"], [19, 2, 1, "", "albums"], [19, 2, 1, "", "clip"], [19, 2, 1, "", "clips"], [19, 2, 1, "", "download"], [19, 2, 1, "", "get"], [19, 3, 1, "", "metadataDirectory"], [19, 2, 1, "", "photo"], [19, 2, 1, "", "photos"]], "plexapi.playlist": [[20, 1, 1, "", "Playlist"]], "plexapi.playlist.Playlist": [[20, 2, 1, "", "addItems"], [20, 2, 1, "", "copyToUser"], [20, 2, 1, "", "create"], [20, 2, 1, "", "delete"], [20, 2, 1, "", "filters"], [20, 2, 1, "", "get"], [20, 3, 1, "", "isAudio"], [20, 3, 1, "", "isPhoto"], [20, 3, 1, "", "isVideo"], [20, 2, 1, "", "item"], [20, 2, 1, "", "items"], [20, 3, 1, "", "metadataDirectory"], [20, 3, 1, "", "metadataType"], [20, 2, 1, "", "moveItem"], [20, 2, 1, "", "removeItems"], [20, 2, 1, "", "section"], [20, 2, 1, "", "sync"], [20, 3, 1, "", "thumb"], [20, 2, 1, "", "updateFilters"]], "plexapi.playqueue": [[21, 1, 1, "", "PlayQueue"]], "plexapi.playqueue.PlayQueue": [[21, 2, 1, "", "addItem"], [21, 2, 1, "", "clear"], [21, 2, 1, "", "create"], [21, 2, 1, "", "fromStationKey"], [21, 2, 1, "", "get"], [21, 2, 1, "", "getQueueItem"], [21, 2, 1, "", "moveItem"], [21, 2, 1, "", "refresh"], [21, 2, 1, "", "removeItem"]], "plexapi.server": [[22, 1, 1, "", "Account"], [22, 1, 1, "", "Activity"], [22, 1, 1, "", "ButlerTask"], [22, 1, 1, "", "Identity"], [22, 1, 1, "", "PlexServer"], [22, 1, 1, "", "Release"], [22, 1, 1, "", "StatisticsBandwidth"], [22, 1, 1, "", "StatisticsResources"], [22, 1, 1, "", "SystemAccount"], [22, 1, 1, "", "SystemDevice"]], "plexapi.server.PlexServer": [[22, 2, 1, "", "account"], [22, 3, 1, "", "activities"], [22, 2, 1, "", "agents"], [22, 2, 1, "", "bandwidth"], [22, 2, 1, "", "browse"], [22, 2, 1, "", "butlerTasks"], [22, 2, 1, "", "canInstallUpdate"], [22, 2, 1, "", "checkForUpdate"], [22, 2, 1, "", "claim"], [22, 2, 1, "", "client"], [22, 2, 1, "", "clients"], [22, 2, 1, "", "continueWatching"], [22, 2, 1, "", "conversions"], [22, 2, 1, "", "createCollection"], [22, 2, 1, "", "createPlayQueue"], [22, 2, 1, "", "createPlaylist"], [22, 2, 1, "", "createToken"], [22, 2, 1, "", "currentBackgroundProcess"], [22, 2, 1, "", "downloadDatabases"], [22, 2, 1, "", "downloadLogs"], [22, 2, 1, "", "getWebURL"], [22, 2, 1, "", "history"], [22, 2, 1, "", "identity"], [22, 2, 1, "", "installUpdate"], [22, 2, 1, "", "isBrowsable"], [22, 2, 1, "", "isLatest"], [22, 3, 1, "", "library"], [22, 2, 1, "", "myPlexAccount"], [22, 2, 1, "", "optimizedItems"], [22, 2, 1, "", "playlist"], [22, 2, 1, "", "playlists"], [22, 2, 1, "", "query"], [22, 2, 1, "", "refreshContent"], [22, 2, 1, "", "refreshSync"], [22, 2, 1, "", "refreshSynclist"], [22, 2, 1, "", "resources"], [22, 2, 1, "", "runButlerTask"], [22, 2, 1, "", "search"], [22, 2, 1, "", "sessions"], [22, 3, 1, "", "settings"], [22, 2, 1, "", "startAlertListener"], [22, 2, 1, "", "streamQuery"], [22, 2, 1, "", "switchUser"], [22, 2, 1, "", "systemAccount"], [22, 2, 1, "", "systemAccounts"], [22, 2, 1, "", "systemDevice"], [22, 2, 1, "", "systemDevices"], [22, 2, 1, "", "transcodeImage"], [22, 2, 1, "", "transcodeSessions"], [22, 2, 1, "", "unclaim"], [22, 2, 1, "", "url"], [22, 2, 1, "", "walk"]], "plexapi.server.StatisticsBandwidth": [[22, 2, 1, "", "account"], [22, 2, 1, "", "device"]], "plexapi.settings": [[23, 1, 1, "", "Preferences"], [23, 1, 1, "", "Setting"], [23, 1, 1, "", "Settings"]], "plexapi.settings.Setting": [[23, 2, 1, "", "set"], [23, 2, 1, "", "toUrl"]], "plexapi.settings.Settings": [[23, 2, 1, "", "all"], [23, 2, 1, "", "get"], [23, 2, 1, "", "group"], [23, 2, 1, "", "groups"], [23, 2, 1, "", "save"]], "plexapi.sonos": [[24, 1, 1, "", "PlexSonosClient"]], "plexapi.sonos.PlexSonosClient": [[24, 2, 1, "", "playMedia"]], "plexapi.sync": [[25, 1, 1, "", "MediaSettings"], [25, 1, 1, "", "Policy"], [25, 1, 1, "", "Status"], [25, 1, 1, "", "SyncItem"], [25, 1, 1, "", "SyncList"]], "plexapi.sync.MediaSettings": [[25, 2, 1, "", "createMusic"], [25, 2, 1, "", "createPhoto"], [25, 2, 1, "", "createVideo"]], "plexapi.sync.Policy": [[25, 2, 1, "", "create"]], "plexapi.sync.SyncItem": [[25, 2, 1, "", "delete"], [25, 2, 1, "", "getMedia"], [25, 2, 1, "", "markDownloaded"], [25, 2, 1, "", "server"]], "plexapi.transport": [[26, 1, 1, "", "RecordingAdapter"], [26, 1, 1, "", "ReplayAdapter"], [26, 1, 1, "", "SingleFlight"], [26, 1, 1, "", "TransportConfig"], [26, 4, 1, "", "recordingKey"], [26, 4, 1, "", "requestKey"]], "plexapi.transport.RecordingAdapter": [[26, 2, 1, "", "send"]], "plexapi.transport.ReplayAdapter": [[26, 2, 1, "", "close"], [26, 2, 1, "", "send"]], "plexapi.transport.SingleFlight": [[26, 2, 1, "", "do"]], "plexapi.transport.TransportConfig": [[26, 2, 1, "", "adapter"], [26, 2, 1, "", "mount"], [26, 2, 1, "", "retry"], [26, 2, 1, "", "session"], [26, 2, 1, "", "timeout"]], "plexapi.utils": [[27, 1, 1, "", "SecretsFilter"], [27, 4, 1, "", "cast"], [27, 4, 1, "", "choose"], [27, 4, 1, "", "createMyPlexDevice"], [27, 4, 1, "", "download"], [27, 4, 1, "", "downloadSessionImages"], [27, 4, 1, "", "fromXMLString"], [27, 4, 1, "", "getAgentIdentifier"], [27, 4, 1, "", "getMyPlexAccount"], [27, 4, 1, "", "getPlexObject"], [27, 4, 1, "", "iterXMLBFS"], [27, 4, 1, "", "iterXMLElements"], [27, 4, 1, "", "joinArgs"], [27, 4, 1, "", "millisecondToHumanstr"], [27, 4, 1, "", "parseXMLString"], [27, 4, 1, "", "plexJWTAuth"], [27, 4, 1, "", "plexOAuth"], [27, 4, 1, "", "registerPlexObject"], [27, 4, 1, "", "reverseSearchType"], [27, 4, 1, "", "reverseTagType"], [27, 4, 1, "", "rget"], [27, 4, 1, "", "searchType"], [27, 4, 1, "", "setDatetimeTimezone"], [27, 4, 1, "", "setXMLParser"], [27, 4, 1, "", "sha1hash"], [27, 4, 1, "", "tagType"], [27, 4, 1, "", "threaded"], [27, 4, 1, "", "toDatetime"], [27, 4, 1, "", "toJson"], [27, 4, 1, "", "toList"]], "plexapi.utils.SecretsFilter": [[27, 2, 1, "", "filter"]], "plexapi.video": [[28, 1, 1, "", "Clip"], [28, 1, 1, "", "ClipHistory"], [28, 1, 1, "", "ClipSession"], [28, 1, 1, "", "Episode"], [28, 1, 1, "", "EpisodeHistory"], [28, 1, 1, "", "EpisodeSession"], [28, 1, 1, "", "Extra"], [28, 1, 1, "", "Movie"], [28, 1, 1, "", "MovieHistory"], [28, 1, 1, "", "MovieSession"], [28, 1, 1, "", "Season"], [28, 1, 1, "", "Show"], [28, 1, 1, "", "Video"]], "plexapi.video.Clip": [[28, 3, 1, "", "locations"], [28, 3, 1, "", "metadataDirectory"]], "plexapi.video.Episode": [[28, 3, 1, "", "actors"], [28, 3, 1, "", "episodeNumber"], [28, 3, 1, "", "hasCommercialMarker"], [28, 3, 1, "", "hasCreditsMarker"], [28, 3, 1, "", "hasIntroMarker"], [28, 3, 1, "", "hasPreviewThumbnails"], [28, 3, 1, "", "hasVoiceActivity"], [28, 3, 1, "", "locations"], [28, 3, 1, "", "metadataDirectory"], [28, 3, 1, "", "parentKey"], [28, 3, 1, "", "parentRatingKey"], [28, 3, 1, "", "parentThumb"], [28, 2, 1, "", "removeFromContinueWatching"], [28, 2, 1, "", "season"], [28, 3, 1, "", "seasonEpisode"], [28, 3, 1, "", "seasonNumber"], [28, 2, 1, "", "show"]], "plexapi.video.Movie": [[28, 3, 1, "", "actors"], [28, 3, 1, "", "hasCreditsMarker"], [28, 3, 1, "", "hasPreviewThumbnails"], [28, 3, 1, "", "hasVoiceActivity"], [28, 3, 1, "", "locations"], [28, 3, 1, "", "metadataDirectory"], [28, 2, 1, "", "removeFromContinueWatching"], [28, 2, 1, "", "reviews"]], "plexapi.video.Season": [[28, 2, 1, "", "download"], [28, 2, 1, "", "episode"], [28, 2, 1, "", "episodes"], [28, 2, 1, "", "get"], [28, 3, 1, "", "isPlayed"], [28, 3, 1, "", "metadataDirectory"], [28, 2, 1, "", "onDeck"], [28, 3, 1, "", "seasonNumber"], [28, 2, 1, "", "show"], [28, 2, 1, "", "unwatched"], [28, 2, 1, "", "watched"]], "plexapi.video.Show": [[28, 3, 1, "", "actors"], [28, 2, 1, "", "download"], [28, 2, 1, "", "episode"], [28, 2, 1, "", "episodes"], [28, 2, 1, "", "get"], [28, 3, 1, "", "isPlayed"], [28, 3, 1, "", "metadataDirectory"], [28, 2, 1, "", "onDeck"], [28, 2, 1, "", "season"], [28, 2, 1, "", "seasons"], [28, 2, 1, "", "unwatched"], [28, 2, 1, "", "watched"]], "plexapi.video.Video": [[28, 2, 1, "", "augmentation"], [28, 2, 1, "", "downloadSubtitles"], [28, 2, 1, "", "optimize"], [28, 2, 1, "", "removeSubtitles"], [28, 2, 1, "", "searchSubtitles"], [28, 2, 1, "", "sync"], [28, 2, 1, "", "uploadSubtitles"], [28, 2, 1, "", "url"]]}, "objnames": {"0": ["py", "module", "Python module"], "1": ["py", "class", "Python class"], "2": ["py", "method", "Python method"], "3": ["py", "property", "Python property"], "4": ["py", "function", "Python function"], "5": ["py", "exception", "Python exception"]}, "objtypes": {"0": "py:module", "1": "py:class", "2": "py:method", "3": "py:property", "4": "py:function", "5": "py:exception"}, "terms": {"": [0, 3, 5, 6, 7, 9, 10, 11, 13, 14, 15, 16, 17, 18, 19, 22, 23, 27, 28, 29], "0": [0, 3, 5, 6, 7, 8, 9, 10, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 28, 29], "00": 7, "000000": 22, "005": 16, "01": [14, 16], "025": 16, "05": 16, "0x0": [23, 29], "0x485b314307f3l": 0, "1": [0, 3, 5, 6, 7, 9, 10, 13, 14, 15, 16, 17, 18, 22, 23, 25, 26, 27, 28, 29], "10": [0, 3, 6, 7, 10, 13, 14, 16, 17, 19, 21, 22, 23, 26, 27, 28, 29], "100": [3, 9, 13, 14, 22, 23, 25, 27, 28, 29], "1000": 14, "10000": [23, 29], "101": 13, "1024": 22, "104353": 3, "1080": [14, 15], "1080p": [23, 28, 29], "11": [3, 5, 14, 23, 25, 29], "12": [0, 14, 22, 23, 29], "120": [0, 18, 23, 26, 27, 29], "12000": [23, 29], "120x120": [23, 29], "121361": 14, "123": 16, "1242x2208": 18, "127": [0, 3, 23, 29], "128": 15, "1280x720": 25, "12855": 21, "13": [10, 14, 15, 23, 28, 29], "1337": 27, "1389985872": 15, "1399": 14, "14": [14, 18, 23, 29], "14400": [23, 29], "1485957738": 21, "15": [14, 18, 23, 29], "150": 27, "1500": [23, 29], "1585769946": 13, "16": [14, 15, 23, 29], "1624": 15, "17": [14, 15, 23, 29], "1751929": 22, "18": [13, 14, 23, 29], "180": [23, 29], "1800": [23, 29], "19": [14, 23, 29], "192": 25, "1920": 15, "1920x1080": 25, "1990": 14, "1999": 14, "1st": 22, "2": [0, 3, 5, 6, 9, 13, 14, 15, 16, 17, 18, 22, 23, 25, 26, 27, 28, 29], "20": [14, 23, 29], "200": 14, "2000": [14, 23, 29], "20000": [23, 29], "2006": 15, "201": 14, "202": 14, "2020": [14, 17, 22], "2021": [14, 22], "202188298": 21, "203": 14, "204": 14, "205": 14, "206": 14, "207": 14, "20central": 14, "21": [14, 23, 28, 29], "21600": [23, 29], "218237558": 24, "22": [14, 23, 29], "229674": 19, "23": [14, 15, 23, 29], "231714": 19, "24": 14, "24p": 15, "25": [6, 14, 16], "25200": 19, "2527": 13, "256": [8, 15], "26": 14, "260x260": [23, 29], "27": 14, "28": 14, "29": 14, "2f": 16, "2fflub84dqlswk9sklo": [3, 18, 22], "3": [0, 3, 5, 7, 14, 15, 17, 18, 22, 23, 25, 26, 27, 28, 29], "30": [0, 14, 18, 23, 28, 29], "300": [14, 23, 29], "3000": [23, 29], "301": 14, "302": 14, "305": 14, "306": 14, "30d": 14, "31": 14, "3112": 22, "312": 14, "313": 14, "314": 14, "3148": 18, "316": 14, "317": 14, "318": 14, "319": 14, "32": [14, 26], "320": [23, 29], "32258d7c": 14, "32400": [0, 3, 4, 7, 8, 13, 15, 22, 23, 26, 29], "32412": 13, "32414": 13, "32433": 0, "33": 14, "34": 14, "35": [14, 15], "36": 14, "3600": [23, 29], "36000": 13, "37": 14, "38": 14, "39": 14, "3e6c": 14, "3rd": 15, "4": [0, 3, 5, 9, 14, 15, 18, 22, 23, 25, 29], "40": 14, "400": 14, "4000": [23, 25, 29], "4096": 27, "41": [14, 15], "42": [14, 15], "429": [0, 26], "43": 14, "43200": [23, 29], "44": 14, "45": 14, "459e": 21, "46": 14, "46618": 15, "47": 14, "48": 14, "480p": [23, 29], "48x48": [23, 29], "49": 14, "494f": 13, "4ac5": 14, "4k": 14, "4th": 15, "4w": 22, "5": [0, 3, 5, 6, 10, 14, 15, 16, 17, 19, 23, 26, 28, 29], "50": [0, 6, 14, 21], "500": 0, "50000": 7, "502": 0, "503": 0, "504": 0, "512000": 0, "53f4b5b6023d41182fe88a99b0e714ba": 13, "5400": [23, 29], "59": 22, "5d07bcb0403c64029053ac4c": 6, "5d07cd8e403c640290f180f9": 6, "5d776b59ad5437001f79c6f8": 28, "5d9c086c46115600200aa2f": 14, "5d9c086fe9d5a1001f4d9fe6": 28, "5d9c09e42df347001e3c2a72": 28, "5mb": 0, "5th": 15, "5xx": 26, "6": [0, 3, 9, 14, 15, 22, 23, 29], "60": [23, 29], "600": [0, 8], "60000": [23, 29], "608": 15, "62": 0, "639": [0, 28], "64": [15, 22], "646ab0aa8a01c543e94ba975f6fd6efadc36b7": 13, "65536": 22, "66351": 28, "6990483": 15, "7": [0, 3, 5, 6, 10, 14, 17, 22, 23, 28, 29], "720": [23, 29], "7200": [23, 29], "7200000": 14, "720p": [23, 29], "733884416": 15, "74": 25, "740d4c206": 13, "750x1334": 18, "7601": 22, "8": [3, 6, 9, 10, 13, 14, 15, 22, 23, 28, 29], "8000": [23, 29], "86400": [23, 29], "8884": 13, "8bd39616": 21, "9": [0, 3, 5, 6, 10, 14, 23, 28, 29], "900": [23, 29], "976": 15, "98ad": 14, "9999999": 18, "A": [3, 4, 7, 8, 9, 10, 14, 15, 17, 18, 20, 21, 22, 23, 27, 29], "AND": 14, "And": 3, "At": [13, 18], "By": [0, 6, 7, 14], "For": [0, 3, 7, 14, 16, 17, 20, 21, 22], "If": [0, 3, 5, 6, 7, 14, 15, 17, 18, 20, 21, 22, 23, 27, 28, 29], "In": [8, 14, 16, 18, 28], "It": [3, 7, 14, 18, 22, 24], "No": [23, 26, 28, 29], "Not": 7, "OF": 3, "OR": 14, "On": [0, 8, 23, 28, 29], "One": [10, 28], "Or": 0, "The": [0, 3, 4, 5, 6, 7, 8, 9, 10, 14, 15, 16, 17, 18, 20, 21, 22, 23, 24, 26, 27, 28, 29], "There": [3, 7, 18], "These": [0, 5, 8, 14, 15, 22], "To": [0, 3, 9, 18], "Will": [13, 28], "_": 0, "__contain": 7, "__endswith": 7, "__exact": 7, "__exist": 7, "__gt": 7, "__gte": 7, "__icontain": 7, "__iendswith": 7, "__iexact": 7, "__in": 7, "__iregex": 7, "__istartswith": 7, "__lt": 7, "__lte": 7, "__regex": 7, "__startswith": 7, "_baseurl": [9, 22, 24], "_cach": 22, "_commandid": 24, "_locat": 28, "_mediacontainer__iter": 7, "_proxythroughserv": 9, "_server": 21, "_session": [9, 22, 24], "_t": 7, "_tag": 7, "_token": [9, 22, 24], "_transport": 22, "abil": 18, "abl": [3, 23, 29], "abort": 0, "about": [5, 14, 15, 18, 22], "abov": [3, 14], "abrkeepoldtranscod": [23, 29], "absolut": 28, "ac3": 15, "acceler": [23, 29], "accept": [18, 21, 23, 29], "acceptedeula": [23, 29], "acceptinvit": 18, "access": [0, 3, 4, 7, 9, 15, 18, 22, 23, 24, 29], "accesstoken": 18, "accordingli": 3, "account": [0, 3, 17, 18, 20, 22, 24, 26, 27, 28], "accountid": [7, 22], "accountoptout": 18, "achiev": [7, 14], "across": [14, 27], "action": [3, 7, 9, 14, 17, 22, 27], "activ": [3, 5, 7, 9, 10, 14, 15, 18, 22, 23, 24, 28, 29], "activedirect": 14, "actor": [14, 15, 22, 28], "actress": 15, "actual": 3, "ad": [3, 6, 7, 10, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 28, 29], "adapt": [15, 18, 22, 26], "add": [3, 4, 6, 7, 10, 14, 16, 17, 18, 19, 20, 21, 22, 28], "addcollect": [7, 14, 17], "addcountri": 17, "adddirector": 17, "addedat": [6, 10, 14, 17, 19, 20, 28], "addedatmixin": 17, "addgenr": 17, "addit": [3, 4, 6, 7, 9, 10, 14, 18, 20, 21, 22, 23, 24, 26, 28, 29], "additem": [10, 20, 21], "addlabel": [7, 14, 17], "addlisten": 16, "addloc": 14, "addmood": 17, "addproduc": 17, "address": [0, 9, 18, 22, 23, 24, 29], "addsimilarartist": 17, "addstyl": 17, "addtag": 17, "addtowatchlist": [17, 18], "addwrit": 17, "admin": [7, 10, 14, 17, 18, 22], "adscons": 18, "adsconsentreminderat": 18, "adsconsentsetat": 18, "adult": [14, 15], "advanc": [10, 14, 17, 20, 22, 23, 29], "advancedfilt": 14, "advancedsettingsmixin": 17, "adventur": [6, 14], "advisori": 15, "affect": [0, 26, 28], "africa": 14, "aftb": 18, "after": [3, 8, 9, 10, 11, 14, 15, 16, 18, 20, 21, 22, 23, 26, 27, 28, 29], "afteritemid": 21, "afterward": 0, "ag": 15, "again": [5, 8, 22], "against": [8, 9, 18, 22], "agegroup": 15, "agent": [5, 7, 14, 15, 17, 18, 19, 20, 22, 27, 28], "agentmediatyp": 15, "ager": 15, "aggreg": 16, "ahead": 22, "aio": [2, 3], "aiohttp": 4, "air": [22, 28], "akin": 7, "album": [3, 6, 7, 10, 14, 15, 19, 20, 22], "albumeditmixin": [14, 17], "albumgain": 15, "albummixin": [6, 17], "albumpeak": 15, "albumrang": 15, "albumsort": 6, "alert": [2, 3], "alertlisten": [5, 22], "alia": [6, 9, 10, 14, 15, 17, 18, 19, 20, 21, 28], "aliv": [0, 26], "all": [0, 3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 25, 26, 28, 29], "allianc": [23, 29], "alllibrari": 18, "allow": [0, 7, 10, 14, 17, 18, 19, 20, 22, 23, 25, 27, 29], "allowcameraupload": [18, 22], "allowchannel": 18, "allowchannelaccess": 22, "allowednetwork": [23, 29], "allowhighoutputbitr": [23, 29], "allowmediadelet": [22, 23, 29], "allowshar": 22, "allowsync": [7, 14, 18, 20, 22], "allsubfold": 14, "along": [0, 8], "alpha": 10, "alphabet": [9, 10], "alreadi": [3, 7, 14, 18, 21, 22, 26], "also": [0, 3, 7, 9, 14, 17, 18, 22, 23, 24, 29], "alt": 15, "alter": 0, "altern": 14, "alwai": [9, 10, 18, 25, 26, 28], "am": [23, 29], "ambigu": 14, "america": [0, 27], "amount": [14, 22, 23, 25, 29], "an": [0, 3, 4, 6, 7, 8, 9, 10, 11, 12, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29], "analysi": [6, 7, 14, 15, 23, 29], "analyz": [3, 6, 7, 14, 15, 28], "anamorph": 15, "android": [0, 18, 28], "ani": [0, 4, 5, 6, 7, 8, 9, 14, 16, 18, 20, 22, 23, 25, 26, 27, 28, 29], "anim": [4, 7, 14, 15], "announc": [23, 29], "anonym": [14, 18, 23, 29], "anoth": [3, 7, 20], "anygood": 15, "apach": 13, "apertur": [14, 15], "api": [0, 3, 4, 6, 7, 8, 9, 10, 14, 15, 16, 17, 18, 19, 20, 22, 24, 28], "app": [7, 14, 22, 23, 25, 29], "appear": [23, 29], "append": [7, 9, 14, 21, 22], "appli": [9, 10, 14, 18, 20, 21, 22, 27], "applic": [0, 7, 23, 29], "approach": 18, "appropri": [3, 27], "ar": [0, 3, 4, 6, 7, 8, 9, 10, 11, 14, 15, 16, 17, 18, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29], "arcanemagu": 3, "aren": 14, "arg": [5, 7, 14, 16, 27], "argentina": 14, "argument": [0, 3, 4, 5, 7, 9, 16, 22, 26, 27], "arithmet": 15, "arnold": [14, 22], "around": [3, 4, 9, 14, 16, 20], "art": [6, 10, 14, 15, 17, 19, 28], "artblurhash": [6, 10, 28], "articl": [21, 23, 24, 28, 29], "articlestr": [23, 29], "artid": [6, 10, 19, 28], "artist": [6, 7, 10, 14, 17, 18, 20, 21, 22], "artisteditmixin": [14, 17], "artistmixin": [6, 17], "artlockmixin": 17, "artmixin": 17, "arturl": [17, 22], "arturlmixin": 17, "artwork": [6, 7, 10, 14, 17, 19, 28], "asap": [23, 29], "asc": [14, 18], "ascii": 15, "asctim": 0, "ask": 27, "asp": 15, "aspect": [15, 28], "aspectratio": 15, "assembl": 7, "asset": 7, "assign": 13, "assist": 13, "associ": [7, 21, 22, 24], "assum": [7, 14, 18], "async": [3, 4], "asynchron": [4, 22, 28], "asyncio": 4, "asynclibrari": 4, "asynclibrarysect": 4, "asyncplexserv": 4, "attempt": [18, 20, 22, 23, 29], "attr": [7, 27], "attribut": [0, 4, 7, 9, 14, 15, 22, 27, 28], "attrstr": 27, "audienc": [6, 10, 14, 15, 17, 28], "audiencer": [6, 10, 14, 17, 22, 28], "audiencerating__lt": 14, "audienceratingimag": 28, "audienceratingimage__startswith": 14, "audienceratingmixin": 17, "audio": [2, 3, 9, 10, 14, 15, 18, 20, 22, 23, 25, 28, 29], "audio_bitrate_320_kbp": 14, "audiobitr": [10, 20], "audioboost": 25, "audiochannel": 15, "audiochannellayout": 15, "audiocodec": 15, "audiodecis": 15, "audiolanguag": [14, 28], "audioprofil": 15, "audiostream": [7, 15], "audiostreamid": 9, "augment": [7, 28], "augmentationkei": 7, "australia": 14, "austria": 14, "auth": [3, 18, 22, 23, 27, 29], "authent": [3, 4, 9, 12, 18, 22, 24, 27], "authenticationtoken": 18, "authtoken": 18, "auto": [15, 17, 18, 22, 28], "autodeletionitempolicyunwatchedlibrari": 28, "autodeletionitempolicywatchedlibrari": 28, "autoemptytrash": [23, 29], "automat": [0, 7, 14, 17, 18, 22, 23, 25, 29], "autoreload": 0, "autoselectaudio": 22, "autotag": [14, 22], "avail": [0, 2, 3, 4, 7, 9, 11, 14, 15, 17, 18, 21, 22, 23, 24, 29], "availablechoic": 14, "availablefield": 14, "availablefilt": 14, "availableoper": 14, "availablesort": 14, "availabletask": 22, "avatar": 18, "avi": [15, 23, 29], "avoid": [0, 3, 26, 27], "awai": 25, "await": 4, "awar": 0, "b": 14, "b38628e": 18, "b6e57a3f": 13, "b8da": 21, "back": [0, 3, 9, 10, 20, 24, 27, 28], "backend": [8, 27], "background": [7, 14, 15, 17, 22, 23, 29], "backgroundprocess": 22, "backgroundqueueidlepaus": [23, 29], "backoff": [0, 26], "backoff_factor": 26, "backup": [0, 18, 23, 29], "backup_count": 0, "backupcodescr": 18, "backupdatabas": 22, "backward": [0, 9], "bad7a3b78c63": 14, "badrequest": [6, 10, 12, 14, 17, 18, 20, 22, 25, 28], "band": 14, "bandwidth": [7, 15, 22, 23, 29], "bandwidthdata": 22, "bar": 27, "base": [2, 4, 5, 6, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28], "base64path": 14, "base_head": 25, "baseadapt": 26, "baseresourc": 15, "baseurl": [0, 3, 4, 9, 22, 26], "basic": [22, 25], "batch": [7, 14, 17, 22], "batchedit": [7, 17], "batchmultiedit": 14, "baz": 27, "bdfslcnsnl789fh7": 0, "becaus": [7, 22, 25], "been": [6, 7, 15, 18, 21, 23, 29], "befor": [0, 7, 11, 14, 18, 21, 22, 23, 26, 27, 28, 29], "begin": [9, 14, 21, 23, 24, 29], "behavior": [0, 18], "behaviour": [17, 26], "behind": 22, "behindthescen": 28, "being": [7, 14, 15, 26, 28], "belgium": 14, "believ": [9, 22], "beliz": 14, "belong": [4, 7, 10, 14, 15, 19, 20, 22, 25], "below": [3, 7, 14, 22, 27, 28], "best": [7, 9, 14, 18], "better": [0, 6, 9, 10, 14, 20, 23, 25, 29], "between": [0, 6, 8, 14, 23, 26, 29], "beyond": 3, "bif": [15, 27, 28], "big": 22, "bin": 22, "binari": 15, "bind": 3, "bit": [7, 14, 15], "bitdepth": 15, "bitrat": [6, 10, 14, 15, 20, 22, 23, 25, 29], "bitratemod": 15, "blank": [14, 17, 23, 29], "blend": 22, "blendcolor": 22, "block": 4, "blu": [23, 29], "blue": 22, "blur": [6, 10, 22, 28], "blurhash": [6, 10, 28], "bodi": 8, "bolivia": 14, "bonaventura": 28, "bond": 14, "bool": [6, 7, 9, 10, 14, 15, 17, 18, 19, 20, 21, 22, 23, 25, 26, 27, 28, 29], "boolean": 14, "boostraptest": 3, "bootstraptest": 3, "both": [17, 18, 22, 27], "bottom": 15, "bottomleft": 15, "bottomright": 15, "bound": [4, 16], "brain": [15, 22], "branch": 14, "brazil": 14, "breadth": 27, "break": 0, "brief": 15, "brother": 22, "brows": [4, 14, 22], "bsd": 2, "bt2020": 15, "buck": 22, "bucket": 16, "bueller": 18, "buffer": [23, 29], "bug": 9, "bui": 15, "build": [7, 9, 16, 22, 24, 26], "builditem": 27, "buildtim": 16, "built": [4, 7, 16, 18, 20], "bundl": [7, 14, 21, 23, 29], "bunni": [14, 22], "butler": [0, 22], "butlerdatabasebackuppath": [23, 29], "butlerendhour": [23, 29], "butlerstarthour": [23, 29], "butlertask": 22, "butlertaskbackupdatabas": [23, 29], "butlertaskcleanoldbundl": [23, 29], "butlertaskcleanoldcachefil": [23, 29], "butlertaskdeepmediaanalysi": [23, 29], "butlertaskgarbagecollectblob": [23, 29], "butlertaskgeneratemediaindexfil": [23, 29], "butlertaskoptimizedatabas": [23, 29], "butlertaskrefreshepgguid": [23, 29], "butlertaskrefreshlibrari": [23, 29], "butlertaskrefreshlocalmedia": [23, 29], "butlertaskrefreshperiodicmetadata": [23, 29], "butlertaskupgrademediaanalysi": [23, 29], "butlerupdatechannel": [23, 29], "button": 7, "byte": [8, 14, 15, 16, 18, 22, 25, 27], "c": 14, "ca": 28, "cabac": 15, "cach": [0, 2, 7, 16, 18, 22, 23, 26, 29], "cached_data_properti": 7, "cached_properti": 7, "cacheentri": 8, "cachekei": 8, "call": [0, 3, 4, 5, 7, 9, 14, 15, 16, 18, 22, 23, 26, 27], "callabl": [5, 7, 16, 18, 26], "callback": [5, 18, 22, 27], "callbackerror": [5, 22], "camelcas": 3, "camera": [15, 22], "camera_upload": 22, "can": [0, 3, 4, 7, 8, 9, 11, 14, 15, 17, 18, 21, 22, 23, 25, 26, 28, 29], "canada": 14, "canautosync": 15, "cancel": [14, 18], "cancelinvit": 18, "cancelupd": 14, "caninstallupd": 22, "cannot": [5, 9, 14, 17, 18, 22, 28], "capabl": [3, 9, 13, 23, 24, 29], "captur": 17, "capturedtim": 17, "car": [3, 7, 15], "case": [0, 7], "cast": [7, 11, 14, 27], "cast_list": 14, "categor": 23, "categori": [14, 22], "caus": [7, 23, 29], "cbr": 15, "cellular": 15, "center": 21, "centroid": 20, "cert": [], "certain": [14, 23, 29], "certif": [22, 23, 29], "certificatevers": [23, 29], "chain": [14, 17], "chang": [7, 8, 18, 21, 22, 23, 25, 28, 29], "channel": [15, 18, 22, 23, 29], "chapter": [6, 14, 15, 21, 23, 28, 29], "chaptersourc": [6, 28], "charact": [14, 15, 18, 22, 27], "check": [7, 14, 17, 18, 22, 23, 27, 29], "checkfil": [7, 15], "checkforupd": 22, "checklogin": 18, "child": [15, 22, 27], "childcount": [10, 28], "children": [16, 27], "chile": 14, "china": 14, "choic": [4, 14, 23, 27, 29], "choos": [23, 27, 29], "christma": 14, "chroma": 15, "chromaloc": 15, "chromasubsampl": 15, "chrome": [18, 22], "chunk": [9, 27], "chunk_siz": 22, "chunksiz": 27, "cinema": [14, 23, 29], "cinematrailersfromblurai": [23, 29], "cinematrailersfromlibrari": [23, 29], "cinematrailersfromtheat": [23, 29], "cinematrailersprerollid": [23, 29], "cinematrailerstyp": [23, 29], "citi": 18, "cl": [4, 7, 27], "claim": [18, 22], "claimtoken": 18, "class": [4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28], "classmethod": [10, 20, 21], "clean": [14, 26, 27, 28], "cleanbundl": 14, "cleanxmlstr": 27, "clear": [8, 16, 21], "click": 22, "client": [0, 2, 3, 6, 7, 10, 12, 13, 14, 16, 18, 19, 20, 21, 22, 23, 24, 25, 27, 28, 29], "client_baseurl": 0, "client_token": 0, "clientid": [6, 10, 14, 18, 19, 20, 25, 28], "clientidentifi": [14, 18, 22, 25], "clientsess": 4, "clienttimelin": 9, "clip": [7, 19, 28], "cliphistori": 28, "clipmixin": [17, 28], "clipsess": 28, "close": [4, 24, 26, 27], "cloudsync": 22, "coalesc": [22, 26], "coalesce_request": 0, "code": [0, 2, 14, 15, 16, 18, 22, 28], "codec": [7, 15, 23, 29], "codecid": 15, "codedheight": 15, "codedwidth": 15, "collect": [0, 2, 6, 7, 14, 15, 16, 17, 19, 22, 28], "collectioneditmixin": 17, "collectionfilterbasedonus": 10, "collectionmixin": [10, 17], "collectionmod": 10, "collectionpublish": 10, "collectionsort": 10, "collector": 16, "collectusagedata": [23, 29], "colombia": 14, "color": [6, 10, 15, 28], "colorprimari": 15, "colorrang": 15, "colorspac": 15, "colortrc": 15, "colour": 22, "column": [10, 14, 20, 22], "com": [3, 5, 6, 7, 9, 13, 14, 15, 18, 19, 20, 21, 22, 24, 28], "combin": [0, 14, 22], "come": [14, 27], "comedi": [14, 22], "comma": [10, 14, 20, 22, 23, 27, 29], "command": [3, 9, 24, 27], "commerci": 28, "common": [6, 14, 15, 19, 28], "commonsensemedia": [15, 28], "commontyp": 14, "companionproxi": 22, "comparison": 0, "compat": [0, 15, 23, 29], "complet": [7, 15, 23, 25, 26, 27, 29], "complex": 7, "compon": [23, 29], "composit": [14, 19, 20], "compositeid": [19, 20], "compress": 15, "comput": [23, 29], "concert": 14, "concurr": [0, 7, 26, 27], "condit": 8, "config": [0, 2, 3, 4, 7, 9, 14, 17, 18, 22, 26, 27], "configpars": 11, "configur": [2, 11, 23, 26, 27, 29], "configurationurl": [23, 29], "confirm": [18, 27], "conform": 3, "confus": [14, 18], "conjunct": 14, "connect": [0, 3, 4, 5, 7, 9, 14, 17, 18, 21, 22, 23, 24, 26, 29], "connectionerror": 26, "connet": 18, "consid": [15, 18, 23, 29], "consist": 15, "construct": 15, "constructor": 5, "consum": [7, 23, 29], "contain": [3, 5, 7, 9, 10, 14, 15, 16, 17, 18, 20, 22, 23, 26, 28, 29], "container_s": [0, 4, 7, 14], "container_start": [4, 7, 14], "content": [3, 8, 10, 13, 14, 17, 18, 20, 22, 23, 25, 26, 27, 28, 29], "content_filt": 22, "content_typ": 13, "contentr": [7, 10, 14, 17, 18, 28], "contentratingmixin": 17, "contenttyp": 25, "context": [9, 14, 15, 16], "contextmenu": 9, "contextu": 22, "contin": 18, "continentcod": 18, "continu": [14, 21, 22, 28], "continuewatch": [14, 22], "contribut": 15, "contributor": 2, "control": [0, 9, 18, 21, 24], "conveni": [9, 11, 18, 21], "convers": [15, 22], "convert": [7, 16, 27], "coordin": 18, "copi": [20, 23, 29], "copyt": 7, "copytous": 20, "cost": 7, "costa": 14, "count": [6, 7, 10, 14, 15, 16, 18, 19, 20, 25, 28], "counter": [16, 24], "counterpart": 4, "countri": [6, 14, 15, 17, 18, 28], "countrymixin": 17, "coverpost": 15, "cpu": [7, 22, 23, 29], "creat": [0, 3, 4, 5, 6, 7, 9, 10, 14, 18, 19, 20, 21, 22, 25, 26, 27, 28], "createcollect": [14, 22], "createdat": [14, 18, 22], "createdataccuraci": 19, "createdattzoffset": 19, "createexistingus": 18, "createhomeus": 18, "createmus": 25, "createmyplexdevic": 27, "createphoto": 25, "createplaylist": [14, 22], "createplayqueu": [9, 22, 24], "createtoken": 22, "createvideo": 25, "creation": [7, 13, 21], "credit": [15, 28], "critic": [15, 17, 18, 28], "criticr": 17, "criticratingmixin": 17, "crypto": 18, "cryptographi": 18, "cumul": 16, "current": [3, 5, 6, 7, 9, 10, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 25, 27, 28, 29], "currentbackgroundprocess": 22, "currentpin": 18, "custom": [10, 14, 18, 20, 22, 23, 28, 29], "customcertificatedomain": [23, 29], "customcertificatekei": [23, 29], "customcertificatepath": [23, 29], "customconnect": [23, 29], "cut": 28, "czech": 14, "d": [0, 7, 8, 14, 22, 25, 26, 27], "da": [23, 29], "dai": [13, 14, 18, 22, 23, 27, 28, 29], "daili": [23, 29], "dashboard": [14, 22], "data": [4, 5, 6, 7, 8, 9, 10, 13, 14, 15, 18, 19, 20, 21, 22, 23, 24, 25, 28, 29], "data_field": 7, "databas": [14, 18, 22, 23, 28, 29], "dataset": 14, "date": [10, 14, 17, 18, 22], "datetim": [0, 6, 7, 10, 14, 17, 18, 19, 20, 22, 27, 28], "dbdb": 21, "dd": [14, 17], "deaf": 18, "deal": 7, "debug": [23, 29], "decad": 14, "decemb": 22, "decid": 3, "decis": 15, "deck": [14, 23, 28, 29], "decod": [7, 15, 18, 23, 27, 29], "decodedjwt": 18, "decodeplexjwt": 18, "decor": 7, "deem": 27, "deep": 15, "deepanalysisvers": 15, "def": [4, 5, 16, 25], "default": [0, 4, 6, 7, 8, 9, 10, 11, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 26, 27, 28, 29], "default_bucket": 16, "default_rul": 8, "defaultadvanc": [14, 17], "defaultaudiolanguag": 22, "defaultdirect": 14, "defaultsubtitlelanguag": 22, "defin": [3, 10, 14, 18, 20, 21, 25, 27, 28], "delai": [0, 26], "deleg": 22, "delet": [0, 5, 7, 8, 10, 14, 17, 18, 20, 22, 23, 25, 26, 28, 29], "deleteart": 17, "deletelogo": 17, "deletemediapreview": 14, "deletepost": 17, "deletesquareart": 17, "deletethem": 17, "delim": 27, "delimit": 27, "demand": [15, 28], "demotehom": 14, "demoterecommend": 14, "demoteshar": 14, "denmark": 14, "depend": [3, 14], "deprec": 27, "depth": 15, "der": [23, 29], "desc": [14, 18, 22], "descend": [14, 18], "desckei": 14, "describ": 14, "descript": [6, 9, 10, 14, 15, 18, 19, 20, 22, 23, 28, 29], "design": 3, "desir": [0, 9, 14], "desktop": [7, 14, 22], "destin": [6, 10, 14, 19, 20, 28], "detach": 27, "detail": [4, 6, 7, 11, 14, 19, 21, 22, 23, 24, 28, 29], "detect": [7, 9, 23, 28, 29], "determin": [20, 27], "dev": [23, 29], "develop": [18, 23, 29], "devic": [0, 6, 9, 10, 12, 13, 14, 18, 19, 20, 22, 23, 24, 25, 27, 28, 29], "device_nam": 0, "deviceclass": [9, 24], "deviceid": [7, 22], "deviceprofil": 28, "di": [7, 28], "diagnost": 22, "dict": [4, 7, 8, 9, 10, 11, 13, 14, 18, 20, 21, 22, 23, 24, 26, 27], "dictionari": [5, 7, 8, 10, 14, 16, 20, 22, 23, 26], "differ": [18, 21, 22, 25], "digit": [18, 23, 29], "dimens": 22, "dir": [6, 7, 10, 14, 18, 19, 20, 22, 27, 28], "direct": [3, 13, 14], "directli": [3, 4, 5, 9, 14, 18], "director": [3, 14, 15, 17, 22, 28], "directori": [0, 6, 8, 10, 11, 14, 15, 19, 20, 22, 23, 26, 28, 29], "directormixin": 17, "disabl": [0, 8, 9, 18, 22, 23, 27, 28, 29], "disablecapabilitycheck": [23, 29], "disableviewstatesync": 18, "disallow": [7, 25], "disc": [6, 17], "discard": [0, 26], "discnumb": 17, "discord": 3, "discov": [13, 14, 15, 18, 23, 29], "discoveri": [13, 23, 29], "discuss": 3, "disk": [6, 7, 8, 15, 19, 23, 28, 29], "diskcach": 8, "disnei": [14, 19], "displai": [7, 9, 10, 15, 17, 22, 27], "displaytitl": 15, "distanc": 6, "distribut": [2, 28], "django": 27, "dlna": [23, 29], "dlnaannouncementleasetim": [23, 29], "dlnaclientprefer": [23, 29], "dlnadefaultprotocolinfo": [23, 29], "dlnadescriptionicon": [23, 29], "dlnadevicediscoveryinterv": [23, 29], "dlnaenabl": [23, 29], "dlnaplatinumlogginglevel": [23, 29], "dlnareporttimelin": [23, 29], "dn": 18, "dnsrebindingprotect": 18, "do": [9, 14, 22, 26, 27], "doc": [0, 3], "docker": [3, 18, 22], "document": [11, 14, 27], "documentari": 14, "doe": [6, 14, 19, 20, 21, 22, 28], "doesn": [7, 9, 14, 18, 22], "dolbi": 15, "domain": [23, 29], "dominican": 14, "don": [3, 17, 22, 23, 29], "done": [0, 3, 7, 18, 27], "doubl": [23, 29], "doviblcompatid": 15, "doviblpres": 15, "dovielpres": 15, "dovilevel": 15, "dovipres": 15, "doviprofil": 15, "dovirpupres": 15, "dovivers": 15, "down": [0, 7, 9, 14], "download": [5, 6, 7, 8, 14, 15, 19, 22, 25, 26, 27, 28], "downloaddatabas": 22, "downloadlog": 22, "downloadsessionimag": 27, "downloadsubtitl": 28, "dream": 3, "dri": [23, 29], "dropdown": 14, "dt": 15, "due": [0, 3], "dump": 27, "duplic": [14, 17], "durat": [6, 7, 14, 15, 16, 20, 23, 27, 28, 29], "duration__gt": 14, "durationinsecond": 20, "dure": [9, 23, 29], "dvd": 28, "dvr": 22, "dvrshowunsupporteddevic": [23, 29], "dynam": 27, "e": [3, 4, 14, 15, 16, 17, 18, 20, 22, 25, 27, 28], "e0f8": 13, "each": [0, 7, 8, 14, 18, 21, 22, 23, 25, 26, 27, 29], "easier": 18, "easili": [0, 9], "ecuador": 14, "ed25519": [18, 27], "edit": [4, 7, 14, 17, 28], "editaddedat": 17, "editadvanc": [14, 17], "editaudiencer": 17, "editcapturedtim": 17, "editcontentr": 17, "editcriticr": 17, "editdiscnumb": 17, "editeditiontitl": 17, "editfield": 17, "editfieldmixin": [7, 14, 17], "editionsmixin": 17, "editiontitl": [14, 17, 28], "editiontitlemixin": 17, "editoriginallyavail": 17, "editoriginaltitl": 17, "editsorttitl": 17, "editstudio": 17, "editsummari": [7, 14, 17], "edittag": 17, "edittaglin": [7, 14, 17], "edittagsmixin": [7, 14, 17], "edittitl": [7, 14, 17], "edittrackartist": 17, "edittracknumb": 17, "edituserr": 17, "effect": [21, 23, 29], "eg": [22, 28], "ehash": 27, "either": [9, 18, 22], "ekei": [4, 7], "el": [14, 23, 29], "element": [7, 9, 14, 22, 27], "elementtre": [0, 4, 7, 8, 9, 22, 24, 27], "eleph": [3, 14], "elephants_dream": 3, "els": [22, 25], "email": [18, 20, 22], "emailonlyauth": 18, "embed": [15, 28], "emit": 16, "empti": [3, 6, 10, 14, 19, 20, 21, 22, 23, 25, 28, 29], "emptytrash": 14, "emul": 24, "en": [0, 14, 15, 28], "enabl": [0, 3, 7, 9, 14, 16, 18, 22, 23, 28, 29], "enable_fast_connect": 0, "enableabrdebugoverlai": [23, 29], "enableairplai": [23, 29], "enableautophototag": 14, "enablebifgener": 14, "enablecinematrail": 14, "enablecreditsmarkergener": 28, "enablehttppipelin": [23, 29], "enableipv6": [23, 29], "enableviewstatesync": 18, "encod": [9, 15, 22, 23, 27, 29], "encrypt": [23, 29], "end": [5, 7, 14, 15, 21], "endpoint": [0, 4, 14, 16, 18, 22, 24, 26], "endpoint_timeout": 0, "endpointtempl": 16, "endramp": 15, "endswith": 14, "enforc": [18, 23, 29], "eng": [14, 15], "engin": 15, "english": 15, "enhanc": 15, "ensur": [0, 7, 23, 29], "enter": 18, "entertain": 28, "entir": 14, "entitl": 18, "entri": [5, 6, 7, 8, 13, 22, 23, 28, 29], "enumvalu": 23, "environ": [3, 27], "episod": [3, 7, 10, 14, 18, 20, 21, 22, 25, 28], "episodeeditmixin": [14, 17], "episodehistori": 28, "episodemixin": [17, 28], "episodenumb": 28, "episodesess": 28, "episodesort": [14, 28], "epoch": [14, 15], "equal": [0, 6, 7, 10, 15, 19, 22, 25, 28], "equival": 4, "error": [0, 5, 12, 14, 16, 22, 23, 26, 29], "establish": 0, "etag": [7, 8], "etc": [3, 4, 6, 7, 9, 14, 15, 17, 18, 22, 25, 27, 28], "etre": [0, 27], "eula": [23, 29], "european": 18, "europeanunionmemb": 18, "even": [7, 9, 14, 26], "event": [4, 16, 23, 29], "eventstream": 22, "ever": 26, "everi": [0, 16, 21, 23, 29], "everyon": 22, "everyth": 27, "ex": [15, 18, 22, 27], "exact": [14, 22], "exactli": 3, "exampl": [0, 4, 7, 8, 10, 13, 14, 15, 16, 17, 18, 21, 22, 23, 25, 26, 27, 28, 29], "except": [2, 6, 10, 14, 15, 16, 19, 20, 22, 26, 27, 28], "exclud": [7, 17, 28], "exhaust": 14, "exist": [3, 4, 6, 7, 8, 9, 14, 15, 18, 19, 20, 21, 22, 26, 28], "exit": 16, "expect": [0, 18], "experi": [23, 25, 29], "experiment": [18, 23, 29], "experimentalfeatur": 18, "expir": [8, 18], "expiri": 8, "explicitli": [14, 17, 25], "exponenti": [0, 26], "expos": 7, "exposit": 16, "exposur": [14, 15], "express": [0, 7, 8, 26], "extend": [7, 8, 15, 27, 28], "extendeddisplaytitl": 15, "extens": [18, 23, 29], "extern": [7, 14, 15, 23, 24, 29], "extra": [0, 3, 7, 14, 17, 23, 26, 28, 29], "extrasmixin": 17, "extratyp": 28, "eyequs": [23, 29], "f": [3, 14, 16, 18, 22], "f46d0b170af4": 21, "f4b58501467e": 13, "factor": [0, 12, 18, 26], "fail": [0, 20, 22], "failur": 25, "failurecod": 25, "fake": 25, "fall": [0, 27], "fallback": [7, 14], "fals": [0, 6, 7, 9, 10, 13, 14, 17, 18, 19, 20, 21, 22, 25, 26, 27, 28], "fast": [23, 29], "faster": [0, 3, 14, 23, 27, 29], "fastkei": 14, "fatal": [23, 29], "favorit": [7, 14, 17, 22], "featur": [0, 3, 4, 7, 18, 22, 23, 24, 29], "fetch": [0, 4, 7, 14, 16, 22], "fetch_work": [0, 7, 26], "fetchev": 16, "fetchitem": [0, 4, 6, 7, 14, 16], "few": [3, 7, 27], "field": [6, 7, 10, 14, 15, 17, 18, 19, 20, 22, 23, 28, 29], "fieldtyp": 14, "file": [0, 3, 6, 7, 8, 11, 14, 15, 17, 18, 19, 20, 22, 23, 25, 26, 27, 28, 29], "fileexistserror": 18, "filenam": [6, 7, 19, 27, 28], "filepath": [7, 17, 27, 28], "fill": 17, "filter": [4, 6, 7, 10, 14, 15, 17, 18, 19, 20, 22, 23, 25, 27, 28], "filteral": 18, "filterchoic": 14, "filterfield": 14, "filteringfield": 14, "filteringfieldtyp": 14, "filteringfilt": 14, "filteringoper": 14, "filteringsort": 14, "filteringtyp": 14, "filtermovi": 18, "filtermus": 18, "filterphoto": 18, "filtertelevis": 18, "filtertyp": 14, "filteruserupd": 10, "final": [3, 15], "find": [7, 14, 16, 22, 28], "find_by_content_typ": 13, "find_by_data": 13, "finditem": 7, "fine": [0, 23, 29], "finer": [23, 29], "finest": [23, 29], "finish": 18, "firend": 18, "firetv": 0, "firmwar": 24, "first": [0, 4, 6, 7, 14, 15, 17, 18, 22, 27, 28], "firstattr": 7, "firstcharact": [8, 14], "firstcharacterkei": 14, "fixmatch": 17, "flag": [7, 14, 21], "flat": [7, 14], "flattenseason": [14, 28], "flight": [4, 26], "float": [6, 7, 8, 10, 14, 15, 16, 17, 18, 19, 22, 23, 26, 27, 28], "flood": 0, "fm": 6, "folder": [6, 14, 19, 22, 23, 28, 29], "follow": [0, 3, 4, 10, 14, 15, 18, 21, 22, 27], "foo": [18, 27], "foobar": 7, "forc": [14, 15, 18, 22, 28], "forceautoadjustqu": [23, 29], "foreign": [18, 28], "format": [0, 6, 7, 9, 10, 11, 14, 15, 16, 18, 20, 22, 25, 27], "forum": 3, "forward": [9, 24], "forwardurl": [18, 27], "found": [3, 4, 6, 8, 10, 11, 12, 13, 14, 18, 19, 20, 27, 28], "four": [3, 14, 18], "fr": 15, "fragment": [7, 14, 22], "frame": [15, 22], "framer": 15, "frameratemod": 15, "franc": 14, "free": [0, 26], "fresh": 14, "freshen": 7, "friend": [14, 18], "friendli": [18, 22, 23, 27, 29], "friendlier": [6, 7, 19, 28], "friendly_nam": 18, "friendlynam": [18, 22, 23, 29], "from": [0, 3, 4, 5, 6, 7, 8, 9, 10, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29], "fromstationkei": 21, "fromxmlstr": 27, "front": 21, "fseventlibrarypartialscanen": [23, 29], "fseventlibraryupdatesen": [23, 29], "fu": 14, "full": [0, 6, 7, 9, 14, 15, 16, 17, 18, 20, 22, 23, 26, 27, 28], "fulli": [26, 28], "func": [5, 7, 11, 16, 22, 26, 27], "function": [5, 7, 11, 13, 14, 16, 22, 26, 27], "further": 7, "futur": 9, "fx": 21, "g": [3, 4, 10, 14, 15, 16, 17, 18, 20, 22, 25, 27, 28], "gain": [15, 23, 29], "game": [3, 22], "garbag": 7, "gather": [4, 7, 14], "gb": 22, "gdm": [2, 23, 29], "gdmenabl": [23, 29], "gener": [0, 6, 7, 9, 10, 12, 14, 15, 18, 19, 20, 22, 23, 27, 28, 29], "generatebifbehavior": [23, 29], "generatechapterthumbbehavior": [23, 29], "generateindexfilesduringanalysi": [23, 29], "generatekeypair": 18, "genr": [4, 6, 14, 15, 17, 22, 27, 28], "genre__tag": 7, "genremixin": 17, "geoip": 18, "geoloc": 18, "germani": 14, "get": [0, 4, 6, 7, 8, 9, 10, 11, 14, 15, 16, 18, 19, 20, 21, 22, 23, 26, 27, 28, 29], "getagentidentifi": 27, "getfieldtyp": 14, "getfiltertyp": 14, "getguid": 14, "getmedia": 25, "getmyplexaccount": 27, "getnod": 0, "getplexobject": 27, "getprotocolinfo": [23, 29], "getqueueitem": 21, "getstreamurl": [6, 7, 28], "getweburl": [7, 14, 22], "gif": [23, 29], "gigabyt": 22, "github": [2, 3, 9, 13, 24], "give": [], "given": [18, 22, 28], "gmail": 18, "go": [9, 22], "goal": [3, 7], "goback": 9, "good": 13, "googl": 22, "got": [22, 25], "gotohom": 9, "gotomedia": 9, "gotomus": 9, "grab": 7, "gracenoteus": [23, 29], "graham": 15, "grandpar": 14, "grandparentart": [6, 28], "grandparentguid": [6, 28], "grandparentkei": [6, 28], "grandparentratingkei": [6, 14, 28], "grandparentslug": 28, "grandparentthem": [6, 28], "grandparentthumb": [6, 28], "grandparenttitl": [6, 14, 28], "granular": 14, "graphic": 7, "greater": [7, 14, 22], "greatli": 0, "group": [3, 15, 20, 23], "guatemala": 14, "guess": [7, 9, 18], "guest": [3, 18], "guid": [6, 10, 14, 15, 18, 19, 20, 23, 27, 28, 29], "guid__id__regex": 7, "guid__regex": 7, "guidelin": 3, "guidlookup": 14, "h": 14, "h265": [7, 14], "ha": [0, 6, 7, 14, 15, 18, 21, 22, 23, 28, 29], "had": 18, "handl": [7, 9, 16, 22], "handshak": 0, "hard": [0, 18, 22], "hardcod": [6, 19, 25, 28], "hardwar": [15, 23, 29], "hardware_transcod": 22, "hardwareacceleratedcodec": [23, 29], "hardwaredevicepath": [23, 29], "has64bitoffset": 15, "hascommercialmark": 28, "hascreditsmark": 28, "hash": [18, 26, 27], "hasintromark": 28, "haspassword": 18, "haspreviewthumbnail": [15, 28], "hasscalingmatrix": 15, "hassonicanalysi": 6, "hasthumbnail": 15, "hasvoiceact": [15, 28], "have": [3, 6, 7, 8, 14, 15, 17, 18, 19, 22, 23, 25, 28, 29], "haven": 14, "hdr": 14, "he": 22, "head": [0, 26], "header": [4, 8, 9, 11, 15, 18, 22, 26, 27], "headercompress": 15, "hear": [15, 18], "hearingimpair": [15, 28], "heavili": 27, "height": [15, 22, 27], "held": [7, 14, 27], "hellowlol": 27, "help": [0, 3, 7, 9, 22, 23, 29], "helper": [13, 18, 23, 27], "here": [18, 24], "hex": [0, 15, 22], "hh": [17, 27], "hidden": [23, 28, 29], "hide": [0, 10, 14, 25, 27, 28], "hideitem": 10, "high": [15, 23, 29], "higher": [23, 29], "highest": 27, "hippojai": 13, "histogram": 16, "histori": [6, 7, 14, 18, 22, 28], "historyid": 7, "historykei": 7, "hit": 16, "hold": 25, "holidai": 14, "home": [0, 9, 11, 13, 14, 18, 22], "homeadmin": 18, "homepag": 10, "homes": 18, "homevis": 14, "hondura": 14, "hong": 14, "horror": 14, "host": [0, 13, 16, 22, 26], "hostcpuutil": 22, "hostmemoryutil": 22, "hostnam": [0, 3, 18], "hour": [14, 22, 23, 29], "hourli": [23, 29], "how": [6, 7, 10, 14, 21, 25, 28], "howev": 0, "html": 0, "http": [0, 3, 4, 7, 8, 9, 13, 14, 15, 16, 18, 21, 22, 23, 24, 26, 27, 28, 29], "httpadapt": 26, "httpsrequir": 18, "httpuri": 18, "hub": [7, 14, 17, 18, 21, 22, 28], "hubidentifi": 14, "hubkei": 14, "hubsearch": [14, 22], "hubsmixin": 17, "human": [22, 27], "hurt": [23, 29], "i": [0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29], "iana": [0, 27], "ibaa": 13, "icon": [15, 20, 23, 29], "id": [0, 4, 6, 7, 9, 10, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 28], "idempot": [0, 26], "ident": [14, 22, 26], "identifi": [0, 5, 6, 7, 9, 10, 13, 14, 15, 18, 19, 20, 21, 22, 23, 25, 26, 27, 28, 29], "idx": [10, 14, 20, 25, 28], "ignor": [3, 16], "illeg": [22, 27], "imag": [3, 6, 7, 10, 14, 15, 17, 18, 19, 20, 22, 23, 27, 28, 29], "imageformat": 22, "imageurl": 22, "imagin": 22, "imdb": [7, 14, 15, 17], "immedi": [9, 14, 21, 22, 28], "impair": 15, "implement": [5, 8], "import": [3, 4, 7, 8, 11, 14, 15, 16, 18, 20, 21, 22, 25, 26, 28], "improv": [0, 23, 29], "includ": [0, 3, 5, 6, 7, 9, 10, 14, 18, 20, 21, 22, 23, 24, 27, 28, 29], "includeaft": 21, "includebefor": 21, "includechapt": 21, "includecollect": 14, "includefil": [14, 22], "includehttp": 18, "includeinglob": 14, "includemark": 7, "includemymix": 14, "includepaus": 9, "includereceiv": 18, "includerel": 21, "includerelai": 18, "includes": 18, "includest": 14, "includetoken": [9, 22], "inclus": 22, "incompat": [23, 29], "increas": [0, 26], "increment": [21, 22, 27], "index": [6, 10, 14, 15, 19, 28], "indic": [6, 28], "individu": [7, 14, 23, 29], "influenc": 27, "info": [0, 7, 10, 14, 15, 18, 20, 22, 23, 29], "inform": [0, 7, 14, 18, 22], "ini": [0, 11, 27], "init": 25, "init_sync": 25, "initi": [9, 18, 21, 22], "initpath": [6, 7, 9, 10, 14, 15, 18, 19, 20, 21, 22, 23, 25, 28], "innervis": 3, "inprivacyrestrictedcountri": 18, "inprogress": 14, "ins": [23, 29], "insensit": 7, "insid": [14, 25, 28], "inspir": 13, "instal": [0, 4, 14, 16, 18, 22, 27], "installupd": 22, "instanc": [5, 6, 7, 9, 10, 14, 17, 18, 19, 20, 22, 24, 27, 28], "instead": [0, 9, 14, 18, 22, 23, 24, 26, 29], "int": [4, 6, 7, 8, 9, 10, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29], "integ": [14, 27], "integr": 24, "intens": 7, "interact": [9, 22, 24], "interfac": [6, 19, 28], "intern": [0, 14], "internet": [7, 14], "interrupt": 7, "interv": [22, 23, 29], "intro": [7, 28], "invalid": [7, 12, 14, 17, 18, 22, 27], "invit": 18, "invitefriend": 18, "invok": 5, "io": [0, 3, 9, 18, 25, 28], "ip": [18, 22, 23, 24, 29], "ip_address": 18, "ipad": 18, "iphon": [0, 3, 9, 18, 25], "ipv": 18, "ipv4": 18, "ipv6": [18, 23, 29], "ireland": 14, "isaudio": [10, 20], "isbrows": 22, "isfresh": 8, "isfullobject": 7, "islatest": 22, "islock": 7, "iso": [0, 14, 15, 28], "isoptimizedvers": 15, "ispartialobject": 7, "isphoto": [10, 20], "isplai": [17, 18, 28], "isplayingmedia": 9, "isvideo": [10, 20], "iswatch": 17, "itali": 14, "item": [0, 4, 5, 6, 7, 9, 10, 12, 14, 15, 16, 17, 18, 19, 20, 21, 22, 24, 25, 27, 28], "itemcast": 27, "itemscompletecount": 25, "itemscount": 25, "itemsdownloadedcount": 25, "itemsreadycount": 25, "itemssuccessfulcount": 25, "iter": [7, 14, 22, 27], "iter_cont": 27, "iteritem": 7, "iterpart": [3, 7], "itersearch": 14, "iterxmlbf": 27, "iterxmlel": [22, 27], "its": [0, 7, 8, 10, 16, 22, 26, 27], "itself": [4, 7, 9, 14, 16], "itun": [22, 23, 29], "ituneslibraryxmlpath": [23, 29], "itunessharingen": [23, 29], "jamaica": 14, "jame": 14, "januari": 22, "jason": 6, "job": 15, "john": 9, "johndo": 0, "join": [3, 18], "joinarg": 27, "joinedat": 18, "jpeg": [22, 23, 29], "jpn": 14, "json": [26, 27], "jump": 9, "just": [3, 14, 22], "jwk": 18, "jwt": [3, 18, 27], "jwtlogin": 18, "jwttoken": 18, "kbp": [23, 29], "keep": [0, 4, 6, 7, 8, 19, 28], "keep_al": [0, 26], "keep_original_nam": [6, 7, 19, 28], "kei": [0, 4, 6, 7, 8, 9, 10, 11, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 26, 27, 28, 29], "kept": [0, 8, 14, 16, 26], "key1": 7, "key2": 7, "key3": 7, "keyfil": 18, "keypair": [18, 27], "keyword": [5, 27], "kib": 22, "kid": 15, "kilobit": [23, 29], "kingdom": 14, "kitchen": 3, "know": [3, 7, 14, 15, 17, 22], "known": [5, 7, 22], "kodi": 0, "kong": 14, "korea": 14, "kung": 14, "kurosawa": 22, "kwarg": [4, 5, 6, 7, 9, 10, 14, 17, 18, 19, 20, 21, 22, 26, 27, 28], "l16": [23, 29], "la": [23, 29], "label": [6, 10, 14, 15, 17, 18, 23, 28], "labelmixin": 17, "laika": 0, "lambda": 22, "lan": [15, 22, 23, 29], "lang": 19, "languag": [0, 14, 15, 17, 18, 22, 23, 28, 29], "languagecod": 15, "languageincloud": [23, 29], "languageoverrid": 28, "languagetag": 15, "lanip": 24, "lannetworksbandwidth": [23, 29], "lap": 28, "larg": [0, 7, 14, 23, 27, 29], "last": [6, 7, 8, 10, 14, 18, 19, 28], "last_episod": 3, "lastautomaticmappedport": [23, 29], "lastmodifi": 8, "lastratedat": [6, 10, 19, 28], "lastseenat": 18, "lastviewedat": [6, 14, 18, 28], "latenc": 16, "later": [0, 18, 22, 26], "latest": [3, 22, 28], "latestentrytim": 14, "latitud": 18, "layer": 15, "layout": 15, "lazili": 7, "leafcount": [6, 20, 28], "leas": [23, 29], "least": [8, 18], "leav": [23, 29], "left": [3, 9, 15, 23, 29], "legaci": [9, 24], "legal": 18, "len": [14, 15], "length": [6, 15], "less": [7, 14, 22], "let": 3, "letter": [9, 14, 15], "level": [0, 6, 7, 9, 14, 15, 23, 27, 29], "levelnam": 0, "lg": 0, "lib": [5, 13, 23, 29], "librari": [0, 2, 3, 4, 5, 6, 7, 8, 10, 12, 15, 16, 18, 19, 20, 21, 22, 23, 25, 26, 27, 28, 29], "librarymediatag": 14, "librarysect": [4, 6, 7, 10, 14, 18, 19, 20, 22, 28], "librarysectionid": [6, 7, 10, 14, 15, 19, 20, 22, 28], "librarysectionkei": [6, 10, 14, 19, 20, 28], "librarysectiontitl": [6, 7, 10, 14, 19, 20, 28], "librarysectiontyp": 14, "librarysectionuuid": 7, "librarytimelin": 14, "libtyp": [4, 10, 14, 18, 20, 22, 27], "licens": [2, 13], "liechtenstein": 14, "like": [0, 3, 7, 14, 17, 22, 25, 26, 28], "limit": [4, 6, 10, 14, 18, 19, 20, 22, 23, 25, 28, 29], "line": [15, 27, 28], "lineno": 0, "link": [0, 3, 15, 18, 24, 28], "linux": [0, 9, 18, 22, 23, 29], "list": [0, 3, 4, 6, 7, 9, 10, 13, 14, 15, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29], "listarg": 27, "listattr": 7, "listen": [3, 5, 6, 16, 22], "listfield": 14, "listfilt": 14, "listfilterchoic": 14, "listoper": 14, "listsort": 14, "listtyp": [6, 10, 19, 28], "lit": 18, "littl": 15, "live": [7, 8, 23, 26, 29], "ll": 22, "load": [0, 4, 6, 7, 11, 14, 15, 18, 19, 22, 26, 28], "local": [0, 3, 7, 14, 15, 18, 19, 22, 23, 24, 27, 29], "localart": 14, "localhost": [4, 7, 8, 15, 22, 23, 26, 29], "locat": [6, 7, 14, 15, 18, 19, 23, 25, 27, 28, 29], "locationid": 28, "lock": [0, 7, 14, 15, 17], "lockallfield": 14, "lockart": 17, "locklogo": 17, "lockpost": 17, "locksquareart": 17, "lockthem": 17, "log": [3, 9, 16, 18, 22, 23, 27, 29], "logdebug": [23, 29], "login": [18, 22, 27], "logo": [15, 17], "logolockmixin": 17, "logomixin": 17, "logourl": 17, "logourlmixin": 17, "logrecord": 0, "logslowrequest": 16, "logtoken": [23, 29], "logverbos": [23, 29], "long": [0, 14, 23, 29], "longer": [7, 23, 29], "longitud": 18, "look": [0, 14, 21, 22, 27], "lookup": [7, 14, 18, 27], "loop": [0, 4], "loopback": 18, "loud": [6, 15], "loudnessanalysisvers": 6, "low": [7, 14], "lower": [23, 29], "lra": 15, "lrc": 15, "lru": 8, "lucki": 6, "luxembourg": 14, "lxml": [0, 3, 27], "lyric": [15, 22], "lyricfind": 15, "lyricstream": [7, 15], "m": [7, 9, 14, 22, 23, 29], "m3u": [20, 22], "m3ufilepath": [14, 20, 22], "mac": 22, "machin": [0, 9, 18, 22, 23, 29], "machineid": 18, "machineidentifi": [6, 9, 18, 19, 22, 23, 24, 25, 28, 29], "macosx": 0, "made": [4, 9, 16, 21, 26], "mai": [0, 2, 5, 7, 8, 9, 14, 18, 22, 23, 25, 27, 29], "mail": 18, "mailinglistact": 18, "mailingliststatu": 18, "main": [3, 4, 7, 9, 13, 14, 22], "maintain": 22, "mainten": [23, 29], "make": [0, 14, 15, 23, 24, 26, 29], "manag": [14, 16, 18, 23, 29], "managedhub": [10, 14], "mang": 14, "mani": [0, 3, 4, 7, 14, 21, 22, 23, 25, 26, 29], "manipul": 7, "manual": [0, 7, 18, 22, 28], "manualportmappingmod": [23, 29], "manualportmappingport": [23, 29], "map": [22, 23, 29], "mappingerror": 22, "mappingerrormessag": 22, "mappingst": 22, "mark": [3, 6, 17, 18, 25, 28], "markdownload": 25, "marker": [7, 14, 15, 28], "markplai": [3, 7, 17, 18], "markunplai": [7, 17, 18], "markunwatch": 17, "markwatch": 17, "marvel": 14, "match": [3, 4, 5, 6, 7, 8, 10, 13, 14, 15, 17, 18, 19, 20, 21, 22, 23, 26, 28, 29], "mate": 13, "matrix": 15, "matroska": [23, 29], "matter": [7, 14], "max": [0, 14], "max_retri": [0, 26], "maxdist": 6, "maxhomes": 18, "maximum": [0, 6, 8, 10, 14, 18, 19, 20, 23, 25, 26, 28, 29], "maxoffsetavail": 15, "maxresult": [4, 7, 14, 18, 22], "maxsiz": 8, "maxvideobitr": [7, 25], "maxyear": 10, "mayb": 22, "mbid": 15, "mbp": [23, 28, 29], "md5": 22, "me": 14, "mean": [7, 16, 25], "meaningless": 15, "meant": 3, "media": [0, 2, 3, 4, 5, 6, 7, 9, 10, 12, 13, 14, 18, 19, 20, 21, 22, 23, 24, 25, 27, 28, 29], "media__container__in": 7, "media__part__contain": 7, "media__part__file__startswith": 7, "media__videocodec": 7, "media__videocodec__exact": 14, "media_set": 14, "mediacontain": 7, "mediacontainert": 7, "mediaheight": 14, "mediaindex": 7, "mediapart": [7, 15], "mediapartstream": 15, "mediaprocessingtarget": 14, "mediaset": [14, 25], "mediatag": [14, 15, 17], "mediatagprefix": [7, 14, 21], "mediatagvers": [7, 14, 21], "mediatyp": [14, 15, 22], "medium": [23, 29], "member": 18, "membership": 18, "memori": [7, 8, 14, 27], "memorycach": 8, "men": 28, "menu": [9, 14], "merg": [8, 17], "messag": [0, 5, 7, 22], "met": 3, "metaclass": 7, "metadata": [4, 5, 6, 7, 10, 14, 15, 16, 17, 18, 19, 20, 21, 23, 28, 29], "metadatadirectori": [6, 10, 19, 20, 28], "metadatatyp": [10, 20, 25], "method": [0, 4, 5, 7, 8, 9, 14, 16, 17, 18, 21, 22, 26, 28], "metric": [2, 23, 29], "metricscollector": 16, "mexico": 14, "michael": 3, "midnight": [23, 29], "millisecond": [6, 7, 9, 14, 15, 18, 20, 24, 27, 28], "millisecondtohumanstr": 27, "mimic": [14, 25], "min": [7, 14, 18, 22], "mindat": [7, 14, 18, 22], "minimum": [10, 15], "minimumprogresstim": [23, 29], "minlin": 15, "minoffsetavail": 15, "minsiz": 22, "minut": [14, 23, 29], "minyear": 10, "mirror": 9, "misc": [23, 29], "miss": [0, 6, 7, 18, 28], "mix": [7, 10, 14, 20, 22, 28], "mixedfield": 14, "mixin": [2, 7], "mkv": [7, 15], "mm": [14, 17, 27], "mobil": [3, 25, 28], "mock": 27, "mode": [7, 9, 10, 14, 15, 18, 22, 28], "model": [9, 14, 15, 18, 25], "modern": [9, 24], "modeupd": 10, "modifi": [8, 9, 14, 21, 24, 25, 27], "modul": [0, 5, 6, 10, 14, 17, 19, 20, 25, 28], "moment": [0, 26], "mon": 14, "monitor": [5, 18, 22], "month": [14, 22], "mood": [6, 14, 15, 17], "moodmixin": 17, "more": [0, 3, 7, 9, 10, 11, 14, 18, 20, 21, 22, 23, 24, 29], "morefil": 14, "most": [3, 14, 22], "mount": [18, 22, 26], "move": [9, 10, 14, 15, 20, 21], "movedown": 9, "moveitem": [10, 20, 21], "moveleft": 9, "moveright": 9, "moveup": 9, "movi": [3, 4, 7, 9, 10, 14, 15, 16, 17, 18, 20, 21, 22, 23, 24, 25, 26, 28, 29], "movie1": 22, "movie2": 22, "movieeditmixin": [14, 17], "moviehistori": 28, "moviemixin": [17, 28], "moviesect": 14, "moviesess": 28, "mp3": [15, 23, 29], "mp4": [7, 23, 29], "mpeg": [23, 29], "mpeg4": 15, "mraz": 6, "msg": 27, "mtype": 9, "much": 14, "multi": 14, "multicast": 13, "multiedit": 14, "multipl": [0, 7, 9, 14, 17], "multius": 22, "music": [3, 6, 7, 9, 10, 14, 18, 20, 21, 22, 23, 24, 25, 28, 29], "music_bitrate_": [6, 10, 14, 20, 25], "music_video": 22, "musicanalysisvers": 6, "musicbitr": 25, "musicsect": 14, "must": [0, 3, 4, 5, 7, 14, 18, 22, 23, 29], "my": [14, 23, 25, 29], "my_callback": 5, "myfirstplexserv": 13, "myplex": [0, 2, 3, 14, 16, 22, 27], "myplex_password": 0, "myplex_usernam": 0, "myplexaccount": [0, 3, 7, 14, 17, 18, 22, 26, 27], "myplexdevic": [6, 10, 14, 18, 19, 20, 22, 27, 28], "myplexinvit": 18, "myplexjwtlogin": 18, "myplexmappingst": 22, "myplexpinlogin": 18, "myplexresourc": [18, 25], "myplexservershar": 18, "myplexsigninst": 22, "myplexsubscript": 22, "myplexus": [7, 18, 20, 22], "myplexusernam": 22, "n": [0, 18, 26], "na": 22, "naiv": 0, "name": [0, 3, 4, 6, 7, 9, 10, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29], "narrow": 14, "nat": 18, "native_sub": 14, "natloopbacksupport": 18, "natur": 25, "navig": [3, 9, 15], "necessari": 9, "need": [0, 3, 7, 8, 14, 15, 18, 22, 25, 27], "neither": 18, "nest": 27, "netdisco": 13, "netherland": 14, "netmask": [23, 29], "network": [0, 3, 13, 14, 23, 28, 29], "never": [0, 7, 8, 23, 25, 27, 28, 29], "new": [0, 3, 4, 5, 6, 7, 8, 10, 13, 14, 17, 18, 19, 20, 21, 22, 23, 25, 26, 27, 28, 29], "new_york": [0, 27], "newest": [6, 14, 22, 28], "newli": 18, "newpin": 18, "newslett": 18, "next": [9, 14, 21, 28], "nextlett": 9, "nicaragua": 14, "node": 27, "non": [18, 20, 22, 28], "none": [0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28], "noon": [23, 29], "nor": 18, "notabl": 0, "note": [3, 4, 7, 9, 14, 15, 17, 18, 20, 22, 23, 24, 28], "notfound": [4, 10, 12, 14, 18, 20, 22, 27], "noth": [7, 21, 26], "notif": [3, 5, 22], "notifi": 5, "notimplementederror": 17, "now": [7, 22, 23, 29], "nr": [10, 28], "nth": [0, 26], "nullslast": 14, "num": [14, 22], "number": [0, 6, 7, 8, 9, 10, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 26, 28, 29], "numlibrari": 18, "o": [14, 18, 22], "oauth": [18, 27], "oauthurl": 18, "obj": [8, 9, 10, 14, 20, 22, 24, 27], "object": [0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28], "observ": 16, "obtain": [3, 18, 21], "obviou": 22, "obvious": 25, "off": [7, 9, 23, 29], "offer": [3, 23, 29], "offertyp": 15, "offici": [3, 15], "offlin": [0, 22], "offset": [6, 7, 9, 15, 18, 21, 24, 28], "often": [5, 6, 7, 15, 18, 22, 28], "ok": 22, "old": [0, 14, 23, 29], "older": [9, 24], "oldest": [6, 14, 28], "omit": 14, "onc": [0, 5, 7, 9, 14, 18, 26, 27], "ondeck": [14, 28], "ondeckwindow": [23, 29], "one": [0, 6, 7, 9, 10, 14, 15, 18, 20, 22, 25, 26, 27, 28], "onelin": 15, "onli": [0, 6, 7, 8, 9, 10, 14, 15, 16, 18, 19, 20, 21, 22, 23, 25, 27, 28, 29], "onlin": [15, 18, 22, 23, 28, 29], "onlinemediasourc": 18, "only_trail": 14, "onwatchlist": [17, 18], "opac": [22, 27], "open": [0, 9, 26, 27], "oper": [0, 7, 14], "opt": [18, 27], "opt_in": 18, "opt_out": 18, "opt_out_manag": 18, "optim": [14, 15, 22, 23, 28, 29], "optimizedforstream": 15, "optimizeditem": 22, "optin": 18, "option": [4, 5, 6, 7, 8, 9, 10, 11, 14, 16, 17, 18, 20, 21, 22, 24, 25, 26, 27, 28], "optout": 18, "optoutmanag": 18, "order": [0, 3, 4, 7, 10, 14, 18, 22, 28], "org": 0, "origin": [6, 7, 17, 19, 21, 23, 28, 29], "originallyavail": 17, "originallyavailableat": [6, 7, 14, 18, 19, 22, 28], "originallyavailablemixin": 17, "originaltitl": [6, 17, 28], "originaltitlemixin": 17, "ot": 9, "other": [0, 7, 8, 14, 17, 22, 23, 25, 26, 27, 29], "otherwis": [6, 7, 18, 19, 27, 28], "our": 3, "out": [0, 7, 15, 17, 18, 22, 23, 29], "output": [0, 23, 29], "outsid": [0, 3, 28], "outstand": 23, "over": [7, 14, 22], "overrid": [0, 5, 7, 8, 26, 28], "overridden": [0, 11, 14], "overwrit": [18, 20, 22, 26], "own": [2, 4, 8, 14, 18, 21, 22, 26, 27], "owner": [14, 18, 22, 23, 29], "ownerfeatur": 22, "ownerid": 18, "ownership": 21, "p": [9, 18], "packag": [0, 14, 18], "packet": 15, "packetlength": 15, "page": [0, 2, 3, 7, 9, 14, 16, 23, 29], "pagedown": 9, "pageup": 9, "pair": [0, 18], "panama": 14, "panel": 9, "paraguai": 14, "param": [4, 7, 8, 9, 14, 17, 18, 22, 24, 26], "paramet": [4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28], "parent": [6, 7, 9, 10, 14, 15, 18, 19, 20, 21, 22, 23, 25, 28], "parentaladvisorytop": 15, "parentguid": [6, 19, 28], "parentindex": [6, 19, 28], "parentkei": [6, 19, 28], "parentratingkei": [6, 14, 19, 28], "parentslug": 28, "parentsneedtoknow": 15, "parentstudio": 28, "parentthem": [6, 28], "parentthumb": [6, 19, 28], "parenttitl": [6, 14, 19, 28], "parentyear": 28, "pars": [0, 4, 7, 8, 9, 14, 16, 22, 27], "parseerror": 27, "parser": [0, 3, 7, 27], "parsetim": 16, "parsexmlstr": 27, "part": [0, 3, 6, 7, 14, 15, 26, 28], "partial": [7, 14, 15, 22, 23, 29], "partindex": 7, "pass": [0, 3, 4, 5, 6, 7, 10, 14, 15, 17, 18, 20, 22, 23, 24, 26, 27, 28, 29], "password": [0, 3, 12, 18, 22, 27], "past": [23, 28, 29], "path": [0, 4, 6, 7, 8, 9, 11, 14, 15, 16, 17, 18, 19, 20, 22, 23, 26, 27, 28, 29], "paus": [3, 9, 15, 22], "payload": 18, "payment": 18, "pc": 9, "peak": 15, "pend": [18, 25], "pendinginvit": 18, "peopl": 14, "pep8": 3, "per": [0, 4, 14, 16, 18, 22, 23, 26, 29], "percentag": 15, "perfect": 15, "perfectmatch": 15, "perform": [0, 3, 7, 14, 22, 23, 29], "period": [18, 23, 29], "permiss": 0, "pernic": 22, "persist": [8, 23], "person": [3, 14, 15, 20], "peru": 14, "pg": [7, 10, 28], "phone": [0, 9, 28], "photo": [2, 7, 9, 10, 14, 15, 17, 18, 20, 22, 24, 25], "photo_autotag": 22, "photo_only_attribut": 15, "photo_quality_": [10, 14, 19, 20, 25], "photo_quality_high": 14, "photoalbum": [7, 10, 14, 19, 20, 22], "photoalbumeditmixin": [14, 17], "photoalbummixin": [17, 19], "photoautotag": 22, "photocapturedtimemixin": 17, "photoeditmixin": [14, 17], "photomixin": [17, 19], "photoqu": 25, "photoresolut": [10, 20, 25], "photosect": 14, "photosess": 19, "pictur": 28, "pin": 18, "ping": 18, "pinlogin": 18, "pip": [3, 4, 22], "pipelin": [23, 29], "pixar": 14, "pixel": [15, 22], "pixelaspectratio": 15, "pixelformat": 15, "pkc": [23, 29], "place": [14, 15, 21, 22, 27], "plai": [3, 6, 7, 9, 14, 17, 18, 21, 22, 23, 24, 28, 29], "plain": 26, "plan": 18, "platform": [0, 7, 9, 15, 18, 22, 24, 25], "platform_vers": 0, "platformcolorthumb": 15, "platforminfo": 15, "platformurl": 15, "platformvers": [9, 18, 22, 24], "platorm": 0, "playabl": [6, 7, 19, 20, 21, 25, 28], "playback": [3, 7, 9, 13, 18, 21, 24], "playedunplayedmixin": [6, 17, 28], "player": [0, 3, 7, 9, 13, 18, 23, 24, 29], "playlist": [2, 3, 6, 7, 9, 14, 19, 21, 22, 24, 28], "playlisteditmixin": 17, "playlistitemid": 7, "playlistmixin": [17, 20], "playlisttab": 22, "playlisttyp": [20, 22], "playmedia": [3, 9, 21, 24], "playnext": 21, "playqueu": [2, 7, 9, 13, 22, 24], "playqueueid": [9, 21], "playqueueitemid": [7, 15, 21], "playqueuelastaddeditemid": 21, "playqueueselecteditemid": 21, "playqueueselecteditemoffset": 21, "playqueueselectedmetadataitemid": 21, "playqueueshuffl": 21, "playqueuesourceuri": 21, "playqueuetotalcount": 21, "playqueuevers": 21, "pleas": 3, "plex": [0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29], "plexaccount": 24, "plexamp": 13, "plexapi": 2, "plexapi_": 0, "plexapi_auth_myplex_password": 3, "plexapi_auth_myplex_usernam": 3, "plexapi_auth_server_baseurl": 3, "plexapi_config_path": 0, "plexapi_header_devic": 3, "plexapi_header_platform": 3, "plexapi_header_platform_vers": 3, "plexapi_header_provid": 3, "plexapi_log_path": 0, "plexapiexcept": 12, "plexapitest": 3, "plexapp": [5, 6, 7, 14, 15, 19, 20, 21, 28], "plexavod": 18, "plexbmc": 13, "plexclient": [0, 7, 9, 18, 22, 24], "plexconfig": 11, "plexconnect": 13, "plexgdm": 13, "plexhistori": [6, 7, 28], "plexinc": [3, 9, 18, 24], "plexjwtauth": 27, "plexmediaserv": [23, 29], "plexmetricsurl": [23, 29], "plexoauth": 27, "plexobject": [4, 7, 9, 14, 15, 18, 21, 22, 23, 25, 27], "plexobjectmeta": 7, "plexobjectt": 7, "plexonlinemail": [23, 29], "plexonlineurl": [23, 29], "plexpartialobject": [0, 6, 7, 9, 10, 19, 20, 21, 28], "plexpass": [18, 22], "plexserv": [0, 4, 5, 7, 8, 9, 10, 14, 15, 18, 20, 21, 22, 23, 24, 26], "plexsess": [6, 7, 19, 28], "plexsonoscli": 24, "plexsonosplay": 3, "plextvod": 18, "plot": 14, "plug": [23, 29], "plugin": [5, 6, 7, 14, 15, 19, 21, 23, 28, 29], "pluginhost": 22, "pluginslaunchtimeout": [23, 29], "pm": [3, 18, 22, 23, 29], "png": [22, 23, 29], "point": [15, 22], "polici": [14, 25, 26], "poll": [9, 18], "pollinterv": 18, "pool": [0, 18, 22, 26], "pool_block": [0, 26], "pool_connect": [0, 26], "pool_maxs": [0, 26], "pop": 14, "popul": [7, 9], "popular": 6, "populartrack": 6, "port": [3, 13, 18, 22, 23, 29], "portion": 7, "portug": 14, "posit": [9, 10, 14, 15, 20], "possibl": [0, 6, 7, 10, 14, 19, 20, 28], "possibli": [18, 27], "post": 8, "postal": 18, "postalcod": 18, "poster": [7, 14, 15, 17], "posterlockmixin": 17, "postermixin": 17, "posterurl": 17, "posterurlmixin": 17, "power": 14, "pq": 21, "pre": [23, 29], "pref": [17, 23], "prefer": [14, 17, 18, 23, 28, 29], "preferred_connect": 18, "prefix": [14, 16], "premium": 14, "premium_music_metadata": 22, "prepar": 18, "preparedrequest": 26, "prepend": 7, "presenc": 18, "present": [7, 15, 18, 25], "preset": [23, 29], "prevent": [3, 18], "preview": [7, 14, 15, 23, 28, 29], "previou": [7, 9, 26], "previous": [20, 22], "previouslett": 9, "price": 15, "pricedescript": 15, "primari": [15, 28], "primaryextrakei": [6, 28], "print": [3, 7, 14, 16, 18, 22], "priorit": 18, "prioriti": [18, 23, 29], "privaci": 18, "privat": [0, 18, 23, 27, 29], "privateaddress": 22, "privatekei": 27, "privateport": 22, "probabl": 25, "problem": [7, 23, 29], "procedur": 0, "process": [5, 7, 8, 14, 15, 16, 23, 25, 29], "processcpuutil": 22, "processmemoryutil": 22, "produc": [14, 15, 17, 28], "producermixin": 17, "product": [0, 9, 13, 18, 24], "productvers": 18, "profil": [15, 18, 23, 25, 28, 29], "profileautoselectaudio": 18, "profileautoselectsubtitl": 18, "profiledefaultaudiolanguag": 18, "profiledefaultsubtitleaccess": 18, "profiledefaultsubtitleforc": 18, "profiledefaultsubtitlelanguag": 18, "program": [23, 29], "progress": [5, 7, 14, 15, 16], "progressbar": [22, 27], "project": 2, "prometheu": 16, "promot": 14, "promotedtoownhom": 14, "promotedtorecommend": 14, "promotedtosharedhom": 14, "promotehom": 14, "promoterecommend": 14, "promoteshar": 14, "prompt": 27, "proof": 9, "proper": [3, 9, 22, 25], "properli": 24, "properti": [4, 6, 7, 9, 10, 14, 15, 16, 17, 18, 19, 20, 22, 28], "proport": 7, "protect": 18, "protocol": [7, 9, 13, 15, 18, 23, 24, 29], "protocolcap": [9, 24], "protocolvers": 9, "provid": [0, 3, 4, 8, 14, 15, 17, 18, 21, 22, 23, 24, 25, 26, 27, 29], "providertitl": 15, "proxi": 9, "proxythroughserv": 9, "proxytyp": 15, "prune": [23, 29], "public": [18, 22, 23, 24, 27, 29], "publicaddress": [18, 22], "publicaddressmatch": 18, "publicip": 18, "publickei": 27, "publicli": [23, 29], "publicport": 22, "publish": [10, 23, 29], "publishserveronplexonlinekei": [23, 29], "pubsub": 18, "puerto": 14, "pull": 7, "purpos": 7, "put": [0, 8, 26], "py": [3, 5, 13], "pyenv": 5, "pyjwt": 18, "python": [0, 2, 7, 27], "python3": 5, "q": 16, "qualiti": [10, 14, 15, 20, 22, 23, 25, 28, 29], "quantil": 16, "queri": [4, 7, 8, 9, 14, 16, 18, 22, 27], "queryev": 16, "queu": [14, 15], "queue": [15, 21], "quickli": [14, 16], "r": [7, 8, 18, 26], "radio": [6, 20, 21], "rai": [23, 29], "rais": [0, 4, 6, 7, 9, 10, 14, 16, 17, 18, 20, 22, 25, 26, 27, 28], "ram": 22, "ramp": 15, "random": [14, 22], "rang": 15, "rare": 22, "rate": [3, 6, 10, 14, 15, 17, 18, 19, 28], "ratingcount": [6, 10, 15], "ratingimag": [14, 28], "ratingkei": [6, 7, 10, 14, 15, 17, 18, 19, 20, 21, 22, 28], "ratingmixin": 17, "ratio": [15, 28], "raw": [3, 8, 18, 27], "re": [0, 22, 25, 27], "reach": 27, "read": [0, 3, 7, 9, 22, 27], "readabl": 27, "readonlylibrari": 22, "realli": 22, "reason": [7, 14], "reasonid": 14, "reasontitl": 14, "rebind": 18, "receiv": [0, 5, 16, 18, 22, 26], "recent": [8, 13, 14, 22], "recentlyad": [4, 14], "recentlyaddedalbum": 14, "recentlyaddedartist": 14, "recentlyaddedepisod": 14, "recentlyaddedmovi": 14, "recentlyaddedseason": 14, "recentlyaddedshow": 14, "recentlyaddedtrack": 14, "recommend": 14, "recommendationsplaylistid": 18, "recommendationsvis": 14, "record": [16, 26, 27], "record_path": 0, "recordbuild": 16, "recordingadapt": 26, "recordingkei": 26, "recreat": 14, "recurs": 27, "red": 14, "redband": 14, "redirect": [18, 27], "reduc": [0, 14, 23, 29], "ref": 0, "refer": [7, 15, 18, 28], "referenc": 7, "reffram": 15, "refresh": [7, 8, 9, 14, 18, 21, 22, 23, 28, 29], "refreshcont": 22, "refreshjwt": 18, "refreshplayqueu": 9, "refreshsync": 22, "refreshsynclist": 22, "refreshwithindai": 18, "regex": 0, "region": 21, "regist": [16, 18, 25], "registerdevic": 18, "registerplexobject": 27, "registri": 27, "regular": [0, 4, 7, 8, 10, 20, 22, 26], "rel": [7, 14], "relai": 18, "relat": [3, 17, 21, 28], "releas": [6, 10, 14, 18, 22, 28], "reli": 0, "reload": [0, 4, 7, 9, 14, 15, 17, 23, 26], "remain": [7, 15], "rememb": 18, "rememberexpiresat": 18, "remot": [0, 3, 6, 9, 18, 19, 22, 23, 24, 28, 29], "remov": [0, 8, 10, 14, 15, 16, 17, 18, 20, 21, 22, 23, 25, 27, 28, 29], "removeal": 22, "removecollect": 17, "removecountri": 17, "removedirector": 17, "removefriend": 18, "removefromcontinuewatch": 28, "removefromwatchlist": [17, 18], "removegenr": [7, 14, 17], "removehomeus": 18, "removeitem": [10, 20, 21], "removelabel": 17, "removelisten": 16, "removeloc": 14, "removemanageduserpin": 18, "removemood": 17, "removepin": 18, "removeproduc": 17, "removesect": 18, "removesimilarartist": 17, "removestyl": 17, "removesubtitl": 28, "removetag": 17, "removewrit": 17, "remux": [23, 29], "renam": 15, "render": [23, 29], "renderd128": [23, 29], "rent": 15, "rental": 18, "repeat": [9, 21, 26], "repeatal": 9, "repeaton": 9, "replac": 16, "replai": [0, 26], "replay_path": 0, "replayadapt": 26, "report": [5, 6, 23, 29], "repres": [5, 6, 7, 9, 10, 14, 15, 18, 19, 20, 22, 23, 24, 25, 28], "represent": [7, 18], "reprocess": 15, "reproduc": 0, "republ": 14, "request": [0, 4, 7, 8, 9, 11, 12, 14, 15, 16, 18, 22, 23, 24, 26, 27, 29], "requestkei": 26, "requestparametersincooki": 22, "requesttimeout": 18, "requir": [0, 3, 4, 6, 7, 12, 14, 15, 17, 18, 22, 23, 24, 25, 27, 28, 29], "requiredbandwidth": 15, "reserv": 15, "reset": [14, 16, 17], "reset_base_head": 11, "resetmanagedhub": 14, "resetselectedsubtitlestream": 15, "resolut": [7, 10, 14, 15, 18, 19, 20, 22, 23, 25, 29], "resolv": 27, "resourc": [0, 3, 6, 9, 10, 13, 14, 15, 18, 22, 28], "resourceconnect": 18, "resourcefilepath": 15, "respect": [5, 18], "respond": 9, "respons": [0, 4, 6, 7, 8, 9, 16, 18, 19, 22, 23, 24, 26, 27, 28, 29], "responsecach": [8, 22], "respres": 14, "restart": [8, 23, 29], "restrict": [3, 14, 18, 23, 29], "result": [0, 4, 7, 10, 14, 17, 18, 20, 22, 23, 26, 27, 29], "result1": 14, "result2": 14, "result3": 14, "result4": 14, "retain": [23, 29], "retri": [0, 18, 22, 26], "retriev": [7, 14, 15, 17, 18, 21, 22], "retry_backoff": 0, "return": [0, 3, 4, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 25, 26, 27, 28], "reus": [0, 3, 26], "revalid": [8, 16], "reversesearchtyp": 27, "reversetagtyp": 27, "review": [14, 15, 28], "rget": 27, "rica": 14, "rico": 14, "right": [9, 15], "ripe": 15, "role": [14, 15, 18, 28], "roll": [23, 29], "root": [4, 5, 22, 27], "roottitl": 25, "rotat": 0, "rotate_byt": 0, "rotten": [14, 28], "rottentomato": [14, 15, 28], "round": 22, "rout": 3, "router": [23, 29], "rtag": 7, "rule": 8, "run": [0, 4, 5, 14, 18, 22, 23, 29], "runbutlertask": 22, "runtimeerror": 18, "russia": 14, "rxx": 3, "s00e00": [7, 28], "sai": [25, 28], "salvador": 14, "same": [0, 3, 4, 14, 17, 20, 22, 26], "sampl": 15, "samplingr": 15, "sar": 14, "satur": [22, 27], "save": [0, 7, 14, 18, 23, 26, 27], "saveedit": 7, "savemultiedit": 14, "savepath": [6, 7, 19, 22, 27, 28], "scale": [15, 25], "scan": [3, 5, 13, 14, 15, 22, 23, 29], "scan_for_cli": 13, "scanner": [14, 23, 29], "scannerlowprior": [23, 29], "scantyp": 15, "scari": 15, "sceneorsampl": 28, "schedul": [14, 22, 23, 29], "scheduledlibraryupdateinterv": [23, 29], "scheduledlibraryupdatesen": [23, 29], "schedulerandom": 22, "scheme": 18, "schwarzenegg": 14, "scifi": 15, "scope": [3, 18, 22, 25, 27], "score": [14, 15], "screen": [7, 9, 18], "screendens": 18, "screenresolut": 18, "screenshot": 14, "script": [0, 13], "scrobbl": 6, "scrobbletyp": 18, "sd": 15, "sdh": [15, 18, 28], "se": 25, "search": [0, 3, 4, 6, 7, 10, 13, 14, 15, 17, 18, 19, 20, 22, 26, 27, 28], "searchalbum": 14, "searchartist": 14, "searchdiscov": 18, "searchepisod": 14, "searchmovi": 14, "searchphoto": 14, "searchresult": [15, 17], "searchseason": 14, "searchshow": 14, "searchsubtitl": 28, "searchtrack": 14, "searchtyp": 27, "season": [7, 10, 14, 18, 20, 22, 25, 28], "seasoncount": 28, "seasoneditmixin": [14, 17], "seasonepisod": 28, "seasonmixin": [17, 28], "seasonnumb": 28, "second": [0, 4, 8, 9, 14, 16, 17, 18, 20, 22, 23, 26, 27, 29], "secondari": 14, "secret": [0, 27], "secretsfilt": 27, "section": [3, 4, 7, 8, 10, 11, 14, 15, 16, 18, 19, 20, 21, 22, 26, 27, 28], "sectionbyid": [4, 14], "sectionid": [4, 14, 22], "secur": [23, 29], "secureconnect": [23, 29], "see": [0, 3, 4, 6, 7, 9, 10, 11, 14, 16, 17, 18, 19, 20, 21, 22, 24, 25, 26, 27, 28], "seed": 6, "seek": [7, 9, 23, 29], "seekto": 9, "seem": [9, 14, 15, 18], "segment": [16, 23, 29], "segmentedtranscodertimeout": [23, 29], "select": [9, 15, 17, 18, 21, 28], "selecteditem": 21, "self": [9, 13, 17, 20, 28], "semicolon": 0, "send": [0, 4, 9, 14, 16, 18, 22, 23, 26, 29], "sendcommand": 9, "sens": [15, 28], "sensit": 0, "sent": [0, 4, 5, 9, 16, 18, 22, 24], "separ": [0, 3, 6, 10, 14, 17, 19, 20, 22, 23, 27, 28, 29], "sequenti": 5, "seri": [14, 18, 28], "serial": 0, "serv": 16, "server": [0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 13, 14, 15, 16, 17, 18, 19, 20, 21, 23, 24, 25, 26, 27, 28, 29], "server_baseurl": 0, "server_token": 0, "serverid": 18, "servernam": 3, "servic": [3, 13, 14, 15, 17, 18, 23, 29], "session": [0, 4, 5, 6, 7, 9, 11, 15, 18, 19, 22, 24, 26, 27, 28], "session_bandwidth_restrict": 22, "sessionkei": 7, "set": [0, 2, 5, 6, 7, 8, 9, 10, 11, 14, 15, 17, 18, 22, 25, 26, 27, 28, 29], "setart": 17, "setaudiostream": 9, "setdatetimetimezon": 27, "setlogo": 17, "setmanageduserpin": 18, "setparamet": 9, "setpin": 18, "setpost": 17, "setrepeat": 9, "setselect": 15, "setselectedaudiostream": 15, "setselectedsubtitlestream": 15, "setshuffl": 9, "setsquareart": 17, "setstream": 9, "setsubtitlestream": 9, "setthem": 17, "setup": 14, "setvideostream": 9, "setvolum": [3, 9], "setxmlpars": [0, 27], "sever": [3, 23, 26, 29], "sha1": 27, "sha1hash": 27, "share": [0, 3, 4, 8, 14, 18, 22, 23, 26, 29], "shared_serv": 18, "shared_usernam": 3, "short": [23, 27], "should": [0, 3, 7, 8, 14, 16, 18, 21, 27], "show": [3, 7, 10, 14, 17, 18, 20, 21, 22, 23, 25, 28, 29], "show_secret": [0, 9, 22], "showeditmixin": [14, 17], "showitem": 10, "showlibrari": 14, "showmixin": [17, 28], "shown": [18, 28], "showord": 28, "showsect": 14, "showstatu": [22, 27], "shuffl": [9, 21], "side": [15, 21, 25], "sign": [18, 22, 23, 27, 29], "signatur": 18, "significantli": [23, 29], "signin": 22, "signinst": 22, "signl": 18, "signout": 18, "similar": [6, 14, 15, 17, 21, 22, 28], "similarartistmixin": 17, "simpl": 9, "simpli": [0, 3, 11, 22], "simplifi": 14, "simultan": [0, 23, 29], "sinc": [8, 14], "sing": [6, 22], "singapor": 14, "singl": [0, 4, 5, 6, 7, 8, 10, 14, 15, 18, 19, 20, 21, 22, 23, 25, 26, 28], "singleflight": 26, "sita": 22, "size": [0, 7, 14, 15, 16, 21, 23, 25, 29], "skip": [3, 6, 7, 9, 14, 18, 22], "skipcount": 6, "skipdetail": 28, "skipnext": [3, 9], "skippar": 28, "skipprevi": 9, "skipto": 9, "slash": 3, "slow": [16, 23, 29], "slower": [23, 29], "slug": [15, 28], "smaller": [7, 23, 29], "smallest": 22, "smart": [10, 14, 17, 20, 22], "smartfiltermixin": 17, "snapshot": [15, 16], "so": [0, 3, 4, 7, 8, 14, 16, 22, 26, 27], "socket": 5, "some": [3, 7, 9, 14, 23, 25, 29], "someth": [17, 23, 25, 28, 29], "sometim": [0, 18], "sonic": [6, 14], "sonicadventur": [6, 14], "sonicallysimilar": 6, "sono": 2, "sonos_speak": 3, "soon": [7, 14, 22, 27], "sort": [4, 6, 10, 14, 17, 18, 19, 20, 22, 23, 25, 28, 29], "sorttitl": 17, "sorttitlemixin": 17, "sortupd": 10, "soundtrack": 28, "sourc": [2, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28], "sourceaudiocodec": 15, "sourcekei": 15, "sourcetitl": 18, "sourceuri": [6, 7, 19, 28], "sourcevideocodec": 15, "south": 14, "space": [15, 23, 29], "spain": 14, "span": 22, "speaker": 24, "special": [14, 28], "specif": [0, 6, 7, 9, 10, 14, 18, 20, 22, 23, 24, 25, 26, 27, 28, 29], "specifi": [0, 4, 5, 6, 7, 9, 10, 11, 14, 15, 17, 18, 19, 20, 21, 22, 23, 24, 25, 27, 28], "speed": [15, 22, 23, 29], "speedi": 7, "spell": 22, "spent": 16, "spielberg": 14, "spill": 28, "split": [14, 17, 27], "splitmergemixin": 17, "squar": [15, 17], "squareart": [15, 17], "squareartlockmixin": 17, "squareartmixin": 17, "squarearturl": 17, "squarearturlmixin": 17, "srt": 15, "srv": 14, "ss": [17, 27], "ssdp": [23, 29], "ssl": 18, "stai": [7, 14], "standard": [0, 5, 27], "star": [3, 6, 10, 15, 17, 19, 28], "start": [5, 7, 8, 9, 14, 15, 18, 21, 23, 24, 27, 29], "startalertlisten": [5, 22], "startitem": 21, "startramp": 15, "stat": 16, "state": [5, 7, 9, 14, 15, 18, 22, 25], "static": 25, "station": [6, 14, 20, 21], "statist": 22, "statisticsbandwidth": 22, "statisticsresourc": 22, "statu": [7, 16, 18, 25], "stb": 13, "step": [3, 9], "stepback": 9, "stepforward": 9, "stephen": 15, "steven": 14, "stevi": 3, "still": [0, 4, 7, 15, 23, 29], "sting": 19, "stink": 0, "stop": [5, 7, 9, 18, 23, 29], "storag": 14, "store": [6, 7, 8, 10, 11, 15, 19, 20, 23, 28, 29], "str": [4, 6, 7, 8, 9, 10, 11, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28], "straight": 25, "stream": [7, 9, 14, 15, 17, 22, 23, 26, 28, 29], "streamid": 28, "streamidentifi": 15, "streamingbrainvers": 22, "streamingservic": 17, "streamitem": [7, 14], "streamqueri": 22, "streamtitl": 28, "streamtyp": 15, "strftime": [22, 27], "string": [0, 3, 6, 7, 9, 10, 14, 16, 18, 20, 21, 22, 23, 25, 26, 27, 28, 29], "studio": [6, 14, 17, 28], "studiomixin": 17, "stuff": 18, "style": [3, 6, 14, 15, 17, 25], "stylemixin": 17, "subclass": [4, 5], "subdivis": 18, "subfold": [6, 14, 19, 28], "subformat": [6, 15], "subject": [23, 29], "subnet": [22, 23, 29], "subsampl": 15, "subscrib": 18, "subscript": [3, 15, 18, 22, 24], "subscriptionact": [18, 22], "subscriptiondescript": 18, "subscriptionfeatur": [18, 22], "subscriptionpaymentservic": 18, "subscriptionplan": 18, "subscriptionst": 22, "subscriptionstatu": 18, "subscriptionsubscribedat": 18, "subsequ": 9, "subset": 7, "subtitl": [7, 9, 14, 15, 18, 22, 25, 28], "subtitledecis": 15, "subtitlelanguag": [14, 28], "subtitlemod": [22, 28], "subtitles": 25, "subtitlestream": [7, 15, 28], "subtitlestreamid": 9, "subtyp": [10, 14, 28], "succe": 18, "succeed": 18, "success": 18, "successfulli": 0, "suffix": 14, "suit": 3, "summari": [6, 7, 10, 14, 17, 19, 20, 23, 28], "summary__icontain": 14, "summarymixin": 17, "super": [23, 29], "superfast": [23, 29], "supersed": 18, "suport": 18, "supplement": 0, "suppli": 15, "support": [3, 7, 9, 13, 18, 21, 23, 24, 25, 27, 28, 29], "sure": [0, 14], "surviv": 8, "sweden": 14, "switch": [18, 22], "switchhomeus": 18, "switchus": 22, "switzerland": 14, "sync": [2, 3, 6, 7, 10, 14, 15, 18, 19, 20, 22, 23, 28, 29], "sync_item": 18, "sync_items_wd": 14, "synchron": [4, 6, 10, 14, 16, 19, 20, 25], "syncitem": [6, 10, 14, 18, 19, 20, 25, 28], "syncitemid": 15, "synclist": [18, 22, 25], "syncmyplexlogingcdeferr": [23, 29], "syncpagingitemslimit": [23, 29], "syncstat": 15, "system": [0, 7, 14, 21, 22, 23, 29], "systemaccount": [7, 22], "systemaudiocodec": [23, 29], "systemdevic": [7, 22], "t": [3, 7, 9, 10, 14, 17, 18, 20, 22, 23, 25, 28, 29], "tab": [14, 22], "tag": [4, 6, 7, 9, 10, 14, 15, 17, 18, 19, 20, 21, 22, 23, 27, 28], "tag__": 7, "tagkei": [14, 15], "taglin": [7, 14, 17, 28], "taglinemixin": 17, "tagmixin": 17, "tagtyp": [14, 27], "tagvalu": 14, "taiwan": 14, "take": [0, 9, 14, 15, 23, 29], "taken": [5, 19], "talk": 15, "talkingpoint": 15, "target": [3, 5, 6, 14, 15, 18, 25, 28], "task": [14, 22, 23, 29], "taudio": 6, "teen": 15, "tell": [7, 9], "temp": 22, "templat": [16, 27], "temporari": [23, 29], "term": 22, "terribli": 22, "test": [0, 13], "test_myplex_updatefriend": 3, "test_myplex_us": 3, "test_sync": 3, "text": [15, 16, 23, 29], "tha": 15, "than": [7, 14, 18, 22], "theater": [23, 29], "thei": [0, 4, 14, 16, 22, 23, 26, 27, 29], "them": [0, 3, 8, 18], "theme": [6, 7, 10, 14, 15, 17, 28], "themeid": [6, 10, 28], "themelockmixin": 17, "thememixin": 17, "themeurl": 17, "themeurlmixin": 17, "themoviedb": [7, 14, 15, 17], "themselv": 18, "therefor": [0, 5, 7], "thetvdb": [14, 17, 28], "thi": [0, 3, 4, 5, 6, 7, 8, 9, 10, 13, 14, 15, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29], "thing": [0, 7, 15], "think": [7, 17], "those": 7, "thread": [0, 4, 5, 16, 18, 26, 27], "three": [14, 23, 29], "thriller": 14, "throne": [3, 22], "throttl": [15, 23, 29], "through": [0, 3, 4, 9, 17, 27], "thumb": [6, 10, 14, 15, 17, 18, 19, 20, 22, 27, 28], "thumbaspectratio": 28, "thumbblurhash": [6, 10, 28], "thumbid": [6, 10, 15, 19, 28], "thumbnail": [6, 7, 10, 14, 15, 18, 19, 22, 23, 28, 29], "thumburl": [17, 22], "tidal": [18, 28], "tiff": [23, 29], "time": [0, 4, 6, 7, 8, 9, 14, 15, 16, 17, 18, 21, 22, 23, 25, 26, 27, 28, 29], "timedelta": 22, "timelin": [5, 7, 9, 13, 14, 23, 24, 29], "timeout": [0, 4, 9, 17, 18, 22, 23, 24, 26, 27, 29], "timespan": 22, "timestamp": [7, 8, 14, 15, 17, 18], "timezon": [0, 18, 27], "titl": [3, 4, 6, 7, 9, 10, 14, 15, 17, 18, 19, 20, 22, 23, 24, 25, 28, 29], "title1": 14, "title2": 14, "titlemixin": 17, "titlesort": [6, 10, 14, 18, 19, 20, 28], "tl": [23, 29], "tldr": 14, "tmdb": [7, 14, 15, 28], "tmdbair": 28, "tmp": 0, "todatetim": [0, 27], "todict": 16, "togeth": [14, 17], "toggl": [0, 9], "toggleosd": 9, "tojson": 27, "token": [0, 3, 4, 7, 8, 9, 12, 15, 18, 22, 23, 24, 26, 27, 29], "tolist": 27, "tomato": [14, 28], "took": 16, "tool": [3, 27], "top": [3, 15, 22, 27], "topic": 15, "topleft": 15, "topright": 15, "toprometheu": 16, "total": [0, 7, 14, 16, 18, 22, 23, 25, 29], "totaldur": 14, "totals": [7, 14, 25], "totalstorag": 14, "totalviews": 14, "tourl": 23, "trace": [0, 26], "track": [6, 7, 10, 14, 15, 17, 18, 20, 22, 28], "track_only_attribut": 15, "trackartist": 17, "trackartistmixin": 17, "trackdiscnumbermixin": 17, "trackeditmixin": [14, 17], "trackhistori": 6, "trackmixin": [6, 17], "tracknumb": [6, 17], "tracknumbermixin": 17, "tracksess": 6, "trail": 3, "trailer": [14, 22, 23, 28, 29], "trancodejob": 15, "transcod": [5, 7, 14, 15, 22, 23, 25, 29], "transcodecountlimit": [23, 29], "transcodehwdecod": 15, "transcodehwdecodingtitl": 15, "transcodehwencod": 15, "transcodehwencodingtitl": 15, "transcodehwfullpipelin": 15, "transcodehwrequest": 15, "transcodeimag": 22, "transcodejob": [15, 22], "transcoderactivevideosess": 22, "transcoderaudio": 22, "transcodercanonlyremuxvideo": [23, 29], "transcoderdefaultdur": [23, 29], "transcoderh264backgroundpreset": [23, 29], "transcoderh264minimumcrf": [23, 29], "transcoderh264opt": [23, 29], "transcoderh264optionsoverrid": [23, 29], "transcoderh264preset": [23, 29], "transcoderliveprunebuff": [23, 29], "transcoderloglevel": [23, 29], "transcoderlyr": 22, "transcoderphoto": 22, "transcoderprunebuff": [23, 29], "transcoderqu": [23, 29], "transcodersubtitl": 22, "transcodertempdirectori": [23, 29], "transcoderthrottlebuff": [23, 29], "transcodervideo": 22, "transcodervideobitr": 22, "transcodervideoqu": 22, "transcodervideoresolut": 22, "transcodervideoresolutionlimit": [23, 29], "transcodesess": [7, 15, 22], "transfer": 21, "transient": 15, "translat": 7, "transport": [0, 2, 18, 22], "transportconfig": [0, 18, 22, 26], "trash": [3, 14, 22, 23, 29], "trc": 15, "treat": 9, "tree": [7, 14, 22, 27], "tri": 27, "trinidad": 14, "trip": 19, "true": [0, 3, 4, 6, 7, 8, 9, 10, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 25, 26, 27, 28, 29], "trust": [], "try": [0, 3, 10, 14, 18, 20], "tt": [7, 23, 29], "tt0944947": 14, "ttl": 8, "ttrack": 6, "tune": 0, "tupl": [7, 16, 18, 22, 27], "turn": [7, 23, 29], "tv": [0, 3, 7, 10, 14, 16, 18, 21, 22, 23, 24, 28, 29], "tvdb": [7, 14, 15, 28], "tvshow": 18, "two": [3, 12, 15, 18], "twofactoren": 18, "twofactorrequir": 12, "type": [3, 4, 5, 6, 7, 9, 10, 11, 12, 13, 14, 15, 16, 18, 19, 20, 21, 22, 23, 25, 27, 28], "typic": [6, 28], "tzdata": 0, "tzinfo": 27, "u": [3, 14, 23, 27, 29], "ubuntu": 18, "ui": [22, 25], "ultra": [6, 10, 23, 28, 29], "ultrablurcolor": [6, 10, 15, 28], "ultrafast": [23, 29], "unabl": [14, 18, 20, 22], "unam": 0, "unauthor": 12, "unclaim": 22, "under": [2, 7], "underli": 4, "underscor": 7, "understand": [3, 9], "undocu": [23, 29], "undon": 14, "unencrypt": [23, 29], "uninstal": 16, "union": 18, "uniqu": [0, 6, 9, 10, 14, 15, 18, 19, 20, 22, 23, 24, 25, 27, 28, 29], "unit": [14, 15], "univers": 28, "unix": 17, "unknown": [6, 7, 9, 12, 14, 15, 18, 19, 22, 23, 25, 27, 28, 29], "unknowntyp": 12, "unless": [3, 21, 22], "unlik": [7, 27], "unlimit": [6, 10, 14, 19, 20, 23, 28, 29], "unlock": [14, 17], "unlockallfield": 14, "unlockart": 17, "unlocklogo": 17, "unlockpost": 17, "unlocksquareart": 17, "unlockthem": 17, "unmatch": [14, 17], "unmatchmatchmixin": 17, "unoffici": 3, "unpack": [22, 27], "unplai": [17, 18, 28], "unregist": 16, "unreli": [23, 29], "unsupport": [4, 7, 9, 10, 12, 20, 22], "untest": 14, "until": [8, 14, 16], "unus": 14, "unwatch": [3, 4, 10, 14, 20, 22, 23, 25, 28, 29], "up": [4, 7, 9, 14, 21, 22, 23, 26, 27, 29], "upcom": [23, 29], "updat": [5, 6, 7, 10, 13, 14, 17, 18, 19, 20, 21, 22, 23, 28, 29], "updatedat": [6, 10, 14, 19, 20, 22, 28], "updatefilt": [10, 20], "updatefriend": 18, "updatemod": 10, "updateprogress": 7, "updatequeues": 14, "updatetimelin": 7, "updatevis": 14, "upgrad": [23, 29], "upload": [15, 17, 18, 22, 23, 28, 29], "uploadart": 17, "uploadlogo": 17, "uploadpost": 17, "uploadsquareart": 17, "uploadsubtitl": 28, "uploadthem": 17, "upper": [0, 16], "upright": 15, "upscal": 22, "uri": [6, 10, 15, 18, 19, 20, 21, 28], "url": [0, 3, 4, 6, 7, 9, 10, 14, 15, 16, 17, 18, 19, 20, 22, 23, 25, 26, 27, 28, 29], "urllib3": 26, "uruguai": 14, "us": [0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29], "usag": [0, 7, 14, 22, 23, 29], "useoriginaltitl": 28, "user": [0, 3, 7, 10, 11, 12, 14, 15, 16, 17, 18, 20, 22, 23, 27, 29], "useraccount": 18, "userid": 15, "usernam": [0, 3, 12, 18, 20, 22, 27], "userplex": 22, "userr": [6, 10, 14, 17, 19, 28], "userratingmixin": 17, "userst": 18, "useruuid": 18, "usual": [15, 28], "utc": [0, 27], "utf": [9, 22], "util": [2, 18, 23, 26, 29], "uuid": [0, 7, 14, 18], "uuu": 27, "v2": [16, 18], "valid": [3, 4, 8, 18, 23, 25, 27], "valu": [0, 3, 5, 6, 7, 9, 10, 11, 13, 14, 15, 16, 17, 18, 19, 20, 23, 25, 26, 27, 28, 29], "var": [23, 29], "variabl": [3, 6, 7, 9, 10, 11, 13, 14, 15, 16, 18, 19, 20, 21, 22, 23, 24, 25, 27, 28], "ve": [7, 25], "vendor": [9, 18], "venezuela": 14, "verbos": [23, 29], "veri": [0, 7, 14, 22, 23, 29], "verif": 18, "verifi": 18, "verify_signatur": 18, "verifyjwt": 18, "version": [0, 5, 6, 9, 13, 15, 18, 21, 22, 23, 24, 25, 28, 29], "veryfast": [23, 29], "veryslow": [23, 29], "via": [0, 3, 24], "video": [2, 3, 7, 9, 10, 14, 15, 17, 18, 20, 22, 23, 25, 29], "video_quality_": [10, 14, 20, 25, 28], "video_quality_10_mbps_1080p": 28, "video_quality_3_mbps_720p": 14, "video_quality_origin": 28, "videocodec": 15, "videodecis": 15, "videofil": 27, "videoframer": 15, "videoondemand": 18, "videoprofil": 15, "videoqu": [10, 14, 20, 25, 28], "videoresolut": [7, 15, 25], "videostream": [7, 15], "videostreamid": 9, "view": [6, 7, 10, 14, 20, 23, 28, 29], "viewcount": [6, 7, 14, 18, 28], "viewcount__gt": [7, 14], "viewedat": 7, "viewedleafcount": [6, 18, 28], "viewgroup": 14, "viewmod": 14, "viewoffset": [6, 18, 28], "viewstat": 18, "viewstatesync": 18, "violenc": 15, "visibl": [10, 14], "vision": 15, "visual": 15, "visualimpair": 15, "vlc": 7, "vnd": [23, 29], "vod": 18, "voic": [15, 22, 28], "voicesearch": 22, "volum": 9, "w": 14, "wa": [4, 5, 6, 7, 8, 10, 14, 15, 16, 18, 19, 20, 22, 25, 26, 28], "wait": [0, 9, 18, 22, 23, 26, 27, 29], "waitforlogin": 18, "walk": [14, 22], "wan": 15, "wanperstreammaxuploadr": [23, 29], "wanperuserstreamcount": [23, 29], "want": [3, 7, 9, 14, 18, 22], "wantotalmaxuploadr": [23, 29], "warn": [0, 17, 23, 29], "wasn": 18, "watch": [7, 10, 14, 18, 20, 22, 23, 25, 28, 29], "watchlist": [17, 18], "watchlistedat": 18, "watchlistmixin": 17, "watchmusicsect": [23, 29], "wav": [23, 29], "we": [3, 6, 7, 9, 22, 27], "web": [3, 7, 14, 17, 18, 22, 23, 29], "webhook": [22, 23, 29], "webhooksen": [23, 29], "websocket": [5, 22], "webui": 7, "week": [14, 22, 23, 28, 29], "well": [5, 7, 22], "were": [7, 9, 22], "what": [3, 15, 17, 18, 23, 27], "when": [0, 5, 6, 7, 8, 9, 10, 14, 15, 17, 18, 19, 20, 21, 22, 23, 25, 26, 27, 28, 29], "where": [0, 6, 7, 10, 14, 15, 19, 20, 21, 22, 25, 27, 28], "whether": [0, 7, 15, 18, 22], "which": [0, 3, 5, 7, 9, 10, 14, 15, 16, 18, 23, 24, 25, 26, 27, 29], "while": [7, 14, 16, 22, 23, 26, 29], "who": [6, 28], "whole": [7, 27], "why": 3, "width": [15, 22, 27], "wiki": [3, 9, 24], "window": [0, 18, 21, 22, 28], "winter": 14, "wise": [14, 22], "wish": [0, 9], "within": [11, 14, 15, 18, 22, 25, 27], "without": [0, 3, 4, 7, 8, 23, 26, 27, 29], "wma": [23, 29], "wmv": [23, 29], "wonder": 3, "word": 3, "work": [0, 6, 7, 14, 19, 22, 24, 25, 27, 28], "worker": 7, "world": 19, "would": [6, 7, 10, 14, 18, 19, 20, 21, 22, 25, 28], "wouldn": [10, 14, 20, 25, 28], "wrap": 4, "wrapper": [3, 4, 9], "write": [0, 18, 23, 27, 29], "writer": [14, 15, 17, 28], "writermixin": 17, "ws_socket": 5, "wtv": [23, 29], "www": 18, "wxh": 25, "x": [9, 11, 16, 18, 22, 23, 24, 25, 27, 29], "x264": [23, 29], "x86_64": 18, "x_plex_container_s": [14, 22], "x_plex_devic": [0, 25], "x_plex_device_nam": 0, "x_plex_identifi": 0, "x_plex_languag": 0, "x_plex_platform": [0, 25], "x_plex_platform_vers": [0, 25], "x_plex_product": 0, "x_plex_provid": [0, 25], "x_plex_vers": 0, "xbhsmsjsdj763jsm": 0, "xbox": 28, "xml": [0, 3, 4, 6, 7, 9, 14, 18, 19, 22, 23, 27, 28, 29], "xml_parser": [0, 3], "xmlparseerror": 27, "xn": [14, 19], "xvid": 15, "xxx": 15, "xxxx": [10, 20], "xxxxxxxxx": [10, 20], "xxxxxxxxxxxxxxxxxxxx": [4, 7, 8, 15, 22, 26], "xyz": 3, "y": [7, 14, 22], "ye": 28, "year": [6, 7, 10, 14, 17, 19, 28], "yet": [0, 25], "yield": [7, 14, 22, 27], "you": [0, 3, 5, 7, 9, 14, 17, 18, 20, 21, 22, 23, 25, 29], "your": [0, 3, 4, 7, 9, 14, 15, 18, 22, 23, 24, 25, 29], "yyyi": [14, 17], "zealand": 14, "zero": [9, 24], "zip": [22, 27], "zoneinfo": 0, "\u0e44\u0e17\u0e22": 15, "\u8ee2\u3005": 28, "\uadf8\ub140": 28, "\uc5fd\uae30\uc801\uc778": 28}, "titles": ["Configuration", "&lt;no title&gt;", "Table of Contents", "Python-PlexAPI", "Aio <span class=\"modname\">plexapi.aio</span>", "Alert <span class=\"modname\">plexapi.alert</span>", "Audio <span class=\"modname\">plexapi.audio</span>", "Base <span class=\"modname\">plexapi.base</span>", "Cache <span class=\"modname\">plexapi.cache</span>", "Client <span class=\"modname\">plexapi.client</span>", "Collection <span class=\"modname\">plexapi.collection</span>", "Config <span class=\"modname\">plexapi.config</span>", "Exceptions <span class=\"modname\">plexapi.exceptions</span>", "Gdm <span class=\"modname\">plexapi.gdm</span>", "Library <span class=\"modname\">plexapi.library</span>", "Media <span class=\"modname\">plexapi.media</span>", "Metrics <span class=\"modname\">plexapi.metrics</span>", "Mixins <span class=\"modname\">plexapi.mixins</span>", "MyPlex <span class=\"modname\">plexapi.myplex</span>", "Photo <span class=\"modname\">plexapi.photo</span>", "Playlist <span class=\"modname\">plexapi.playlist</span>", "Playqueue <span class=\"modname\">plexapi.playqueue</span>", "Server <span class=\"modname\">plexapi.server</span>", "Settings <span class=\"modname\">plexapi.settings</span>", "Sonos <span class=\"modname\">plexapi.sonos</span>", "Sync <span class=\"modname\">plexapi.sync</span>", "Transport <span class=\"modname\">plexapi.transport</span>", "Utils <span class=\"modname\">plexapi.utils</span>", "Video <span class=\"modname\">plexapi.video</span>", "&lt;no title&gt;"], "titleterms": {"aio": 4, "alert": 5, "audio": 6, "auth": 0, "base": 7, "cach": 8, "client": 9, "collect": 10, "common": 3, "config": 11, "configur": 0, "content": 2, "contribut": 2, "control": 3, "document": 3, "environ": 0, "exampl": 3, "except": 12, "gdm": 13, "get": 3, "header": 0, "instal": 3, "instanc": 3, "librari": 14, "log": 0, "media": 15, "metric": 16, "mixin": 17, "modul": 2, "myplex": 18, "option": 0, "over": 3, "overview": [2, 3], "photo": 19, "playlist": 20, "playqueu": 21, "plexapi": [0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28], "plexserv": 3, "python": 3, "question": 3, "run": 3, "section": 0, "server": 22, "set": 23, "sono": [3, 24], "speaker": 3, "sync": 25, "tabl": 2, "test": 3, "transport": 26, "usag": [2, 3], "util": 27, "variabl": 0, "video": 28}})
\ No newline at end of file
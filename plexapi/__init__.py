@@ -7,7 +7,7 @@ from uuid import getnode
 import plexapi.const as const
 import plexapi.utils as utils
 from plexapi.config import PlexConfig, reset_base_headers
-from plexapi.utils import SecretsFilter, setDatetimeTimezone
+from plexapi.utils import SecretsFilter, setDatetimeTimezone, setXMLParser
 
 # Load User Defined Config
 DEFAULT_CONFIG_PATH = os.path.expanduser('~/.config/plexapi/config.ini')
@@ -22,6 +22,8 @@ setDatetimeTimezone(CONFIG.get('plexapi.timezone', False))
 
 X_PLEX_CONTAINER_SIZE = CONFIG.get('plexapi.container_size', 100, int)
 X_PLEX_ENABLE_FAST_CONNECT = CONFIG.get('plexapi.enable_fast_connect', False, bool)
+FETCH_WORKERS = CONFIG.get('plexapi.fetch_workers', 1, int)
+setXMLParser(CONFIG.get('plexapi.xml_parser', 'etree'))
 
 # Plex Header Configuration
 X_PLEX_PROVIDES = CONFIG.get('header.provides', 'controller')
@@ -54,6 +56,8 @@ logfilter = SecretsFilter()
 if CONFIG.get('log.show_secrets', '').lower() != 'true':
     log.addFilter(logfilter)
 
+from plexapi.metrics import requestBudget  # noqa: E402,F401
+
 
 def __getattr__(name):
     """ Dynamic module attribute access for aliased values. """
@@ -0,0 +1,367 @@
+import asyncio
+import functools
+import warnings
+from xml.etree.ElementTree import Element
+
+from plexapi import log, metrics, utils
+from plexapi.base import OPERATORS, MediaContainer, PageBounds, PlexObject
+from plexapi.exceptions import BadRequest, NotFound, Unauthorized, Unsupported
+from plexapi.library import FilteringFieldType, FilteringType, Library
+from plexapi.server import PlexServer
+from requests.status_codes import _codes as codes
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncPlexServer:
+    """ Asyncio counterpart to :class:`~plexapi.server.PlexServer`. Requests are sent through an
+        ``aiohttp`` session so a single event loop can keep many requests in flight without
+        blocking a thread per request. The returned items are the same :class:`~plexapi.base.PlexObject`
+        subclasses built by :class:`~plexapi.server.PlexServer`. They are bound to a regular
+        (synchronous) :class:`~plexapi.server.PlexServer` sharing the same baseurl and token, so any
+        follow-up calls made directly on the objects (e.g. ``reload()`` or editing) are blocking.
+
+        Note: ``aiohttp`` must be installed in order to use this feature.
+
+        .. code-block:: python
+
+            >> pip install plexapi[async]
+
+        Parameters:
+            baseurl (str): Base url for to access the Plex Media Server (default: 'http://localhost:32400').
+            token (str): Required Plex authentication token to access the server.
+            session (aiohttp.ClientSession, optional): Use your own session object. A new session is created
+                (and closed with :func:`~plexapi.aio.AsyncPlexServer.close`) if not provided.
+            timeout (int, optional): Timeout in seconds for the requests to the server (default config.TIMEOUT).
+
+        Raises:
+            :exc:`~plexapi.exceptions.Unsupported`: aiohttp not installed.
+
+        Example:
+
+            .. code-block:: python
+
+                import asyncio
+                from plexapi.aio import AsyncPlexServer
+
+                async def main():
+                    async with AsyncPlexServer('http://localhost:32400', token='xxxxxxxxxxxxxxxxxxxx') as plex:
+                        movies = await plex.library.section('Movies')
+                        results = await asyncio.gather(
+                            movies.search(unwatched=True),
+                            plex.fetchItems('/library/recentlyAdded'),
+                        )
+
+                asyncio.run(main())
+
+    """
+
+    def __init__(self, baseurl=None, token=None, session=None, timeout=None):
+        if aiohttp is None:
+            raise Unsupported('aiohttp must be installed to use the AsyncPlexServer.')
+        # The synchronous server is used to build the connection details and is loaded with
+        # the server data on connect(). PlexObjects built from the responses are bound to it.
+        self._server = PlexServer.__new__(PlexServer)
+        self._server._configure(baseurl, token, timeout=timeout)
+        self._asession = session
+        self._ownsSession = session is None
+        self._library = None
+
+    def __getattr__(self, attr):
+        # Expose the loaded server attributes (friendlyName, machineIdentifier, version, etc.)
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        return getattr(self._server, attr)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}:{self._server._baseurl}>"
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    @property
+    def server(self):
+        """ The synchronous :class:`~plexapi.server.PlexServer` the built objects are bound to. """
+        return self._server
+
+    @property
+    def library(self):
+        """ :class:`~plexapi.aio.AsyncLibrary` to browse or search your media. """
+        if self._library is None:
+            self._library = AsyncLibrary(self)
+        return self._library
+
+    async def connect(self):
+        """ Load the server data from the root (``/``) endpoint. Returns itself. """
+        data = await self.query(self._server.key)
+        PlexObject.__init__(self._server, self._server, data, self._server.key)
+        return self
+
+    async def close(self):
+        """ Close the underlying ``aiohttp`` session if it was created by this object. """
+        if self._asession is not None and self._ownsSession:
+            await self._asession.close()
+            self._asession = None
+
+    def _session(self):
+        if self._asession is None:
+            self._asession = aiohttp.ClientSession()
+        return self._asession
+
+    async def query(self, key, method=None, headers=None, params=None, timeout=None, **kwargs):
+        """ Awaitable equivalent of :func:`~plexapi.server.PlexServer.query`. Sends the request
+            to the Plex server and parses the returned XML into an ElementTree object.
+            Returns None if no data exists in the response.
+
+            Parameters:
+                key (str): API URL path in Plex.
+                method (str, optional): HTTP method to use (default: 'GET').
+                headers (dict, optional): Additional headers to add to the request.
+                params (dict, optional): Additional params to add to the request.
+                timeout (int, optional): Timeout in seconds (default: the server timeout).
+                **kwargs (dict): Additional arguments passed to ``aiohttp.ClientSession.request``.
+        """
+        url = self._server.url(key)
+        method = (method or 'GET').upper()
+        timeout = aiohttp.ClientTimeout(total=timeout or self._server._timeout)
+        log.debug('%s %s', method, url)
+        headers = self._server._headers(**headers or {})
+        if params:
+            params = {k: str(v) for k, v in params.items() if v is not None}
+        with metrics.QueryEvent('server', method, url, key) as event:
+            async with self._session().request(
+                method, url, headers=headers, params=params, timeout=timeout, **kwargs
+            ) as response:
+                content = await response.read()
+                event.received(response, content)
+                if response.status not in (200, 201, 204):
+                    codename = codes.get(response.status)[0]
+                    errtext = content.decode('utf-8', errors='replace').replace('\n', ' ')
+                    message = f'({response.status}) {codename}; {response.url} {errtext}'
+                    if response.status == 401:
+                        raise Unauthorized(message)
+                    elif response.status == 404:
+                        raise NotFound(message)
+                    else:
+                        raise BadRequest(message)
+            return event.parse(utils.parseXMLString, content)
+
+    async def fetchItems(
+        self,
+        ekey,
+        cls=None,
+        container_start=None,
+        container_size=None,
+        maxresults=None,
+        params=None,
+        **kwargs,
+    ):
+        """ Awaitable equivalent of :func:`~plexapi.base.PlexObject.fetchItems`. See
+            :func:`~plexapi.base.PlexObject.fetchItems` for details on the parameters
+            and on filtering the XML attributes.
+        """
+        ekey = self._server._buildFetchKey(ekey)
+        results = MediaContainer[cls](self._server, Element('MediaContainer'), initpath=ekey)
+        bounds = PageBounds(container_start, container_size, maxresults)
+
+        while True:
+            headers = {
+                'X-Plex-Container-Start': str(bounds.start),
+                'X-Plex-Container-Size': str(bounds.size),
+            }
+            data = await self.query(ekey, headers=headers, params=params)
+            subresults = self._server._findPageItems(data, cls, ekey, **kwargs)
+            results.extend(subresults)
+            if not bounds.advance(data, len(subresults)):
+                break
+
+        return results
+
+    async def fetchItem(self, ekey, cls=None, **kwargs):
+        """ Awaitable equivalent of :func:`~plexapi.base.PlexObject.fetchItem`. See
+            :func:`~plexapi.base.PlexObject.fetchItem` for details on the parameters.
+        """
+        if isinstance(ekey, int):
+            ekey = f'/library/metadata/{ekey}'
+
+        try:
+            return (await self.fetchItems(ekey, cls, **kwargs))[0]
+        except IndexError:
+            clsname = cls.__name__ if cls else 'None'
+            raise NotFound(f'Unable to find elem: cls={clsname}, attrs={kwargs}') from None
+
+
+class AsyncLibrary:
+    """ Asyncio counterpart to :class:`~plexapi.library.Library`.
+
+        Parameters:
+            server (:class:`~plexapi.aio.AsyncPlexServer`): AsyncPlexServer this library belongs to.
+    """
+
+    def __init__(self, server):
+        self._aserver = server
+        self._sections = None
+
+    async def _loadSections(self):
+        """ Loads and caches all the library sections. """
+        if self._sections is None:
+            key = '/library/sections'
+            data = await self._aserver.query(key)
+            library = Library(self._aserver.server, None)
+            self._sections = [
+                AsyncLibrarySection(self._aserver, library._buildSection(elem, key))
+                for elem in data
+            ]
+        return self._sections
+
+    async def sections(self):
+        """ Returns a list of all media sections in this library as
+            :class:`~plexapi.aio.AsyncLibrarySection` objects.
+        """
+        return list(await self._loadSections())
+
+    async def section(self, title):
+        """ Returns the :class:`~plexapi.aio.AsyncLibrarySection` that matches the specified title.
+            See :func:`~plexapi.library.Library.section` for details.
+
+            Raises:
+                :exc:`~plexapi.exceptions.NotFound`: The library section title is not found on the server.
+        """
+        normalized_title = title.lower().strip()
+        sections = [s for s in await self._loadSections() if s.title.lower().strip() == normalized_title]
+        if not sections:
+            raise NotFound(f'Invalid library section: {title}')
+        if len(sections) > 1:
+            warnings.warn(
+                'Multiple library sections with the same title found, use "sectionByID" instead. '
+                'Returning the last section.'
+            )
+        return sections[-1]
+
+    async def sectionByID(self, sectionID):
+        """ Returns the :class:`~plexapi.aio.AsyncLibrarySection` that matches the specified sectionID.
+
+            Raises:
+                :exc:`~plexapi.exceptions.NotFound`: The library section ID is not found on the server.
+        """
+        try:
+            return next(s for s in await self._loadSections() if s.key == sectionID)
+        except StopIteration:
+            raise NotFound(f'Invalid library sectionID: {sectionID}') from None
+
+
+class AsyncLibrarySection:
+    """ Asyncio wrapper around a :class:`~plexapi.library.LibrarySection`. The attributes of
+        the wrapped section (title, key, type, etc.) are available directly on this object.
+
+        Parameters:
+            server (:class:`~plexapi.aio.AsyncPlexServer`): AsyncPlexServer this section belongs to.
+            section (:class:`~plexapi.library.LibrarySection`): The wrapped library section.
+    """
+
+    def __init__(self, server, section):
+        self._aserver = server
+        self._section = section
+
+    def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        return getattr(self._section, attr)
+
+    def __repr__(self):
+        return f"<Async{repr(self._section)[1:]}"
+
+    @property
+    def section(self):
+        """ The wrapped synchronous :class:`~plexapi.library.LibrarySection`. """
+        return self._section
+
+    async def _queryFilters(self, key):
+        """ Asynchronous equivalent of :func:`~plexapi.library.LibrarySection._queryFilters`. """
+        section = self._section
+        filterCache = getattr(section._server, '_filterCache', None)
+        if filterCache is not None and '_filterCacheVersion' not in section.__dict__:
+            # The sections of the async library are never served from the response cache
+            section.__dict__['_filterCacheVersion'] = filterCache.version(section)
+        data = filterCache.get(section, key) if filterCache is not None else None
+        if data is None:
+            data = await self._aserver.query(key)
+            if filterCache is not None:
+                filterCache.set(section, key, data)
+        return data
+
+    async def _loadFilters(self):
+        """ Asynchronously retrieves the filter metadata used to validate search filters and sorts.
+            The values are stored in the cache of the wrapped :class:`~plexapi.library.LibrarySection`.
+        """
+        section = self._section
+        if '_loadFilters' in section.__dict__:
+            return section._loadFilters
+
+        _key = ('/library/sections/{key}/{filter}?includeMeta=1&includeAdvanced=1'
+                '&X-Plex-Container-Start=0&X-Plex-Container-Size=0')
+
+        data = await self._queryFilters(_key.format(key=section.key, filter='all'))
+        filterTypes = section.findItems(data, FilteringType, rtag='Meta')
+        fieldTypes = section.findItems(data, FilteringFieldType, rtag='Meta')
+
+        if section.TYPE != 'photo':  # No collections for photo library
+            data = await self._queryFilters(_key.format(key=section.key, filter='collections'))
+            filterTypes.extend(section.findItems(data, FilteringType, rtag='Meta'))
+
+        guidFieldType = '<FieldType type="guid"><Operator key="=" title="is"/></FieldType>'
+        fieldTypes.append(section._manuallyLoadXML(guidFieldType, FilteringFieldType))
+
+        section.__dict__['_loadFilters'] = (filterTypes, fieldTypes)
+        return section._loadFilters
+
+    async def search(self, title=None, sort=None, maxresults=None, libtype=None,
+                     container_start=None, container_size=None, limit=None, filters=None, **kwargs):
+        """ Awaitable equivalent of :func:`~plexapi.library.LibrarySection.search`. See
+            :func:`~plexapi.library.LibrarySection.search` for details on the parameters.
+
+            Note: The filter metadata used to validate the filters and sorts is fetched asynchronously
+            the first time. Validating a tag filter by name (e.g. ``genre="Animation"``) requests the
+            filter choices through the synchronous server, so the filters are then validated in the
+            default executor of the event loop to avoid blocking it.
+        """
+        buildSearchKey = functools.partial(
+            self._section._buildSearchKey,
+            title=title, sort=sort, libtype=libtype, limit=limit, filters=filters, returnKwargs=True, **kwargs)
+        if (
+            sort is not None
+            or filters is not None
+            or isinstance(title, (list, tuple))
+            or any(field.split('__')[-1] not in OPERATORS for field in kwargs if field != 'includeGuids')
+        ):
+            await self._loadFilters()
+            key, kwargs = await asyncio.get_running_loop().run_in_executor(None, buildSearchKey)
+        else:
+            key, kwargs = buildSearchKey()
+        return await self._aserver.fetchItems(
+            key, container_start=container_start, container_size=container_size, maxresults=maxresults, **kwargs)
+
+    async def all(self, libtype=None, **kwargs):
+        """ Awaitable equivalent of :func:`~plexapi.library.LibrarySection.all`. """
+        libtype = libtype or self._section.TYPE
+        return await self.search(libtype=libtype, **kwargs)
+
+    async def get(self, title, **kwargs):
+        """ Awaitable equivalent of :func:`~plexapi.library.LibrarySection.get`.
+
+            Raises:
+                :exc:`~plexapi.exceptions.NotFound`: The title is not found in the library.
+        """
+        try:
+            return (await self.search(title, limit=1, **kwargs))[0]
+        except IndexError:
+            msg = f"Unable to find item with title '{title}'"
+            if kwargs:
+                msg += f" and kwargs {kwargs}"
+            raise NotFound(msg) from None
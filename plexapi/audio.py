@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import os
+from datetime import datetime
 from pathlib import Path
 from urllib.parse import quote_plus
 
 from typing import Any, Dict, List, Optional, TypeVar
 
 from plexapi import media, utils
-from plexapi.base import Playable, PlexPartialObject, PlexHistory, PlexSession, cached_data_property
+from plexapi.base import Playable, PlexPartialObject, PlexHistory, PlexSession, cached_data_property, data_field
 from plexapi.exceptions import BadRequest
 from plexapi.mixins import ArtistMixins, AlbumMixins, TrackMixins, PlayedUnplayedMixin
 from plexapi.playlist import Playlist
@@ -52,32 +53,30 @@ class Audio(PlexPartialObject, PlayedUnplayedMixin):
     """
     METADATA_TYPE = 'track'
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt'))
-        self.art = data.attrib.get('art')
-        self.artBlurHash = data.attrib.get('artBlurHash')
-        self.distance = utils.cast(float, data.attrib.get('distance'))
-        self.guid = data.attrib.get('guid')
-        self.index = utils.cast(int, data.attrib.get('index'))
-        self.key = data.attrib.get('key', '')
-        self.lastRatedAt = utils.toDatetime(data.attrib.get('lastRatedAt'))
-        self.lastViewedAt = utils.toDatetime(data.attrib.get('lastViewedAt'))
-        self.librarySectionID = utils.cast(int, data.attrib.get('librarySectionID'))
-        self.librarySectionKey = data.attrib.get('librarySectionKey')
-        self.librarySectionTitle = data.attrib.get('librarySectionTitle')
-        self.listType = 'audio'
-        self.musicAnalysisVersion = utils.cast(int, data.attrib.get('musicAnalysisVersion'))
-        self.ratingKey = utils.cast(int, data.attrib.get('ratingKey'))
-        self.summary = data.attrib.get('summary')
-        self.thumb = data.attrib.get('thumb')
-        self.thumbBlurHash = data.attrib.get('thumbBlurHash')
-        self.title = data.attrib.get('title')
-        self.titleSort = data.attrib.get('titleSort', self.title)
-        self.type = data.attrib.get('type')
-        self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt'))
-        self.userRating = utils.cast(float, data.attrib.get('userRating'))
-        self.viewCount = utils.cast(int, data.attrib.get('viewCount', 0))
+    addedAt = data_field(datetime)
+    art = data_field()
+    artBlurHash = data_field()
+    distance = data_field(float)
+    guid = data_field()
+    index = data_field(int)
+    key = data_field(default='')
+    lastRatedAt = data_field(datetime)
+    lastViewedAt = data_field(datetime)
+    librarySectionID = data_field(int)
+    librarySectionKey = data_field()
+    librarySectionTitle = data_field()
+    listType = data_field(default='audio')
+    musicAnalysisVersion = data_field(int)
+    ratingKey = data_field(int)
+    summary = data_field()
+    thumb = data_field()
+    thumbBlurHash = data_field()
+    title = data_field()
+    titleSort = data_field(fallback='title')
+    type = data_field()
+    updatedAt = data_field(datetime)
+    userRating = data_field(float)
+    viewCount = data_field(int, default=0)
 
     @cached_data_property
     def fields(self):
@@ -198,14 +197,14 @@ class Artist(
     TAG = 'Directory'
     TYPE = 'artist'
 
+    albumSort = data_field(int, default='-1')
+    audienceRating = data_field(float)
+    rating = data_field(float)
+    theme = data_field()
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
-        Audio._loadData(self, data)
-        self.albumSort = utils.cast(int, data.attrib.get('albumSort', '-1'))
-        self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
         self.key = self.key.replace('/children', '')  # FIX_BUG_50
-        self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.theme = data.attrib.get('theme')
 
     @cached_data_property
     def collections(self):
@@ -373,24 +372,24 @@ class Album(
     TAG = 'Directory'
     TYPE = 'album'
 
+    audienceRating = data_field(float)
+    leafCount = data_field(int)
+    loudnessAnalysisVersion = data_field(int)
+    originallyAvailableAt = data_field(datetime, format='%Y-%m-%d')
+    parentGuid = data_field()
+    parentKey = data_field()
+    parentRatingKey = data_field(int)
+    parentTheme = data_field()
+    parentThumb = data_field()
+    parentTitle = data_field()
+    rating = data_field(float)
+    studio = data_field()
+    viewedLeafCount = data_field(int)
+    year = data_field(int)
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
-        Audio._loadData(self, data)
-        self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
         self.key = self.key.replace('/children', '')  # FIX_BUG_50
-        self.leafCount = utils.cast(int, data.attrib.get('leafCount'))
-        self.loudnessAnalysisVersion = utils.cast(int, data.attrib.get('loudnessAnalysisVersion'))
-        self.originallyAvailableAt = utils.toDatetime(data.attrib.get('originallyAvailableAt'), '%Y-%m-%d')
-        self.parentGuid = data.attrib.get('parentGuid')
-        self.parentKey = data.attrib.get('parentKey')
-        self.parentRatingKey = utils.cast(int, data.attrib.get('parentRatingKey'))
-        self.parentTheme = data.attrib.get('parentTheme')
-        self.parentThumb = data.attrib.get('parentThumb')
-        self.parentTitle = data.attrib.get('parentTitle')
-        self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.studio = data.attrib.get('studio')
-        self.viewedLeafCount = utils.cast(int, data.attrib.get('viewedLeafCount'))
-        self.year = utils.cast(int, data.attrib.get('year'))
 
     @cached_data_property
     def collections(self):
@@ -534,34 +533,30 @@ class Track(
     TAG = 'Track'
     TYPE = 'track'
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        Audio._loadData(self, data)
-        Playable._loadData(self, data)
-        self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
-        self.chapterSource = data.attrib.get('chapterSource')
-        self.duration = utils.cast(int, data.attrib.get('duration'))
-        self.grandparentArt = data.attrib.get('grandparentArt')
-        self.grandparentGuid = data.attrib.get('grandparentGuid')
-        self.grandparentKey = data.attrib.get('grandparentKey')
-        self.grandparentRatingKey = utils.cast(int, data.attrib.get('grandparentRatingKey'))
-        self.grandparentTheme = data.attrib.get('grandparentTheme')
-        self.grandparentThumb = data.attrib.get('grandparentThumb')
-        self.grandparentTitle = data.attrib.get('grandparentTitle')
-        self.originalTitle = data.attrib.get('originalTitle')
-        self.parentGuid = data.attrib.get('parentGuid')
-        self.parentIndex = utils.cast(int, data.attrib.get('parentIndex'))
-        self.parentKey = data.attrib.get('parentKey')
-        self.parentRatingKey = utils.cast(int, data.attrib.get('parentRatingKey'))
-        self.parentThumb = data.attrib.get('parentThumb')
-        self.parentTitle = data.attrib.get('parentTitle')
-        self.primaryExtraKey = data.attrib.get('primaryExtraKey')
-        self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.ratingCount = utils.cast(int, data.attrib.get('ratingCount'))
-        self.skipCount = utils.cast(int, data.attrib.get('skipCount'))
-        self.sourceURI = data.attrib.get('source')  # remote playlist item
-        self.viewOffset = utils.cast(int, data.attrib.get('viewOffset', 0))
-        self.year = utils.cast(int, data.attrib.get('year'))
+    audienceRating = data_field(float)
+    chapterSource = data_field()
+    duration = data_field(int)
+    grandparentArt = data_field()
+    grandparentGuid = data_field()
+    grandparentKey = data_field()
+    grandparentRatingKey = data_field(int)
+    grandparentTheme = data_field()
+    grandparentThumb = data_field()
+    grandparentTitle = data_field()
+    originalTitle = data_field()
+    parentGuid = data_field()
+    parentIndex = data_field(int)
+    parentKey = data_field()
+    parentRatingKey = data_field(int)
+    parentThumb = data_field()
+    parentTitle = data_field()
+    primaryExtraKey = data_field()
+    rating = data_field(float)
+    ratingCount = data_field(int)
+    skipCount = data_field(int)
+    sourceURI = data_field(attr='source')  # remote playlist item
+    viewOffset = data_field(int, default=0)
+    year = data_field(int)
 
     @cached_data_property
     def chapters(self):
@@ -1,12 +1,16 @@
+import copy
 import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, Generic, Iterable, List, Optional, TypeVar, Union, overload
 import weakref
 from functools import cached_property
 from urllib.parse import parse_qsl, urlencode, urlparse
-from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
-from plexapi import CONFIG, X_PLEX_CONTAINER_SIZE, log, utils
+from plexapi import CONFIG, FETCH_WORKERS, X_PLEX_CONTAINER_SIZE, log, metrics, utils
 from plexapi.exceptions import BadRequest, NotFound, UnknownType, Unsupported
 
 if TYPE_CHECKING:
@@ -19,6 +23,11 @@ MediaContainerT = TypeVar('MediaContainerT', bound='MediaContainer')
 
 USER_DONT_RELOAD_FOR_KEYS: set[str] = set()
 _DONT_RELOAD_FOR_KEYS: set[str] = {'centroid', 'key', 'sourceURI'}
+_COMPACT_DATA = Element('Compact')  # shared empty data of the compacted objects
+# User state attributes which are missing from the listings and details of an item when not set
+_USER_STATE_ATTRS = {'lastRatedAt', 'lastSkippedAt', 'lastViewedAt', 'skipCount', 'userRating', 'viewCount', 'viewOffset'}
+# Attributes of the items of a single container (playlist or play queue) which are never shared in the identity map
+_CONTAINER_ATTRS = ('playlistItemID', 'playQueueItemID')
 OPERATORS = {
     'exact': lambda v, q: v == q,
     'iexact': lambda v, q: v.lower() == q.lower(),
@@ -69,8 +78,142 @@ class cached_data_property(cached_property, Generic[_T]):
         return super().__get__(instance, owner)
 
 
+class data_field(Generic[_T]):
+    """ Attribute of a PlexObject decoded lazily from the XML attributes of its data.
+
+        The XML attribute is only read and cast on first access, then the value is cached
+        on the instance like a :class:`cached_data_property`. Building an object from a large
+        listing therefore costs nothing for the attributes that are never accessed. Cached
+        values are invalidated when the object is reloaded with new data. The values of a
+        compacted object (see :func:`~plexapi.base.PlexPartialObject.compact`) are read from
+        its record instead.
+
+        Parameters:
+            cast (type, optional): Type to cast the value to: int, float, bool or datetime
+                (default: the str value).
+            default (str, optional): Value used when the XML attribute is missing, before casting.
+            attr (str, optional): Name of the XML attribute (default: the name of the field).
+            fallback (str, optional): Name of another XML attribute used when this one is missing.
+            format (str, optional): Format used to parse a datetime (default: a timestamp).
+
+        Example:
+
+            .. code-block:: python
+
+                class Movie(Video):
+                    duration = data_field(int)
+                    originallyAvailableAt = data_field(datetime, format='%Y-%m-%d')
+                    sourceURI = data_field(attr='source')
+
+    """
+    __slots__ = ('cast', 'default', 'attr', 'fallback', 'format', 'name')
+
+    def __init__(self, cast=None, default=None, attr=None, fallback=None, format=None):
+        self.cast = cast
+        self.default = default
+        self.attr = attr
+        self.fallback = fallback
+        self.format = format
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        if self.attr is None:
+            self.attr = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> "data_field[_T]":
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> _T:
+        ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> "data_field[_T] | _T":
+        if instance is None:
+            return self
+        record = instance.__dict__.get('_record')
+        if record is not None:
+            return record[type(instance)._data_field_index[self.name]]
+        data = instance.__dict__.get('_data')
+        if data is None:
+            return None
+        value = instance.__dict__[self.name] = self.decode(data)
+        return value
+
+    def decode(self, data):
+        """ Returns the value of the field decoded from the XML element. """
+        value = data.attrib.get(self.attr)
+        if value is None:
+            value = data.attrib.get(self.fallback, self.default) if self.fallback else self.default
+        if value is None or self.cast is None:
+            return value
+        if self.cast is datetime:
+            return utils.toDatetime(value, self.format)
+        return utils.cast(self.cast, value)
+
+
+def _mergeListingData(data, elem):
+    """ Returns the full data of an item with the attributes of its listing element. The user state
+        attributes missing from the listing element are removed, and the child elements are kept.
+    """
+    attrib = {k: v for k, v in data.attrib.items() if k not in _USER_STATE_ATTRS}
+    attrib.update(elem.attrib)
+    merged = elem.makeelement(data.tag, attrib)
+    # lxml elements can only have a single parent, copy the child elements to leave the full data untouched
+    merged.extend(data if isinstance(data, Element) else [copy.deepcopy(child) for child in data])
+    return merged
+
+
+class PageBounds:
+    """ Computes the bounds of the pages of results requested by :func:`~plexapi.base.PlexObject.fetchItems`
+        and :func:`~plexapi.aio.AsyncPlexServer.fetchItems`.
+
+        Parameters:
+            container_start (int, optional): Offset of the first item (default 0).
+            container_size (int, optional): Number of items per page (default config.X_PLEX_CONTAINER_SIZE).
+            maxresults (int, optional): Maximum number of items to fetch.
+
+        Attributes:
+            start (int): Offset of the next page.
+            size (int): Number of items of the next page.
+            offset (int): Offset of the first item.
+            found (int): Number of items found in the fetched pages.
+            total (int): Total number of items reported by the last fetched page.
+            wanted (int): Number of items wanted from the offset, once the total is known.
+    """
+
+    def __init__(self, container_start=None, container_size=None, maxresults=None):
+        self.start = container_start or 0
+        self.size = container_size or X_PLEX_CONTAINER_SIZE
+        self.offset = self.start
+        self.maxresults = maxresults
+        self.found = 0
+        self.total = None
+        self.wanted = None
+        if maxresults is not None:
+            self.size = min(self.size, maxresults)
+
+    def advance(self, data, found):
+        """ Records a fetched page of data with the number of items found in it and moves to the next page.
+            Returns True if the next page needs to be fetched.
+        """
+        self.total = utils.cast(int, data.attrib.get('totalSize') or data.attrib.get('size')) or found
+        if not found and self.offset > self.total:
+            log.info('container_start is greater than the number of items')
+        self.found += found
+        self.start += self.size
+        if self.start > self.total:
+            return False
+        self.wanted = self.total - self.offset
+        if self.maxresults is not None:
+            self.wanted = min(self.maxresults, self.wanted)
+            self.size = min(self.size, self.wanted - self.found)
+        return self.wanted > self.found
+
+
 class PlexObjectMeta(type):
-    """Metaclass for PlexObject to handle cached_data_properties."""
+    """Metaclass for PlexObject to handle cached_data_properties and data_fields."""
     def __new__(mcs, name, bases, attrs):
         cached_data_props = set()
 
@@ -86,7 +229,21 @@ class PlexObjectMeta(type):
 
         attrs['_cached_data_properties'] = cached_data_props
 
-        return super().__new__(mcs, name, bases, attrs)
+        cls = super().__new__(mcs, name, bases, attrs)
+
+        # Find all the data_fields in the class hierarchy (including mixins), in resolution order
+        data_fields = {}
+        for klass in reversed(cls.__mro__):
+            for attr_name, attr_value in vars(klass).items():
+                if isinstance(attr_value, data_field):
+                    data_fields[attr_name] = attr_value
+                elif attr_name in data_fields:
+                    del data_fields[attr_name]
+        cls._data_fields = data_fields
+        cls._data_field_index = {attr_name: i for i, attr_name in enumerate(data_fields)}
+        cached_data_props.update(data_fields)
+
+        return cls
 
 
 class PlexObject(metaclass=PlexObjectMeta):
@@ -102,23 +259,27 @@ class PlexObject(metaclass=PlexObjectMeta):
     TYPE = None     # xml element type
     key = None      # plex relative url
 
-    def __init__(self, server, data, initpath=None, parent=None):
-        self._server = server
-        self._data = data
-        self._initpath = initpath or self.key
-        self._parent = weakref.ref(parent) if parent is not None else None
-        self._details_key = None
+    # Defaults of the bookkeeping attributes removed from compacted objects
+    _overwriteNone = True
+    _edits = None
 
-        # Allow overwriting previous attribute values with `None` when manually reloading
-        self._overwriteNone = True
-        # Automatically reload the object when accessing a missing attribute
-        self._autoReload = CONFIG.get('plexapi.autoreload', True, bool)
-        # Attribute to save batch edits for a single API call
-        self._edits = None
+    def __init__(self, server, data, initpath=None, parent=None):
+        # Private attributes are set directly, bypassing __setattr__, since objects are built by the thousands
+        self.__dict__.update(
+            _server=server,
+            _initpath=initpath or self.key,
+            _data=data,
+            _parent=weakref.ref(parent) if parent is not None else None,
+            # Allow overwriting previous attribute values with `None` when manually reloading
+            _overwriteNone=True,
+            # Automatically reload the object when accessing a missing attribute
+            _autoReload=CONFIG.get('plexapi.autoreload', True, bool),
+            # Attribute to save batch edits for a single API call
+            _edits=None,
+        )
 
         if data is not None:
             self._loadData(data)
-        self._details_key = self._buildDetailsKey()
 
     def __repr__(self):
         uid = self._clean(self.firstAttr('_baseurl', 'ratingKey', 'id', 'key', 'playQueueID', 'uri', 'type'))
@@ -126,7 +287,7 @@ class PlexObject(metaclass=PlexObjectMeta):
         return f"<{':'.join([p for p in [self.__class__.__name__, uid, name] if p])}>"
 
     def __setattr__(self, attr, value):
-        overwriteNone = self.__dict__.get('_overwriteNone')
+        overwriteNone = self.__dict__.get('_overwriteNone', True)
         # Don't overwrite an attr with None unless it's a private variable or overwrite None is True
         if value is not None or attr.startswith('_') or attr not in self.__dict__ or overwriteNone:
             self.__dict__[attr] = value
@@ -145,7 +306,7 @@ class PlexObject(metaclass=PlexObjectMeta):
         # cls is specified, build the object and return
         initpath = initpath or self._initpath
         if cls is not None:
-            return cls(self._server, elem, initpath, parent=self)
+            return self._buildMappedItem(elem, cls, initpath)
         # cls is not specified, try looking it up in PLEXOBJECTS
         etype = elem.attrib.get('streamType', elem.attrib.get('tagType', elem.attrib.get('type')))
         ehash = f'{elem.tag}.{etype}' if etype else elem.tag
@@ -156,9 +317,41 @@ class PlexObject(metaclass=PlexObjectMeta):
         ecls = utils.getPlexObject(ehash, default=elem.tag)
         # log.debug('Building %s as %s', elem.tag, ecls.__name__)
         if ecls is not None:
-            return ecls(self._server, elem, initpath, parent=self)
+            return self._buildMappedItem(elem, ecls, initpath)
         raise UnknownType(f"Unknown library type <{elem.tag} type='{etype}'../>")
 
+    def _buildMappedItem(self, elem, cls, initpath):
+        """ Builds the object, or reuses the existing object for the same item from the identity
+            map of the server if enabled. See :class:`~plexapi.cache.IdentityMap`.
+        """
+        identityMap = getattr(self._server, '_identityMap', None)
+        ratingKey = elem.attrib.get('ratingKey')
+        if (
+            identityMap is None or not ratingKey
+            or not issubclass(cls, PlexPartialObject) or issubclass(cls, (PlexSession, PlexHistory))
+            or any(attr in elem.attrib for attr in _CONTAINER_ATTRS)
+        ):
+            return cls(self._server, elem, initpath, parent=self)
+        key = identityMap.key(cls, ratingKey)
+        obj = identityMap.get(key)
+        if type(obj) is not cls:
+            obj = cls(self._server, elem, initpath, parent=self)
+            identityMap.set(key, obj)
+        elif obj._isDetailsPath(initpath):
+            # Refresh the existing object with its details, it is then a full object
+            obj._initpath = initpath
+            obj._invalidateCacheAndLoadData(elem)
+        elif not obj.isFullObject():
+            # Refresh the existing object, the attributes missing from the new data are missing
+            obj._invalidateCacheAndLoadData(elem)
+        else:
+            # Refresh the attributes of the full object from the listing, keeping its child elements
+            obj._invalidateCacheAndLoadData(_mergeListingData(obj._data, elem))
+        if obj._parent is not None and obj._parent() is None:
+            # The container the object was first built from is gone, use the current one
+            obj._parent = weakref.ref(self)
+        return obj
+
     def _buildItemOrNone(self, elem, cls=None, initpath=None):
         """ Calls :func:`~plexapi.base.PlexObject._buildItem` but returns
             None if elem is an unknown type.
@@ -168,6 +361,11 @@ class PlexObject(metaclass=PlexObjectMeta):
         except UnknownType:
             return None
 
+    @cached_property
+    def _details_key(self):
+        """ Returns the details key of the object, built on first access. """
+        return self._buildDetailsKey()
+
     def _buildDetailsKey(self, **kwargs):
         """ Builds the details key with the XML include parameters.
             All parameters are included by default with the option to override each parameter
@@ -237,7 +435,7 @@ class PlexObject(metaclass=PlexObjectMeta):
                     it only returns those items. By default we convert the xml elements
                     with the best guess PlexObjects based on tag and type attrs.
         """
-        elem = ElementTree.fromstring(xml)
+        elem = utils.fromXMLString(xml)
         return self._buildItemOrNone(elem, cls)
 
     def fetchItems(
@@ -248,6 +446,7 @@ class PlexObject(metaclass=PlexObjectMeta):
         container_size=None,
         maxresults=None,
         params=None,
+        workers=None,
         **kwargs,
     ):
         """ Load the specified key to find and build all items with the specified tag
@@ -266,6 +465,9 @@ class PlexObject(metaclass=PlexObjectMeta):
                 container_size (None, int): How many items in data
                 maxresults (int, optional): Only return the specified number of results.
                 params (dict, optional): Any additional params to add to the request.
+                workers (int, optional): Number of pages to fetch concurrently once the first page
+                    has returned the total number of items (default config.FETCH_WORKERS).
+                    The pages are still assembled in order into the returned results.
                 **kwargs (dict): Optionally add XML attribute to filter the items.
                     See the details below for more info.
 
@@ -328,55 +530,252 @@ class PlexObject(metaclass=PlexObjectMeta):
                     fetchItem(ekey, Media__Part__file__startswith="D:\\Movies")
 
         """
-        if ekey is None:
-            raise BadRequest('ekey was not provided')
+        ekey = self._buildFetchKey(ekey)
+        results = MediaContainer[cls](self._server, Element('MediaContainer'), initpath=ekey)
+        with metrics.FetchEvent(ekey):
+            for subresults in self._iterPages(
+                ekey, cls, container_start, container_size, maxresults, params, workers, **kwargs
+            ):
+                results.extend(subresults)
+        return results
 
-        if isinstance(ekey, list) and all(isinstance(key, int) for key in ekey):
-            ekey = f'/library/metadata/{",".join(str(key) for key in ekey)}'
+    def iterItems(
+        self,
+        ekey,
+        cls=None,
+        container_start=None,
+        container_size=None,
+        maxresults=None,
+        params=None,
+        workers=None,
+        **kwargs,
+    ):
+        """ Load the specified key to find and build all items with the specified tag
+            and attrs, yielding the items one page at a time. Unlike
+            :func:`~plexapi.base.PlexObject.fetchItems`, the items are not collected into a
+            single :class:`~plexapi.base.MediaContainer`, so each page of data can be garbage
+            collected once its items are no longer referenced. This keeps memory usage flat
+            when iterating over very large results.
 
-        container_start = container_start or 0
-        container_size = container_size or X_PLEX_CONTAINER_SIZE
-        offset = container_start
+            See :func:`~plexapi.base.PlexObject.fetchItems` for the available parameters
+            and for details on filtering the XML attributes.
 
-        if maxresults is not None:
-            container_size = min(container_size, maxresults)
+            Example:
 
-        results = MediaContainer[cls](self._server, Element('MediaContainer'), initpath=ekey)
-        headers = {}
+                .. code-block:: python
 
-        while True:
-            headers['X-Plex-Container-Start'] = str(container_start)
-            headers['X-Plex-Container-Size'] = str(container_size)
+                    for track in plex.iterItems('/library/sections/3/all?type=10'):
+                        print(track.title)
+
+        """
+        ekey = self._buildFetchKey(ekey)
+        with metrics.FetchEvent(ekey) as event:
+            for subresults in self._iterPages(
+                ekey, cls, container_start, container_size, maxresults, params, workers, **kwargs
+            ):
+                yield from event.suspended(subresults)
+
+    def streamItems(
+        self,
+        ekey,
+        cls=None,
+        container_start=None,
+        container_size=None,
+        maxresults=None,
+        params=None,
+        **kwargs,
+    ):
+        """ Load the specified key to find and build all items with the specified tag
+            and attrs, yielding each item as soon as it is parsed from the response.
+            Unlike :func:`~plexapi.base.PlexObject.iterItems`, a page of results is never
+            held in memory as a whole, so a very large ``container_size`` can be used to
+            list a library in a few requests while memory usage stays proportional to a
+            single item. Each page is requested once the previous page is consumed.
 
-            data = self._server.query(ekey, headers=headers, params=params)
-            subresults = self.findItems(data, cls, ekey, **kwargs)
-            total_size = utils.cast(int, data.attrib.get('totalSize') or data.attrib.get('size')) or len(subresults)
+            See :func:`~plexapi.base.PlexObject.fetchItems` for the available parameters
+            and for details on filtering the XML attributes.
 
-            if not subresults:
-                if offset > total_size:
-                    log.info('container_start is greater than the number of items')
+            Example:
+
+                .. code-block:: python
 
-            librarySectionID = utils.cast(int, data.attrib.get('librarySectionID'))
-            if librarySectionID:
-                for item in subresults:
+                    for track in plex.streamItems('/library/sections/3/all?type=10', container_size=50000):
+                        print(track.title)
+
+        """
+        ekey = self._buildFetchKey(ekey)
+        container_start = container_start or 0
+        container_size = container_size or X_PLEX_CONTAINER_SIZE
+        found = 0
+
+        with metrics.FetchEvent(ekey) as event:
+            while maxresults is None or found < maxresults:
+                if maxresults is not None:
+                    container_size = min(container_size, maxresults - found)
+                headers = {
+                    'X-Plex-Container-Start': str(container_start),
+                    'X-Plex-Container-Size': str(container_size),
+                }
+                elems = self._server.streamQuery(ekey, headers=headers, params=params)
+                try:
+                    root = next(elems, None)
+                    if root is None:
+                        break
+                    for item in event.suspended(self._buildStreamItems(root, elems, cls, ekey, **kwargs)):
+                        found += 1
+                        yield item
+                        if found == maxresults:
+                            return
+                finally:
+                    elems.close()
+
+                container_start += container_size
+                total_size = utils.cast(int, root.attrib.get('totalSize') or root.attrib.get('size')) or 0
+                if container_start >= total_size:
+                    break
+
+    def _buildStreamItems(self, root, elems, cls=None, initpath=None, **kwargs):
+        """ Builds and yields the matching items from the elements of a streamed page of data.
+            See :func:`~plexapi.base.PlexObject.streamItems`.
+        """
+        if cls and cls.TAG and 'tag' not in kwargs:
+            kwargs['etag'] = cls.TAG
+        if cls and cls.TYPE and 'type' not in kwargs:
+            kwargs['type'] = cls.TYPE
+        librarySectionID = utils.cast(int, root.attrib.get('librarySectionID'))
+        check = self._compileAttrs(**kwargs)
+        # Only the time spent building the items is recorded, the elements are parsed while downloaded
+        built, seconds = 0, 0.0
+        try:
+            for elem in elems:
+                start = time.perf_counter()
+                item = self._buildItemOrNone(elem, cls, initpath) if check(elem) else None
+                if item is not None and librarySectionID:
                     item.librarySectionID = librarySectionID
+                seconds += time.perf_counter() - start
+                if item is not None:
+                    built += 1
+                    yield item
+        finally:
+            metrics.recordBuild(seconds, built)
+
+    def _buildFetchKey(self, ekey):
+        """ Returns the API URL path to fetch items from.
+            See :func:`~plexapi.base.PlexObject.fetchItems` for details.
+        """
+        if ekey is None:
+            raise BadRequest('ekey was not provided')
+
+        if isinstance(ekey, list) and all(isinstance(key, int) for key in ekey):
+            ekey = f'/library/metadata/{",".join(str(key) for key in ekey)}'
 
-            results.extend(subresults)
+        return ekey
 
-            container_start += container_size
+    def _iterPages(
+        self,
+        ekey,
+        cls=None,
+        container_start=None,
+        container_size=None,
+        maxresults=None,
+        params=None,
+        workers=None,
+        **kwargs,
+    ):
+        """ Yields a :class:`~plexapi.base.MediaContainer` of the items found in each page of
+            results for the specified key. See :func:`~plexapi.base.PlexObject.fetchItems` for details.
+        """
+        bounds = PageBounds(container_start, container_size, maxresults)
+        workers = workers or FETCH_WORKERS
+
+        while True:
+            data = self._fetchPage(ekey, bounds.start, bounds.size, params)
+            subresults = self._findPageItems(data, cls, ekey, **kwargs)
+            more = bounds.advance(data, len(subresults))
+            yield subresults
+            del data, subresults
+
+            if not more:
+                break
 
-            if container_start > total_size:
+            if workers > 1:
+                # Without XML attribute filters every remaining item is known to be wanted,
+                # otherwise keep fetching until enough matching items are found.
+                end = bounds.total if kwargs else bounds.offset + bounds.wanted
+                pages = self._fetchPagesConcurrently(ekey, bounds.start, bounds.size, end, params, workers)
+                yield from self._iterPagesUntil(pages, bounds.wanted - bounds.found, cls, ekey, **kwargs)
                 break
 
-            wanted_number_of_items = total_size - offset
-            if maxresults is not None:
-                wanted_number_of_items = min(maxresults, wanted_number_of_items)
-                container_size = min(container_size, wanted_number_of_items - len(results))
+    def _fetchPage(self, ekey, container_start, container_size, params=None):
+        """ Returns the data for a single page of the specified key. """
+        headers = {
+            'X-Plex-Container-Start': str(container_start),
+            'X-Plex-Container-Size': str(container_size),
+        }
+        return self._server.query(ekey, headers=headers, params=params)
+
+    def _fetchPagesConcurrently(self, ekey, container_start, container_size, end, params, workers):
+        """ Yields the data for each page of the specified key from container_start up to end.
+            Up to the specified number of workers pages are requested concurrently, but the pages
+            are always yielded in order.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for start in range(container_start, end, container_size):
+                size = min(container_size, end - start)
+                pending.append(executor.submit(self._fetchPage, ekey, start, size, params))
+                if len(pending) >= workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _iterPageData(self, ekey, container_start=None, container_size=None, params=None, workers=None):
+        """ Yields the raw data of each page of results for the specified key, without building any
+            object. Once the first page has returned the total number of items, up to the specified
+            number of workers pages are requested concurrently (default config.FETCH_WORKERS).
+        """
+        container_start = container_start or 0
+        container_size = container_size or X_PLEX_CONTAINER_SIZE
+        workers = workers or FETCH_WORKERS
+        data = self._fetchPage(ekey, container_start, container_size, params)
+        yield data
+        total_size = utils.cast(int, data.attrib.get('totalSize') or data.attrib.get('size')) or 0
+        container_start += container_size
+        if workers > 1:
+            yield from self._fetchPagesConcurrently(ekey, container_start, container_size, total_size, params, workers)
+            return
+        while container_start < total_size and len(data):
+            data = self._fetchPage(ekey, container_start, container_size, params)
+            yield data
+            container_start += container_size
 
-            if wanted_number_of_items <= len(results):
+    def _iterPagesUntil(self, pages, wanted_number_of_items, cls=None, initpath=None, **kwargs):
+        """ Yields the items found in each page of data until the wanted number of items is reached. """
+        found = 0
+        for data in pages:
+            subresults = self._findPageItems(data, cls, initpath, **kwargs)
+            remaining = wanted_number_of_items - found
+            if len(subresults) > remaining:
+                del subresults[remaining:]
+                subresults.size = len(subresults)
+            found += len(subresults)
+            yield subresults
+            if wanted_number_of_items <= found:
+                pages.close()
                 break
 
-        return results
+    def _findPageItems(self, data, cls=None, initpath=None, **kwargs):
+        """ Finds and builds the items in a single page of data returned by
+            :func:`~plexapi.base.PlexObject.fetchItems`.
+        """
+        start = time.perf_counter()
+        subresults = self.findItems(data, cls, initpath, **kwargs)
+        librarySectionID = utils.cast(int, data.attrib.get('librarySectionID'))
+        if librarySectionID:
+            for item in subresults:
+                item.librarySectionID = librarySectionID
+        metrics.recordBuild(time.perf_counter() - start, len(subresults))
+        return subresults
 
     def fetchItem(self, ekey, cls=None, **kwargs):
         """ Load the specified key to find and build the first item with the
@@ -420,8 +819,9 @@ class PlexObject(metaclass=PlexObjectMeta):
             data = next(utils.iterXMLBFS(data, rtag), Element('Empty'))
         # loop through all data elements to find matches
         items = MediaContainer[cls](self._server, data, initpath=initpath) if data.tag == 'MediaContainer' else []
+        check = self._compileAttrs(**kwargs)
         for elem in data:
-            if self._checkAttrs(elem, **kwargs):
+            if check(elem):
                 item = self._buildItemOrNone(elem, cls, initpath)
                 if item is not None:
                     items.append(item)
@@ -450,9 +850,10 @@ class PlexObject(metaclass=PlexObjectMeta):
         # rtag to iter on a specific root tag using breadth-first search
         if rtag:
             data = next(utils.iterXMLBFS(data, rtag), [])
+        kwargs[f'{attr}__exists'] = True
+        check = self._compileAttrs(**kwargs)
         for elem in data:
-            kwargs[f'{attr}__exists'] = True
-            if self._checkAttrs(elem, **kwargs):
+            if check(elem):
                 results.append(elem.attrib.get(attr))
         return results
 
@@ -510,22 +911,48 @@ class PlexObject(metaclass=PlexObjectMeta):
         return self
 
     def _checkAttrs(self, elem, **kwargs):
-        attrsFound = {}
-        for attr, query in kwargs.items():
-            attr, op, operator = self._getAttrOperator(attr)
-            values = self._getAttrValue(elem, attr)
-            # special case query in (None, 0, '') to include missing attr
-            if op == 'exact' and not values and query in (None, 0, ''):
-                return True
-            # return if attr were looking for is missing
-            attrsFound[attr] = False
-            for value in values:
-                value = self._castAttrValue(op, query, value)
-                if operator(value, query):
-                    attrsFound[attr] = True
-                    break
-        # log.debug('Checking %s for %s found: %s', elem.tag, kwargs, attrsFound)
-        return all(attrsFound.values())
+        """ Returns True if the element matches all the specified attributes.
+            See :func:`~plexapi.base.PlexObject._compileAttrs`.
+        """
+        return self._compileAttrs(**kwargs)(elem)
+
+    def _compileAttrs(self, **kwargs):
+        """ Returns a function checking if an element matches all the specified attributes.
+            The operators, nested tag paths, query casts and regular expressions are resolved
+            once so the function is fast to call on every element of a large response.
+            See :func:`~plexapi.base.PlexObject.fetchItem` for the supported attributes.
+        """
+        filters = [self._compileAttr(attr, query) for attr, query in kwargs.items()]
+
+        def check(elem):
+            found = True
+            for getValues, test, includeMissing in filters:
+                values = getValues(elem)
+                # special case query in (None, 0, '') to include missing attr
+                if not values:
+                    if includeMissing:
+                        return True
+                    found = False
+                elif found and not any(test(value) for value in values):
+                    found = False
+            return found
+        return check
+
+    def _compileAttr(self, attr, query):
+        """ Returns the functions getting the values and testing a value of an element for
+            a single ``attr__op=query`` filter, and whether a missing value matches.
+        """
+        attr, op, operator = self._getAttrOperator(attr)
+        if op in ('regex', 'iregex'):
+            query = re.compile(query, flags=re.IGNORECASE if op == 'iregex' else 0)
+            operator = lambda v, q: bool(q.search(v))
+        cast = self._getAttrCast(op, query)
+        if cast is None:
+            test = lambda value: operator(value, query)
+        else:
+            test = lambda value: operator(cast(value), query)
+        includeMissing = op == 'exact' and query in (None, 0, '')
+        return self._getAttrValues(attr), test, includeMissing
 
     def _getAttrOperator(self, attr):
         for op, operator in OPERATORS.items():
@@ -535,49 +962,76 @@ class PlexObject(metaclass=PlexObjectMeta):
         # default to exact match
         return attr, 'exact', OPERATORS['exact']
 
-    def _getAttrValue(self, elem, attrstr, results=None):
-        # log.debug('Fetching %s in %s', attrstr, elem.tag)
-        parts = attrstr.split('__', 1)
-        attr = parts[0]
-        attrstr = parts[1] if len(parts) == 2 else None
-        if attrstr:
-            results = [] if results is None else results
-            for child in (c for c in elem if c.tag.lower() == attr.lower()):
-                results += self._getAttrValue(child, attrstr, results)
-            return [r for r in results if r is not None]
-        # check were looking for the tag
-        if attr.lower() == 'etag':
-            return [elem.tag]
-        # loop through attrs so we can perform case-insensitive match
-        for _attr, value in elem.attrib.items():
-            if attr.lower() == _attr.lower():
-                return [value]
-        return []
-
-    def _castAttrValue(self, op, query, value):
-        if op == 'exists':
+    def _getAttrValues(self, attrstr):
+        """ Returns a function getting the list of values of the attribute path from an element.
+            The path is ``attr`` or ``tag__...__attr`` to get the attribute of the child elements,
+            matched case-insensitively. The attribute ``etag`` is the tag of the element.
+        """
+        *tags, attr = attrstr.lower().split('__')
+        name = attrstr.rsplit('__', 1)[-1]
+
+        def getValue(elem):
+            value = elem.attrib.get(name)
+            if value is None:
+                # loop through attrs so we can perform case-insensitive match
+                for _attr, _value in elem.attrib.items():
+                    if _attr.lower() == attr:
+                        return _value
             return value
+
+        def getValues(elem):
+            if not tags:
+                if attr == 'etag':
+                    return [elem.tag]
+                value = getValue(elem)
+                return [] if value is None else [value]
+            elems = [elem]
+            for tag in tags:
+                elems = [child for e in elems for child in e if child.tag.lower() == tag]
+            if attr == 'etag':
+                return [e.tag for e in elems]
+            return [value for value in map(getValue, elems) if value is not None]
+        return getValues
+
+    def _getAttrCast(self, op, query):
+        """ Returns the function casting the attribute values to the type of the query, or None. """
+        if op == 'exists':
+            return None
         if isinstance(query, bool):
-            return bool(int(value))
-        if isinstance(query, int) and '.' in value:
-            return float(value)
+            return lambda value: bool(int(value))
         if isinstance(query, int):
-            return int(value)
+            return lambda value: float(value) if '.' in value else int(value)
         if isinstance(query, float):
-            return float(value)
-        return value
+            return float
+        return None
 
     def _invalidateCacheAndLoadData(self, data):
         """Load attribute values from Plex XML response and invalidate cached properties."""
-        old_data_id = id(getattr(self, '_data', None))
+        changed = id(data) != id(self.__dict__.get('_data'))
+        # Keep the values of the data fields missing from the new data when not overwriting with None
+        kept = {}
+        if changed and not self.__dict__.get('_overwriteNone', True):
+            kept = self._keptDataFields(data)
         self._data = data
 
-        # If the data's object ID has changed, invalidate cached properties
-        if id(data) != old_data_id:
+        # If the data's object ID has changed, invalidate cached properties and the compacted record
+        if changed:
+            self.__dict__.pop('_record', None)
             self._invalidateCachedProperties()
+            self.__dict__.update(kept)
 
         self._loadData(data)
 
+    def _keptDataFields(self, data):
+        """ Returns the current values of the data fields which would be overwritten with None by the new data. """
+        kept = {}
+        for name, field in self._data_fields.items():
+            if field.decode(data) is None:
+                value = self.__dict__[name] if name in self.__dict__ else field.__get__(self, type(self))
+                if value is not None:
+                    kept[name] = value
+        return kept
+
     def _invalidateCachedProperties(self):
         """Invalidate all cached data property values."""
         cached_props = getattr(self.__class__, '_cached_data_properties', set())
@@ -587,13 +1041,15 @@ class PlexObject(metaclass=PlexObjectMeta):
                 del self.__dict__[prop_name]
 
     def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        raise NotImplementedError('Abstract method not implemented.')
+        """ Load attribute values from Plex XML response. Attributes declared with
+            :class:`~plexapi.base.data_field` are decoded lazily and are not loaded here.
+        """
 
     def _findAndLoadElem(self, data, **kwargs):
         """ Find and load the first element in the data that matches the specified attributes. """
+        check = self._compileAttrs(**kwargs)
         for elem in data:
-            if self._checkAttrs(elem, **kwargs):
+            if check(elem):
                 self._invalidateCacheAndLoadData(elem)
 
     @property
@@ -636,6 +1092,12 @@ class PlexPartialObject(PlexObject):
         'skipRefresh': 1,
     }
 
+    def __init__(self, server, data, initpath=None, parent=None):
+        super().__init__(server, data, initpath, parent)
+        # Only the partial objects of the listings are compacted, full objects keep their child elements
+        if data is not None and CONFIG.get('plexapi.compact', False, bool) and not self.isFullObject():
+            self.compact()
+
     def __eq__(self, other):
         if isinstance(other, PlexPartialObject):
             return self.key == other.key
@@ -661,8 +1123,11 @@ class PlexPartialObject(PlexObject):
         # Log the reload.
         clsname = self.__class__.__name__
         title = self.__dict__.get('title', self.__dict__.get('name'))
+        if title is None and self._data is not None:
+            title = self._data.attrib.get('title', self._data.attrib.get('name'))
         objname = f"{clsname} '{title}'" if title else clsname
         log.debug("Reloading %s for attr '%s'", objname, attr)
+        metrics.recordAutoReload(self, attr)
         # Reload and return the value
         self._reload(_overwriteNone=False)
         return super(PlexPartialObject, self).__getattribute__(attr)
@@ -689,17 +1154,61 @@ class PlexPartialObject(PlexObject):
         key = f"/{self.key.lstrip('/')}/analyze"
         self._server.query(key, method=self._server._session.put)
 
+    def compact(self):
+        """ Reduce the memory used by this object to keep large listings in memory. All the
+            data fields are decoded into a single record, strings are interned so equal values
+            (codecs, content ratings, tags...) are shared between objects, and the XML data with
+            all its child elements is dropped. The object is then a partial object: accessing
+            a child element such as :attr:`media` or a missing attribute reloads it in full.
+            Partial objects are compacted when they are built when the `plexapi.compact` configuration
+            option is enabled.
+
+            Example:
+
+                .. code-block:: python
+
+                    tracks = [track.compact() for track in plex.library.section('Music').searchTracks()]
+
+        """
+        if isinstance(self, (PlexSession, PlexHistory)) or '_record' in self.__dict__:
+            return self
+        attrs = self.__dict__
+        data = attrs['_data']
+        if data is None:
+            return self
+        cls = type(self)
+        record = []
+        for name, field in cls._data_fields.items():
+            value = attrs.pop(name) if name in attrs else field.decode(data)
+            record.append(utils.intern(value))
+        for name, value in list(attrs.items()):
+            if name in ('_overwriteNone', '_edits') and value == getattr(cls, name):
+                del attrs[name]
+            elif name in cls._cached_data_properties or name == '_details_key':
+                del attrs[name]
+            elif not name.startswith('_'):
+                attrs[name] = utils.intern(value)
+        attrs['_record'] = tuple(record)
+        attrs['_data'] = _COMPACT_DATA
+        return self
+
     def isFullObject(self):
         """ Returns True if this is already a full object. A full object means all attributes
             were populated from the api path representing only this item. For example, the
             search result for a movie often only contain a portion of the attributes a full
-            object (main url) for that movie would contain.
+            object (main url) for that movie would contain. Compacted objects are never full objects.
         """
+        if '_record' in self.__dict__:
+            return False
+        return not self.key or self._isDetailsPath(self._initpath)
+
+    def _isDetailsPath(self, initpath):
+        """ Returns True if the initpath requests the details of this object with all the include parameters. """
         parsed_key = urlparse(self._details_key or self.key)
-        parsed_initpath = urlparse(self._initpath)
+        parsed_initpath = urlparse(initpath)
         query_key = set(parse_qsl(parsed_key.query))
         query_init = set(parse_qsl(parsed_initpath.query))
-        return not self.key or (parsed_key.path == parsed_initpath.path and query_key <= query_init)
+        return parsed_key.path == parsed_initpath.path and query_key <= query_init
 
     def isPartialObject(self):
         """ Returns True if this is not a full object. """
@@ -849,6 +1358,68 @@ class PlexPartialObject(PlexObject):
         return PlayQueue.create(self._server, self, *args, **kwargs)
 
 
+def reloadItems(items, chunksize=None, workers=None, **kwargs):
+    """ Reload many :class:`~plexapi.base.PlexPartialObject` in place with a few batched requests
+        instead of one request per object. The items are requested by ratingKey from
+        ``/library/metadata/<key1,key2,...>`` with the same XML include parameters as
+        :func:`~plexapi.base.PlexObject.reload`. Items which cannot be requested by
+        ratingKey are reloaded one by one.
+
+        Parameters:
+            items (list): List of :class:`~plexapi.base.PlexPartialObject` to reload.
+            chunksize (int, optional): Maximum number of items requested at once
+                (default: `plexapi.container_size`).
+            workers (int, optional): Number of requests made concurrently
+                (default: `plexapi.fetch_workers`).
+            **kwargs (dict): A dictionary of XML include parameters to include/exclude or override.
+                See :class:`~plexapi.base.PlexPartialObject` for all the available include parameters.
+
+        Returns:
+            list: The reloaded items.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.base import reloadItems
+                movies = reloadItems(plex.library.section('Movies').all(), workers=4)
+                print([movie.media[0].parts[0].streams for movie in movies])
+
+    """
+    chunksize = chunksize or X_PLEX_CONTAINER_SIZE
+    workers = workers or FETCH_WORKERS
+    items = list(items)
+    groups = {}
+    for item in items:
+        if not isinstance(item, PlexPartialObject) or isinstance(item, (PlexSession, PlexHistory)):
+            continue
+        details_key = item._buildDetailsKey(**kwargs) if kwargs else item._details_key
+        path, _, query = (details_key or '').partition('?')
+        if item._server is not None and item.ratingKey and path == f'/library/metadata/{item.ratingKey}':
+            group = groups.setdefault((item._server, query), {})
+            group.setdefault(str(item.ratingKey), []).append((item, details_key))
+        else:
+            item._reload(**kwargs)
+
+    for (server, query), group in groups.items():
+        ratingKeys = list(group)
+        keys = []
+        for start in range(0, len(ratingKeys), chunksize):
+            key = f'/library/metadata/{",".join(ratingKeys[start:start + chunksize])}'
+            keys.append(f'{key}?{query}' if query else key)
+        if workers > 1 and len(keys) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(server.query, keys))
+        else:
+            results = map(server.query, keys)
+        for data in results:
+            for elem in data:
+                for item, details_key in group.get(elem.attrib.get('ratingKey'), ()):
+                    item._initpath = details_key
+                    item._invalidateCacheAndLoadData(elem)
+    return items
+
+
 class Playable:
     """ This is a mixin to store functions specific to media that is Playable.
         Things were getting mixed up a bit when dealing with Shows, Season, Artists,
@@ -859,10 +1430,8 @@ class Playable:
             playQueueItemID (int): PlayQueue item ID (only populated for :class:`~plexapi.playlist.PlayQueue` items).
     """
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        self.playlistItemID = utils.cast(int, data.attrib.get('playlistItemID'))    # playlist
-        self.playQueueItemID = utils.cast(int, data.attrib.get('playQueueItemID'))  # playqueue
+    playlistItemID = data_field(int)  # playlist
+    playQueueItemID = data_field(int)  # playqueue
 
     def getStreamURL(self, **kwargs):
         """ Returns a stream url that may be used by external applications such as VLC.
@@ -1235,6 +1804,21 @@ class MediaContainer(
                     continue
                 setattr(self, key, getattr(__iterable, key))
 
+    def reloadAll(self, chunksize=None, workers=None, **kwargs):
+        """ Reload all the items in this container in place with a few batched requests.
+            See :func:`~plexapi.base.reloadItems` for the parameters.
+
+            Example:
+
+                .. code-block:: python
+
+                    movies = plex.library.section('Movies').all().reloadAll()
+                    print([movie.chapters for movie in movies])
+
+        """
+        reloadItems(self, chunksize=chunksize, workers=workers, **kwargs)
+        return self
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         self.allowSync = utils.cast(int, data.attrib.get('allowSync'))
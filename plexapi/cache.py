@@ -0,0 +1,401 @@
+import json
+import os
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+from plexapi import log, utils
+from plexapi.transport import requestKey
+
+# Default time-to-live (in seconds) for endpoints that rarely change.
+# Keys are regular expressions matched against the start of the requested API path.
+DEFAULT_RULES = {
+    r'/library/sections/?$': 300,
+    r'/library/sections/\d+/(all|collections)\?includeMeta=1': 3600,
+    r'/hubs(\?|$)': 60,
+    r'/identity$': 3600,
+    r'/:/prefs$': 300,
+}
+
+
+class CacheEntry:
+    """ A single cached response.
+
+        Parameters:
+            content (bytes): The raw response body.
+            etag (str): The ``ETag`` header returned with the response (optional).
+            lastModified (str): The ``Last-Modified`` header returned with the response (optional).
+            expires (float): Timestamp when the entry needs to be revalidated with the server.
+            version (str): Version of the cached data used to discard the outdated entries (optional).
+    """
+
+    def __init__(self, content, etag=None, lastModified=None, expires=0, version=None):
+        self.content = content
+        self.etag = etag
+        self.lastModified = lastModified
+        self.expires = expires
+        self.version = version
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{len(self.content)}b:{self.etag or self.lastModified or ""}>'
+
+    def isFresh(self):
+        """ Returns True if the entry can be used without revalidating it with the server. """
+        return time.time() < self.expires
+
+    def validators(self):
+        """ Returns the conditional request headers used to revalidate the entry with the server. """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.lastModified:
+            headers['If-Modified-Since'] = self.lastModified
+        return headers
+
+
+class MemoryCache:
+    """ In-memory least recently used (LRU) cache backend.
+
+        Parameters:
+            maxsize (int): Maximum number of entries to keep (default 256).
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """ Returns the :class:`~plexapi.cache.CacheEntry` for the key or None if not found. """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        """ Stores the :class:`~plexapi.cache.CacheEntry` for the key. """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """ Removes the entry for the key if it exists. """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self, prefix=None):
+        """ Removes all entries, or only the entries with a key starting with the prefix. """
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+
+class DiskCache:
+    """ On-disk cache backend. Each entry is stored in its own file so the cache can be
+        shared between processes and survives restarts.
+
+        Parameters:
+            path (str): Directory to store the cache files (default ``~/.cache/plexapi/responses``).
+    """
+    EXTENSION = '.cache'
+
+    def __init__(self, path=None):
+        self.path = os.path.expanduser(path or os.path.join('~', '.cache', 'plexapi', 'responses'))
+        os.makedirs(self.path, exist_ok=True)
+
+    def _filepath(self, key):
+        return os.path.join(self.path, utils.sha1hash(key) + self.EXTENSION)
+
+    def get(self, key):
+        """ Returns the :class:`~plexapi.cache.CacheEntry` for the key or None if not found. """
+        try:
+            with open(self._filepath(key), 'rb') as handle:
+                header, content = handle.read().split(b'\n', 1)
+            meta = json.loads(header)
+        except (OSError, ValueError):
+            return None
+        if meta.get('key', key) != key:
+            return None
+        return CacheEntry(
+            content, meta.get('etag'), meta.get('lastModified'), meta.get('expires', 0), meta.get('version'))
+
+    def set(self, key, entry):
+        """ Stores the :class:`~plexapi.cache.CacheEntry` for the key. """
+        meta = {
+            'key': key, 'etag': entry.etag, 'lastModified': entry.lastModified,
+            'expires': entry.expires, 'version': entry.version,
+        }
+        filepath = self._filepath(key)
+        tmppath = f'{filepath}.{os.getpid()}.{threading.get_ident()}'
+        try:
+            with open(tmppath, 'wb') as handle:
+                handle.write(json.dumps(meta).encode('utf-8') + b'\n' + entry.content)
+            os.replace(tmppath, filepath)
+        except OSError as e:  # pragma: no cover
+            log.warning('Unable to write cache file %s: %s', filepath, e)
+
+    def delete(self, key):
+        """ Removes the entry for the key if it exists. """
+        try:
+            os.remove(self._filepath(key))
+        except OSError:
+            pass
+
+    def clear(self, prefix=None):
+        """ Removes all entries, or only the entries with a key starting with the prefix.
+            Entries saved without their key are always removed.
+        """
+        for filename in os.listdir(self.path):
+            if filename.endswith(self.EXTENSION):
+                filepath = os.path.join(self.path, filename)
+                try:
+                    if prefix is not None:
+                        with open(filepath, 'rb') as handle:
+                            key = json.loads(handle.readline()).get('key')
+                        if key is not None and not key.startswith(prefix):
+                            continue
+                    os.remove(filepath)
+                except (OSError, ValueError):  # pragma: no cover
+                    pass
+
+
+class ResponseCache:
+    """ Optional response cache used by :func:`~plexapi.server.PlexServer.query` for GET requests.
+        Cached responses are returned without a request to the server until their time-to-live
+        expires. The entries of each server are kept apart by the server url, so a cache can be
+        shared by several servers. After that, the response is revalidated with the server using the ``ETag`` and
+        ``Last-Modified`` headers when the server provided them, and only downloaded again if
+        it changed. Any other request method (PUT, POST, DELETE) clears the cached responses of
+        the server since its content may have changed. A request sent with the ``Cache-Control: no-cache``
+        header is never served from the cache.
+
+        Parameters:
+            backend (obj, optional): Cache backend to store the entries, :class:`~plexapi.cache.MemoryCache`
+                or :class:`~plexapi.cache.DiskCache` (default ``MemoryCache()``). Any object implementing
+                ``get``, ``set``, ``delete`` and ``clear(prefix=None)`` can be used.
+            rules (dict, optional): Time-to-live in seconds for API paths, as a dictionary of regular
+                expressions matched against the start of the requested path. These are merged with
+                (and override) :data:`~plexapi.cache.DEFAULT_RULES`. Set a ttl to ``None`` to disable
+                caching of a default rule.
+            ttl (int, optional): Time-to-live in seconds for any path not matching a rule.
+                Default is None to only cache the paths matching a rule.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.cache import DiskCache, ResponseCache
+                from plexapi.server import PlexServer
+
+                cache = ResponseCache(DiskCache(), rules={r'/library/sections/\\d+/firstCharacter': 600})
+                plex = PlexServer('http://localhost:32400', token='xxxxxxxxxxxxxxxxxxxx', cache=cache)
+
+    """
+
+    def __init__(self, backend=None, rules=None, ttl=None):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.defaultTTL = ttl
+        self.rules = [
+            (re.compile(pattern), value)
+            for pattern, value in {**DEFAULT_RULES, **(rules or {})}.items()
+        ]
+
+    def ttl(self, key):
+        """ Returns the time-to-live in seconds for the API path or None if it should not be cached. """
+        for pattern, value in self.rules:
+            if pattern.match(key):
+                return value
+        return self.defaultTTL
+
+    def cacheKey(self, key, headers=None, params=None, namespace=None):
+        """ Returns the cache key for a request to the API path. The key starts with the namespace
+            (the server url) to keep apart the entries of several servers sharing the cache. The token
+            is never part of the key, only its hash to keep apart the entries of each user.
+        """
+        headers = dict(headers or {})
+        token = headers.pop('X-Plex-Token', None)
+        cacheKey = requestKey('GET', key, headers, params)
+        if token:
+            cacheKey = f'{cacheKey}|user={utils.sha1hash(token)}'
+        return f'{namespace}|{cacheKey}' if namespace else cacheKey
+
+    def get(self, cacheKey):
+        """ Returns the :class:`~plexapi.cache.CacheEntry` for the cache key or None if not found. """
+        return self.backend.get(cacheKey)
+
+    def set(self, cacheKey, ttl, content, headers=None):
+        """ Stores the response content for the cache key and returns the new
+            :class:`~plexapi.cache.CacheEntry`.
+
+            Parameters:
+                cacheKey (str): The cache key returned by :func:`~plexapi.cache.ResponseCache.cacheKey`.
+                ttl (int): Time-to-live in seconds.
+                content (bytes): The raw response body.
+                headers (dict): The response headers.
+        """
+        headers = headers or {}
+        entry = CacheEntry(
+            content,
+            etag=headers.get('ETag'),
+            lastModified=headers.get('Last-Modified'),
+            expires=time.time() + ttl,
+        )
+        self.backend.set(cacheKey, entry)
+        return entry
+
+    def refresh(self, cacheKey, entry, ttl):
+        """ Extends the expiry of an entry after it was revalidated with the server. """
+        entry.expires = time.time() + ttl
+        self.backend.set(cacheKey, entry)
+        return entry
+
+    def data(self, entry):
+        """ Returns the parsed response of the :class:`~plexapi.cache.CacheEntry`. The response is
+            parsed on every call, so changes made by a caller to its data never affect the cached response.
+        """
+        return utils.parseXMLString(entry.content)
+
+    def clear(self, namespace=None):
+        """ Removes all cached responses, or only the cached responses of the namespace (the server url). """
+        if namespace:
+            self.backend.clear(prefix=f'{namespace}|')
+        else:
+            self.backend.clear()
+
+
+class FilterCache:
+    """ Optional persistent cache of the filter, sort and field metadata of the library sections
+        (:class:`~plexapi.library.FilteringType`, :class:`~plexapi.library.FilteringFieldType` and
+        :class:`~plexapi.library.FilterChoice`). The metadata is requested once per section and
+        shared between processes and restarts, instead of being requested again before the first
+        filtered search of every process. Entries are keyed by the server ``machineIdentifier``
+        and version, and the section uuid and agent. An entry is discarded once the ``updatedAt``
+        or ``scannedAt`` of the section changes. When the :class:`~plexapi.cache.ResponseCache` of
+        the server is enabled, the library sections are requested again without it the first time
+        the cache is used for a section, since a cached section may be outdated. The metadata missing
+        from the cache is also requested without the response cache.
+
+        The cache is enabled for every :class:`~plexapi.server.PlexServer` by setting the
+        ``filter_cache`` option of the config file to the directory to store the entries.
+
+        Parameters:
+            backend (obj, optional): Cache backend to store the entries (default
+                ``DiskCache('~/.cache/plexapi/filters')``). Any object implementing
+                ``get``, ``set``, ``delete`` and ``clear`` can be used.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.cache import FilterCache
+                from plexapi.server import PlexServer
+
+                plex = PlexServer('http://localhost:32400', token='xxxxxxxxxxxxxxxxxxxx', filterCache=FilterCache())
+                movies = plex.library.section('Movies').search(genre='Animation')
+
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else DiskCache(os.path.join('~', '.cache', 'plexapi', 'filters'))
+
+    def cacheKey(self, section, key):
+        """ Returns the cache key for the API path of the filter metadata of a library section. """
+        server = section._server
+        return f'{server.machineIdentifier}:{server.version}:{section.uuid}:{section.agent}:{key}'
+
+    def version(self, section):
+        """ Returns the version of the library section used to discard the outdated entries. """
+        return ':'.join(
+            str(int(value.timestamp())) if value else ''
+            for value in (section.updatedAt, section.scannedAt)
+        )
+
+    def get(self, section, key):
+        """ Returns the parsed response for the API path of the library section or None if
+            not found or outdated.
+        """
+        cacheKey = self.cacheKey(section, key)
+        entry = self.backend.get(cacheKey)
+        if entry is None:
+            return None
+        if entry.version != section._filterCacheVersion:
+            self.backend.delete(cacheKey)
+            return None
+        return utils.parseXMLString(entry.content)
+
+    def set(self, section, key, data):
+        """ Stores the parsed response for the API path of the library section. """
+        content = utils.toXMLString(data)
+        self.backend.set(self.cacheKey(section, key), CacheEntry(content, version=section._filterCacheVersion))
+
+    def clear(self):
+        """ Removes all cached filter metadata. """
+        self.backend.clear()
+
+
+class IdentityMap:
+    """ Optional identity map used by a :class:`~plexapi.server.PlexServer` to build a single
+        object per library item. Items built again from any listing (library sections, hubs,
+        collections...) reuse the existing object instead of creating a new one,
+        so data already reloaded is shared and edits are reflected everywhere. An existing
+        partial object is refreshed with the new data. An existing full object is refreshed
+        with the attributes of the new data when it is only partial, keeping its child elements.
+        Objects are kept with weak references and are removed once they are no longer used elsewhere.
+
+        Sessions, history entries and the items of playlists and play queues (which have
+        attributes specific to their container, such as ``playlistItemID``) are never mapped.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.cache import IdentityMap
+                from plexapi.server import PlexServer
+
+                plex = PlexServer('http://localhost:32400', token='xxxxxxxxxxxxxxxxxxxx', identityMap=IdentityMap())
+                movie = plex.library.section('Movies').get('Cars')
+                assert movie in plex.library.section('Movies').all()
+
+    """
+
+    def __init__(self):
+        self._objects = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def key(self, cls, ratingKey):
+        """ Returns the key of an object of the class with the ratingKey. """
+        return (cls.TYPE or cls.__name__, str(ratingKey))
+
+    def get(self, key):
+        """ Returns the object for the key or None if not found. """
+        with self._lock:
+            return self._objects.get(key)
+
+    def set(self, key, obj):
+        """ Stores the object for the key. """
+        with self._lock:
+            self._objects[key] = obj
+
+    def delete(self, key):
+        """ Removes the object for the key. """
+        with self._lock:
+            self._objects.pop(key, None)
+
+    def clear(self):
+        """ Removes all the objects. """
+        with self._lock:
+            self._objects.clear()
@@ -1,10 +1,9 @@
 import time
 import weakref
-from xml.etree import ElementTree
 
 import requests
 
-from plexapi import BASE_HEADERS, CONFIG, TIMEOUT, log, logfilter, utils
+from plexapi import BASE_HEADERS, CONFIG, TIMEOUT, log, logfilter, metrics, utils
 from plexapi.base import PlexObject
 from plexapi.exceptions import BadRequest, NotFound, Unauthorized, Unsupported
 from plexapi.playqueue import PlayQueue
@@ -184,18 +183,19 @@ class PlexClient(PlexObject):
         timeout = timeout or self._timeout
         log.debug('%s %s', method.__name__.upper(), url)
         headers = self._headers(**headers or {})
-        response = method(url, headers=headers, timeout=timeout, **kwargs)
-        if response.status_code not in (200, 201, 204):
-            codename = codes.get(response.status_code)[0]
-            errtext = response.text.replace('\n', ' ')
-            message = f'({response.status_code}) {codename}; {response.url} {errtext}'
-            if response.status_code == 401:
-                raise Unauthorized(message)
-            elif response.status_code == 404:
-                raise NotFound(message)
-            else:
-                raise BadRequest(message)
-        return utils.parseXMLString(response.text)
+        with metrics.QueryEvent('client', method.__name__, url, path) as event:
+            response = event.received(method(url, headers=headers, timeout=timeout, **kwargs))
+            if response.status_code not in (200, 201, 204):
+                codename = codes.get(response.status_code)[0]
+                errtext = response.text.replace('\n', ' ')
+                message = f'({response.status_code}) {codename}; {response.url} {errtext}'
+                if response.status_code == 401:
+                    raise Unauthorized(message)
+                elif response.status_code == 404:
+                    raise NotFound(message)
+                else:
+                    raise BadRequest(message)
+            return event.parse(utils.parseXMLString, response.content)
 
     def sendCommand(self, command, proxy=None, **params):
         """ Convenience wrapper around :func:`~plexapi.client.PlexClient.query` to more easily
@@ -232,7 +232,7 @@ class PlexClient(PlexObject):
 
         try:
             return query(key, headers=headers)
-        except ElementTree.ParseError:
+        except utils.XMLParseError:
             # Workaround for players which don't return valid XML on successful commands
             #   - Plexamp, Plex for Android: `b'OK'`
             #   - Plex for Samsung: `b'<?xml version="1.0"?><Response code="200" status="OK">'`
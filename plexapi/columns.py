@@ -0,0 +1,390 @@
+import re
+from datetime import date, datetime
+
+from plexapi.base import OPERATORS
+from plexapi.exceptions import BadRequest, Unsupported
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+BACKENDS = ('numpy', 'arrow')
+AGGREGATES = ('count', 'sum', 'mean', 'min', 'max')
+
+# Types of the columns by attribute name, any other attribute is a string column.
+INT_FIELDS = {
+    'ratingKey', 'parentRatingKey', 'grandparentRatingKey', 'librarySectionID', 'id', 'index', 'parentIndex',
+    'year', 'parentYear', 'duration', 'viewCount', 'skipCount', 'viewOffset', 'leafCount', 'viewedLeafCount',
+    'childCount', 'bitrate', 'width', 'height', 'audioChannels', 'size', 'streamType', 'channels',
+    'bitDepth', 'samplingRate', 'optimizedForStreaming', 'has64bitOffsets', 'selected', 'default',
+    'deepAnalysisVersion',
+}
+FLOAT_FIELDS = {'rating', 'audienceRating', 'userRating', 'aspectRatio', 'loudness', 'gain', 'frameRate'}
+TIMESTAMP_FIELDS = {'addedAt', 'updatedAt', 'lastViewedAt', 'lastRatedAt', 'lastSkippedAt'}
+DATE_FIELDS = {'originallyAvailableAt'}
+
+# Missing value of a datetime64 array (NaT) as an integer
+_NAT = -2 ** 63
+
+
+def fieldType(field):
+    """ Returns the type of the column of a field: int, float, timestamp, date or str. """
+    attr = field.rsplit('__', 1)[-1]
+    if attr in INT_FIELDS:
+        return 'int'
+    if attr in FLOAT_FIELDS:
+        return 'float'
+    if attr in TIMESTAMP_FIELDS:
+        return 'timestamp'
+    if attr in DATE_FIELDS:
+        return 'date'
+    return 'str'
+
+
+def defaultBackend():
+    """ Returns the columns backend used when none is specified: arrow when :mod:`pyarrow` is
+        installed, otherwise numpy.
+    """
+    return 'arrow' if pyarrow is not None else 'numpy'
+
+
+class ColumnReader:
+    """ Reads the values of fields from XML elements into columns, without building Plex objects.
+        A field is the name of an attribute of the element (e.g. ``year``) or the path of the
+        nested elements and the attribute separated by double underscores (e.g. ``Media__videoCodec``
+        or ``Media__Part__size``). The value of a nested field is the value of the first nested element.
+
+        Parameters:
+            fields (list): The fields to read.
+
+        Attributes:
+            fields (list): The fields read.
+            values (dict): The list of string values (None when missing) read for each field.
+    """
+
+    def __init__(self, fields):
+        if isinstance(fields, str):
+            fields = [fields]
+        self.fields = list(fields)
+        self.values = {field: [] for field in self.fields}
+        self._getters = []
+        for field in self.fields:
+            *tags, attr = field.split('__')
+            if not attr or not all(tags):
+                raise BadRequest(f'Invalid field: {field}')
+            self._getters.append((self.values[field].append, '/'.join(tags) or None, attr))
+
+    def __len__(self):
+        return len(self.values[self.fields[0]]) if self.fields else 0
+
+    def read(self, elems):
+        """ Appends the values of the fields of each element to the columns. """
+        getters = self._getters
+        for elem in elems:
+            attrib = elem.attrib
+            for append, path, attr in getters:
+                if path is None:
+                    append(attrib.get(attr))
+                else:
+                    child = elem.find(path)
+                    append(None if child is None else child.attrib.get(attr))
+        return self
+
+    def columns(self, backend=None):
+        """ Returns the :class:`~plexapi.columns.Columns` of the typed arrays of the fields. Missing values are NaN
+            in float columns and NaT in datetime columns of the numpy backend, and nulls with the
+            arrow backend. Integer columns with missing values are float columns with the numpy backend.
+
+            Parameters:
+                backend (str, optional): numpy to return :class:`numpy.ndarray` or arrow to return
+                    :class:`pyarrow.Array` (default :func:`~plexapi.columns.defaultBackend`).
+
+            Raises:
+                :exc:`~plexapi.exceptions.BadRequest`: Unknown backend.
+                :exc:`~plexapi.exceptions.Unsupported`: The backend library is not installed.
+        """
+        backend = backend or defaultBackend()
+        if backend not in BACKENDS:
+            raise BadRequest(f'Unknown columns backend: {backend}, use one of {", ".join(BACKENDS)}')
+        if backend == 'numpy' and numpy is None:
+            raise Unsupported('numpy must be installed to read columns.')
+        if backend == 'arrow' and pyarrow is None:
+            raise Unsupported('pyarrow must be installed to read arrow columns.')
+        toArray = _arrowArray if backend == 'arrow' else _numpyArray
+        return Columns((field, toArray(values, fieldType(field))) for field, values in self.values.items())
+
+
+class Columns(dict):
+    """ A snapshot of the items of a library section as a dictionary of typed arrays by field,
+        returned by :func:`~plexapi.library.LibrarySection.toColumns`. The snapshot can be filtered,
+        sorted and grouped locally with vectorized numpy operations, without any request to the server.
+
+        Filters use the same ``field__operator=value`` expressions as
+        :func:`~plexapi.base.PlexObject.fetchItems` (e.g. ``year__gte=2000``, ``title__icontains='star'``,
+        ``Media__videoCodec__in=['hevc', 'av1']``, ``lastViewedAt__exists=False``). The value is compared
+        with the typed values of the column: numbers for the numeric columns and :class:`~datetime.datetime`,
+        :class:`~datetime.date`, ISO strings or timestamps for the datetime columns. Like with ``fetchItems``,
+        missing values never match, except for ``__exists=False`` and ``__exact`` with None, 0 or ''.
+
+        .. code-block:: python
+
+            from datetime import datetime, timedelta
+
+            movies = plex.library.section('Movies').toColumns(
+                ['ratingKey', 'title', 'lastViewedAt', 'Media__videoResolution', 'Media__videoCodec', 'Media__Part__size']
+            )
+            stale = movies.filter(
+                Media__videoResolution='4k', Media__videoCodec='hevc', Media__Part__size__gt=40 * 1024 ** 3,
+                lastViewedAt__lt=datetime.now() - timedelta(days=365),
+            ).sort('Media__Part__size', reverse=True)
+            sizes = movies.groupBy('Media__videoResolution', movies=('ratingKey', 'count'), size=('Media__Part__size', 'sum'))
+    """
+
+    @property
+    def size(self):
+        """ Returns the number of rows of the columns. """
+        return len(next(iter(self.values()))) if self else 0
+
+    def mask(self, **kwargs):
+        """ Returns the :class:`numpy.ndarray` of booleans of the rows matching all of the filters. """
+        if numpy is None:
+            raise Unsupported('numpy must be installed to filter columns.')
+        mask = numpy.ones(self.size, dtype=bool)
+        for attr, query in kwargs.items():
+            mask &= self._mask(attr, query)
+        return mask
+
+    def filter(self, **kwargs):
+        """ Returns the :class:`~plexapi.columns.Columns` of the rows matching all of the filters.
+
+            Raises:
+                :exc:`~plexapi.exceptions.BadRequest`: Unknown field.
+        """
+        return self.take(self.mask(**kwargs))
+
+    def take(self, indices):
+        """ Returns the :class:`~plexapi.columns.Columns` of the rows at the indices or of the rows
+            where the boolean mask is True.
+        """
+        indices = numpy.asarray(indices)
+        if indices.dtype == bool:
+            indices = numpy.flatnonzero(indices)
+        return Columns((field, _take(array, indices)) for field, array in self.items())
+
+    def sort(self, field, reverse=False):
+        """ Returns the :class:`~plexapi.columns.Columns` sorted by the values of the field.
+            Missing values are sorted last.
+        """
+        values, missing = self._values(field)
+        present = numpy.flatnonzero(~missing)
+        if values.dtype.kind == 'O':
+            order = sorted(present.tolist(), key=values.__getitem__, reverse=reverse)
+        else:
+            if reverse:
+                # Sort the reversed values and reverse the order to keep the order of equal values
+                present = present[::-1]
+            order = present[numpy.argsort(values[present], kind='stable')]
+            if reverse:
+                order = order[::-1]
+        return self.take(numpy.concatenate([numpy.asarray(order, dtype=numpy.intp), numpy.flatnonzero(missing)]))
+
+    def groupBy(self, fields, **aggregates):
+        """ Groups the rows by the values of the fields and returns the :class:`~plexapi.columns.Columns`
+            of the values of the fields and of the aggregates of each group, as numpy arrays.
+
+            Parameters:
+                fields (str or list): The field or fields to group the rows by.
+                **aggregates (dict): Name of each aggregate column and a tuple of the field to aggregate and
+                    the aggregate function: count, sum, mean, min or max. Missing values are ignored.
+
+            Raises:
+                :exc:`~plexapi.exceptions.BadRequest`: Unknown field or aggregate function.
+        """
+        fields = [fields] if isinstance(fields, str) else list(fields)
+        codes = numpy.zeros(self.size, dtype=numpy.int64)
+        for field in fields:
+            fieldCodes, count = _factorize(*self._values(field))
+            codes = codes * count + fieldCodes
+        _, first, groups = numpy.unique(codes, return_index=True, return_inverse=True)
+        columns = Columns((field, self._values(field)[0][first]) for field in fields)
+        for name, (field, func) in aggregates.items():
+            if func not in AGGREGATES:
+                raise BadRequest(f'Unknown aggregate function: {func}, use one of {", ".join(AGGREGATES)}')
+            values, missing = self._values(field)
+            columns[name] = _aggregate(func, values, missing, groups.ravel(), len(first))
+        return columns
+
+    def _values(self, field):
+        """ Returns the numpy array of the values of the field and the boolean mask of the missing values. """
+        if field not in self:
+            raise BadRequest(f'Unknown field: {field}, use one of {", ".join(self)}')
+        values = self[field]
+        if pyarrow is not None and isinstance(values, (pyarrow.Array, pyarrow.ChunkedArray)):
+            values = values.to_numpy(zero_copy_only=False)
+        kind = values.dtype.kind
+        if kind == 'f':
+            missing = numpy.isnan(values)
+        elif kind == 'M':
+            missing = numpy.isnat(values)
+        elif kind == 'O':
+            missing = numpy.equal(values, None)
+        else:
+            missing = numpy.zeros(len(values), dtype=bool)
+        return values, missing
+
+    def _mask(self, attr, query):
+        """ Returns the boolean mask of the rows matching a single ``field__operator=value`` filter. """
+        op = attr.rsplit('__', 1)[-1]
+        if op in OPERATORS and attr.rsplit('__', 1)[0] in self:
+            field = attr.rsplit('__', 1)[0]
+        else:
+            field, op = attr, 'exact'
+        values, missing = self._values(field)
+        if op == 'exists':
+            return ~missing if query else missing
+        if op == 'exact' and query is None:
+            return missing
+        includeMissing = op == 'exact' and query in (0, '')
+        if op in ('exact', 'ne', 'gt', 'gte', 'lt', 'lte', 'in') and values.dtype.kind != 'O':
+            if op == 'in':
+                mask = numpy.isin(values, [_query(values, q) for q in query])
+            else:
+                mask = getattr(numpy, _COMPARE[op])(values, _query(values, query))
+        else:
+            mask = _matchStrings(op, values, missing, query)
+        return (mask & ~missing) | (missing & includeMissing)
+
+
+# Names of the numpy functions of the comparison operators
+_COMPARE = {'exact': 'equal', 'ne': 'not_equal', 'gt': 'greater', 'gte': 'greater_equal', 'lt': 'less', 'lte': 'less_equal'}
+
+
+def _query(values, query):
+    """ Returns the query value cast to the type of the values. """
+    if values.dtype.kind == 'M':
+        unit = numpy.datetime_data(values.dtype)[0]
+        if isinstance(query, datetime):
+            return numpy.datetime64(int(query.timestamp()), 's').astype(values.dtype)
+        if isinstance(query, date):
+            return numpy.datetime64(query.isoformat()).astype(values.dtype)
+        if isinstance(query, (int, float)):
+            return numpy.datetime64(int(query), 's').astype(values.dtype)
+        return numpy.datetime64(query, unit)
+    if isinstance(query, str):
+        return float(query)
+    return query
+
+
+def _matchStrings(op, values, missing, query):
+    """ Returns the boolean mask of the values matching a string operator, compared as strings. """
+    strings = numpy.where(missing, '', values).astype(str)
+    strops = getattr(numpy, 'strings', numpy.char)
+    if op in ('iexact', 'icontains', 'istartswith', 'iendswith'):
+        strings, query, op = strops.lower(strings), str(query).lower(), op[1:]
+    if op == 'in':
+        return numpy.isin(strings, [str(q) for q in query])
+    if op in ('regex', 'iregex'):
+        pattern = re.compile(query, flags=re.IGNORECASE if op == 'iregex' else 0)
+        return numpy.fromiter((bool(pattern.search(s)) for s in strings), dtype=bool, count=len(strings))
+    if op == 'exact':
+        return strings == str(query)
+    if op == 'ne':
+        return strings != str(query)
+    if op == 'contains':
+        return strops.find(strings, str(query)) >= 0
+    if op == 'startswith':
+        return strops.startswith(strings, str(query))
+    if op == 'endswith':
+        return strops.endswith(strings, str(query))
+    return getattr(numpy, _COMPARE[op])(strings, str(query))
+
+
+def _take(array, indices):
+    """ Returns the values of a numpy or arrow array at the indices. """
+    if isinstance(array, numpy.ndarray):
+        return array[indices]
+    return array.take(pyarrow.array(indices, type=pyarrow.int64()))
+
+
+def _factorize(values, missing):
+    """ Returns the integer code of each value, missing values included, and the number of codes. """
+    if values.dtype.kind == 'O':
+        index = {}
+        codes = numpy.fromiter((index.setdefault(v, len(index)) for v in values), dtype=numpy.int64, count=len(values))
+        return codes, max(len(index), 1)
+    _, codes = numpy.unique(values, return_inverse=True)
+    codes = codes.ravel().astype(numpy.int64)
+    count = int(codes.max()) + 1 if len(codes) else 1
+    if missing.any():
+        codes[missing] = count
+        count += 1
+    return codes, count
+
+
+def _aggregate(func, values, missing, groups, count):
+    """ Returns the numpy array of the aggregate of the values of each group. """
+    present = ~missing
+    counts = numpy.bincount(groups[present], minlength=count)
+    if func == 'count':
+        return counts
+    if values.dtype.kind == 'O':
+        raise BadRequest(f'Cannot {func} a string column')
+    if func in ('sum', 'mean'):
+        sums = numpy.bincount(groups[present], weights=values[present].astype(numpy.float64), minlength=count)
+        if func == 'mean':
+            with numpy.errstate(invalid='ignore', divide='ignore'):
+                return sums / counts
+        return sums.astype(numpy.int64) if values.dtype.kind in 'iu' else sums
+    isDatetime = values.dtype.kind == 'M'
+    numbers = values.view(numpy.int64) if isDatetime else values.astype(numpy.float64)
+    initial = numpy.iinfo(numpy.int64).max if func == 'min' else numpy.iinfo(numpy.int64).min
+    if not isDatetime:
+        initial = numpy.inf if func == 'min' else -numpy.inf
+    result = numpy.full(count, initial, dtype=numbers.dtype)
+    ufunc = numpy.minimum if func == 'min' else numpy.maximum
+    ufunc.at(result, groups[present], numbers[present])
+    if isDatetime:
+        result[counts == 0] = _NAT
+        return result.view(values.dtype)
+    result[counts == 0] = numpy.nan
+    return result
+
+
+def _numbers(values, cast):
+    return [None if value is None or value == '' else cast(value) for value in values]
+
+
+def _numpyArray(values, ftype):
+    """ Returns the numpy array of the string values of a column of the type. """
+    if ftype == 'int':
+        numbers = _numbers(values, int)
+        if None not in numbers:
+            return numpy.array(numbers, dtype=numpy.int64)
+        return numpy.array([numpy.nan if n is None else n for n in numbers], dtype=numpy.float64)
+    if ftype == 'float':
+        return numpy.array([numpy.nan if n is None else n for n in _numbers(values, float)], dtype=numpy.float64)
+    if ftype == 'timestamp':
+        numbers = [_NAT if n is None else n for n in _numbers(values, int)]
+        return numpy.array(numbers, dtype=numpy.int64).view('datetime64[s]')
+    if ftype == 'date':
+        return numpy.array([value or 'NaT' for value in values], dtype='datetime64[D]')
+    return numpy.array(values, dtype=object)
+
+
+def _arrowArray(values, ftype):
+    """ Returns the arrow array of the string values of a column of the type. """
+    if ftype == 'int':
+        return pyarrow.array(_numbers(values, int), type=pyarrow.int64())
+    if ftype == 'float':
+        return pyarrow.array(_numbers(values, float), type=pyarrow.float64())
+    if ftype == 'timestamp':
+        return pyarrow.array(_numbers(values, int), type=pyarrow.int64()).cast(pyarrow.timestamp('s'))
+    if ftype == 'date':
+        return pyarrow.array([value or None for value in values], type=pyarrow.string()).cast(pyarrow.date32())
+    return pyarrow.array(values, type=pyarrow.string())
@@ -31,3 +31,8 @@ class Unauthorized(BadRequest):
 class TwoFactorRequired(Unauthorized):
     """ Two factor authentication required. """
     pass
+
+
+class RequestBudgetExceeded(PlexApiException):
+    """ Too many requests were sent, see :func:`~plexapi.metrics.requestBudget`. """
+    pass
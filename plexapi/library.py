@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import base64
+import heapq
+import itertools
+import json
+import os
 import re
+import threading
+import zlib
 from typing import Any, TYPE_CHECKING
 import warnings
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import parse_qs, quote_plus, urlencode, urlparse
 
-from plexapi import log, media, utils
+from plexapi import FETCH_WORKERS, X_PLEX_CONTAINER_SIZE, log, media, utils
 from plexapi.base import OPERATORS, PlexObject, cached_data_property
+from plexapi.columns import ColumnReader
 from plexapi.exceptions import BadRequest, NotFound
 from plexapi.mixins import (
     MovieEditMixins, ShowEditMixins, SeasonEditMixins, EpisodeEditMixins,
@@ -20,6 +29,19 @@ from plexapi.settings import Setting
 if TYPE_CHECKING:
     from plexapi.audio import Track
 
+# Library types of the items of each library section type
+LIBTYPES = {
+    'movie': ('movie',),
+    'show': ('show', 'season', 'episode'),
+    'artist': ('artist', 'album', 'track'),
+    'photo': ('photoalbum', 'photo'),
+}
+# Fields of the search filters used to find the items changed since a timestamp
+CHANGED_FIELDS = ('addedAt', 'updatedAt', 'lastViewedAt')
+# Parameters to list only the ratingKeys of the items, without their tags and media
+KEYS_ONLY = {'excludeElements': 'Media,Genre,Country,Director,Writer,Role,Collection,Label,Guid,Image',
+             'excludeFields': 'summary,tagline'}
+
 
 class Library(PlexObject):
     """ Represents a PlexServer library. This contains all sections of media defined
@@ -48,20 +70,24 @@ class Library(PlexObject):
         key = '/library/sections'
         sectionsByID = {}
         sectionsByTitle = defaultdict(list)
-        libcls = {
-            'movie': MovieSection,
-            'show': ShowSection,
-            'artist': MusicSection,
-            'photo': PhotoSection,
-        }
 
         for elem in self._server.query(key):
-            section = libcls.get(elem.attrib.get('type'), LibrarySection)(self._server, elem, initpath=key)
+            section = self._buildSection(elem, key)
             sectionsByID[section.key] = section
             sectionsByTitle[section.title.lower().strip()].append(section)
 
         return sectionsByID, dict(sectionsByTitle)
 
+    def _buildSection(self, elem, initpath):
+        """ Builds the :class:`~plexapi.library.LibrarySection` subclass matching the section type. """
+        libcls = {
+            'movie': MovieSection,
+            'show': ShowSection,
+            'artist': MusicSection,
+            'photo': PhotoSection,
+        }
+        return libcls.get(elem.attrib.get('type'), LibrarySection)(self._server, elem, initpath=initpath)
+
     @property
     def _sectionsByID(self):
         """ Returns a dictionary of all library sections by ID. """
@@ -139,14 +165,17 @@ class Library(PlexObject):
         key = self._buildQueryKey('/hubs', **kwargs)
         return self.fetchItems(key)
 
-    def all(self, **kwargs):
+    def all(self, workers=None, **kwargs):
         """ Returns a list of all media from all library sections.
             This may be a very large dataset to retrieve.
+
+            Parameters:
+                workers (int, optional): Number of library sections requested concurrently
+                    (default config.FETCH_WORKERS).
         """
         items = []
-        for section in self.sections():
-            for item in section.all(**kwargs):
-                items.append(item)
+        for results in self._searchSections(self.sections(), lambda section: section.all(**kwargs), workers):
+            items.extend(results)
         return items
 
     def onDeck(self):
@@ -178,6 +207,68 @@ class Library(PlexObject):
         key = self._buildQueryKey('/library/all', **args)
         return self.fetchItems(key)
 
+    def searchSections(self, title=None, sort=None, maxresults=None, libtype=None, sections=None, workers=None, **kwargs):
+        """ Searches every library section with :func:`~plexapi.library.LibrarySection.search` and returns
+            the merged results. Up to the specified number of workers library sections are searched concurrently.
+            When a sort is specified, each library section returns its results in that order and the results
+            are merged in the same order, otherwise the results are returned by library section.
+            With maxresults, no library section returns more than maxresults items. Without a sort, the library
+            sections are not searched anymore once enough items are found when they are searched one at a time.
+
+            Parameters:
+                title (str, optional): General string query to search for.
+                sort (str or list, optional): The sort field(s) of the results (e.g. ``'addedAt:desc'``).
+                    The results are merged by the values of the attributes of the same names.
+                maxresults (int, optional): Only return the specified number of results.
+                libtype (str, optional): Only search the library sections containing this library type
+                    and return the items of this library type.
+                sections (list, optional): The :class:`~plexapi.library.LibrarySection` or library section
+                    titles to search (default all the library sections).
+                workers (int, optional): Number of library sections searched concurrently
+                    (default config.FETCH_WORKERS).
+                **kwargs (dict): Additional search filters of :func:`~plexapi.library.LibrarySection.search`.
+
+            Example:
+
+                .. code-block:: python
+
+                    # The 10 most recently added movies, episodes and tracks of all library sections
+                    items = plex.library.searchSections(sort='addedAt:desc', maxresults=10, workers=8)
+
+        """
+        if sections is None:
+            sections = self.sections()
+        sections = [self.section(section) if isinstance(section, str) else section for section in sections]
+        if libtype is not None:
+            sections = [section for section in sections if libtype in LIBTYPES.get(section.TYPE, ())]
+        sequential = min(workers or FETCH_WORKERS, len(sections)) <= 1
+        found = []
+
+        def search(section):
+            remaining = maxresults
+            if maxresults is not None and sequential and sort is None:
+                # Stop searching the next library sections once enough items are found
+                remaining = maxresults - len(found)
+                if remaining <= 0:
+                    return []
+            results = section.search(title=title, sort=sort, maxresults=remaining, libtype=libtype, **kwargs)
+            found.extend(results)
+            return results
+
+        results = self._searchSections(sections, search, workers)
+        merged = heapq.merge(*results, key=_sortKey(sort)) if sort else itertools.chain.from_iterable(results)
+        return list(itertools.islice(merged, maxresults))
+
+    def _searchSections(self, sections, search, workers=None):
+        """ Returns the list of the results of the search function called with each library section,
+            calling it for up to the specified number of library sections concurrently.
+        """
+        workers = min(workers or FETCH_WORKERS, len(sections))
+        if workers <= 1:
+            return [search(section) for section in sections]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(search, sections))
+
     def cleanBundles(self):
         """ Poster images and other metadata for items in your library are kept in "bundle"
             packages. When you remove items from your library, these bundles aren't immediately
@@ -427,6 +518,7 @@ class LibrarySection(PlexObject):
             language (str): Language represented in this section (en, xn, etc).
             locations (List<str>): List of folder paths added to the library section.
             refreshing (bool): True if this section is currently being refreshed.
+            scannedAt (datetime): Datetime the library section was last scanned.
             scanner (str): Internal scanner used to find media (Plex Movie Scanner, Plex Premium Music Scanner, etc.)
             thumb (str): Thumbnail image used to represent the library section.
             title (str): Name of the library section.
@@ -434,6 +526,7 @@ class LibrarySection(PlexObject):
             updatedAt (datetime): Datetime the library section was last updated.
             uuid (str): Unique id for the section (32258d7c-3e6c-4ac5-98ad-bad7a3b78c63)
     """
+    _guidIndex = None
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
@@ -446,6 +539,7 @@ class LibrarySection(PlexObject):
         self.key = utils.cast(int, data.attrib.get('key'))
         self.language = data.attrib.get('language')
         self.refreshing = utils.cast(bool, data.attrib.get('refreshing'))
+        self.scannedAt = utils.toDatetime(data.attrib.get('scannedAt'))
         self.scanner = data.attrib.get('scanner')
         self.thumb = data.attrib.get('thumb')
         self.title = data.attrib.get('title')
@@ -661,18 +755,17 @@ class LibrarySection(PlexObject):
                     result3 = library.getGuid('tmdb://1399')
                     result4 = library.getGuid('tvdb://121361')
 
-                    # Alternatively, create your own guid lookup dictionary for faster performance
-                    guidLookup = {}
-                    for item in library.all():
-                        guidLookup[item.guid] = item
-                        guidLookup.update({guid.id: item for guid in item.guids})
-
-                    result1 = guidLookup['plex://show/5d9c086c46115600200aa2fe']
-                    result2 = guidLookup['imdb://tt0944947']
-                    result3 = guidLookup['tmdb://1399']
-                    result4 = guidLookup['tvdb://121361']
+                    # Alternatively, build a guid index of the library for faster lookups
+                    library.guidIndex()
+                    result2 = library.getGuid('imdb://tt0944947')  # Uses the guid index
+                    results = library.getGuids(['imdb://tt0944947', 'tmdb://1399', 'tvdb://121361'])
 
         """
+        if self._guidIndex is not None:
+            item = self.getGuids([guid]).get(guid)
+            if item is None:
+                raise NotFound(f"Guid '{guid}' is not found in the library")
+            return item
 
         try:
             if guid.startswith('plex://'):
@@ -685,6 +778,52 @@ class LibrarySection(PlexObject):
         except IndexError:
             raise NotFound(f"Guid '{guid}' is not found in the library") from None
 
+    def getGuids(self, guids):
+        """ Returns the media items with the specified external Plex, IMDB, TMDB, or TVDB IDs, looked up in the
+            :class:`~plexapi.library.GuidIndex` of the library section. The guid index is built by the first call
+            if :func:`~plexapi.library.LibrarySection.guidIndex` was not called before, and updated with the
+            changes of the library section when a guid is not found. The items are requested together in batches.
+
+            Parameters:
+                guids (list): The external guids of the items to return.
+
+            Returns:
+                dict: The items by guid. The guids not found in the library are not included.
+        """
+        index = self._guidIndex
+        refreshed = index is None
+        if index is None:
+            index = self.guidIndex()
+        ratingKeys = {guid: index.get(guid) for guid in guids}
+        if None in ratingKeys.values() and not refreshed:
+            index.refresh()
+            ratingKeys = {guid: index.get(guid) for guid in guids}
+        found = sorted({ratingKey for ratingKey in ratingKeys.values() if ratingKey is not None})
+        items = {}
+        for start in range(0, len(found), X_PLEX_CONTAINER_SIZE):
+            for item in self._server.fetchItems(found[start:start + X_PLEX_CONTAINER_SIZE]):
+                items[item.ratingKey] = item
+        if len(items) < len(found):
+            # Items removed since the last update of the index
+            index.refresh()
+        return {guid: items[ratingKey] for guid, ratingKey in ratingKeys.items() if ratingKey in items}
+
+    def guidIndex(self, path=None, libtypes=None):
+        """ Builds or updates the :class:`~plexapi.library.GuidIndex` of the library section and returns it.
+            The guid index is then used by :func:`~plexapi.library.LibrarySection.getGuid` and
+            :func:`~plexapi.library.LibrarySection.getGuids` instead of searching the library.
+
+            Parameters:
+                path (str, optional): Path of a JSON file to save the guid index to and load it from.
+                libtypes (list, optional): The library types of the items to index (default the main library type).
+        """
+        index = self._guidIndex
+        if index is None or (path and index.path != os.path.expanduser(path)) or (libtypes and index.libtypes != libtypes):
+            index = GuidIndex(self, path, libtypes)
+        index.refresh()
+        self._guidIndex = index
+        return index
+
     def all(self, libtype=None, **kwargs):
         """ Returns a list of all items from this library section.
             See description of :func:`~plexapi.library.LibrarySection.search()` for details about filtering / sorting.
@@ -882,6 +1021,35 @@ class LibrarySection(PlexObject):
         self._server.query(key, method=self._server._session.delete)
         return self
 
+    @cached_data_property
+    def _filterCacheVersion(self):
+        """ Returns the version of this library section used by the :class:`~plexapi.cache.FilterCache`.
+            When the response cache of the server is enabled, the library sections are requested again
+            without it since a cached response may have an outdated ``updatedAt`` or ``scannedAt``.
+        """
+        section = self
+        if getattr(self._server, '_cache', None) is not None:
+            key = '/library/sections'
+            data = self._server.query(key, headers={'Cache-Control': 'no-cache'})
+            elem = next((elem for elem in data if elem.attrib.get('key') == str(self.key)), None)
+            if elem is not None:
+                section = Library(self._server, None)._buildSection(elem, key)
+        return self._server._filterCache.version(section)
+
+    def _queryFilters(self, key):
+        """ Returns the response of a filter metadata request for this library section,
+            using the persistent :class:`~plexapi.cache.FilterCache` of the server if enabled.
+        """
+        filterCache = getattr(self._server, '_filterCache', None)
+        if filterCache is None:
+            return self._server.query(key)
+        data = filterCache.get(self, key)
+        if data is None:
+            # Bypass the response cache which may return the outdated metadata
+            data = self._server.query(key, headers={'Cache-Control': 'no-cache'})
+            filterCache.set(self, key, data)
+        return data
+
     @cached_data_property
     def _loadFilters(self):
         """ Retrieves and caches the list of :class:`~plexapi.library.FilteringType` and
@@ -891,13 +1059,13 @@ class LibrarySection(PlexObject):
                 '&X-Plex-Container-Start=0&X-Plex-Container-Size=0')
 
         key = _key.format(key=self.key, filter='all')
-        data = self._server.query(key)
+        data = self._queryFilters(key)
         filterTypes = self.findItems(data, FilteringType, rtag='Meta')
         fieldTypes = self.findItems(data, FilteringFieldType, rtag='Meta')
 
         if self.TYPE != 'photo':  # No collections for photo library
             key = _key.format(key=self.key, filter='collections')
-            data = self._server.query(key)
+            data = self._queryFilters(key)
             filterTypes.extend(self.findItems(data, FilteringType, rtag='Meta'))
 
         # Manually add guid field type, only allowing "is" operator
@@ -1065,7 +1233,7 @@ class LibrarySection(PlexObject):
                 raise NotFound(f'Unknown filter field "{field}" for libtype "{libtype}". '
                                f'Available filters: {availableFilters}') from None
 
-        data = self._server.query(field.key)
+        data = self._queryFilters(field.key)
         return self.findItems(data, FilterChoice)
 
     def _validateFilterField(self, field, values, libtype=None):
@@ -1557,6 +1725,202 @@ class LibrarySection(PlexObject):
         return self.fetchItems(
             key, container_start=container_start, container_size=container_size, maxresults=maxresults, **kwargs)
 
+    def iterSearch(self, title=None, sort=None, maxresults=None, libtype=None,
+                   container_start=None, container_size=None, limit=None, filters=None, stream=False, **kwargs):
+        """ Search the library and yield the results one page at a time instead of returning a single list.
+            The memory usage stays flat no matter how large the library is, as long as the yielded items are
+            not kept around. See :func:`~plexapi.library.LibrarySection.search` for details on the parameters.
+
+            Parameters:
+                stream (bool, optional): True to parse each page while it is downloaded and yield each item
+                    as soon as it is parsed, so only one item at a time is held in memory instead of a page.
+                    See :func:`~plexapi.base.PlexObject.streamItems`. Default False.
+
+            Example:
+
+                .. code-block:: python
+
+                    for track in library.iterSearch(libtype='track', container_size=1000):
+                        print(track.title, track.duration)
+
+        """
+        key, kwargs = self._buildSearchKey(
+            title=title, sort=sort, libtype=libtype, limit=limit, filters=filters, returnKwargs=True, **kwargs)
+        iterItems = self.streamItems if stream else self.iterItems
+        return iterItems(
+            key, container_start=container_start, container_size=container_size, maxresults=maxresults, **kwargs)
+
+    def toColumns(self, fields, libtype=None, backend=None, maxresults=None,
+                  container_start=None, container_size=None, workers=None, **kwargs):
+        """ Search the library and return the values of the specified fields of the results as typed
+            columns, parsed straight from the XML of each page without building any Plex object.
+            This is much cheaper than :func:`~plexapi.library.LibrarySection.search` when only a few
+            fields of every item are needed, e.g. for analytics over a whole library section.
+            Collections are not included in the results.
+
+            Parameters:
+                fields (list): The fields to return. A field is an XML attribute of the items (e.g. ``year``)
+                    or of the first nested element of the items with the path of the element separated
+                    by double underscores (e.g. ``Media__videoCodec``, ``Media__Part__size``, ``Genre__tag``).
+                libtype (str, optional): The library type of the items to return (default the main library type).
+                backend (str, optional): numpy to return :class:`numpy.ndarray` columns or arrow to return
+                    :class:`pyarrow.Array` columns (default arrow when pyarrow is installed, otherwise numpy).
+                    See :func:`~plexapi.columns.ColumnReader.columns` for the column types.
+                maxresults (int, optional): Only return the specified number of results.
+                container_start (int, optional): Default 0.
+                container_size (int, optional): Default X_PLEX_CONTAINER_SIZE in your config file.
+                workers (int, optional): Number of pages requested concurrently (default config.FETCH_WORKERS).
+                **kwargs (dict): Additional search filters and sort (``title``, ``sort``, ``filters``, ``limit``).
+                    See :func:`~plexapi.library.LibrarySection.search` for details.
+
+            Returns:
+                :class:`~plexapi.columns.Columns`: The array of the values of each field by field name,
+                which can be filtered, sorted and grouped locally.
+
+            Raises:
+                :exc:`~plexapi.exceptions.BadRequest`: Invalid field or unknown backend.
+                :exc:`~plexapi.exceptions.Unsupported`: numpy or pyarrow is not installed.
+
+            Example:
+
+                .. code-block:: python
+
+                    columns = plex.library.section('Movies').toColumns(
+                        ['ratingKey', 'title', 'year', 'duration', 'viewCount', 'Media__videoResolution', 'Media__Part__size']
+                    )
+                    print(columns['Media__Part__size'].sum())
+
+        """
+        reader = ColumnReader(fields)
+        reader.columns(backend)  # Fail early when the backend is not available
+        key, kwargs = self._buildSearchKey(libtype=libtype, returnKwargs=True, **kwargs)
+        key += '&includeCollections=0'
+        check = self._compileAttrs(**kwargs) if kwargs else None
+        for data in self._iterPageData(key, container_start, container_size, workers=workers):
+            elems = [elem for elem in data if elem.attrib.get('ratingKey')]
+            if check is not None:
+                elems = [elem for elem in elems if check(elem)]
+            if maxresults is not None:
+                elems = elems[:maxresults - len(reader)]
+            reader.read(elems)
+            if maxresults is not None and len(reader) >= maxresults:
+                break
+        return reader.columns(backend)
+
+    def changesSince(self, checkpoint=None, libtype=None, container_size=None):
+        """ Returns the items of the library section added, updated or removed since a checkpoint, to keep
+            an external copy of the library in sync. Only the changed items are requested with the
+            ``addedAt>>``, ``updatedAt>>`` and ``lastViewedAt>>`` search filters, so the cost of a sync
+            depends on the number of changes and not on the size of the library. The removed items are
+            found by comparing the number of items on the server with the number of known items, the
+            ratingKeys of the items are only listed when they differ.
+
+            Items changed in the same second as the checkpoint can be returned again by the next call.
+
+            Parameters:
+                checkpoint (str, datetime or int, optional): The :attr:`~plexapi.library.LibraryChanges.checkpoint`
+                    token returned by the previous call, or the datetime or timestamp to list the changes from.
+                    Removed items are only returned when resuming from a token. Default is to return all
+                    the items as added.
+                libtype (str, optional): The library type of the items (default the main library type).
+                    Checkpoint tokens are only valid for the library type they were returned for.
+                container_size (int, optional): Default X_PLEX_CONTAINER_SIZE in your config file.
+
+            Returns:
+                :class:`~plexapi.library.LibraryChanges`: The added, updated and removed items and the checkpoint
+                token to resume from.
+
+            Raises:
+                :exc:`~plexapi.exceptions.BadRequest`: Invalid checkpoint token.
+
+            Example:
+
+                .. code-block:: python
+
+                    changes = plex.library.section('Movies').changesSince(checkpoint)
+                    for movie in changes.added + changes.updated:
+                        index.update(movie.ratingKey, movie.title)
+                    index.delete(changes.removed)
+                    checkpoint = changes.checkpoint
+
+        """
+        libtype = libtype or self.TYPE
+        changed, removed, since, checkpoint = self._changedElements(checkpoint, libtype, container_size)
+        added, updated = [], []
+        for elem, key in changed.values():
+            item = self._buildItemOrNone(elem, initpath=key)
+            if item is None:
+                continue
+            item.librarySectionID = self.key
+            addedAt = utils.cast(int, elem.attrib.get('addedAt')) or 0
+            (added if since is None or addedAt >= since else updated).append(item)
+        return LibraryChanges(added, updated, removed, checkpoint)
+
+    def _changedElements(self, checkpoint, libtype, container_size=None):
+        """ Returns the elements of the items changed since the checkpoint (see
+            :func:`~plexapi.library.LibrarySection.changesSince`) with the key they were listed with
+            by ratingKey, the ratingKeys of the removed items, the timestamp of the checkpoint and
+            the new checkpoint token.
+        """
+        known = None
+        if checkpoint is None:
+            since = None
+        elif isinstance(checkpoint, str):
+            since, known = _decodeCheckpoint(checkpoint, self.uuid, libtype)
+        elif isinstance(checkpoint, datetime):
+            since = int(checkpoint.timestamp())
+        else:
+            since = int(checkpoint)
+
+        changed, timestamps = {}, [since or 0]
+        if since is None:
+            keys = [self._listKey(libtype)]
+        else:
+            keys = [self._listKey(libtype, **{self._changedFilter(libtype, field): since - 1}) for field in CHANGED_FIELDS]
+        for key in keys:
+            for data in self._iterPageData(key, container_size=container_size):
+                for elem in data:
+                    ratingKey = utils.cast(int, elem.attrib.get('ratingKey'))
+                    if ratingKey is None or ratingKey in changed or elem.attrib.get('type') != libtype:
+                        continue
+                    changed[ratingKey] = (elem, key)
+                    timestamps.extend(utils.cast(int, elem.attrib.get(field)) or 0 for field in CHANGED_FIELDS)
+
+        if since is None:
+            ratingKeys, removed = set(changed), []
+        else:
+            ratingKeys = (known or set()) | set(changed)
+            if known is None or len(ratingKeys) != self.totalViewSize(libtype, includeCollections=False):
+                ratingKeys = self._ratingKeys(libtype, container_size)
+            removed = sorted((known or set()) - ratingKeys)
+        return changed, removed, since, _encodeCheckpoint(max(timestamps), ratingKeys, self.uuid, libtype)
+
+    def _listKey(self, libtype=None, **params):
+        """ Returns the API key listing the items of the libtype without collections, with the
+            additional search params. The params are not validated with the filters of the section.
+        """
+        libtype = libtype or self.TYPE
+        args = {'type': utils.searchType(libtype), 'includeCollections': 0, 'includeGuids': 1, **params}
+        if libtype == 'photo':
+            args['clusterZoomLevel'] = 1
+        return f'/library/sections/{self.key}/all{utils.joinArgs(args)}'
+
+    def _changedFilter(self, libtype, field):
+        """ Returns the name of the search filter of the items of the libtype with the field after a timestamp.
+            Plex expects the libtype in front of the field for the libtypes other than the main one.
+        """
+        prefix = '' if libtype == self.TYPE else f'{libtype}.'
+        return f'{prefix}{field}>>'
+
+    def _ratingKeys(self, libtype=None, container_size=None, workers=None):
+        """ Returns the set of the ratingKeys of all the items of the libtype, listed without their tags and media. """
+        key = self._listKey(libtype, **KEYS_ONLY)
+        return {
+            int(elem.attrib['ratingKey'])
+            for data in self._iterPageData(key, container_size=container_size, workers=workers)
+            for elem in data if elem.attrib.get('ratingKey')
+        }
+
     def _locations(self):
         """ Returns a list of :class:`~plexapi.library.Location` objects
         """
@@ -2143,6 +2507,194 @@ class PhotoSection(LibrarySection, PhotoalbumEditMixins, PhotoEditMixins):
         return super(PhotoSection, self).sync(**kwargs)
 
 
+class LibraryChanges:
+    """ The changes of a library section since a checkpoint, returned by
+        :func:`~plexapi.library.LibrarySection.changesSince`.
+
+        Attributes:
+            added (list): The items added since the checkpoint (all the items without a checkpoint).
+            updated (list): The items updated or played since the checkpoint and added before it.
+            removed (list): The ratingKeys of the items removed since the checkpoint.
+            checkpoint (str): The token to pass to the next call to resume from these changes.
+    """
+
+    def __init__(self, added, updated, removed, checkpoint):
+        self.added = added
+        self.updated = updated
+        self.removed = removed
+        self.checkpoint = checkpoint
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:added={len(self.added)}:updated={len(self.updated)}:removed={len(self.removed)}>'
+
+    def __bool__(self):
+        return bool(self.added or self.updated or self.removed)
+
+
+class GuidIndex:
+    """ An index of the items of a library section by their Plex and external guids (e.g. ``plex://movie/...``,
+        ``imdb://tt0944947``, ``tmdb://1399``, ``tvdb://121361``), used by
+        :func:`~plexapi.library.LibrarySection.getGuid` and :func:`~plexapi.library.LibrarySection.getGuids`
+        to find items without searching the library. The index is built from a single paged listing of the
+        items with their guids, and kept up to date with :func:`~plexapi.library.LibrarySection.changesSince`
+        when a guid is not found. Call :func:`~plexapi.library.GuidIndex.refresh` to update it explicitly
+        (e.g. from an :class:`~plexapi.alert.AlertListener` callback).
+
+        Parameters:
+            section (:class:`~plexapi.library.LibrarySection`): The library section to index.
+            path (str, optional): Path of a JSON file to save the index to and load it from, so the
+                index is only updated with the changes since it was saved. Default is in memory only.
+            libtypes (list, optional): The library types of the items to index (default the main library type).
+
+        Attributes:
+            path (str): Path of the JSON file of the index, or None.
+            libtypes (list): The library types of the indexed items.
+    """
+
+    def __init__(self, section, path=None, libtypes=None):
+        self._section = section
+        self._lock = threading.RLock()
+        self.path = os.path.expanduser(path) if path else None
+        self.libtypes = list(libtypes or [section.TYPE])
+        self._guids = {}  # guid -> ratingKey
+        self._itemGuids = {}  # ratingKey -> guids
+        self._checkpoints = {}  # libtype -> changesSince checkpoint token
+        self._load()
+
+    def __len__(self):
+        return len(self._itemGuids)
+
+    def __contains__(self, guid):
+        return guid in self._guids
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self._section.title}:{len(self)}>'
+
+    def get(self, guid):
+        """ Returns the ratingKey of the item with the guid, or None if the guid is not indexed. """
+        return self._guids.get(guid)
+
+    def refresh(self):
+        """ Updates the index with the items added, updated or removed since the last update, or builds
+            the index from a listing of all the items the first time. Returns the number of changed items.
+        """
+        with self._lock:
+            changes = 0
+            for libtype in self.libtypes:
+                changed, removed, _, checkpoint = self._section._changedElements(self._checkpoints.get(libtype), libtype)
+                for ratingKey in removed:
+                    self._remove(ratingKey)
+                for ratingKey, (elem, _) in changed.items():
+                    guids = [elem.attrib.get('guid')] + [guid.attrib.get('id') for guid in elem.iter('Guid')]
+                    self._add(ratingKey, [guid for guid in guids if guid])
+                self._checkpoints[libtype] = checkpoint
+                changes += len(changed) + len(removed)
+            self._save()
+            return changes
+
+    def _add(self, ratingKey, guids):
+        self._remove(ratingKey)
+        self._itemGuids[ratingKey] = guids
+        for guid in guids:
+            self._guids[guid] = ratingKey
+
+    def _remove(self, ratingKey):
+        for guid in self._itemGuids.pop(ratingKey, ()):
+            if self._guids.get(guid) == ratingKey:
+                del self._guids[guid]
+
+    def _load(self):
+        """ Loads the index saved for the same library section and library types, if any. """
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding='utf-8') as handle:
+                saved = json.load(handle)
+            if saved['version'] != 1 or saved['uuid'] != self._section.uuid or saved['libtypes'] != self.libtypes:
+                return
+            checkpoints, items = saved['checkpoints'], saved['items']
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.warning('Failed to load the guid index %s: %s', self.path, e)
+            return
+        for ratingKey, guids in items.items():
+            self._add(int(ratingKey), guids)
+        self._checkpoints = checkpoints
+
+    def _save(self):
+        """ Saves the index to its file, replacing the previous file atomically. """
+        if not self.path:
+            return
+        saved = {'version': 1, 'uuid': self._section.uuid, 'libtypes': self.libtypes,
+                 'checkpoints': self._checkpoints, 'items': self._itemGuids}
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp = f'{self.path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as handle:
+            json.dump(saved, handle, separators=(',', ':'))
+        os.replace(tmp, self.path)
+
+
+class _SortValue:
+    """ A value of a sort field, comparable with the other values of the field in the sort direction.
+        Missing values are sorted last and strings are compared case-insensitively.
+    """
+    __slots__ = ('value', 'desc')
+
+    def __init__(self, value, desc):
+        self.value = value.lower() if isinstance(value, str) else value
+        self.desc = desc
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        if self.value is None or other.value is None:
+            return self.value is not None and other.value is None
+        return self.value > other.value if self.desc else self.value < other.value
+
+
+def _sortKey(sort):
+    """ Returns the function returning the key to merge items sorted by the sort fields of a search
+        (e.g. ``'year:desc,titleSort'``). The values are read without reloading partial objects.
+    """
+    fields = []
+    for part in (sort if isinstance(sort, (list, tuple)) else sort.split(',')):
+        field, _, direction = part.strip().partition(':')
+        fields.append((field.split('.')[-1], direction == 'desc'))
+
+    def key(item):
+        values = []
+        for field, desc in fields:
+            try:
+                value = object.__getattribute__(item, field)
+            except AttributeError:
+                value = None
+            values.append(_SortValue(value, desc))
+        return tuple(values)
+    return key
+
+
+def _encodeCheckpoint(since, ratingKeys, uuid, libtype):
+    """ Returns the checkpoint token of the timestamp and the ratingKeys of the items of a library section.
+        The sorted ratingKeys are stored as the differences between consecutive keys to compress well.
+    """
+    ratingKeys = sorted(ratingKeys)
+    deltas = [key - prev for prev, key in zip([0] + ratingKeys, ratingKeys)]
+    checkpoint = {'version': 1, 'uuid': uuid, 'libtype': libtype, 'since': since, 'keys': deltas}
+    return base64.urlsafe_b64encode(zlib.compress(json.dumps(checkpoint, separators=(',', ':')).encode())).decode()
+
+
+def _decodeCheckpoint(token, uuid, libtype):
+    """ Returns the timestamp and the set of ratingKeys of a checkpoint token of the library section and libtype. """
+    try:
+        checkpoint = json.loads(zlib.decompress(base64.urlsafe_b64decode(token.encode())))
+        valid = checkpoint['version'] == 1 and checkpoint['uuid'] == uuid and checkpoint['libtype'] == libtype
+    except (ValueError, TypeError, KeyError, zlib.error):
+        valid = False
+    if not valid:
+        raise BadRequest(f'Invalid checkpoint token for the {libtype} items of this library section')
+    return checkpoint['since'], set(itertools.accumulate(checkpoint['keys']))
+
+
 @utils.registerPlexObject
 class LibraryTimeline(PlexObject):
     """Represents a LibrarySection timeline.
@@ -1,9 +1,8 @@
 from pathlib import Path
 from urllib.parse import quote_plus
-from xml.etree import ElementTree
 
 from plexapi import log, settings, utils
-from plexapi.base import PlexObject, cached_data_property
+from plexapi.base import PlexObject, cached_data_property, data_field
 from plexapi.exceptions import BadRequest
 
 
@@ -47,39 +46,39 @@ class Media(PlexObject):
     """
     TAG = 'Media'
 
+    aspectRatio = data_field(float)
+    audioChannels = data_field(int)
+    audioCodec = data_field()
+    audioProfile = data_field()
+    bitrate = data_field(int)
+    container = data_field()
+    duration = data_field(int)
+    height = data_field(int)
+    id = data_field(int)
+    has64bitOffsets = data_field(bool)
+    hasVoiceActivity = data_field(bool, default='0')
+    optimizedForStreaming = data_field(bool)
+    proxyType = data_field(int)
+    selected = data_field(bool)
+    target = data_field()
+    title = data_field()
+    videoCodec = data_field()
+    videoFrameRate = data_field()
+    videoProfile = data_field()
+    videoResolution = data_field()
+    width = data_field(int)
+    uuid = data_field()
+
+    # Photo only attributes
+    aperture = data_field()
+    exposure = data_field()
+    iso = data_field(int)
+    lens = data_field()
+    make = data_field()
+    model = data_field()
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
-        self.aspectRatio = utils.cast(float, data.attrib.get('aspectRatio'))
-        self.audioChannels = utils.cast(int, data.attrib.get('audioChannels'))
-        self.audioCodec = data.attrib.get('audioCodec')
-        self.audioProfile = data.attrib.get('audioProfile')
-        self.bitrate = utils.cast(int, data.attrib.get('bitrate'))
-        self.container = data.attrib.get('container')
-        self.duration = utils.cast(int, data.attrib.get('duration'))
-        self.height = utils.cast(int, data.attrib.get('height'))
-        self.id = utils.cast(int, data.attrib.get('id'))
-        self.has64bitOffsets = utils.cast(bool, data.attrib.get('has64bitOffsets'))
-        self.hasVoiceActivity = utils.cast(bool, data.attrib.get('hasVoiceActivity', '0'))
-        self.optimizedForStreaming = utils.cast(bool, data.attrib.get('optimizedForStreaming'))
-        self.proxyType = utils.cast(int, data.attrib.get('proxyType'))
-        self.selected = utils.cast(bool, data.attrib.get('selected'))
-        self.target = data.attrib.get('target')
-        self.title = data.attrib.get('title')
-        self.videoCodec = data.attrib.get('videoCodec')
-        self.videoFrameRate = data.attrib.get('videoFrameRate')
-        self.videoProfile = data.attrib.get('videoProfile')
-        self.videoResolution = data.attrib.get('videoResolution')
-        self.width = utils.cast(int, data.attrib.get('width'))
-        self.uuid = data.attrib.get('uuid')
-
-        # Photo only attributes
-        self.aperture = data.attrib.get('aperture')
-        self.exposure = data.attrib.get('exposure')
-        self.iso = utils.cast(int, data.attrib.get('iso'))
-        self.lens = data.attrib.get('lens')
-        self.make = data.attrib.get('make')
-        self.model = data.attrib.get('model')
-
         parent = self._parent()
         self._parentKey = parent.key
 
@@ -136,31 +135,32 @@ class MediaPart(PlexObject):
     """
     TAG = 'Part'
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        self.accessible = utils.cast(bool, data.attrib.get('accessible'))
-        self.audioProfile = data.attrib.get('audioProfile')
-        self.container = data.attrib.get('container')
-        self.decision = data.attrib.get('decision')
-        self.deepAnalysisVersion = utils.cast(int, data.attrib.get('deepAnalysisVersion'))
-        self.duration = utils.cast(int, data.attrib.get('duration'))
-        self.exists = utils.cast(bool, data.attrib.get('exists'))
-        self.file = data.attrib.get('file')
-        self.has64bitOffsets = utils.cast(bool, data.attrib.get('has64bitOffsets'))
-        self.hasThumbnail = utils.cast(bool, data.attrib.get('hasThumbnail'))
-        self.id = utils.cast(int, data.attrib.get('id'))
-        self.indexes = data.attrib.get('indexes')
-        self.key = data.attrib.get('key')
-        self.optimizedForStreaming = utils.cast(bool, data.attrib.get('optimizedForStreaming'))
-        self.packetLength = utils.cast(int, data.attrib.get('packetLength'))
-        self.protocol = data.attrib.get('protocol')
-        self.requiredBandwidths = data.attrib.get('requiredBandwidths')
-        self.selected = utils.cast(bool, data.attrib.get('selected'))
-        self.size = utils.cast(int, data.attrib.get('size'))
-        self.streams = self._buildStreams(data)
-        self.syncItemId = utils.cast(int, data.attrib.get('syncItemId'))
-        self.syncState = data.attrib.get('syncState')
-        self.videoProfile = data.attrib.get('videoProfile')
+    accessible = data_field(bool)
+    audioProfile = data_field()
+    container = data_field()
+    decision = data_field()
+    deepAnalysisVersion = data_field(int)
+    duration = data_field(int)
+    exists = data_field(bool)
+    file = data_field()
+    has64bitOffsets = data_field(bool)
+    hasThumbnail = data_field(bool)
+    id = data_field(int)
+    indexes = data_field()
+    key = data_field()
+    optimizedForStreaming = data_field(bool)
+    packetLength = data_field(int)
+    protocol = data_field()
+    requiredBandwidths = data_field()
+    selected = data_field(bool)
+    size = data_field(int)
+    syncItemId = data_field(int)
+    syncState = data_field()
+    videoProfile = data_field()
+
+    @cached_data_property
+    def streams(self):
+        return self._buildStreams(self._data)
 
     def _buildStreams(self, data):
         """ Returns a list of :class:`~plexapi.media.MediaPartStream` objects in this MediaPart. """
@@ -1062,7 +1062,7 @@ class BaseResource(PlexObject):
         data = f'{key}?url={quote_plus(self.ratingKey)}'
         try:
             self._server.query(data, method=self._server._session.put)
-        except ElementTree.ParseError:
+        except utils.XMLParseError:
             pass
 
     @property
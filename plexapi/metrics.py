@@ -0,0 +1,623 @@
+import os
+import re
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from urllib.parse import urlsplit
+
+from plexapi import CONFIG, log
+from plexapi.exceptions import RequestBudgetExceeded
+
+# Registered event listeners, see addListener()
+_listeners = []
+_local = threading.local()
+
+# Active request budgets, see requestBudget()
+_budgets = []
+_budgetsLock = threading.Lock()
+
+# Auto-reloads of partial objects per call site, see autoReloads()
+_autoReloads = Counter()
+_autoReloadsLock = threading.Lock()
+_autoReloadBudget = CONFIG.get('plexapi.autoreload_budget', 0, int)
+_autoReloadAction = CONFIG.get('plexapi.autoreload_action', 'warn')
+
+# Frames from files in this directory are skipped when looking for the call site
+_PLEXAPI_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+# Path segments replaced by a placeholder in endpoint templates (ids, hashes, timestamps)
+_ID_SEGMENT_RE = re.compile(r'^(\d+|[0-9a-f]{16,}|[0-9a-f-]{36})$', re.IGNORECASE)
+
+# Default latency histogram buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Collected counters and their Prometheus metric names
+_PROMETHEUS_COUNTERS = {
+    'count': ('calls', 'Number of requests sent and fetches.'),
+    'errors': ('errors', 'Number of requests and fetches which raised an exception.'),
+    'bytes': ('received_bytes', 'Number of bytes received.'),
+    'cacheHits': ('cache_hits', 'Number of requests served from the response cache.'),
+    'items': ('items', 'Number of items built by the fetches.'),
+    'pages': ('pages', 'Number of pages built by the fetches.'),
+}
+_PROMETHEUS_HISTOGRAMS = {
+    'duration': 'Seconds spent handling the requests and fetches.',
+    'latency': 'Seconds until the responses were received.',
+    'parseTime': 'Seconds spent parsing the responses.',
+    'buildTime': 'Seconds spent building the fetched items.',
+}
+
+
+def addListener(listener):
+    """ Registers a listener called with every :class:`~plexapi.metrics.QueryEvent` and
+        :class:`~plexapi.metrics.FetchEvent`. Listeners are called synchronously in the thread
+        that made the request, so they should return quickly. Exceptions raised by a listener
+        are logged and ignored.
+
+        Parameters:
+            listener (callable): Function called with the event as its only argument.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi import metrics
+
+                def logSlowRequests(event):
+                    if event.type == 'query' and event.latency > 1:
+                        print(f'Slow request: {event.method} {event.endpoint} {event.latency:.2f}s')
+
+                metrics.addListener(logSlowRequests)
+
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+    return listener
+
+
+def removeListener(listener):
+    """ Unregisters a listener added with :func:`~plexapi.metrics.addListener`. """
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def enabled():
+    """ Returns True if any listener is registered. """
+    return bool(_listeners)
+
+
+def emit(event):
+    """ Sends the event to all the registered listeners. """
+    for listener in list(_listeners):
+        try:
+            listener(event)
+        except Exception as e:
+            log.warning('Metrics listener %r failed: %s', listener, e)
+
+
+def endpointTemplate(url):
+    """ Returns the endpoint template of an API path or url by removing the query string and
+        replacing the id path segments with ``{id}``. For example, ``/library/metadata/123/children?X=1``
+        returns ``/library/metadata/{id}/children``. The host is kept for full urls
+        (e.g. ``https://plex.tv/api/v2/user`` returns ``plex.tv/api/v2/user``).
+    """
+    parts = urlsplit(url)
+    path = '/'.join('{id}' if _ID_SEGMENT_RE.match(segment) else segment for segment in parts.path.split('/'))
+    return f'{parts.hostname}{path}' if parts.hostname else path
+
+
+class QueryEvent:
+    """ Event emitted after every request sent by :func:`~plexapi.server.PlexServer.query`,
+        :func:`~plexapi.aio.AsyncPlexServer.query`, :func:`~plexapi.myplex.MyPlexAccount.query`
+        and :func:`~plexapi.client.PlexClient.query`.
+        Used as a context manager around the request, which emits the event on exit.
+
+        Parameters:
+            source (str): Object type that sent the request (server, myplex or client).
+            method (str): HTTP method.
+            url (str): Requested url.
+            key (str, optional): Requested API path used for the endpoint template (default: the url).
+            cached (bool, optional): True if the response may be served from the response cache. The request
+                is then only counted in the request budgets when :func:`~plexapi.metrics.QueryEvent.charge`
+                is called before sending it (default False).
+
+        Attributes:
+            type (str): 'query'
+            endpoint (str): Endpoint template of the url, see :func:`~plexapi.metrics.endpointTemplate`.
+            status (int): Response status code (None if no response was received or served from the cache).
+            bytes (int): Number of bytes received.
+            latency (float): Seconds until the response was received.
+            parseTime (float): Seconds spent parsing the response.
+            cache (str): 'hit' if served from the response cache, 'revalidated' if the cached response
+                was revalidated with the server, or None.
+            error (str): Name of the exception raised while handling the request, or None.
+            duration (float): Total seconds spent handling the request.
+    """
+    type = 'query'
+
+    def __init__(self, source, method, url, key=None, cached=False):
+        self.source = source
+        self.method = method.upper()
+        self.url = url
+        self.endpoint = endpointTemplate(key or url)
+        self.status = None
+        self.bytes = 0
+        self.latency = None
+        self.parseTime = 0.0
+        self.cache = None
+        self.error = None
+        self.duration = None
+        self._start = None
+        self._cached = cached
+        self._charged = False
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.method}:{self.endpoint}:{self.status}>'
+
+    def __enter__(self):
+        if not self._cached:
+            self.charge()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exctype, excvalue, traceback):
+        self.duration = time.perf_counter() - self._start
+        if exctype is not None:
+            self.error = exctype.__name__
+        if _listeners:
+            emit(self)
+
+    def charge(self):
+        """ Counts the request in the active request budgets, once. Raises
+            :class:`~plexapi.exceptions.RequestBudgetExceeded` if a budget does not allow the request.
+        """
+        if not self._charged:
+            self._charged = True
+            countRequest(self.method, self.endpoint)
+
+    def received(self, response, content=None):
+        """ Records the response status, size and latency. The content must be specified for
+            an ``aiohttp`` response, which is read separately.
+        """
+        self.latency = time.perf_counter() - self._start
+        if content is None:
+            self.status = response.status_code
+            self.bytes = len(response.content)
+        else:
+            self.status = response.status
+            self.bytes = len(content)
+        return response
+
+    def parse(self, func, *args):
+        """ Returns ``func(*args)`` and adds the time it took to the parse time. """
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.parseTime += time.perf_counter() - start
+
+
+class FetchEvent:
+    """ Event emitted after every call to :func:`~plexapi.base.PlexObject.fetchItems`,
+        :func:`~plexapi.base.PlexObject.iterItems` and :func:`~plexapi.base.PlexObject.streamItems`.
+        Used as a context manager around the call, which emits the event on exit.
+
+        Parameters:
+            url (str): Requested API path.
+
+        Attributes:
+            type (str): 'fetch'
+            source (str): 'fetch'
+            method (str): 'GET'
+            endpoint (str): Endpoint template of the path, see :func:`~plexapi.metrics.endpointTemplate`.
+            items (int): Number of items built.
+            pages (int): Number of pages built.
+            buildTime (float): Seconds spent finding and building the items.
+            error (str): Name of the exception raised while fetching the items, or None.
+            duration (float): Total seconds spent fetching the items.
+    """
+    type = 'fetch'
+    source = 'fetch'
+    method = 'GET'
+
+    def __init__(self, url):
+        self.url = url
+        self.endpoint = endpointTemplate(url)
+        self.items = 0
+        self.pages = 0
+        self.buildTime = 0.0
+        self.error = None
+        self.duration = None
+        self._start = None
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.endpoint}:{self.items}>'
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        _activeFetches().append(self)
+        return self
+
+    def __exit__(self, exctype, excvalue, traceback):
+        fetches = _activeFetches()
+        if self in fetches:
+            fetches.remove(self)
+        self.duration = time.perf_counter() - self._start
+        if exctype is not None:
+            self.error = exctype.__name__
+        if _listeners:
+            emit(self)
+
+    def suspended(self, items):
+        """ Yields the items of a generator fetching the items (e.g. :func:`~plexapi.base.PlexObject.iterItems`).
+            The event is not in progress while each item is yielded, so the items built by the caller in the
+            meantime are not added to this event.
+        """
+        for item in items:
+            _activeFetches().remove(self)
+            try:
+                yield item
+            finally:
+                _activeFetches().append(self)
+
+
+def _activeFetches():
+    """ Returns the stack of fetch events in progress in the current thread. """
+    if not hasattr(_local, 'fetches'):
+        _local.fetches = []
+    return _local.fetches
+
+
+def recordBuild(seconds, items):
+    """ Adds a page of built items to the fetch event in progress in the current thread. """
+    fetches = _activeFetches()
+    if fetches:
+        event = fetches[-1]
+        event.buildTime += seconds
+        event.items += items
+        event.pages += 1
+
+
+def callSite():
+    """ Returns the first frame of the current stack outside of plexapi as ``file:line in function``. """
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename.startswith(_PLEXAPI_DIR):
+        frame = frame.f_back
+    if frame is None:
+        return 'unknown'
+    return f'{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}'
+
+
+class RequestBudget:
+    """ Context manager limiting the number of requests sent while it is active.
+        Created with :func:`~plexapi.metrics.requestBudget`.
+
+        Parameters:
+            limit (int): Maximum number of requests.
+            action (str): 'raise' to raise :class:`~plexapi.exceptions.RequestBudgetExceeded` instead of
+                sending the request over the limit, or 'warn' to log a warning once the limit is exceeded.
+
+        Attributes:
+            requests (int): Number of requests sent while the budget was active.
+            callSites (Counter): Number of requests per call site (the first frame outside of plexapi).
+            endpoints (Counter): Number of requests per method and endpoint template.
+    """
+
+    def __init__(self, limit, action='raise'):
+        if action not in ('raise', 'warn'):
+            raise ValueError(f"Invalid budget action '{action}', must be 'raise' or 'warn'.")
+        self.limit = limit
+        self.action = action
+        self.requests = 0
+        self.callSites = Counter()
+        self.endpoints = Counter()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.requests}/{self.limit}>'
+
+    def __enter__(self):
+        with _budgetsLock:
+            _budgets.append(self)
+        return self
+
+    def __exit__(self, exctype, excvalue, traceback):
+        with _budgetsLock:
+            _budgets.remove(self)
+
+    def count(self, method, endpoint, site, requests=1):
+        """ Counts the requests to the endpoint from the call site. Raises
+            :class:`~plexapi.exceptions.RequestBudgetExceeded` or logs a warning when the limit is exceeded.
+        """
+        with self._lock:
+            self.requests += requests
+            self.callSites[site] += requests
+            self.endpoints[f'{method} {endpoint}'] += requests
+            exceeded = requests > 0 and self.requests > self.limit
+            first = self.requests == self.limit + 1
+            if exceeded and self.action == 'raise':
+                # The request is not sent
+                self.requests -= requests
+                self.callSites[site] -= requests
+                self.endpoints[f'{method} {endpoint}'] -= requests
+        if not exceeded:
+            return
+        message = f'Request budget of {self.limit} exceeded by {method} {endpoint} from {site}\n{self.report()}'
+        if self.action == 'raise':
+            raise RequestBudgetExceeded(message)
+        if first:
+            log.warning(message)
+
+    def report(self, top=10):
+        """ Returns a summary of the call sites and endpoints with the most requests. """
+        lines = [f'{self.requests} requests (limit {self.limit})', 'Top call sites:']
+        lines += [f'  {count:>6}  {site}' for site, count in self.callSites.most_common(top) if count]
+        lines.append('Top endpoints:')
+        lines += [f'  {count:>6}  {endpoint}' for endpoint, count in self.endpoints.most_common(top) if count]
+        return '\n'.join(lines)
+
+
+def requestBudget(limit, action='raise'):
+    """ Returns a context manager limiting the number of HTTP requests sent while it is active,
+        from any thread, by :class:`~plexapi.server.PlexServer`, :class:`~plexapi.myplex.MyPlexAccount`
+        and :class:`~plexapi.client.PlexClient`. Responses served from the response cache are not counted.
+        The requests are counted per call site to find the code causing them, such as a loop
+        auto-reloading partial objects. Also available as ``plexapi.requestBudget``.
+
+        Parameters:
+            limit (int): Maximum number of requests.
+            action (str): 'raise' (default) to raise :class:`~plexapi.exceptions.RequestBudgetExceeded`
+                instead of sending the request over the limit, or 'warn' to log a warning once.
+
+        Example:
+
+            .. code-block:: python
+
+                import plexapi
+
+                with plexapi.requestBudget(100) as budget:
+                    for movie in plex.library.section('Movies').all():
+                        print(movie.title, movie.studio)  # studio is missing from the listing
+                print(budget.report())
+
+    """
+    return RequestBudget(limit, action)
+
+
+def countRequest(method, endpoint, requests=1):
+    """ Counts a request in all the active request budgets. """
+    if not _budgets:
+        return
+    site = callSite()
+    for budget in list(_budgets):
+        budget.count(method.upper(), endpoint, site, requests)
+
+
+def setAutoReloadBudget(budget, action='warn'):
+    """ Sets the maximum number of automatic reloads of partial objects from a single call site
+        before warning or raising. The defaults are the `plexapi.autoreload_budget` and
+        `plexapi.autoreload_action` configuration options.
+
+        Parameters:
+            budget (int): Maximum number of auto-reloads per call site (0 to disable).
+            action (str): 'warn' (default) to log a warning once per call site, or 'raise' to raise
+                :class:`~plexapi.exceptions.RequestBudgetExceeded` instead of reloading.
+    """
+    global _autoReloadBudget, _autoReloadAction
+    if action not in ('raise', 'warn'):
+        raise ValueError(f"Invalid budget action '{action}', must be 'raise' or 'warn'.")
+    _autoReloadBudget = budget
+    _autoReloadAction = action
+
+
+def recordAutoReload(obj, attr):
+    """ Counts an automatic reload of a partial object for the current call site. Raises
+        :class:`~plexapi.exceptions.RequestBudgetExceeded` or logs a warning when the number of
+        auto-reloads from the call site exceeds the budget, see :func:`~plexapi.metrics.setAutoReloadBudget`.
+    """
+    site = callSite()
+    with _autoReloadsLock:
+        _autoReloads[site] += 1
+        count = _autoReloads[site]
+    budget = _autoReloadBudget
+    if not budget or count <= budget:
+        return
+    message = (f'{count} automatic reloads of partial objects from {site} (budget {budget}), '
+               f'last for {obj.__class__.__name__}.{attr}. Use reloadAll() or access attributes '
+               'included in the listings to avoid a request per object.')
+    if _autoReloadAction == 'raise':
+        raise RequestBudgetExceeded(message)
+    if count == budget + 1:
+        log.warning(message)
+
+
+def autoReloads():
+    """ Returns the number of automatic reloads of partial objects per call site. """
+    with _autoReloadsLock:
+        return dict(_autoReloads)
+
+
+def resetAutoReloads():
+    """ Clears the counts of automatic reloads per call site. """
+    with _autoReloadsLock:
+        _autoReloads.clear()
+
+
+class Histogram:
+    """ Cumulative histogram of observed values.
+
+        Parameters:
+            buckets (tuple): Upper bounds of the buckets (default :data:`~plexapi.metrics.DEFAULT_BUCKETS`).
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.count}:{self.mean:.4f}>'
+
+    @property
+    def mean(self):
+        """ Returns the mean of the observed values. """
+        return self.sum / self.count if self.count else 0.0
+
+    def observe(self, value):
+        """ Adds a value to the histogram. """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """ Returns the upper bound of the bucket containing the quantile q (0 to 1). """
+        target = q * self.count
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            if total >= target and total:
+                return bound
+        return self.max
+
+    def toDict(self):
+        """ Returns the histogram as a dictionary. """
+        return {
+            'count': self.count, 'sum': self.sum, 'mean': self.mean, 'max': self.max,
+            'buckets': dict(zip(self.buckets + (float('inf'),), self.counts)),
+        }
+
+
+class MetricsCollector:
+    """ In-process metrics collector aggregating the :class:`~plexapi.metrics.QueryEvent` and
+        :class:`~plexapi.metrics.FetchEvent` events per source, method and endpoint template.
+        Counters (requests, errors, cache hits, bytes, items) and latency histograms are kept.
+
+        Parameters:
+            buckets (tuple): Upper bounds of the histogram buckets in seconds
+                (default :data:`~plexapi.metrics.DEFAULT_BUCKETS`).
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi import metrics
+
+                collector = metrics.MetricsCollector().install()
+                movies = plex.library.section('Movies').all()
+                for (source, method, endpoint), stats in collector.snapshot().items():
+                    print(source, method, endpoint, stats['count'], stats['latency']['mean'])
+                print(collector.toPrometheus())
+
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __call__(self, event):
+        key = (event.source, event.method, event.endpoint)
+        with self._lock:
+            stats = self._stats[key]
+            stats['count'] += 1
+            stats['errors'] += event.error is not None
+            stats['duration'].observe(event.duration)
+            if event.type == 'query':
+                stats['bytes'] += event.bytes
+                stats['cacheHits'] += event.cache == 'hit'
+                if event.status is not None:
+                    stats['status'][event.status] += 1
+                if event.latency is not None:
+                    stats['latency'].observe(event.latency)
+                stats['parseTime'].observe(event.parseTime)
+            else:
+                stats['items'] += event.items
+                stats['pages'] += event.pages
+                stats['buildTime'].observe(event.buildTime)
+
+    def _newStats(self):
+        return {
+            'count': 0, 'errors': 0, 'bytes': 0, 'cacheHits': 0, 'items': 0, 'pages': 0,
+            'status': defaultdict(int),
+            'duration': Histogram(self.buckets),
+            'latency': Histogram(self.buckets),
+            'parseTime': Histogram(self.buckets),
+            'buildTime': Histogram(self.buckets),
+        }
+
+    def install(self):
+        """ Registers the collector as a listener with :func:`~plexapi.metrics.addListener`. Returns itself. """
+        addListener(self)
+        return self
+
+    def uninstall(self):
+        """ Unregisters the collector. """
+        removeListener(self)
+
+    def reset(self):
+        """ Clears all the collected metrics. """
+        with self._lock:
+            self._stats = defaultdict(self._newStats)
+
+    def snapshot(self):
+        """ Returns the collected metrics as a dictionary of ``(source, method, endpoint)`` keys
+            to dictionaries of counters and histograms (converted to dictionaries).
+        """
+        with self._lock:
+            return {
+                key: {
+                    name: value.toDict() if isinstance(value, Histogram) else
+                    dict(value) if isinstance(value, dict) else value
+                    for name, value in stats.items()
+                }
+                for key, stats in self._stats.items()
+            }
+
+    def toPrometheus(self, prefix='plexapi'):
+        """ Returns the collected metrics in the Prometheus text exposition format. The samples of
+            each metric family are grouped together after the ``# HELP`` and ``# TYPE`` lines of the family.
+        """
+        families = {}
+
+        def samples(metric, mtype, text):
+            return families.setdefault(metric, (mtype, text, []))[2]
+
+        with self._lock:
+            for (source, method, endpoint), stats in sorted(self._stats.items()):
+                labels = f'source="{source}",method="{method}",endpoint="{endpoint}"'
+                for name, (metric, text) in _PROMETHEUS_COUNTERS.items():
+                    metric = f'{prefix}_{metric}_total'
+                    samples(metric, 'counter', text).append(f'{metric}{{{labels}}} {stats[name]}')
+                for status, count in sorted(stats['status'].items()):
+                    metric = f'{prefix}_responses_total'
+                    samples(metric, 'counter', 'Number of responses by status code.').append(
+                        f'{metric}{{{labels},status="{status}"}} {count}')
+                for name, text in _PROMETHEUS_HISTOGRAMS.items():
+                    histogram = stats[name]
+                    if not histogram.count:
+                        continue
+                    metric = f'{prefix}_{_snakeCase(name)}_seconds'
+                    lines = samples(metric, 'histogram', text)
+                    total = 0
+                    for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+                        total += count
+                        le = '+Inf' if bound == float('inf') else bound
+                        lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {total}')
+                    lines.append(f'{metric}_sum{{{labels}}} {histogram.sum}')
+                    lines.append(f'{metric}_count{{{labels}}} {histogram.count}')
+
+        lines = []
+        for metric, (mtype, text, values) in families.items():
+            lines.append(f'# HELP {metric} {text}')
+            lines.append(f'# TYPE {metric} {mtype}')
+            lines.extend(values)
+        return '\n'.join(lines) + '\n'
+
+
+def _snakeCase(name):
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
@@ -0,0 +1,470 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from plexapi import FETCH_WORKERS, X_PLEX_CONTAINER_SIZE, log, utils
+from plexapi.exceptions import BadRequest, NotFound
+from plexapi.library import CHANGED_FIELDS, LIBTYPES
+
+# Version of the database schema, a mirror with another version is rebuilt from scratch
+SCHEMA_VERSION = 1
+
+# Columns of the mirrored tables and their SQLite types. The values are taken from the
+# attributes of the same name in the XML elements returned by the Plex server.
+ITEM_COLUMNS = {
+    'ratingKey': 'INTEGER PRIMARY KEY',
+    'librarySectionID': 'INTEGER',
+    'type': 'TEXT',
+    'key': 'TEXT',
+    'guid': 'TEXT',
+    'title': 'TEXT',
+    'titleSort': 'TEXT',
+    'originalTitle': 'TEXT',
+    'parentRatingKey': 'INTEGER',
+    'parentTitle': 'TEXT',
+    'grandparentRatingKey': 'INTEGER',
+    'grandparentTitle': 'TEXT',
+    'index': 'INTEGER',
+    'parentIndex': 'INTEGER',
+    'year': 'INTEGER',
+    'originallyAvailableAt': 'TEXT',
+    'contentRating': 'TEXT',
+    'studio': 'TEXT',
+    'duration': 'INTEGER',
+    'rating': 'REAL',
+    'audienceRating': 'REAL',
+    'userRating': 'REAL',
+    'viewCount': 'INTEGER',
+    'viewOffset': 'INTEGER',
+    'leafCount': 'INTEGER',
+    'viewedLeafCount': 'INTEGER',
+    'childCount': 'INTEGER',
+    'addedAt': 'INTEGER',
+    'updatedAt': 'INTEGER',
+    'lastViewedAt': 'INTEGER',
+}
+MEDIA_COLUMNS = {
+    'id': 'INTEGER PRIMARY KEY',
+    'ratingKey': 'INTEGER',
+    'duration': 'INTEGER',
+    'bitrate': 'INTEGER',
+    'width': 'INTEGER',
+    'height': 'INTEGER',
+    'aspectRatio': 'REAL',
+    'audioChannels': 'INTEGER',
+    'audioCodec': 'TEXT',
+    'videoCodec': 'TEXT',
+    'videoResolution': 'TEXT',
+    'videoFrameRate': 'TEXT',
+    'container': 'TEXT',
+}
+PART_COLUMNS = {
+    'id': 'INTEGER PRIMARY KEY',
+    'mediaID': 'INTEGER',
+    'ratingKey': 'INTEGER',
+    'key': 'TEXT',
+    'file': 'TEXT',
+    'size': 'INTEGER',
+    'duration': 'INTEGER',
+    'container': 'TEXT',
+}
+STREAM_COLUMNS = {
+    'id': 'INTEGER PRIMARY KEY',
+    'partID': 'INTEGER',
+    'ratingKey': 'INTEGER',
+    'streamType': 'INTEGER',
+    'codec': 'TEXT',
+    'languageCode': 'TEXT',
+    'displayTitle': 'TEXT',
+    'selected': 'INTEGER',
+}
+TABLES = {
+    'sections': {'key': 'INTEGER PRIMARY KEY', 'uuid': 'TEXT', 'type': 'TEXT', 'title': 'TEXT', 'refreshedAt': 'INTEGER'},
+    'items': dict(ITEM_COLUMNS, xml='BLOB'),
+    'tags': {'ratingKey': 'INTEGER', 'tagType': 'TEXT', 'id': 'INTEGER', 'tag': 'TEXT'},
+    'guids': {'ratingKey': 'INTEGER', 'guid': 'TEXT'},
+    'media': MEDIA_COLUMNS,
+    'parts': PART_COLUMNS,
+    'streams': STREAM_COLUMNS,
+}
+INDEXES = (
+    ('items', 'librarySectionID', 'type'),
+    ('items', 'parentRatingKey'),
+    ('items', 'grandparentRatingKey'),
+    ('items', 'guid'),
+    ('tags', 'ratingKey'),
+    ('tags', 'tagType', 'tag'),
+    ('guids', 'ratingKey'),
+    ('guids', 'guid'),
+    ('media', 'ratingKey'),
+    ('parts', 'ratingKey'),
+    ('streams', 'ratingKey'),
+)
+# Child elements of the items that are not tags
+NOT_TAGS = {'Media', 'Guid', 'Image', 'UltraBlurColors', 'Rating', 'Field', 'Location', 'Chapter', 'Marker', 'Extras'}
+# Cast functions of the SQLite types
+CASTS = {'INTEGER': int, 'REAL': float, 'TEXT': str, 'BLOB': bytes}
+# A single term of the ordering of the items, a column name and an optional direction
+ORDER_TERM = re.compile(r'^\s*"?(\w+)"?(?:\s+(ASC|DESC))?\s*$', re.IGNORECASE)
+
+
+def _quote(name):
+    """ Returns the quoted SQL identifier of a column or table name (e.g. index is a keyword). """
+    return f'"{name}"'
+
+
+def _row(columns, attrib, **values):
+    """ Returns the tuple of the values of the columns from the attributes of an element. """
+    row = []
+    for name, sqltype in columns.items():
+        value = values[name] if name in values else attrib.get(name)
+        if value is not None and not isinstance(value, (int, float, bytes)):
+            value = utils.cast(CASTS[sqltype.split()[0]], value)
+        row.append(value)
+    return tuple(row)
+
+
+def _orderBy(orderBy):
+    """ Returns the SQL ordering of the items from the comma separated column names with an optional
+        ASC or DESC direction.
+    """
+    terms = []
+    for term in orderBy.split(','):
+        match = ORDER_TERM.match(term)
+        if not match or match.group(1) not in ITEM_COLUMNS:
+            raise BadRequest(f'Invalid orderBy: {term.strip()}, use the name of a column of the items with '
+                             'an optional ASC or DESC direction')
+        column, direction = match.groups()
+        terms.append(f'{_quote(column)} {direction.upper()}' if direction else _quote(column))
+    return ', '.join(terms)
+
+
+def _insert(table, columns):
+    """ Returns the SQL statement inserting or replacing a row of the table. """
+    names = ', '.join(_quote(name) for name in columns)
+    values = ', '.join('?' for _ in columns)
+    return f'INSERT OR REPLACE INTO {table} ({names}) VALUES ({values})'
+
+
+class LibraryMirror:
+    """ A local copy of the items of the library sections of a Plex server stored in a SQLite database.
+        The first :func:`~plexapi.mirror.LibraryMirror.refresh` downloads every item of the sections,
+        the following ones only download the items added, updated or played since the previous refresh
+        and remove the deleted items. The mirrored items can then be queried locally without any
+        request to the server, as lightweight rows or as regular Plex objects.
+
+        .. code-block:: python
+
+            from plexapi.mirror import LibraryMirror
+
+            mirror = LibraryMirror(plex, '~/.cache/plexapi/library.db')
+            mirror.refresh()  # Incremental after the first time
+            movies = mirror.items('Movies', year=2020, genre='Comedy', orderBy='rating DESC', limit=10)
+            rows = mirror.rows(libtype='episode', where='viewCount > 0', orderBy='lastViewedAt DESC')
+            rows = mirror.execute('SELECT videoResolution, count(*) FROM media GROUP BY videoResolution')
+
+        The tables of the database are ``sections``, ``items`` (one row per movie, show, season, episode,
+        artist, album, track, photo album and photo with the columns of :data:`~plexapi.mirror.ITEM_COLUMNS`
+        and the raw XML of the item), ``tags`` (genres, directors, collections, labels, ...), ``guids``,
+        ``media``, ``parts`` and ``streams``. The rows of all the tables are linked by the ratingKey
+        of the item. The streams are missing from the listings of the library sections, so the details
+        of the new and updated items with media are also requested in batches to store their streams.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): The server to mirror the library of.
+            path (str): Path of the SQLite database file, created if it does not exist (default in memory).
+            containerSize (int, optional): Number of items requested per page (default config.X_PLEX_CONTAINER_SIZE).
+            workers (int, optional): Number of pages requested concurrently by the first refresh of a
+                library section (default config.FETCH_WORKERS).
+            includeStreams (bool, optional): False to not request the details of the items, leaving the
+                ``streams`` table empty (default True).
+
+        Attributes:
+            path (str): Path of the SQLite database file.
+            connection (sqlite3.Connection): The connection to the database. Rows are returned as :class:`sqlite3.Row`.
+    """
+
+    def __init__(self, server, path=':memory:', containerSize=None, workers=None, includeStreams=True):
+        self._server = server
+        self._lock = threading.RLock()
+        self.path = path if path == ':memory:' else os.path.expanduser(path)
+        self.containerSize = containerSize or X_PLEX_CONTAINER_SIZE
+        self.workers = workers or FETCH_WORKERS
+        self.includeStreams = includeStreams
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self._createTables()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.path}>'
+
+    def close(self):
+        """ Closes the connection to the database. """
+        self.connection.close()
+
+    def _createTables(self):
+        """ Creates the tables of the database, dropping the tables of a previous schema version. """
+        with self._lock, self.connection:
+            version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+            if version != SCHEMA_VERSION:
+                for table in TABLES:
+                    self.connection.execute(f'DROP TABLE IF EXISTS {table}')
+            for table, columns in TABLES.items():
+                definition = ', '.join(f'{_quote(name)} {sqltype}' for name, sqltype in columns.items())
+                self.connection.execute(f'CREATE TABLE IF NOT EXISTS {table} ({definition})')
+            for table, *columns in INDEXES:
+                name = f'{table}_{"_".join(columns)}'
+                self.connection.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({", ".join(map(_quote, columns))})')
+            self.connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def refresh(self, sections=None, full=False):
+        """ Updates the mirror with the items added, updated, played or deleted since the previous refresh.
+            The first refresh of a library section downloads all of its items.
+
+            Parameters:
+                sections (list, optional): List of :class:`~plexapi.library.LibrarySection` or library
+                    section titles to refresh. Default is all the library sections of the server.
+                full (bool, optional): True to download all the items again instead of the changed ones.
+
+            Returns:
+                tuple: The number of items added or updated and the number of items deleted.
+        """
+        if sections is None:
+            sections = self._server.library.sections()
+        updated = deleted = 0
+        for section in sections:
+            if isinstance(section, str):
+                section = self._server.library.section(section)
+            if section.TYPE not in LIBTYPES:
+                log.debug('Library section %s of type %s is not mirrored', section.title, section.TYPE)
+                continue
+            for libtype in LIBTYPES[section.TYPE]:
+                since = None if full else self._since(section.key, libtype)
+                updated += self._refreshItems(section, libtype, since)
+                deleted += self._deleteItems(section, libtype)
+            with self._lock, self.connection:
+                self.connection.execute(
+                    _insert('sections', TABLES['sections']),
+                    (section.key, section.uuid, section.TYPE, section.title, int(time.time()))
+                )
+        return updated, deleted
+
+    def _since(self, sectionKey, libtype):
+        """ Returns the timestamp of the most recent change of the mirrored items, or None if there are no items. """
+        changed = ', '.join(f'coalesce({_quote(field)}, 0)' for field in CHANGED_FIELDS)
+        row = self.execute(
+            f'SELECT max(max({changed})) FROM items WHERE librarySectionID = ? AND type = ?', (sectionKey, libtype)
+        )[0]
+        return row[0]
+
+    def _iterElements(self, section, key, workers=1):
+        """ Yields the elements of all the pages of the key. """
+        for data in section._iterPageData(key, container_size=self.containerSize, workers=workers):
+            yield from data
+
+    def _refreshItems(self, section, libtype, since=None):
+        """ Downloads and stores the items of the libtype in the library section changed after the since
+            timestamp, or all of the items if since is None. Returns the number of items stored.
+        """
+        if since is None:
+            keys = [(section._listKey(libtype), self.workers)]
+        else:
+            keys = [(section._listKey(libtype, **{section._changedFilter(libtype, field): since - 1}), 1)
+                    for field in CHANGED_FIELDS]
+        stored = set()
+        batch = []
+        for key, workers in keys:
+            for elem in self._iterElements(section, key, workers):
+                ratingKey = utils.cast(int, elem.attrib.get('ratingKey'))
+                if ratingKey is None or ratingKey in stored or elem.attrib.get('type') != libtype:
+                    continue
+                stored.add(ratingKey)
+                batch.append(elem)
+                if len(batch) >= self.containerSize:
+                    self._store(section.key, batch)
+                    batch = []
+        self._store(section.key, batch)
+        log.debug('Mirrored %s %s items of library section %s', len(stored), libtype, section.title)
+        return len(stored)
+
+    def _details(self, elems):
+        """ Returns the details elements of the elements with media by ratingKey, which include the streams
+            missing from the listings. The details are requested in a single request.
+        """
+        ratingKeys = [
+            elem.attrib['ratingKey'] for elem in elems
+            if elem.attrib.get('type') != 'photo' and elem.find('Media') is not None
+        ]
+        if not self.includeStreams or not ratingKeys:
+            return {}
+        data = self._server.query(f'/library/metadata/{",".join(ratingKeys)}')
+        return {elem.attrib.get('ratingKey'): elem for elem in data}
+
+    def _store(self, sectionKey, elems):
+        """ Inserts or replaces the rows of the elements in a single transaction. """
+        if not elems:
+            return
+        details = self._details(elems)
+        items, tags, guids, media, parts, streams = [], [], [], [], [], []
+        for elem in elems:
+            ratingKey = int(elem.attrib['ratingKey'])
+            items.append(_row(TABLES['items'], elem.attrib, librarySectionID=sectionKey, xml=utils.toXMLString(elem)))
+            for child in details.get(elem.attrib['ratingKey'], elem).findall('Media'):
+                media.append(_row(MEDIA_COLUMNS, child.attrib, ratingKey=ratingKey))
+                for part in child.iter('Part'):
+                    parts.append(_row(PART_COLUMNS, part.attrib, mediaID=child.attrib.get('id'), ratingKey=ratingKey))
+                    for stream in part.iter('Stream'):
+                        streams.append(_row(STREAM_COLUMNS, stream.attrib, partID=part.attrib.get('id'),
+                                            ratingKey=ratingKey))
+            for child in elem:
+                if child.tag == 'Guid':
+                    guids.append((ratingKey, child.attrib.get('id')))
+                elif child.tag not in NOT_TAGS and 'tag' in child.attrib:
+                    tags.append((ratingKey, child.tag, utils.cast(int, child.attrib.get('id')), child.attrib['tag']))
+        ratingKeys = [(row[0],) for row in items]
+        with self._lock, self.connection:
+            for table in ('tags', 'guids', 'media', 'parts', 'streams'):
+                self.connection.executemany(f'DELETE FROM {table} WHERE ratingKey = ?', ratingKeys)
+            self.connection.executemany(_insert('items', TABLES['items']), items)
+            self.connection.executemany(_insert('tags', TABLES['tags']), tags)
+            self.connection.executemany(_insert('guids', TABLES['guids']), guids)
+            self.connection.executemany(_insert('media', MEDIA_COLUMNS), media)
+            self.connection.executemany(_insert('parts', PART_COLUMNS), parts)
+            self.connection.executemany(_insert('streams', STREAM_COLUMNS), streams)
+
+    def _deleteItems(self, section, libtype):
+        """ Removes the mirrored items of the libtype in the library section that were deleted from the server.
+            The ratingKeys of the items are only listed when the number of items on the server is not the same
+            as the number of mirrored items. Returns the number of items removed.
+        """
+        count = self.execute(
+            'SELECT count(*) FROM items WHERE librarySectionID = ? AND type = ?', (section.key, libtype)
+        )[0][0]
+        if not count or count == section.totalViewSize(libtype, includeCollections=False):
+            return 0
+        ratingKeys = section._ratingKeys(libtype, self.containerSize, self.workers)
+        deleted = [
+            (row[0],) for row in self.execute(
+                'SELECT ratingKey FROM items WHERE librarySectionID = ? AND type = ?', (section.key, libtype)
+            ) if row[0] not in ratingKeys
+        ]
+        with self._lock, self.connection:
+            for table in TABLES:
+                if table != 'sections':
+                    self.connection.executemany(f'DELETE FROM {table} WHERE ratingKey = ?', deleted)
+        log.debug('Removed %s deleted %s items of library section %s', len(deleted), libtype, section.title)
+        return len(deleted)
+
+    def _sectionKey(self, section):
+        """ Returns the key of a :class:`~plexapi.library.LibrarySection`, library section title or key. """
+        if isinstance(section, int):
+            return section
+        if isinstance(section, str):
+            rows = self.execute('SELECT key FROM sections WHERE title = ?', (section,))
+            if not rows:
+                raise NotFound(f'Invalid library section: {section}')
+            return rows[0][0]
+        return section.key
+
+    def _select(self, columns, section=None, libtype=None, where=None, params=(), orderBy=None, limit=None, **kwargs):
+        """ Returns the SQL query and parameters selecting the columns of the matching items. """
+        clauses, values = [], []
+        if section is not None:
+            clauses.append('librarySectionID = ?')
+            values.append(self._sectionKey(section))
+        if libtype is not None:
+            clauses.append('type = ?')
+            values.append(libtype)
+        for field, value in kwargs.items():
+            many = isinstance(value, (list, tuple, set))
+            value = list(value) if many else [value]
+            operator = f'IN ({", ".join("?" for _ in value)})' if many else '= ?'
+            if field in ITEM_COLUMNS:
+                clauses.append(f'{_quote(field)} {operator}')
+            elif field.isalpha():
+                # Any other field is the type of a tag (e.g. genre, director, collection, label)
+                clauses.append(
+                    'ratingKey IN (SELECT ratingKey FROM tags WHERE lower(tagType) = ? AND lower(tag) '
+                    f'{operator})'
+                )
+                value = [field.lower()] + [str(v).lower() for v in value]
+            else:
+                raise BadRequest(f'Unknown field: {field}')
+            values.extend(value)
+        if where is not None:
+            clauses.append(f'({where})')
+            values.extend(params)
+        query = f'SELECT {columns} FROM items'
+        if clauses:
+            query += f' WHERE {" AND ".join(clauses)}'
+        if orderBy is not None:
+            query += f' ORDER BY {_orderBy(orderBy)}'
+        if limit is not None:
+            query += f' LIMIT {int(limit)}'
+        return query, values
+
+    def execute(self, sql, params=()):
+        """ Executes any SQL query on the mirror and returns the list of :class:`sqlite3.Row`.
+
+            Parameters:
+                sql (str): The SQL query.
+                params (tuple or dict, optional): The parameters of the query.
+        """
+        with self._lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def rows(self, section=None, libtype=None, where=None, params=(), orderBy=None, limit=None, **kwargs):
+        """ Returns the list of :class:`sqlite3.Row` of the matching mirrored items, with the columns
+            of :data:`~plexapi.mirror.ITEM_COLUMNS`.
+
+            Parameters:
+                section (:class:`~plexapi.library.LibrarySection`, str or int, optional): Library section,
+                    library section title or library section key of the items.
+                libtype (str, optional): Type of the items (movie, show, season, episode, artist, album, track,
+                    photoalbum, photo).
+                where (str, optional): Additional SQL condition on the columns of the items.
+                params (tuple, optional): Parameters of the SQL condition.
+                orderBy (str, optional): Comma separated columns of the items to order the items by, each
+                    with an optional ASC or DESC direction (e.g. ``'year DESC, titleSort'``).
+                limit (int, optional): Maximum number of items to return.
+                **kwargs (dict): Values of the columns of the items (e.g. ``year=2020``) or tags of the items
+                    (e.g. ``genre='Comedy'``, ``director=['Peter Jackson', 'Ridley Scott']``). Lists of values
+                    match any of the values. Tags are case-insensitive.
+
+            Raises:
+                :exc:`~plexapi.exceptions.BadRequest`: Unknown field or invalid orderBy.
+                :exc:`~plexapi.exceptions.NotFound`: The library section title is not mirrored.
+        """
+        columns = ', '.join(_quote(name) for name in ITEM_COLUMNS)
+        query, values = self._select(columns, section, libtype, where, params, orderBy, limit, **kwargs)
+        return self.execute(query, values)
+
+    def items(self, section=None, libtype=None, where=None, params=(), orderBy=None, limit=None, **kwargs):
+        """ Returns the list of Plex objects (e.g. :class:`~plexapi.video.Movie`) of the matching mirrored items,
+            built from their XML without any request to the server. The objects are partial objects like the
+            items of a library search. See :func:`~plexapi.mirror.LibraryMirror.rows` for the parameters.
+        """
+        query, values = self._select('librarySectionID, xml', section, libtype, where, params, orderBy, limit, **kwargs)
+        items = []
+        for row in self.execute(query, values):
+            initpath = f'/library/sections/{row[0]}/all'
+            item = self._server._buildItemOrNone(utils.parseXMLString(row[1]), initpath=initpath)
+            if item is not None:
+                item.librarySectionID = row[0]
+                items.append(item)
+        return items
+
+    def count(self, section=None, libtype=None, where=None, params=(), **kwargs):
+        """ Returns the number of matching mirrored items. See :func:`~plexapi.mirror.LibraryMirror.rows`
+            for the parameters.
+        """
+        query, values = self._select('count(*)', section, libtype, where, params, **kwargs)
+        return self.execute(query, values)[0][0]
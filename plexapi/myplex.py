@@ -22,7 +22,7 @@ except ImportError:  # pragma: no cover
     jwt = None
 
 from plexapi import (BASE_HEADERS, CONFIG, TIMEOUT, X_PLEX_ENABLE_FAST_CONNECT, X_PLEX_IDENTIFIER,
-                     log, logfilter, utils)
+                     log, logfilter, metrics, utils)
 from plexapi.base import PlexObject, cached_data_property
 from plexapi.client import PlexClient
 from plexapi.exceptions import BadRequest, NotFound, Unauthorized, TwoFactorRequired
@@ -30,6 +30,7 @@ from plexapi.library import LibrarySection
 from plexapi.server import PlexServer
 from plexapi.sonos import PlexSonosClient
 from plexapi.sync import SyncItem, SyncList
+from plexapi.transport import TransportConfig
 from requests.status_codes import _codes as codes
 
 
@@ -49,6 +50,9 @@ class MyPlexAccount(PlexObject):
             timeout (int): timeout in seconds on initial connect to myplex (default config.TIMEOUT).
             code (str): Two-factor authentication code to use when logging in with username and password.
             remember (bool): Remember the account token for 14 days (Default True).
+            transport (:class:`~plexapi.transport.TransportConfig`, optional): Connection pooling, retry
+                and per-endpoint timeout settings (default loaded from the config file). The adapters are
+                mounted on the provided session if both a session and a transport are provided.
 
         Attributes:
             key (str): 'https://plex.tv/api/v2/user'
@@ -129,9 +133,15 @@ class MyPlexAccount(PlexObject):
     METADATA = 'https://metadata.provider.plex.tv'
     key = 'https://plex.tv/api/v2/user'
 
-    def __init__(self, username=None, password=None, token=None, session=None, timeout=None, code=None, remember=True):
+    def __init__(self, username=None, password=None, token=None, session=None, timeout=None, code=None, remember=True,
+                 transport=None):
         self._token = logfilter.add_secret(token or CONFIG.get('auth.server_token'))
-        self._session = session or requests.Session()
+        self._transport = transport or TransportConfig()
+        if session is None:
+            session = self._transport.session()
+        elif transport is not None:
+            transport.mount(session)
+        self._session = session
         self._timeout = timeout or TIMEOUT
         self._sonos_cache = []
         self._sonos_cache_timestamp = 0
@@ -249,29 +259,30 @@ class MyPlexAccount(PlexObject):
 
     def query(self, url, method=None, headers=None, timeout=None, **kwargs):
         method = method or self._session.get
-        timeout = timeout or self._timeout
+        timeout = timeout or self._transport.timeout(url, self._timeout)
         log.debug('%s %s %s', method.__name__.upper(), url, kwargs.get('json', ''))
         headers = self._headers(**headers or {})
-        response = method(url, headers=headers, timeout=timeout, **kwargs)
-        if response.status_code not in (200, 201, 204):  # pragma: no cover
-            codename = codes.get(response.status_code)[0]
-            errtext = response.text.replace('\n', ' ')
-            message = f'({response.status_code}) {codename}; {response.url} {errtext}'
-            if response.status_code == 401:
-                if "verification code" in response.text:
-                    raise TwoFactorRequired(message)
-                raise Unauthorized(message)
-            elif response.status_code == 404:
-                raise NotFound(message)
-            elif response.status_code == 422 and "Invalid token" in response.text:
-                raise Unauthorized(message)
-            else:
-                raise BadRequest(message)
-        if 'application/json' in response.headers.get('Content-Type', ''):
-            return response.json()
-        elif 'text/plain' in response.headers.get('Content-Type', ''):
-            return response.text.strip()
-        return utils.parseXMLString(response.text)
+        with metrics.QueryEvent('myplex', method.__name__, url) as event:
+            response = event.received(method(url, headers=headers, timeout=timeout, **kwargs))
+            if response.status_code not in (200, 201, 204):  # pragma: no cover
+                codename = codes.get(response.status_code)[0]
+                errtext = response.text.replace('\n', ' ')
+                message = f'({response.status_code}) {codename}; {response.url} {errtext}'
+                if response.status_code == 401:
+                    if "verification code" in response.text:
+                        raise TwoFactorRequired(message)
+                    raise Unauthorized(message)
+                elif response.status_code == 404:
+                    raise NotFound(message)
+                elif response.status_code == 422 and "Invalid token" in response.text:
+                    raise Unauthorized(message)
+                else:
+                    raise BadRequest(message)
+            if 'application/json' in response.headers.get('Content-Type', ''):
+                return event.parse(response.json)
+            elif 'text/plain' in response.headers.get('Content-Type', ''):
+                return response.text.strip()
+            return event.parse(utils.parseXMLString, response.content)
 
     def ping(self):
         """ Ping the Plex.tv API.
@@ -523,7 +534,7 @@ class MyPlexAccount(PlexObject):
             params['pin'] = pin
         data = self.query(url, self._session.post, params=params)
         userToken = data.attrib.get('authenticationToken')
-        return MyPlexAccount(token=userToken, session=self._session)
+        return MyPlexAccount(token=userToken, session=self._session, transport=self._transport)
 
     def setPin(self, newPin, currentPin=None):
         """ Set a new Plex Home PIN for the account.
@@ -1964,7 +1975,7 @@ class MyPlexPinLogin:
             codename = codes.get(response.status_code)[0]
             errtext = response.text.replace('\n', ' ')
             raise BadRequest(f'({response.status_code}) {codename} {response.url}; {errtext}')
-        return utils.parseXMLString(response.text)
+        return utils.parseXMLString(response.content)
 
 
 class MyPlexJWTLogin:
@@ -2489,7 +2500,7 @@ class MyPlexJWTLogin:
             raise BadRequest(f'({response.status_code}) {codename} {response.url}; {errtext}')
         if 'application/json' in response.headers.get('Content-Type', '') and len(response.content):
             return response.json()
-        return utils.parseXMLString(response.text)
+        return utils.parseXMLString(response.content)
 
 
 def _connect(cls, url, token, session, timeout, results, i, job_is_done_event=None):
@@ -196,7 +196,6 @@ class Photo(
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
-        Playable._loadData(self, data)
         self.addedAt = utils.toDatetime(data.attrib.get('addedAt'))
         self.createdAtAccuracy = data.attrib.get('createdAtAccuracy')
         self.createdAtTZOffset = utils.cast(int, data.attrib.get('createdAtTZOffset'))
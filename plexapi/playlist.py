@@ -50,7 +50,6 @@ class Playlist(
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
-        Playable._loadData(self, data)
         self.addedAt = utils.toDatetime(data.attrib.get('addedAt'))
         self.allowSync = utils.cast(bool, data.attrib.get('allowSync'))
         self.composite = data.attrib.get('composite')  # url to thumbnail
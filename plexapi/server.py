@@ -1,12 +1,12 @@
+import itertools
 import os
 from urllib.parse import urlencode
 
-import requests
-
 from plexapi import BASE_HEADERS, CONFIG, TIMEOUT, log, logfilter
-from plexapi import utils
+from plexapi import metrics, utils
 from plexapi.alert import AlertListener
 from plexapi.base import PlexObject, cached_data_property
+from plexapi.cache import DiskCache, FilterCache
 from plexapi.client import PlexClient
 from plexapi.collection import Collection
 from plexapi.exceptions import BadRequest, NotFound, Unauthorized
@@ -15,6 +15,7 @@ from plexapi.media import Conversion, Optimized
 from plexapi.playlist import Playlist
 from plexapi.playqueue import PlayQueue
 from plexapi.settings import Settings
+from plexapi.transport import TransportConfig, requestKey
 from requests.status_codes import _codes as codes
 
 # Need these imports to populate utils.PLEXOBJECTS
@@ -40,6 +41,16 @@ class PlexServer(PlexObject):
                 cache the http responses from the server.
             timeout (int, optional): Timeout in seconds on initial connection to the server
                 (default config.TIMEOUT).
+            cache (:class:`~plexapi.cache.ResponseCache`, optional): Cache the responses of GET requests
+                to endpoints that rarely change. See :class:`~plexapi.cache.ResponseCache` for details.
+            transport (:class:`~plexapi.transport.TransportConfig`, optional): Connection pooling, retry
+                and per-endpoint timeout settings (default loaded from the config file). The adapters are
+                mounted on the provided session if both a session and a transport are provided.
+            identityMap (:class:`~plexapi.cache.IdentityMap`, optional): Build a single object per library
+                item and reuse it from every listing. See :class:`~plexapi.cache.IdentityMap` for details.
+            filterCache (:class:`~plexapi.cache.FilterCache`, optional): Persist the filter, sort and field
+                metadata of the library sections (default enabled by the ``filter_cache`` config option).
+                See :class:`~plexapi.cache.FilterCache` for details.
 
         Attributes:
             allowCameraUpload (bool): True if server allows camera upload.
@@ -96,18 +107,41 @@ class PlexServer(PlexObject):
             _baseurl (str): HTTP address of the client.
             _token (str): Token used to access this client.
             _session (obj): Requests session object used to access this client.
+            _cache (:class:`~plexapi.cache.ResponseCache`): Response cache used by
+                :func:`~plexapi.server.PlexServer.query` (None if disabled).
+            _transport (:class:`~plexapi.transport.TransportConfig`): Transport settings used to access this server.
+            _identityMap (:class:`~plexapi.cache.IdentityMap`): Identity map of the objects built from this server
+                (None if disabled).
+            _filterCache (:class:`~plexapi.cache.FilterCache`): Persistent cache of the filter metadata of the
+                library sections (None if disabled).
     """
     key = '/'
 
-    def __init__(self, baseurl=None, token=None, session=None, timeout=None):
+    def __init__(self, baseurl=None, token=None, session=None, timeout=None, cache=None, transport=None,
+                 identityMap=None, filterCache=None):
+        self._configure(baseurl, token, session, timeout, cache, transport, identityMap, filterCache)
+        data = self.query(self.key, timeout=self._timeout)
+        super(PlexServer, self).__init__(self, data, self.key)
+
+    def _configure(self, baseurl=None, token=None, session=None, timeout=None, cache=None, transport=None,
+                   identityMap=None, filterCache=None):
+        """ Sets up the connection attributes used to query the server. """
         self._baseurl = baseurl or CONFIG.get('auth.server_baseurl', 'http://localhost:32400')
         self._baseurl = self._baseurl.rstrip('/')
         self._token = logfilter.add_secret(token or CONFIG.get('auth.server_token'))
         self._showSecrets = CONFIG.get('log.show_secrets', '').lower() == 'true'
-        self._session = session or requests.Session()
+        self._transport = transport or TransportConfig()
+        if session is None:
+            session = self._transport.session()
+        elif transport is not None:
+            transport.mount(session)
+        self._session = session
         self._timeout = timeout or TIMEOUT
-        data = self.query(self.key, timeout=self._timeout)
-        super(PlexServer, self).__init__(self, data, self.key)
+        self._cache = cache
+        self._identityMap = identityMap
+        if filterCache is None and CONFIG.get('plexapi.filter_cache'):
+            filterCache = FilterCache(DiskCache(CONFIG.get('plexapi.filter_cache')))
+        self._filterCache = filterCache
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
@@ -266,7 +300,7 @@ class PlexServer(PlexObject):
             session = self._session
         if timeout is None:
             timeout = self._timeout
-        return PlexServer(self._baseurl, token=userToken, session=session, timeout=timeout)
+        return PlexServer(self._baseurl, token=userToken, session=session, timeout=timeout, transport=self._transport)
 
     @cached_data_property
     def _systemAccounts(self):
@@ -314,7 +348,7 @@ class PlexServer(PlexObject):
     def _myPlexAccount(self):
         """ Cache for myPlexAccount. """
         from plexapi.myplex import MyPlexAccount
-        return MyPlexAccount(token=self._token, session=self._session)
+        return MyPlexAccount(token=self._token, session=self._session, transport=self._transport)
 
     def myPlexAccount(self):
         """ Returns a :class:`~plexapi.myplex.MyPlexAccount` object using the same
@@ -742,10 +776,95 @@ class PlexServer(PlexObject):
         """
         url = self.url(key)
         method = method or self._session.get
-        timeout = timeout or self._timeout
+        timeout = timeout or self._transport.timeout(key, self._timeout)
         log.debug('%s %s', method.__name__.upper(), url)
         headers = self._headers(**headers or {})
-        response = method(url, headers=headers, params=params, timeout=timeout, **kwargs)
+        if method.__name__.lower() != 'get':
+            if self._cache is not None:
+                self._cache.clear(self._baseurl)
+            return self._request(key, url, method, headers, params, timeout, **kwargs)
+        flight = self._transport.singleflight
+        if flight is None or kwargs:
+            return self._get(key, url, method, headers, params, timeout, **kwargs)
+        return flight.do(
+            requestKey('GET', url, headers, params),
+            lambda: self._get(key, url, method, headers, params, timeout),
+        )
+
+    def _request(self, key, url, method, headers, params, timeout, **kwargs):
+        """ Sends the request and returns the parsed response. """
+        with metrics.QueryEvent('server', method.__name__, url, key) as event:
+            response = event.received(method(url, headers=headers, params=params, timeout=timeout, **kwargs))
+            self._checkResponse(response)
+            return event.parse(utils.parseXMLString, response.content)
+
+    def _get(self, key, url, method, headers, params, timeout, **kwargs):
+        """ Handles a GET request through the response cache if enabled. Fresh responses are returned
+            without a request to the server, and stale responses are revalidated with the server.
+        """
+        ttl = self._cache.ttl(key) if self._cache is not None else None
+        if ttl is None or headers.get('Cache-Control') == 'no-cache':
+            return self._request(key, url, method, headers, params, timeout, **kwargs)
+        with metrics.QueryEvent('server', method.__name__, url, key, cached=True) as event:
+            cacheKey = self._cache.cacheKey(key, headers, params, namespace=self._baseurl)
+            entry = self._cache.get(cacheKey)
+            if entry is not None:
+                if entry.isFresh():
+                    log.debug('Cache hit %s', url)
+                    event.cache = 'hit'
+                    return event.parse(self._cache.data, entry)
+                headers.update(entry.validators())
+            event.charge()
+            response = event.received(method(url, headers=headers, params=params, timeout=timeout, **kwargs))
+            if entry is not None and response.status_code == 304:
+                log.debug('Cache revalidated %s', url)
+                event.cache = 'revalidated'
+                return event.parse(self._cache.data, self._cache.refresh(cacheKey, entry, ttl))
+            self._checkResponse(response)
+            data = event.parse(utils.parseXMLString, response.content)
+            if response.status_code == 200:
+                self._cache.set(cacheKey, ttl, response.content, response.headers)
+            return data
+
+    def streamQuery(self, key, headers=None, params=None, timeout=None, chunk_size=65536):
+        """ Sends a GET request to the Plex server and incrementally parses the response while it
+            is downloaded. The root element is yielded first (with its attributes only), followed by
+            each of its child elements as soon as it is parsed. See :func:`~plexapi.utils.iterXMLElements`.
+            The response cache and request coalescing are not used for streamed requests.
+
+            If the response contains illegal XML characters, the request is sent again with the
+            characters removed, and the elements already yielded are skipped.
+
+            Parameters:
+                key (str): API URL path in Plex.
+                headers (dict, optional): Additional headers to add to the request.
+                params (dict, optional): Additional params to add to the request.
+                timeout (int, optional): Timeout in seconds (default: the server timeout).
+                chunk_size (int, optional): Number of bytes to read from the response at a time (default 64 KiB).
+        """
+        yielded = 0
+        try:
+            for elem in self._streamElements(key, headers, params, timeout, chunk_size):
+                yield elem
+                yielded += 1
+        except utils.XMLParseError:
+            log.debug('Unable to parse %s, retrying with illegal XML characters removed', key)
+            elems = self._streamElements(key, headers, params, timeout, chunk_size, clean=True)
+            yield from itertools.islice(elems, yielded, None)
+
+    def _streamElements(self, key, headers=None, params=None, timeout=None, chunk_size=65536, clean=False):
+        """ Yields the elements of a streamed GET request. See :func:`~plexapi.server.PlexServer.streamQuery`. """
+        url = self.url(key)
+        timeout = timeout or self._transport.timeout(key, self._timeout)
+        log.debug('GET %s (stream)', url)
+        headers = self._headers(**headers or {})
+        metrics.countRequest('GET', metrics.endpointTemplate(key))
+        with self._session.get(url, headers=headers, params=params, timeout=timeout, stream=True) as response:
+            self._checkResponse(response)
+            yield from utils.iterXMLElements(response.iter_content(chunk_size), clean=clean)
+
+    def _checkResponse(self, response):
+        """ Raises the matching exception if the response was not successful. """
         if response.status_code not in (200, 201, 204):
             codename = codes.get(response.status_code)[0]
             errtext = response.text.replace('\n', ' ')
@@ -756,7 +875,6 @@ class PlexServer(PlexObject):
                 raise NotFound(message)
             else:
                 raise BadRequest(message)
-        return utils.parseXMLString(response.text)
 
     def search(self, query, mediatype=None, limit=None, sectionId=None):
         """ Returns a list of media items or filter categories from the resulting
@@ -0,0 +1,339 @@
+import base64
+import io
+import json
+import os
+import re
+import threading
+from concurrent.futures import Future
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import DEFAULT_RETRIES, BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from plexapi import CONFIG, log, utils
+
+# Response status codes retried for idempotent requests when retries are enabled.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Request headers that change the response content and must be part of a request key.
+KEY_HEADERS = ('X-Plex-Container-Start', 'X-Plex-Container-Size', 'X-Plex-Token')
+
+# Response headers saved with the recorded responses.
+RECORDED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+def requestKey(method, url, headers=None, params=None):
+    """ Returns a string identifying a request by its method, url, content headers and params. """
+    headers = headers or {}
+    parts = [method.upper(), url]
+    parts.extend(f'{name}={headers[name]}' for name in KEY_HEADERS if name in headers)
+    if params:
+        parts.extend(f'{k}={v}' for k, v in sorted(params.items()) if v is not None)
+    return '|'.join(parts)
+
+
+class TransportConfig:
+    """ HTTP transport settings used to build the :class:`requests.Session` of a
+        :class:`~plexapi.server.PlexServer` or :class:`~plexapi.myplex.MyPlexAccount`.
+        Any value not provided is loaded from the ``[plexapi]`` section of the config file,
+        which defaults to the behaviour of a plain :class:`requests.Session`.
+
+        Parameters:
+            pool_connections (int, optional): Number of connection pools (one per host) to cache (default 10).
+            pool_maxsize (int, optional): Maximum number of connections kept alive per host (default 10).
+                Increase this when making many concurrent requests to the same server, for example
+                with the ``plexapi.fetch_workers`` setting.
+            pool_block (bool, optional): Wait for a free connection when the pool is full instead of
+                opening and discarding extra connections (default False).
+            max_retries (int, optional): Number of times to retry an idempotent request (GET, HEAD,
+                PUT, DELETE, OPTIONS, TRACE) on connection errors or a 429/5xx response (default 0).
+            backoff_factor (float, optional): Exponential backoff factor in seconds between retries.
+                The delay before the nth retry is ``backoff_factor * 2 ** (n - 1)`` (default 0.5).
+            keep_alive (bool, optional): Reuse connections between requests (default True).
+            coalesce (bool, optional): Share a single in-flight request between identical concurrent
+                GET requests (default False). The callers then receive the same parsed response.
+                See :class:`~plexapi.transport.SingleFlight`.
+            record (str, optional): Directory to record all the responses to, see
+                :class:`~plexapi.transport.RecordingAdapter` (default None).
+            replay (str, optional): Directory to replay the recorded responses from instead of sending
+                the requests, see :class:`~plexapi.transport.ReplayAdapter` (default None).
+            timeouts (dict, optional): Timeout in seconds for specific endpoints, as a dictionary of
+                regular expressions searched in the requested path or url. Overrides the default timeout
+                of the server or account.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.server import PlexServer
+                from plexapi.transport import TransportConfig
+
+                transport = TransportConfig(
+                    pool_maxsize=32, max_retries=3, timeouts={r'/library/sections/\\d+/all': 120}
+                )
+                plex = PlexServer('http://localhost:32400', token='xxxxxxxxxxxxxxxxxxxx', transport=transport)
+
+    """
+
+    def __init__(self, pool_connections=None, pool_maxsize=None, pool_block=None, max_retries=None,
+                 backoff_factor=None, keep_alive=None, timeouts=None, coalesce=None, record=None, replay=None):
+        self.pool_connections = _setting(pool_connections, 'plexapi.pool_connections', 10, int)
+        self.pool_maxsize = _setting(pool_maxsize, 'plexapi.pool_maxsize', 10, int)
+        self.pool_block = _setting(pool_block, 'plexapi.pool_block', False, bool)
+        self.max_retries = _setting(max_retries, 'plexapi.max_retries', 0, int)
+        self.backoff_factor = _setting(backoff_factor, 'plexapi.retry_backoff', 0.5, float)
+        self.keep_alive = _setting(keep_alive, 'plexapi.keep_alive', True, bool)
+        if timeouts is None:
+            timeouts = _parseTimeouts(CONFIG.get('plexapi.endpoint_timeouts', ''))
+        self.timeouts = [(re.compile(pattern), value) for pattern, value in timeouts.items()]
+        self.singleflight = SingleFlight() if _setting(coalesce, 'plexapi.coalesce_requests', False, bool) else None
+        self.record = _setting(record, 'plexapi.record_path', None, str)
+        self.replay = _setting(replay, 'plexapi.replay_path', None, str)
+        self._adapter = None
+
+    def __repr__(self):
+        return (
+            f'<{self.__class__.__name__}:pool={self.pool_connections}x{self.pool_maxsize}'
+            f':retries={self.max_retries}:keepalive={self.keep_alive}>'
+        )
+
+    def retry(self):
+        """ Returns the :class:`urllib3.util.Retry` policy used by the session adapters. Without retries,
+            the default of :class:`requests.adapters.HTTPAdapter` is kept so a read timeout still raises
+            :class:`requests.exceptions.ReadTimeout`.
+        """
+        if not self.max_retries:
+            return DEFAULT_RETRIES
+        return Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+
+    def adapter(self):
+        """ Returns the :class:`requests.adapters.HTTPAdapter` using these settings. The adapter is
+            created once and shared by all the sessions using this transport, so they share the
+            same connection pools.
+        """
+        if self._adapter is None:
+            if self.replay:
+                self._adapter = ReplayAdapter(self.replay)
+            else:
+                cls = RecordingAdapter if self.record else HTTPAdapter
+                kwargs = {'path': self.record} if self.record else {}
+                self._adapter = cls(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block,
+                    max_retries=self.retry(),
+                    **kwargs,
+                )
+        return self._adapter
+
+    def session(self):
+        """ Returns a new :class:`requests.Session` using these settings. """
+        session = requests.Session()
+        self.mount(session)
+        return session
+
+    def mount(self, session):
+        """ Mounts the connection adapters on an existing :class:`requests.Session`.
+
+            Parameters:
+                session (requests.Session): The session to configure.
+        """
+        adapter = self.adapter()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def timeout(self, key, default=None):
+        """ Returns the timeout in seconds for the requested path or url.
+
+            Parameters:
+                key (str): The requested path or url.
+                default (int): Timeout to return if no endpoint timeout matches.
+        """
+        for pattern, value in self.timeouts:
+            if pattern.search(key):
+                return value
+        return default
+
+
+class SingleFlight:
+    """ Coalesces identical concurrent calls. While a call for a key is in flight, other threads
+        calling :func:`~plexapi.transport.SingleFlight.do` with the same key wait for it and receive
+        the same result (or exception) instead of making their own call. This avoids sending the
+        same request many times when several threads reload the same object or list the library
+        sections at the same moment. Calls made after the in-flight call completes are not affected.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        """ Returns the result of ``func()``, shared with any identical call already in flight.
+
+            Parameters:
+                key (str): Key identifying identical calls, see :func:`~plexapi.transport.requestKey`.
+                func (callable): Function to call if no identical call is in flight.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+def recordingKey(request):
+    """ Returns the key of a :class:`requests.PreparedRequest` used to record and replay its response.
+        The token is not part of the key, so responses recorded with one account can be replayed
+        with any token.
+    """
+    parts = urlsplit(request.url)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != 'X-Plex-Token'])
+    url = urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
+    headers = {k: v for k, v in request.headers.items() if k in KEY_HEADERS and k != 'X-Plex-Token'}
+    return requestKey(request.method, url, headers)
+
+
+class RecordingAdapter(HTTPAdapter):
+    """ Transport adapter sending the requests like :class:`requests.adapters.HTTPAdapter` and
+        saving each response to a directory, to be replayed later with
+        :class:`~plexapi.transport.ReplayAdapter` without a Plex server. Each response is saved
+        to its own JSON file named after the hash of the request method, url (without the token)
+        and container headers. Repeated requests overwrite the previous response.
+
+        Parameters:
+            path (str): Directory to save the responses to.
+            **kwargs (dict): Additional arguments passed to :class:`requests.adapters.HTTPAdapter`.
+
+        Example:
+
+            .. code-block:: python
+
+                from plexapi.server import PlexServer
+                from plexapi.transport import TransportConfig
+
+                # Record the responses of a live server
+                plex = PlexServer(baseurl, token, transport=TransportConfig(record='recordings'))
+                plex.library.section('Movies').all()
+
+                # Replay the responses later without the server
+                plex = PlexServer(baseurl, token, transport=TransportConfig(replay='recordings'))
+                plex.library.section('Movies').all()
+
+    """
+
+    def __init__(self, path, **kwargs):
+        self.path = os.path.expanduser(path)
+        os.makedirs(self.path, exist_ok=True)
+        super().__init__(**kwargs)
+
+    def send(self, request, stream=False, **kwargs):
+        """ Sends the :class:`requests.PreparedRequest` and saves its response. The response
+            is always fully downloaded before being saved, even for a streamed request.
+        """
+        response = super().send(request, stream=False, **kwargs)
+        key = recordingKey(request)
+        content = response.content
+        try:
+            body, encoding = content.decode('utf-8'), 'utf-8'
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode('ascii'), 'base64'
+        record = {
+            'key': key,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {k: response.headers[k] for k in RECORDED_HEADERS if k in response.headers},
+            'encoding': encoding,
+            'body': body,
+        }
+        filepath = os.path.join(self.path, utils.sha1hash(key) + '.json')
+        tmppath = f'{filepath}.{os.getpid()}.{threading.get_ident()}'
+        with open(tmppath, 'w', encoding='utf-8') as handle:
+            json.dump(record, handle, indent=1)
+        os.replace(tmppath, filepath)
+        log.debug('Recorded %s to %s', key, filepath)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """ Transport adapter returning the responses saved by :class:`~plexapi.transport.RecordingAdapter`
+        instead of sending the requests. See :class:`~plexapi.transport.RecordingAdapter` for an example.
+
+        Parameters:
+            path (str): Directory to load the recorded responses from.
+
+        Raises:
+            :exc:`requests.exceptions.ConnectionError`: No response was recorded for a request.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = os.path.expanduser(path)
+
+    def send(self, request, stream=False, **kwargs):
+        """ Returns the recorded :class:`requests.Response` of the :class:`requests.PreparedRequest`. """
+        key = recordingKey(request)
+        filepath = os.path.join(self.path, utils.sha1hash(key) + '.json')
+        try:
+            with open(filepath, encoding='utf-8') as handle:
+                record = json.load(handle)
+        except FileNotFoundError:
+            raise requests.exceptions.ConnectionError(f'No recorded response for {key}', request=request) from None
+        if record['encoding'] == 'base64':
+            content = base64.b64decode(record['body'])
+        else:
+            content = record['body'].encode('utf-8')
+        response = requests.Response()
+        response.status_code = record['status']
+        response.reason = record['reason']
+        response.headers = CaseInsensitiveDict(record['headers'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(content)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        """ Nothing to clean up, no connection is ever opened. """
+
+
+def _setting(value, key, default, cast):
+    """ Returns the value if provided, otherwise the value of the config key. """
+    if value is not None:
+        return value
+    return CONFIG.get(key, default, cast)
+
+
+def _parseTimeouts(value):
+    """ Parses the ``plexapi.endpoint_timeouts`` config value in the format
+        ``<regex>=<seconds>;<regex>=<seconds>`` into a dictionary.
+    """
+    timeouts = {}
+    for rule in filter(None, (rule.strip() for rule in value.split(';'))):
+        pattern, _, seconds = rule.rpartition('=')
+        timeouts[pattern] = float(seconds)
+    return timeouts
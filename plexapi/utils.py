@@ -1,5 +1,7 @@
 import base64
+import codecs
 import functools
+import itertools
 import json
 import logging
 import os
@@ -15,7 +17,8 @@ from collections import deque
 from datetime import datetime, timedelta
 from getpass import getpass
 from hashlib import sha1
-from threading import Event, Thread
+from threading import Event, Thread, local
+from typing import Union
 from urllib.parse import quote
 from xml.etree import ElementTree
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -29,6 +32,11 @@ try:
 except ImportError:
     tqdm = None
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 log = logging.getLogger('plexapi')
 
 # Search Types - Plex uses these to filter specific media types when searching.
@@ -107,6 +115,16 @@ PLEXOBJECTS = {}
 # Global timezone for toDatetime() conversions, set by setDatetimeTimezone()
 DATETIME_TIMEZONE = None
 
+# Global XML parser backend for parseXMLString() and iterXMLElements(), set by setXMLParser()
+XML_PARSER = 'etree'
+XML_PARSERS = ('etree', 'lxml')
+
+# Exceptions raised when parsing invalid XML with any of the XML parser backends
+XMLParseError = (ElementTree.ParseError,) + ((lxml_etree.XMLSyntaxError,) if lxml_etree is not None else ())
+
+# lxml parsers must not be shared between threads
+_lxmlParsers = local()
+
 
 class SecretsFilter(logging.Filter):
     """ Logging filter to hide secrets. """
@@ -185,6 +203,18 @@ def cast(func, value):
     return func(value)
 
 
+def intern(value):
+    """ Returns the interned value of a string so that equal strings share the same memory,
+        or the value unchanged if it is not a string.
+
+        Parameters:
+            value (any): value to be interned and returned.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
 def joinArgs(args):
     """ Returns a query string (uses for HTTP URLs) where only the value is URL encoded.
         Example return value: '?genre=action&type=1337'.
@@ -369,6 +399,67 @@ def setDatetimeTimezone(value):
     return DATETIME_TIMEZONE
 
 
+def setXMLParser(value):
+    """ Sets the XML parser backend used to parse the responses from the Plex servers.
+
+        Parameters:
+            value (str):
+                - ``etree`` to use the Python standard library :mod:`xml.etree.ElementTree` (default).
+                - ``lxml`` to use :mod:`lxml.etree`, which is faster on large responses. Falls back
+                  to ``etree`` if lxml is not installed.
+
+        Returns:
+            str: The XML parser backend in use.
+    """
+    global XML_PARSER
+
+    setting = str(value or 'etree').strip().lower()
+    if setting not in XML_PARSERS:
+        log.warning('Unknown XML parser "%s", defaulting to etree', value)
+        setting = 'etree'
+    elif setting == 'lxml' and lxml_etree is None:
+        log.warning('lxml is not installed, defaulting to the etree XML parser')
+        setting = 'etree'
+
+    XML_PARSER = setting
+    return XML_PARSER
+
+
+def _lxmlParserOptions():
+    """ Returns the lxml parser options matching the behaviour of the standard library parser. """
+    return {'remove_comments': True, 'remove_pis': True, 'resolve_entities': False, 'huge_tree': True}
+
+
+def _lxmlParser():
+    """ Returns the lxml parser for the current thread. """
+    parser = getattr(_lxmlParsers, 'parser', None)
+    if parser is None:
+        parser = _lxmlParsers.parser = lxml_etree.XMLParser(**_lxmlParserOptions())
+    return parser
+
+
+def fromXMLString(s: Union[str, bytes]):
+    """ Parse an XML document with the configured XML parser backend (see :func:`setXMLParser`)
+        and return the root element. Unlike :func:`parseXMLString`, invalid XML is not cleaned.
+
+        Raises:
+            :exc:`xml.etree.ElementTree.ParseError` or :exc:`lxml.etree.XMLSyntaxError`: The document
+                is not valid XML. Both are included in :data:`~plexapi.utils.XMLParseError`.
+    """
+    if isinstance(s, str):
+        s = s.encode('utf-8')
+    if XML_PARSER == 'lxml':
+        return lxml_etree.fromstring(s, _lxmlParser())
+    return ElementTree.fromstring(s)
+
+
+def toXMLString(elem):
+    """ Serialize an element parsed by any of the XML parser backends and return the XML document as bytes. """
+    if lxml_etree is not None and lxml_etree.iselement(elem) and not isinstance(elem, ElementTree.Element):
+        return lxml_etree.tostring(elem)
+    return ElementTree.tostring(elem)
+
+
 def _parseTimestamp(value, tzinfo):
     """ Helper function to parse a timestamp value into a datetime object. """
     try:
@@ -773,7 +864,9 @@ def toJson(obj, **kwargs):
     def serialize(obj):
         if isinstance(obj, datetime):
             return obj.isoformat()
-        return {k: v for k, v in obj.__dict__.items() if not k.startswith('_')}
+        # Decode the lazy data fields without triggering an auto-reload
+        fields = {k: object.__getattribute__(obj, k) for k in getattr(obj, '_data_fields', ()) if not k.startswith('_')}
+        return {**fields, **{k: v for k, v in obj.__dict__.items() if not k.startswith('_')}}
     return json.dumps(obj, default=serialize, **kwargs)
 
 
@@ -833,15 +926,63 @@ def cleanXMLString(s):
     return _illegal_XML_re.sub('', s)
 
 
-def parseXMLString(s: str):
-    """ Parse an XML string and return an ElementTree object. """
-    if not s.strip():
+def parseXMLString(s: Union[str, bytes]):
+    """ Parse an XML string and return an ElementTree object. Passing the raw response bytes
+        (``response.content``) avoids decoding and re-encoding the whole response before parsing.
+    """
+    if not s or s.isspace():
         return None
     try:  # Attempt to parse the string as-is without cleaning (which is expensive)
-        return ElementTree.fromstring(s.encode('utf-8'))
-    except ElementTree.ParseError:  # If it fails, clean the string and try again
+        return fromXMLString(s)
+    except XMLParseError:  # If it fails, clean the string and try again
+        if isinstance(s, bytes):
+            s = s.decode('utf-8', errors='replace')
         cleaned_s = cleanXMLString(s).encode('utf-8')
-        return ElementTree.fromstring(cleaned_s) if cleaned_s.strip() else None
+        return fromXMLString(cleaned_s) if cleaned_s.strip() else None
+
+
+def iterXMLElements(chunks, clean=False):
+    """ Incrementally parse an XML document and yield its top-level elements as soon as they are complete.
+        The root element is yielded first, as soon as its opening tag is parsed, with its attributes but
+        without any children. Each child element of the root is then yielded once its closing tag is parsed,
+        and detached from the root so the parsed document is never held in memory as a whole.
+
+        Parameters:
+            chunks (iterable): Chunks of the XML document as bytes (e.g. ``response.iter_content()``).
+            clean (bool): Remove the illegal XML characters from the document before parsing it
+                (see :func:`~plexapi.utils.cleanXMLString`).
+
+        Raises:
+            :exc:`xml.etree.ElementTree.ParseError` or :exc:`lxml.etree.XMLSyntaxError`: The document
+                is not valid XML. Both are included in :data:`~plexapi.utils.XMLParseError`.
+    """
+    if XML_PARSER == 'lxml':
+        parser = lxml_etree.XMLPullParser(events=('start', 'end'), **_lxmlParserOptions())
+    else:
+        parser = ElementTree.XMLPullParser(events=('start', 'end'))
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace') if clean else None
+    root = None
+    depth = 0
+    for chunk in itertools.chain(chunks, [None]):
+        if chunk is None:
+            if clean:
+                parser.feed(cleanXMLString(decoder.decode(b'', final=True)))
+            if root is None:  # Empty document
+                return
+            parser.close()
+        else:
+            parser.feed(cleanXMLString(decoder.decode(chunk)) if clean else chunk)
+        for event, elem in parser.read_events():
+            if event == 'start':
+                depth += 1
+                if depth == 1:
+                    root = elem
+                    yield root
+            else:
+                depth -= 1
+                if depth == 1:
+                    root.remove(elem)
+                    yield elem
 
 
 def generateUUID() -> str:
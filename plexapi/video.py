@@ -1,9 +1,10 @@
 import os
+from datetime import datetime
 from pathlib import Path
 from urllib.parse import quote_plus
 
 from plexapi import media, utils
-from plexapi.base import Playable, PlexPartialObject, PlexHistory, PlexSession, cached_data_property
+from plexapi.base import Playable, PlexPartialObject, PlexHistory, PlexSession, cached_data_property, data_field
 from plexapi.exceptions import BadRequest
 from plexapi.mixins import MovieMixins, ShowMixins, SeasonMixins, EpisodeMixins, ClipMixins, PlayedUnplayedMixin
 
@@ -39,29 +40,27 @@ class Video(PlexPartialObject, PlayedUnplayedMixin):
             viewCount (int): Count of times the item was played.
     """
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt'))
-        self.art = data.attrib.get('art')
-        self.artBlurHash = data.attrib.get('artBlurHash')
-        self.guid = data.attrib.get('guid')
-        self.key = data.attrib.get('key', '')
-        self.lastRatedAt = utils.toDatetime(data.attrib.get('lastRatedAt'))
-        self.lastViewedAt = utils.toDatetime(data.attrib.get('lastViewedAt'))
-        self.librarySectionID = utils.cast(int, data.attrib.get('librarySectionID'))
-        self.librarySectionKey = data.attrib.get('librarySectionKey')
-        self.librarySectionTitle = data.attrib.get('librarySectionTitle')
-        self.listType = 'video'
-        self.ratingKey = utils.cast(int, data.attrib.get('ratingKey'))
-        self.summary = data.attrib.get('summary')
-        self.thumb = data.attrib.get('thumb')
-        self.thumbBlurHash = data.attrib.get('thumbBlurHash')
-        self.title = data.attrib.get('title')
-        self.titleSort = data.attrib.get('titleSort', self.title)
-        self.type = data.attrib.get('type')
-        self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt'))
-        self.userRating = utils.cast(float, data.attrib.get('userRating'))
-        self.viewCount = utils.cast(int, data.attrib.get('viewCount', 0))
+    addedAt = data_field(datetime)
+    art = data_field()
+    artBlurHash = data_field()
+    guid = data_field()
+    key = data_field(default='')
+    lastRatedAt = data_field(datetime)
+    lastViewedAt = data_field(datetime)
+    librarySectionID = data_field(int)
+    librarySectionKey = data_field()
+    librarySectionTitle = data_field()
+    listType = data_field(default='video')
+    ratingKey = data_field(int)
+    summary = data_field()
+    thumb = data_field()
+    thumbBlurHash = data_field()
+    title = data_field()
+    titleSort = data_field(fallback='title')
+    type = data_field()
+    updatedAt = data_field(datetime)
+    userRating = data_field(float)
+    viewCount = data_field(int, default=0)
 
     @cached_data_property
     def fields(self):
@@ -383,31 +382,27 @@ class Movie(
     TYPE = 'movie'
     METADATA_TYPE = 'movie'
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        Video._loadData(self, data)
-        Playable._loadData(self, data)
-        self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
-        self.audienceRatingImage = data.attrib.get('audienceRatingImage')
-        self.chapterSource = data.attrib.get('chapterSource')
-        self.contentRating = data.attrib.get('contentRating')
-        self.duration = utils.cast(int, data.attrib.get('duration'))
-        self.editionTitle = data.attrib.get('editionTitle')
-        self.enableCreditsMarkerGeneration = utils.cast(int, data.attrib.get('enableCreditsMarkerGeneration', '-1'))
-        self.languageOverride = data.attrib.get('languageOverride')
-        self.originallyAvailableAt = utils.toDatetime(data.attrib.get('originallyAvailableAt'), '%Y-%m-%d')
-        self.originalTitle = data.attrib.get('originalTitle')
-        self.primaryExtraKey = data.attrib.get('primaryExtraKey')
-        self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.ratingImage = data.attrib.get('ratingImage')
-        self.slug = data.attrib.get('slug')
-        self.sourceURI = data.attrib.get('source')  # remote playlist item
-        self.studio = data.attrib.get('studio')
-        self.tagline = data.attrib.get('tagline')
-        self.theme = data.attrib.get('theme')
-        self.useOriginalTitle = utils.cast(int, data.attrib.get('useOriginalTitle', '-1'))
-        self.viewOffset = utils.cast(int, data.attrib.get('viewOffset', 0))
-        self.year = utils.cast(int, data.attrib.get('year'))
+    audienceRating = data_field(float)
+    audienceRatingImage = data_field()
+    chapterSource = data_field()
+    contentRating = data_field()
+    duration = data_field(int)
+    editionTitle = data_field()
+    enableCreditsMarkerGeneration = data_field(int, default='-1')
+    languageOverride = data_field()
+    originallyAvailableAt = data_field(datetime, format='%Y-%m-%d')
+    originalTitle = data_field()
+    primaryExtraKey = data_field()
+    rating = data_field(float)
+    ratingImage = data_field()
+    slug = data_field()
+    sourceURI = data_field(attr='source')  # remote playlist item
+    studio = data_field()
+    tagline = data_field()
+    theme = data_field()
+    useOriginalTitle = data_field(int, default='-1')
+    viewOffset = data_field(int, default=0)
+    year = data_field(int)
 
     @cached_data_property
     def chapters(self):
@@ -594,42 +589,40 @@ class Show(
     TYPE = 'show'
     METADATA_TYPE = 'episode'
 
+    audienceRating = data_field(float)
+    audienceRatingImage = data_field()
+    audioLanguage = data_field(default='')
+    autoDeletionItemPolicyUnwatchedLibrary = data_field(int, default='0')
+    autoDeletionItemPolicyWatchedLibrary = data_field(int, default='0')
+    childCount = data_field(int)
+    contentRating = data_field()
+    duration = data_field(int)
+    editionTitle = data_field()
+    enableCreditsMarkerGeneration = data_field(int, default='-1')
+    episodeSort = data_field(int, default='-1')
+    flattenSeasons = data_field(int, default='-1')
+    index = data_field(int)
+    languageOverride = data_field()
+    leafCount = data_field(int)
+    network = data_field()
+    originallyAvailableAt = data_field(datetime, format='%Y-%m-%d')
+    originalTitle = data_field()
+    rating = data_field(float)
+    seasonCount = data_field(int, fallback='childCount')
+    showOrdering = data_field()
+    slug = data_field()
+    studio = data_field()
+    subtitleLanguage = data_field(default='')
+    subtitleMode = data_field(int, default='-1')
+    tagline = data_field()
+    theme = data_field()
+    useOriginalTitle = data_field(int, default='-1')
+    viewedLeafCount = data_field(int)
+    year = data_field(int)
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
-        Video._loadData(self, data)
-        self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
-        self.audienceRatingImage = data.attrib.get('audienceRatingImage')
-        self.audioLanguage = data.attrib.get('audioLanguage', '')
-        self.autoDeletionItemPolicyUnwatchedLibrary = utils.cast(
-            int, data.attrib.get('autoDeletionItemPolicyUnwatchedLibrary', '0'))
-        self.autoDeletionItemPolicyWatchedLibrary = utils.cast(
-            int, data.attrib.get('autoDeletionItemPolicyWatchedLibrary', '0'))
-        self.childCount = utils.cast(int, data.attrib.get('childCount'))
-        self.contentRating = data.attrib.get('contentRating')
-        self.duration = utils.cast(int, data.attrib.get('duration'))
-        self.editionTitle = data.attrib.get('editionTitle')
-        self.enableCreditsMarkerGeneration = utils.cast(int, data.attrib.get('enableCreditsMarkerGeneration', '-1'))
-        self.episodeSort = utils.cast(int, data.attrib.get('episodeSort', '-1'))
-        self.flattenSeasons = utils.cast(int, data.attrib.get('flattenSeasons', '-1'))
-        self.index = utils.cast(int, data.attrib.get('index'))
         self.key = self.key.replace('/children', '')  # FIX_BUG_50
-        self.languageOverride = data.attrib.get('languageOverride')
-        self.leafCount = utils.cast(int, data.attrib.get('leafCount'))
-        self.network = data.attrib.get('network')
-        self.originallyAvailableAt = utils.toDatetime(data.attrib.get('originallyAvailableAt'), '%Y-%m-%d')
-        self.originalTitle = data.attrib.get('originalTitle')
-        self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.seasonCount = utils.cast(int, data.attrib.get('seasonCount', self.childCount))
-        self.showOrdering = data.attrib.get('showOrdering')
-        self.slug = data.attrib.get('slug')
-        self.studio = data.attrib.get('studio')
-        self.subtitleLanguage = data.attrib.get('subtitleLanguage', '')
-        self.subtitleMode = utils.cast(int, data.attrib.get('subtitleMode', '-1'))
-        self.tagline = data.attrib.get('tagline')
-        self.theme = data.attrib.get('theme')
-        self.useOriginalTitle = utils.cast(int, data.attrib.get('useOriginalTitle', '-1'))
-        self.viewedLeafCount = utils.cast(int, data.attrib.get('viewedLeafCount'))
-        self.year = utils.cast(int, data.attrib.get('year'))
 
     @cached_data_property
     def collections(self):
@@ -816,29 +809,29 @@ class Season(
     TYPE = 'season'
     METADATA_TYPE = 'episode'
 
+    audienceRating = data_field(float)
+    audioLanguage = data_field(default='')
+    editionTitle = data_field()
+    index = data_field(int)
+    leafCount = data_field(int)
+    parentGuid = data_field()
+    parentIndex = data_field(int)
+    parentKey = data_field()
+    parentRatingKey = data_field(int)
+    parentSlug = data_field()
+    parentStudio = data_field()
+    parentTheme = data_field()
+    parentThumb = data_field()
+    parentTitle = data_field()
+    rating = data_field(float)
+    subtitleLanguage = data_field(default='')
+    subtitleMode = data_field(int, default='-1')
+    viewedLeafCount = data_field(int)
+    year = data_field(int)
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
-        Video._loadData(self, data)
-        self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
-        self.audioLanguage = data.attrib.get('audioLanguage', '')
-        self.editionTitle = data.attrib.get('editionTitle')
-        self.index = utils.cast(int, data.attrib.get('index'))
         self.key = self.key.replace('/children', '')  # FIX_BUG_50
-        self.leafCount = utils.cast(int, data.attrib.get('leafCount'))
-        self.parentGuid = data.attrib.get('parentGuid')
-        self.parentIndex = utils.cast(int, data.attrib.get('parentIndex'))
-        self.parentKey = data.attrib.get('parentKey')
-        self.parentRatingKey = utils.cast(int, data.attrib.get('parentRatingKey'))
-        self.parentSlug = data.attrib.get('parentSlug')
-        self.parentStudio = data.attrib.get('parentStudio')
-        self.parentTheme = data.attrib.get('parentTheme')
-        self.parentThumb = data.attrib.get('parentThumb')
-        self.parentTitle = data.attrib.get('parentTitle')
-        self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.subtitleLanguage = data.attrib.get('subtitleLanguage', '')
-        self.subtitleMode = utils.cast(int, data.attrib.get('subtitleMode', '-1'))
-        self.viewedLeafCount = utils.cast(int, data.attrib.get('viewedLeafCount'))
-        self.year = utils.cast(int, data.attrib.get('year'))
 
     @cached_data_property
     def collections(self):
@@ -1013,42 +1006,38 @@ class Episode(
     TYPE = 'episode'
     METADATA_TYPE = 'episode'
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        Video._loadData(self, data)
-        Playable._loadData(self, data)
-        self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
-        self.audienceRatingImage = data.attrib.get('audienceRatingImage')
-        self.chapterSource = data.attrib.get('chapterSource')
-        self.contentRating = data.attrib.get('contentRating')
-        self.duration = utils.cast(int, data.attrib.get('duration'))
-        self.editionTitle = data.attrib.get('editionTitle')
-        self.grandparentArt = data.attrib.get('grandparentArt')
-        self.grandparentGuid = data.attrib.get('grandparentGuid')
-        self.grandparentKey = data.attrib.get('grandparentKey')
-        self.grandparentRatingKey = utils.cast(int, data.attrib.get('grandparentRatingKey'))
-        self.grandparentSlug = data.attrib.get('grandparentSlug')
-        self.grandparentTheme = data.attrib.get('grandparentTheme')
-        self.grandparentThumb = data.attrib.get('grandparentThumb')
-        self.grandparentTitle = data.attrib.get('grandparentTitle')
-        self.index = utils.cast(int, data.attrib.get('index'))
-        self.originallyAvailableAt = utils.toDatetime(data.attrib.get('originallyAvailableAt'), '%Y-%m-%d')
-        self.parentGuid = data.attrib.get('parentGuid')
-        self.parentIndex = utils.cast(int, data.attrib.get('parentIndex'))
-        self.parentTitle = data.attrib.get('parentTitle')
-        self.parentYear = utils.cast(int, data.attrib.get('parentYear'))
-        self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.skipParent = utils.cast(bool, data.attrib.get('skipParent', '0'))
-        self.sourceURI = data.attrib.get('source')  # remote playlist item
-        self.viewOffset = utils.cast(int, data.attrib.get('viewOffset', 0))
-        self.year = utils.cast(int, data.attrib.get('year'))
-
-        # If seasons are hidden, parentKey and parentRatingKey are missing from the XML response.
-        # https://forums.plex.tv/t/parentratingkey-not-in-episode-xml-when-seasons-are-hidden/300553
-        # Use cached properties below to return the correct values if they are missing to avoid auto-reloading.
-        self._parentKey = data.attrib.get('parentKey')
-        self._parentRatingKey = utils.cast(int, data.attrib.get('parentRatingKey'))
-        self._parentThumb = data.attrib.get('parentThumb')
+    audienceRating = data_field(float)
+    audienceRatingImage = data_field()
+    chapterSource = data_field()
+    contentRating = data_field()
+    duration = data_field(int)
+    editionTitle = data_field()
+    grandparentArt = data_field()
+    grandparentGuid = data_field()
+    grandparentKey = data_field()
+    grandparentRatingKey = data_field(int)
+    grandparentSlug = data_field()
+    grandparentTheme = data_field()
+    grandparentThumb = data_field()
+    grandparentTitle = data_field()
+    index = data_field(int)
+    originallyAvailableAt = data_field(datetime, format='%Y-%m-%d')
+    parentGuid = data_field()
+    parentIndex = data_field(int)
+    parentTitle = data_field()
+    parentYear = data_field(int)
+    rating = data_field(float)
+    skipParent = data_field(bool, default='0')
+    sourceURI = data_field(attr='source')  # remote playlist item
+    viewOffset = data_field(int, default=0)
+    year = data_field(int)
+
+    # If seasons are hidden, parentKey and parentRatingKey are missing from the XML response.
+    # https://forums.plex.tv/t/parentratingkey-not-in-episode-xml-when-seasons-are-hidden/300553
+    # Use cached properties below to return the correct values if they are missing to avoid auto-reloading.
+    _parentKey = data_field(attr='parentKey')
+    _parentRatingKey = data_field(int, attr='parentRatingKey')
+    _parentThumb = data_field(attr='parentThumb')
 
     @cached_data_property
     def chapters(self):
@@ -1265,21 +1254,16 @@ class Clip(
     TYPE = 'clip'
     METADATA_TYPE = 'clip'
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        Video._loadData(self, data)
-        Playable._loadData(self, data)
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt'))
-        self.duration = utils.cast(int, data.attrib.get('duration'))
-        self.extraType = utils.cast(int, data.attrib.get('extraType'))
-        self.index = utils.cast(int, data.attrib.get('index'))
-        self.originallyAvailableAt = utils.toDatetime(
-            data.attrib.get('originallyAvailableAt'), '%Y-%m-%d')
-        self.skipDetails = utils.cast(int, data.attrib.get('skipDetails'))
-        self.subtype = data.attrib.get('subtype')
-        self.thumbAspectRatio = data.attrib.get('thumbAspectRatio')
-        self.viewOffset = utils.cast(int, data.attrib.get('viewOffset', 0))
-        self.year = utils.cast(int, data.attrib.get('year'))
+    addedAt = data_field(datetime)
+    duration = data_field(int)
+    extraType = data_field(int)
+    index = data_field(int)
+    originallyAvailableAt = data_field(datetime, format='%Y-%m-%d')
+    skipDetails = data_field(int)
+    subtype = data_field()
+    thumbAspectRatio = data_field()
+    viewOffset = data_field(int, default=0)
+    year = data_field(int)
 
     @cached_data_property
     def media(self):
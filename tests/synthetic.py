@@ -0,0 +1,466 @@
+"""
+Synthetic Plex Media Server for offline tests and benchmarks.
+
+The server generates deterministic library listings, metadata, sessions, history
+and hubs responses for any library size on the fly, without keeping the items in
+memory. An optional latency per request and per item makes the timings closer to
+a real server. Run it standalone to point tools or scripts at it:
+
+    python -m tests.synthetic --movies 100000 --shows 1000 --episodes 20 --port 32400 --latency 0.02
+"""
+import argparse
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import quoteattr
+
+MACHINE_IDENTIFIER = 'f0e1d2c3b4a5968778695a4b3c2d1e0f00112233'
+VERSION = '1.40.0.7998-c29d4c0c8'
+ADDED_AT = 1600000000
+
+GENRES = ('Action', 'Adventure', 'Animation', 'Comedy', 'Crime', 'Drama', 'Fantasy', 'Horror', 'Romance', 'Thriller')
+RATINGS = ('G', 'PG', 'PG-13', 'R', 'TV-14', 'TV-MA')
+CODECS = (('h264', 'aac', 'mp4'), ('hevc', 'eac3', 'mkv'), ('h264', 'ac3', 'mkv'))
+RESOLUTIONS = (('1080', 1920, 1080), ('720', 1280, 720), ('4k', 3840, 2160), ('sd', 720, 480))
+
+SECTIONS = (
+    # key, type, title, agent, scanner, default libtype, libtypes
+    (1, 'movie', 'Movies', 'tv.plex.agents.movie', 'Plex Movie', 1, (1,)),
+    (2, 'show', 'TV Shows', 'tv.plex.agents.series', 'Plex TV Series', 2, (2, 3, 4)),
+    (3, 'artist', 'Music', 'tv.plex.agents.music', 'Plex Music', 8, (8, 9, 10)),
+)
+
+
+def attrs(**kwargs):
+    """ Returns the XML attributes string of the keyword arguments, skipping None values. """
+    return ' '.join(f'{k}={quoteattr(str(v))}' for k, v in kwargs.items() if v is not None)
+
+
+class SyntheticLibrary:
+    """ Generates the items of a synthetic library. Each item is identified by its ratingKey and
+        generated from it, so any library size can be served without storing the items.
+
+        Parameters:
+            movies (int): Number of movies in the Movies section.
+            shows (int): Number of shows in the TV Shows section (each with a single season).
+            episodes (int): Number of episodes in each show.
+            artists (int): Number of artists in the Music section (each with a single album).
+            tracks (int): Number of tracks in each album.
+            sessions (int): Number of playing sessions returned by /status/sessions.
+            history (int): Number of history entries returned by /status/sessions/history/all.
+    """
+
+    def __init__(self, movies=1000, shows=100, episodes=10, artists=100, tracks=10, sessions=5, history=1000):
+        self.movies = movies
+        self.shows = shows
+        self.episodes = episodes
+        self.artists = artists
+        self.tracks = tracks
+        self.sessions = sessions
+        self.history = history
+        # ratingKey ranges of each item type: [start, end)
+        ranges = [('movie', movies), ('show', shows), ('season', shows), ('episode', shows * episodes),
+                  ('artist', artists), ('album', artists), ('track', artists * tracks)]
+        self.ranges = {}
+        start = 1
+        for libtype, count in ranges:
+            self.ranges[libtype] = (start, start + count)
+            start += count
+
+    def count(self, libtype):
+        """ Returns the number of items of the libtype. """
+        start, end = self.ranges[libtype]
+        return end - start
+
+    def ratingKey(self, libtype, index):
+        """ Returns the ratingKey of the nth item of the libtype. """
+        return self.ranges[libtype][0] + index
+
+    def libtype(self, ratingKey):
+        """ Returns the libtype and index of the item with the ratingKey, or (None, None) if not found. """
+        for libtype, (start, end) in self.ranges.items():
+            if start <= ratingKey < end:
+                return libtype, ratingKey - start
+        return None, None
+
+    def item(self, ratingKey, **extra):
+        """ Returns the XML element of the item with the ratingKey, or None if not found. """
+        libtype, index = self.libtype(ratingKey)
+        if libtype is None:
+            return None
+        return getattr(self, f'_{libtype}')(ratingKey, index, extra)
+
+    def items(self, libtype, start=0, size=None):
+        """ Returns the XML elements of the items of the libtype in the range. """
+        total = self.count(libtype)
+        end = total if size is None else min(total, start + size)
+        return [self.item(self.ratingKey(libtype, i)) for i in range(start, end)]
+
+    def children(self, ratingKey):
+        """ Returns the libtype and ratingKeys of the children of the item. """
+        libtype, index = self.libtype(ratingKey)
+        if libtype in ('show', 'artist'):
+            childtype = 'season' if libtype == 'show' else 'album'
+            return childtype, [self.ratingKey(childtype, index)]
+        if libtype == 'season':
+            return 'episode', [self.ratingKey('episode', index * self.episodes + i) for i in range(self.episodes)]
+        if libtype == 'album':
+            return 'track', [self.ratingKey('track', index * self.tracks + i) for i in range(self.tracks)]
+        return None, []
+
+    def leaves(self, ratingKey):
+        """ Returns the ratingKeys of the episodes of a show or the tracks of an artist. """
+        libtype, index = self.libtype(ratingKey)
+        if libtype in ('show', 'artist'):
+            return self.children(self.children(ratingKey)[1][0])[1]
+        return self.children(ratingKey)[1]
+
+    def _media(self, ratingKey, rand, duration, video=True):
+        if video:
+            videoCodec, audioCodec, container = rand.choice(CODECS)
+            resolution, width, height = rand.choice(RESOLUTIONS)
+        else:
+            videoCodec, audioCodec, container, resolution, width, height = None, 'flac', 'flac', None, None, None
+        size = duration * rand.randint(100, 1000)
+        return (
+            f'<Media {attrs(id=ratingKey, duration=duration, bitrate=rand.randint(500, 20000), width=width, height=height, aspectRatio="1.78" if video else None, audioChannels=rand.choice((2, 6)), audioCodec=audioCodec, videoCodec=videoCodec, videoResolution=resolution, container=container, videoFrameRate="24p" if video else None)}>'  # noqa: E501
+            f'<Part {attrs(id=ratingKey, key=f"/library/parts/{ratingKey}/{ADDED_AT}/file.{container}", duration=duration, file=f"/media/{ratingKey}/file.{container}", size=size, container=container)}/>'  # noqa: E501
+            f'</Media>'
+        )
+
+    def _movie(self, ratingKey, index, extra):
+        rand = random.Random(ratingKey)
+        duration = rand.randint(4800, 10800) * 1000
+        genres = ''.join(f'<Genre {attrs(tag=tag)}/>' for tag in rand.sample(GENRES, 2))
+        return (
+            f'<Video {attrs(ratingKey=ratingKey, key=f"/library/metadata/{ratingKey}", guid=f"plex://movie/{ratingKey:024x}", type="movie", title=f"Movie {index + 1}", titleSort=f"Movie {index + 1:08d}", librarySectionID=1, librarySectionTitle="Movies", librarySectionKey="/library/sections/1", contentRating=rand.choice(RATINGS), summary=f"Synthetic movie number {index + 1}. " * 4, rating=round(rand.uniform(1, 10), 1), audienceRating=round(rand.uniform(1, 10), 1), viewCount=rand.choice((None, 1, 2)), year=1950 + ratingKey % 75, originallyAvailableAt=f"{1950 + ratingKey % 75}-01-01", duration=duration, thumb=f"/library/metadata/{ratingKey}/thumb/{ADDED_AT}", art=f"/library/metadata/{ratingKey}/art/{ADDED_AT}", addedAt=ADDED_AT + ratingKey, updatedAt=ADDED_AT + ratingKey, **extra)}>'  # noqa: E501
+            f'{self._media(ratingKey, rand, duration)}{genres}'
+            f'<Country tag="United States of America"/><Director {attrs(tag=f"Director {ratingKey % 500}")}/>'
+            f'<Role {attrs(tag=f"Actor {ratingKey % 1000}")}/><Role {attrs(tag=f"Actor {(ratingKey + 1) % 1000}")}/>'
+            f'</Video>'
+        )
+
+    def _show(self, ratingKey, index, extra):
+        rand = random.Random(ratingKey)
+        genres = ''.join(f'<Genre {attrs(tag=tag)}/>' for tag in rand.sample(GENRES, 2))
+        return (
+            f'<Directory {attrs(ratingKey=ratingKey, key=f"/library/metadata/{ratingKey}/children", guid=f"plex://show/{ratingKey:024x}", type="show", title=f"Show {index + 1}", librarySectionID=2, librarySectionTitle="TV Shows", contentRating=rand.choice(RATINGS), summary=f"Synthetic show number {index + 1}.", year=1990 + ratingKey % 35, leafCount=self.episodes, viewedLeafCount=0, childCount=1, thumb=f"/library/metadata/{ratingKey}/thumb/{ADDED_AT}", addedAt=ADDED_AT + ratingKey, updatedAt=ADDED_AT + ratingKey, **extra)}>'  # noqa: E501
+            f'{genres}</Directory>'
+        )
+
+    def _season(self, ratingKey, index, extra):
+        show = self.ratingKey('show', index)
+        return (
+            f'<Directory {attrs(ratingKey=ratingKey, key=f"/library/metadata/{ratingKey}/children", guid=f"plex://season/{ratingKey:024x}", type="season", title="Season 1", index=1, parentRatingKey=show, parentKey=f"/library/metadata/{show}", parentTitle=f"Show {index + 1}", librarySectionID=2, leafCount=self.episodes, viewedLeafCount=0, addedAt=ADDED_AT + ratingKey, updatedAt=ADDED_AT + ratingKey, **extra)}/>'  # noqa: E501
+        )
+
+    def _episode(self, ratingKey, index, extra):
+        rand = random.Random(ratingKey)
+        showIndex, episodeIndex = divmod(index, self.episodes)
+        show, season = self.ratingKey('show', showIndex), self.ratingKey('season', showIndex)
+        duration = rand.randint(1200, 3600) * 1000
+        return (
+            f'<Video {attrs(ratingKey=ratingKey, key=f"/library/metadata/{ratingKey}", guid=f"plex://episode/{ratingKey:024x}", type="episode", title=f"Episode {episodeIndex + 1}", index=episodeIndex + 1, parentIndex=1, parentRatingKey=season, parentKey=f"/library/metadata/{season}", parentTitle="Season 1", grandparentRatingKey=show, grandparentKey=f"/library/metadata/{show}", grandparentTitle=f"Show {showIndex + 1}", librarySectionID=2, librarySectionTitle="TV Shows", contentRating=rand.choice(RATINGS), summary=f"Synthetic episode {episodeIndex + 1}. " * 3, viewCount=rand.choice((None, 1)), duration=duration, thumb=f"/library/metadata/{ratingKey}/thumb/{ADDED_AT}", addedAt=ADDED_AT + ratingKey, updatedAt=ADDED_AT + ratingKey, **extra)}>'  # noqa: E501
+            f'{self._media(ratingKey, rand, duration)}<Director {attrs(tag=f"Director {ratingKey % 500}")}/>'
+            f'</Video>'
+        )
+
+    def _artist(self, ratingKey, index, extra):
+        return (
+            f'<Directory {attrs(ratingKey=ratingKey, key=f"/library/metadata/{ratingKey}/children", guid=f"plex://artist/{ratingKey:024x}", type="artist", title=f"Artist {index + 1}", librarySectionID=3, librarySectionTitle="Music", summary=f"Synthetic artist number {index + 1}.", thumb=f"/library/metadata/{ratingKey}/thumb/{ADDED_AT}", addedAt=ADDED_AT + ratingKey, updatedAt=ADDED_AT + ratingKey, **extra)}>'  # noqa: E501
+            f'<Genre {attrs(tag=GENRES[ratingKey % len(GENRES)])}/></Directory>'
+        )
+
+    def _album(self, ratingKey, index, extra):
+        artist = self.ratingKey('artist', index)
+        return (
+            f'<Directory {attrs(ratingKey=ratingKey, key=f"/library/metadata/{ratingKey}/children", guid=f"plex://album/{ratingKey:024x}", type="album", title=f"Album {index + 1}", parentRatingKey=artist, parentKey=f"/library/metadata/{artist}", parentTitle=f"Artist {index + 1}", librarySectionID=3, leafCount=self.tracks, year=1960 + ratingKey % 65, addedAt=ADDED_AT + ratingKey, updatedAt=ADDED_AT + ratingKey, **extra)}/>'  # noqa: E501
+        )
+
+    def _track(self, ratingKey, index, extra):
+        rand = random.Random(ratingKey)
+        artistIndex, trackIndex = divmod(index, self.tracks)
+        artist, album = self.ratingKey('artist', artistIndex), self.ratingKey('album', artistIndex)
+        duration = rand.randint(120, 420) * 1000
+        return (
+            f'<Track {attrs(ratingKey=ratingKey, key=f"/library/metadata/{ratingKey}", guid=f"plex://track/{ratingKey:024x}", type="track", title=f"Track {trackIndex + 1}", index=trackIndex + 1, parentIndex=1, parentRatingKey=album, parentKey=f"/library/metadata/{album}", parentTitle=f"Album {artistIndex + 1}", grandparentRatingKey=artist, grandparentKey=f"/library/metadata/{artist}", grandparentTitle=f"Artist {artistIndex + 1}", librarySectionID=3, librarySectionTitle="Music", viewCount=rand.choice((None, 1, 5)), duration=duration, addedAt=ADDED_AT + ratingKey, updatedAt=ADDED_AT + ratingKey, **extra)}>'  # noqa: E501
+            f'{self._media(ratingKey, rand, duration, video=False)}</Track>'
+        )
+
+
+class SyntheticPlexServer:
+    """ Local HTTP server answering like a Plex Media Server with a :class:`SyntheticLibrary`.
+
+        Parameters:
+            latency (float): Seconds to wait before answering each request.
+            itemLatency (float): Additional seconds to wait per item returned.
+            host (str): Address to listen on (default 127.0.0.1).
+            port (int): Port to listen on (default 0, any free port).
+            **kwargs (dict): Library sizes passed to :class:`SyntheticLibrary`.
+
+        Example:
+
+            .. code-block:: python
+
+                with SyntheticPlexServer(movies=10000, latency=0.01) as server:
+                    plex = PlexServer(server.baseurl, token='synthetic')
+                    movies = plex.library.section('Movies').all()
+                    print(server.requests)
+
+    """
+    ROUTES = (
+        (r'/', '_root'),
+        (r'/identity', '_identity'),
+        (r'/library', '_libraryRoot'),
+        (r'/library/sections', '_sections'),
+        (r'/library/sections/(?P<section>\d+)', '_section'),
+        (r'/library/sections/(?P<section>\d+)/all', '_sectionAll'),
+        (r'/library/sections/(?P<section>\d+)/(collections|firstCharacter)', '_empty'),
+        (r'/library/metadata/(?P<keys>[\d,]+)', '_metadata'),
+        (r'/library/metadata/(?P<key>\d+)/children', '_children'),
+        (r'/library/metadata/(?P<key>\d+)/allLeaves', '_allLeaves'),
+        (r'/status/sessions', '_sessions'),
+        (r'/status/sessions/history/all', '_history'),
+        (r'/hubs', '_hubs'),
+        (r'/hubs/sections/(?P<section>\d+)', '_hubs'),
+    )
+
+    def __init__(self, latency=0.0, itemLatency=0.0, host='127.0.0.1', port=0, **kwargs):
+        self.library = SyntheticLibrary(**kwargs)
+        self.latency = latency
+        self.itemLatency = itemLatency
+        self.requests = 0
+        self._routes = [(re.compile(f'{pattern}/?$'), getattr(self, name)) for pattern, name in self.ROUTES]
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def baseurl(self):
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """ Starts serving requests in a background thread. Returns the baseurl of the server. """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.baseurl
+
+    def stop(self):
+        """ Stops the server. """
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread = None
+        self._httpd.server_close()
+
+    def serveForever(self):
+        """ Serves requests in the current thread until interrupted. """
+        self._httpd.serve_forever()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                status, body = server.respond(self.path, self.headers)
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/xml;charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_PUT = do_POST = do_DELETE = do_GET
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def respond(self, path, headers=None):
+        """ Returns the status code and body of the response to a request. """
+        with self._lock:
+            self.requests += 1
+        parts = urlsplit(path)
+        params = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        headers = headers or {}
+        start = int(headers.get('X-Plex-Container-Start') or params.get('X-Plex-Container-Start') or 0)
+        size = headers.get('X-Plex-Container-Size') or params.get('X-Plex-Container-Size')
+        size = int(size) if size is not None else None
+        for pattern, handler in self._routes:
+            match = pattern.match(parts.path)
+            if match:
+                result = handler(params=params, start=start, size=size, **match.groupdict())
+                if result is not None:
+                    body, count = result
+                    time.sleep(self.latency + self.itemLatency * count)
+                    return 200, body.encode('utf-8')
+        time.sleep(self.latency)
+        return 404, b'<html><head><title>Not Found</title></head><body><h1>404 Not Found</h1></body></html>'
+
+    def _container(self, elements, totalSize=None, start=0, **kwargs):
+        """ Returns the MediaContainer response of the elements and the number of elements. """
+        container = attrs(size=len(elements), totalSize=totalSize, offset=start if totalSize is not None else None, **kwargs)
+        return f'<?xml version="1.0" encoding="UTF-8"?>\n<MediaContainer {container}>{"".join(elements)}</MediaContainer>\n', len(elements)  # noqa: E501
+
+    def _page(self, libtype, start, size, **kwargs):
+        return self._container(self.library.items(libtype, start, size), self.library.count(libtype), start, **kwargs)
+
+    def _root(self, **kwargs):
+        return self._container(
+            [], friendlyName='Synthetic Plex Server', machineIdentifier=MACHINE_IDENTIFIER, version=VERSION,
+            platform='Linux', platformVersion='6.1', myPlex=1, myPlexUsername='synthetic@example.com',
+            multiuser=1, allowSync=1, transcoderVideo=1, updatedAt=ADDED_AT,
+        )
+
+    def _identity(self, **kwargs):
+        return self._container([], claimed=1, machineIdentifier=MACHINE_IDENTIFIER, version=VERSION)
+
+    def _libraryRoot(self, **kwargs):
+        directories = [f'<Directory {attrs(key=key, title=title)}/>' for key, title in
+                       (('sections', 'Library Sections'), ('recentlyAdded', 'Recently Added Content'))]
+        return self._container(directories, identifier='com.plexapp.plugins.library', title1='Plex Library')
+
+    def _sectionElement(self, key, stype, title, agent, scanner):
+        return (
+            f'<Directory {attrs(allowSync=1, key=key, type=stype, title=title, agent=agent, scanner=scanner, language="en-US", uuid=f"00000000-0000-0000-0000-{key:012d}", updatedAt=ADDED_AT, createdAt=ADDED_AT, scannedAt=ADDED_AT, content=1, directory=1, contentChangedAt=ADDED_AT, hidden=0)}>'  # noqa: E501
+            f'<Location {attrs(id=key, path=f"/media/{title}")}/></Directory>'
+        )
+
+    def _sections(self, **kwargs):
+        elements = [self._sectionElement(*section[:5]) for section in SECTIONS]
+        return self._container(elements, allowSync=0, title1='Plex Library')
+
+    def _findSection(self, section):
+        return next((s for s in SECTIONS if s[0] == int(section)), None)
+
+    def _section(self, section, **kwargs):
+        found = self._findSection(section)
+        if found is not None:
+            return self._container([], librarySectionID=found[0], title1=found[2])
+
+    def _sectionAll(self, section, params, start, size, **kwargs):
+        found = self._findSection(section)
+        if found is None:
+            return None
+        libtype = int(params.get('type', found[5]))
+        if libtype not in found[6]:
+            return self._container([], 0, start)
+        libtype = {1: 'movie', 2: 'show', 3: 'season', 4: 'episode', 8: 'artist', 9: 'album', 10: 'track'}[libtype]
+        title = params.get('title')
+        if title is not None:
+            # Only the title filter is supported, any other filter is ignored
+            ratingKeys = [self.library.ratingKey(libtype, i) for i in range(self.library.count(libtype))]
+            elements = [self.library.item(ratingKey) for ratingKey in ratingKeys]
+            elements = [element for element in elements if f'title="{title.lower()}' in element.lower()]
+            end = len(elements) if size is None else start + size
+            return self._container(elements[start:end], len(elements), start)
+        if params.get('sort', '').endswith(':desc'):
+            # Any descending sort returns the items by descending ratingKey (and addedAt)
+            ratingKeys = [self.library.ratingKey(libtype, i) for i in reversed(range(self.library.count(libtype)))]
+            return self._slice(ratingKeys, start, size)
+        return self._page(libtype, start, size, librarySectionID=found[0], librarySectionTitle=found[2])
+
+    def _empty(self, **kwargs):
+        return self._container([], 0)
+
+    def _metadata(self, keys, **kwargs):
+        elements = [self.library.item(int(key)) for key in keys.split(',')]
+        elements = [element for element in elements if element is not None]
+        if elements:
+            return self._container(elements)
+
+    def _slice(self, ratingKeys, start, size):
+        end = len(ratingKeys) if size is None else start + size
+        elements = [self.library.item(ratingKey) for ratingKey in ratingKeys[start:end]]
+        return self._container(elements, len(ratingKeys), start)
+
+    def _children(self, key, start, size, **kwargs):
+        libtype, ratingKeys = self.library.children(int(key))
+        if libtype is not None:
+            return self._slice(ratingKeys, start, size)
+
+    def _allLeaves(self, key, start, size, **kwargs):
+        ratingKeys = self.library.leaves(int(key))
+        if ratingKeys:
+            return self._slice(ratingKeys, start, size)
+
+    def _sessions(self, **kwargs):
+        elements = []
+        for i in range(self.library.sessions):
+            libtype = 'movie' if i % 2 else 'episode'
+            ratingKey = self.library.ratingKey(libtype, i % max(self.library.count(libtype), 1))
+            element = self.library.item(ratingKey, sessionKey=i + 1, viewOffset=60000 * (i + 1))
+            closing = element.rindex('</')
+            session = (
+                f'<User {attrs(id=i + 1, title=f"user{i + 1}", thumb=f"https://plex.tv/users/{i + 1}/avatar")}/>'
+                f'<Player {attrs(address=f"10.0.0.{i + 1}", machineIdentifier=f"player-{i + 1}", product="Plex Web", platform="Chrome", state="playing", title=f"Player {i + 1}", local=1)}/>'  # noqa: E501
+                f'<Session {attrs(id=f"session-{i + 1}", bandwidth=10000, location="lan")}/>'
+            )
+            elements.append(element[:closing] + session + element[closing:])
+        return self._container(elements)
+
+    def _history(self, start, size, **kwargs):
+        total = self.library.history
+        end = total if size is None else min(total, start + size)
+        elements = []
+        for i in range(start, end):
+            ratingKey = self.library.ratingKey('movie', i % max(self.library.movies, 1))
+            elements.append(
+                f'<Video {attrs(historyKey=f"/status/sessions/history/{i + 1}", key=f"/library/metadata/{ratingKey}", ratingKey=ratingKey, librarySectionID=1, title=f"Movie {ratingKey}", type="movie", viewedAt=ADDED_AT + 86400 * 365 - i * 60, accountID=1 + i % 3, deviceID=1 + i % 5)}/>'  # noqa: E501
+            )
+        return self._container(elements, total, start)
+
+    def _hubs(self, section=None, **kwargs):
+        hubs = []
+        for key, stype, title, agent, scanner, libtype, libtypes in SECTIONS:
+            if section is not None and key != int(section):
+                continue
+            itemtype = {1: 'movie', 2: 'show', 8: 'artist'}[libtype]
+            count = self.library.count(itemtype)
+            ratingKeys = [self.library.ratingKey(itemtype, i) for i in range(max(count - 10, 0), count)][::-1]
+            items = ''.join(self.library.item(ratingKey) for ratingKey in ratingKeys)
+            hubKey = '/library/metadata/' + ','.join(map(str, ratingKeys))
+            hubs.append(
+                f'<Hub {attrs(hubKey=hubKey, key=f"/hubs/home/recentlyAdded?type={libtype}&sectionID={key}", title=f"Recently Added in {title}", type=stype, hubIdentifier=f"home.{stype}.recent", context="hub.home.recent", size=len(ratingKeys), more=int(count > 10), style="shelf")}>'  # noqa: E501
+                f'{items}</Hub>'
+            )
+        return self._container(hubs)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=32400, help='Port to listen on')
+    parser.add_argument('--movies', type=int, default=1000, help='Number of movies')
+    parser.add_argument('--shows', type=int, default=100, help='Number of shows')
+    parser.add_argument('--episodes', type=int, default=10, help='Number of episodes per show')
+    parser.add_argument('--artists', type=int, default=100, help='Number of artists')
+    parser.add_argument('--tracks', type=int, default=10, help='Number of tracks per artist')
+    parser.add_argument('--sessions', type=int, default=5, help='Number of playing sessions')
+    parser.add_argument('--history', type=int, default=1000, help='Number of history entries')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds to wait before each response')
+    parser.add_argument('--item-latency', type=float, default=0.0, help='Additional seconds to wait per item')
+    opts = parser.parse_args()
+    server = SyntheticPlexServer(
+        latency=opts.latency, itemLatency=opts.item_latency, host=opts.host, port=opts.port,
+        movies=opts.movies, shows=opts.shows, episodes=opts.episodes, artists=opts.artists,
+        tracks=opts.tracks, sessions=opts.sessions, history=opts.history,
+    )
+    print(f'Serving a synthetic Plex server on {server.baseurl}')
+    try:
+        server.serveForever()
+    except KeyboardInterrupt:
+        pass
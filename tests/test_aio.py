@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from plexapi.base import MediaContainer
+from plexapi.video import Movie
+
+pytest.importorskip("aiohttp")
+from plexapi.aio import AsyncPlexServer  # noqa: E402
+
+
+def _run(plex, coro):
+    async def main():
+        async with AsyncPlexServer(plex._baseurl, plex._token) as aplex:
+            return await coro(aplex)
+    return asyncio.run(main())
+
+
+def test_aio_server_connect(plex):
+    async def connect(aplex):
+        return aplex.machineIdentifier, aplex.server
+    machineIdentifier, server = _run(plex, connect)
+    assert machineIdentifier == plex.machineIdentifier
+    assert server._baseurl == plex._baseurl
+
+
+def test_aio_fetchItems(plex, movies):
+    async def fetch(aplex):
+        return await asyncio.gather(
+            aplex.fetchItems(f"/library/sections/{movies.key}/all", cls=Movie, container_size=1),
+            aplex.fetchItem(f"/library/sections/{movies.key}/all", title="Elephants Dream"),
+        )
+    items, movie = _run(plex, fetch)
+    assert isinstance(items, MediaContainer)
+    assert len(items) == items.totalSize == len(movies.all())
+    assert all(isinstance(item, Movie) for item in items)
+    assert movie.title == "Elephants Dream"
+    assert movie._server.machineIdentifier == plex.machineIdentifier
+
+
+def test_aio_library_section_search(plex, movies):
+    async def search(aplex):
+        sections = await aplex.library.sections()
+        section = await aplex.library.section(movies.title)
+        return sections, section, await section.search(sort="titleSort:desc", maxresults=2)
+    sections, section, results = _run(plex, search)
+    assert len(sections) == len(plex.library.sections())
+    assert section.key == movies.key
+    assert [item.ratingKey for item in results] == [
+        item.ratingKey for item in movies.search(sort="titleSort:desc", maxresults=2)
+    ]
+
+
+def test_aio_synthetic_server():
+    from .synthetic import SyntheticPlexServer
+
+    async def main(baseurl):
+        async with AsyncPlexServer(baseurl, "token") as aplex:
+            items = await aplex.fetchItems("/library/sections/1/all", container_size=7)
+            limited = await aplex.fetchItems("/library/sections/1/all", container_size=7, maxresults=10)
+            offset = await aplex.fetchItems("/library/sections/1/all", container_start=20, container_size=4)
+            movie = await aplex.fetchItem("/library/sections/1/all", title="Movie 3")
+            section = await aplex.library.sectionByID(1)
+            return aplex.machineIdentifier, items, limited, offset, movie, await section.all(container_size=10)
+
+    with SyntheticPlexServer(movies=25, shows=1, episodes=1, artists=1, tracks=1) as synthetic:
+        machineIdentifier, items, limited, offset, movie, movies = asyncio.run(main(synthetic.baseurl))
+    assert machineIdentifier
+    assert len(items) == 25 and all(isinstance(item, Movie) for item in items)
+    assert [item.ratingKey for item in limited] == [item.ratingKey for item in items[:10]]
+    assert [item.ratingKey for item in offset] == [item.ratingKey for item in items[20:]]
+    assert movie.title == "Movie 3"
+    assert items[0].librarySectionID == 1
+    assert [item.ratingKey for item in movies] == [item.ratingKey for item in items]
+
+
+def test_aio_query_events():
+    from plexapi import metrics
+    from plexapi.exceptions import NotFound
+
+    from .synthetic import SyntheticPlexServer
+
+    async def main(baseurl):
+        async with AsyncPlexServer(baseurl, "token") as aplex:
+            await aplex.fetchItems("/library/sections/1/all")
+            with pytest.raises(NotFound):
+                await aplex.query("/missing")
+
+    events = []
+    metrics.addListener(events.append)
+    try:
+        with SyntheticPlexServer(movies=3) as synthetic:
+            asyncio.run(main(synthetic.baseurl))
+    finally:
+        metrics.removeListener(events.append)
+    queries = [event for event in events if event.type == "query"]
+    assert [(event.method, event.endpoint, event.status) for event in queries] == [
+        ("GET", "/", 200),
+        ("GET", "/library/sections/{id}/all", 200),
+        ("GET", "/missing", 404),
+    ]
+    assert all(event.source == "server" and event.latency is not None for event in queries)
+    assert queries[1].bytes > 0 and queries[1].parseTime > 0
+    assert queries[2].error == "NotFound"
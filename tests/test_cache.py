@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+import pytest
+from plexapi.cache import DiskCache, FilterCache, MemoryCache, ResponseCache
+from plexapi.server import PlexServer
+
+BASEURL = "http://plexserver:32400"
+SERVER_XML = '<MediaContainer friendlyName="Test Server" machineIdentifier="abc123" version="1.40.0"/>'
+SECTIONS_XML = '<MediaContainer size="1"><Directory key="1" type="movie" title="Movies"/></MediaContainer>'
+
+
+@pytest.fixture(params=["memory", "disk"])
+def cached_plex(request, requests_mock, tmp_path):
+    backend = MemoryCache() if request.param == "memory" else DiskCache(str(tmp_path))
+    requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+    return PlexServer(BASEURL, token="faketoken", cache=ResponseCache(backend))
+
+
+def test_cache_fresh_response(cached_plex, requests_mock):
+    requests_mock.get(f"{BASEURL}/library/sections", text=SECTIONS_XML, headers={"ETag": "abc"})
+    first = cached_plex.query("/library/sections")
+    second = cached_plex.query("/library/sections")
+    assert requests_mock.call_count == 2  # server root and sections
+    assert first[0].attrib["title"] == second[0].attrib["title"] == "Movies"
+
+
+def test_cache_hit_returns_new_data(cached_plex, requests_mock):
+    requests_mock.get(f"{BASEURL}/library/sections", text=SECTIONS_XML)
+    first = cached_plex.query("/library/sections")
+    first[0].attrib["title"] = "Changed"
+    second = cached_plex.query("/library/sections")
+    assert second is not first
+    assert second[0].attrib["title"] == "Movies"
+    assert cached_plex.query("/library/sections")[0].attrib["title"] == "Movies"
+
+
+def test_cache_revalidate_response(cached_plex, requests_mock):
+    cached_plex._cache.rules.clear()
+    cached_plex._cache.defaultTTL = 0
+    requests_mock.get(f"{BASEURL}/library/sections", text=SECTIONS_XML, headers={"ETag": "abc"})
+    cached_plex.query("/library/sections")
+    requests_mock.get(f"{BASEURL}/library/sections", status_code=304)
+    data = cached_plex.query("/library/sections")
+    assert requests_mock.last_request.headers["If-None-Match"] == "abc"
+    assert data[0].attrib["title"] == "Movies"
+
+
+def test_cache_uncached_and_cleared(cached_plex, requests_mock):
+    requests_mock.get(f"{BASEURL}/library/sections", text=SECTIONS_XML)
+    requests_mock.get(f"{BASEURL}/status/sessions", text=SECTIONS_XML)
+    requests_mock.put(f"{BASEURL}/library/sections/1", text="")
+    cached_plex.query("/status/sessions")
+    cached_plex.query("/status/sessions")
+    cached_plex.query("/library/sections")
+    cached_plex.query("/library/sections/1", method=cached_plex._session.put)
+    cached_plex.query("/library/sections")
+    assert requests_mock.call_count == 6
+
+
+def test_cache_filter_metadata(requests_mock, tmp_path):
+    meta = (
+        '<MediaContainer size="0"><Meta><Type key="/library/sections/1/all?type=1" type="{type}" title="Movies">'
+        '<Filter filter="genre" filterType="string" key="/library/sections/1/genre?type=1" title="Genre" type="filter"/>'
+        '<Sort key="titleSort" title="Title"/><Field key="title" title="Title" type="string"/></Type>'
+        '<FieldType type="string"><Operator key="=" title="contains"/></FieldType></Meta></MediaContainer>'
+    )
+    requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+    requests_mock.get(f"{BASEURL}/library", text='<MediaContainer title1="Plex Library"/>')
+    requests_mock.get(f"{BASEURL}/library/sections/1/all?includeMeta=1", text=meta.format(type="movie"))
+    requests_mock.get(f"{BASEURL}/library/sections/1/collections?includeMeta=1", text=meta.format(type="collection"))
+    requests_mock.get(
+        f"{BASEURL}/library/sections/1/genre?type=1",
+        text='<MediaContainer><Directory key="/library/sections/1/all?genre=1" title="Drama" type="genre"/></MediaContainer>',
+    )
+
+    def section(scannedAt):
+        requests_mock.get(
+            f"{BASEURL}/library/sections",
+            text=f'<MediaContainer><Directory key="1" type="movie" title="Movies" uuid="abc" agent="tv.plex.agents.movie" '
+                 f'updatedAt="1600000000" scannedAt="{scannedAt}"/></MediaContainer>',
+        )
+        plex = PlexServer(BASEURL, token="faketoken", filterCache=FilterCache(DiskCache(str(tmp_path))))
+        section = plex.library.sectionByID(1)
+        requests_mock.reset_mock()
+        return section
+
+    movies = section(1600000000)
+    assert [f.type for f in movies.filterTypes()] == ["movie", "collection"]
+    assert [c.title for c in movies.listFilterChoices("genre")] == ["Drama"]
+    assert requests_mock.call_count == 3
+
+    # Another process with the same section version does not request the metadata again
+    movies = section(1600000000)
+    assert [f.type for f in movies.filterTypes()] == ["movie", "collection"]
+    assert movies.listSorts()[0].key == "titleSort"
+    assert [c.title for c in movies.listFilterChoices("genre")] == ["Drama"]
+    assert requests_mock.call_count == 0
+
+    # The metadata is requested again once the section is scanned
+    movies = section(1600000100)
+    movies.filterTypes()
+    assert requests_mock.call_count == 2
+
+
+def test_cache_filter_metadata_with_response_cache(requests_mock, tmp_path):
+    meta = (
+        '<MediaContainer size="0"><Meta><Type key="/library/sections/1/all?type=1" type="movie" title="Movies"/>'
+        '</Meta></MediaContainer>'
+    )
+
+    def sections(scannedAt):
+        requests_mock.get(
+            f"{BASEURL}/library/sections",
+            text=f'<MediaContainer><Directory key="1" type="movie" title="Movies" uuid="abc" agent="tv.plex.agents.movie" '
+                 f'updatedAt="1600000000" scannedAt="{scannedAt}"/></MediaContainer>',
+        )
+
+    requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+    requests_mock.get(f"{BASEURL}/library", text='<MediaContainer title1="Plex Library"/>')
+    requests_mock.get(f"{BASEURL}/library/sections/1/all?includeMeta=1", text=meta)
+    requests_mock.get(f"{BASEURL}/library/sections/1/collections?includeMeta=1", text=meta)
+    sections(1600000000)
+    filterCache = FilterCache(DiskCache(str(tmp_path / "filters")))
+    plex = PlexServer(BASEURL, token="faketoken", cache=ResponseCache(), filterCache=filterCache)
+    plex.library.sectionByID(1).filterTypes()
+
+    # The section is scanned while the library sections are still served from the response cache
+    sections(1600000100)
+    plex = PlexServer(BASEURL, token="faketoken", cache=plex._cache, filterCache=filterCache)
+    movies = plex.library.sectionByID(1)
+    assert movies.scannedAt.timestamp() == 1600000000
+    requests_mock.reset_mock()
+    movies.filterTypes()
+    # The sections and the outdated metadata are requested again without the response cache
+    assert [request.path for request in requests_mock.request_history] == [
+        "/library/sections", "/library/sections/1/all", "/library/sections/1/collections",
+    ]
+    assert requests_mock.request_history[0].headers["Cache-Control"] == "no-cache"
+
+
+def test_cache_shared_between_servers(requests_mock, tmp_path):
+    other = "http://otherserver:32400"
+    cache = ResponseCache(DiskCache(str(tmp_path)))
+    requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+    requests_mock.get(f"{other}/", text=SERVER_XML.replace("abc123", "def456"))
+    requests_mock.get(f"{BASEURL}/library/sections", text=SECTIONS_XML)
+    requests_mock.get(f"{other}/library/sections", text=SECTIONS_XML.replace("Movies", "Shows"))
+    requests_mock.put(f"{other}/library/sections/1", text="")
+    plex = PlexServer(BASEURL, token="faketoken", cache=cache)
+    otherPlex = PlexServer(other, token="faketoken", cache=cache)
+    assert plex.query("/library/sections")[0].attrib["title"] == "Movies"
+    assert otherPlex.query("/library/sections")[0].attrib["title"] == "Shows"
+
+    # Updating a server only clears the cached responses of that server
+    otherPlex.query("/library/sections/1", method=otherPlex._session.put)
+    requests_mock.reset_mock()
+    assert plex.query("/library/sections")[0].attrib["title"] == "Movies"
+    assert requests_mock.call_count == 0
+    assert otherPlex.query("/library/sections")[0].attrib["title"] == "Shows"
+    assert requests_mock.call_count == 1
+
+
+def test_cache_default_rules():
+    cache = ResponseCache()
+    assert cache.ttl("/hubs") == cache.ttl("/hubs?count=10") == 60
+    assert cache.ttl("/hubs/search?query=cars") is None
+    assert cache.ttl("/hubs/sections/1") is None
+
+
+def test_cache_key_without_token(requests_mock, tmp_path):
+    requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+    requests_mock.get(f"{BASEURL}/library/sections", text=SECTIONS_XML)
+    plex = PlexServer(BASEURL, token="SECRETTOKEN123", cache=ResponseCache(DiskCache(str(tmp_path))))
+    plex.query("/library/sections")
+    files = list(tmp_path.iterdir())
+    assert files and not any(b"SECRETTOKEN123" in path.read_bytes() for path in files)
+    # The entries of another user are kept apart
+    other = PlexServer(BASEURL, token="OTHERTOKEN", cache=plex._cache)
+    requests_mock.reset_mock()
+    other.query("/library/sections")
+    assert requests_mock.call_count == 1
@@ -0,0 +1,109 @@
+from datetime import datetime
+
+import pytest
+from xml.etree import ElementTree
+
+from plexapi.columns import ColumnReader
+from plexapi.exceptions import BadRequest
+from plexapi.server import PlexServer
+
+from .synthetic import SyntheticPlexServer
+
+FIELDS = ["ratingKey", "title", "year", "addedAt", "originallyAvailableAt", "rating", "viewCount",
+          "Media__videoResolution", "Media__Part__size"]
+
+
+def test_columns_reader():
+    numpy = pytest.importorskip("numpy")
+    data = ElementTree.fromstring(
+        '<MediaContainer>'
+        '<Video ratingKey="1" title="A" year="2001" addedAt="1600000000" rating="7.5" viewCount="2">'
+        '<Media videoResolution="4k"><Part size="1000"/></Media><Genre tag="Drama"/></Video>'
+        '<Video ratingKey="2" title="B" originallyAvailableAt="2002-02-02"/>'
+        '</MediaContainer>'
+    )
+    columns = ColumnReader(FIELDS + ["Genre__tag"]).read(data).columns("numpy")
+    assert list(columns) == FIELDS + ["Genre__tag"]
+    assert columns["ratingKey"].dtype == numpy.int64
+    assert columns["year"].dtype == numpy.float64 and numpy.isnan(columns["year"][1])
+    assert columns["addedAt"][0] == numpy.datetime64(1600000000, "s") and numpy.isnat(columns["addedAt"][1])
+    assert columns["originallyAvailableAt"][1] == numpy.datetime64("2002-02-02")
+    assert list(columns["Media__videoResolution"]) == ["4k", None]
+    assert columns["Media__Part__size"][0] == 1000
+    assert list(columns["Genre__tag"]) == ["Drama", None]
+    streams = ColumnReader(["Media__Part__Stream__frameRate", "Media__Part__deepAnalysisVersion"]).read(
+        ElementTree.fromstring(
+            '<MediaContainer><Video><Media><Part deepAnalysisVersion="6"><Stream frameRate="23.976"/></Part>'
+            '</Media></Video><Video/></MediaContainer>'
+        )
+    ).columns("numpy")
+    assert streams["Media__Part__Stream__frameRate"][0] == 23.976 and numpy.isnan(streams["Media__Part__Stream__frameRate"][1])
+    assert streams["Media__Part__deepAnalysisVersion"][0] == 6
+    with pytest.raises(BadRequest):
+        ColumnReader(["Media__"])
+    with pytest.raises(BadRequest):
+        ColumnReader(["title"]).columns("pandas")
+
+
+def values(array):
+    return array.to_pylist() if hasattr(array, "to_pylist") else array.tolist()
+
+
+@pytest.mark.parametrize("backend", ["numpy", "arrow"])
+def test_columns_library_section(backend):
+    pytest.importorskip("pyarrow" if backend == "arrow" else "numpy")
+    with SyntheticPlexServer(movies=250, shows=2, episodes=3, artists=1, tracks=1) as synthetic:
+        plex = PlexServer(synthetic.baseurl, token="token")
+        section = plex.library.sectionByID(1)
+        movies = section.search(container_size=100)
+        columns = section.toColumns(FIELDS, backend=backend, container_size=100, workers=2)
+        assert len(columns["ratingKey"]) == len(movies) == 250
+        assert values(columns["ratingKey"]) == [movie.ratingKey for movie in movies]
+        assert values(columns["Media__Part__size"]) == [movie.media[0].parts[0].size for movie in movies]
+        assert len(section.toColumns(["title"], backend=backend, maxresults=120, container_size=50)["title"]) == 120
+        recent = section.toColumns(["year"], backend=backend, year__gte=2020)["year"]
+        assert len(recent) == len([movie for movie in movies if movie.year >= 2020])
+        episodes = plex.library.sectionByID(2).toColumns(["grandparentTitle", "index"], libtype="episode", backend=backend)
+        assert values(episodes["index"]) == [1, 2, 3, 1, 2, 3]
+
+
+@pytest.mark.parametrize("backend", ["numpy", "arrow"])
+def test_columns_query(backend):
+    pytest.importorskip("pyarrow" if backend == "arrow" else "numpy")
+    data = ElementTree.fromstring(
+        '<MediaContainer>' + "".join(
+            f'<Video ratingKey="{k}" title="Movie {k}" year="{1995 + k}" addedAt="{1600000000 + k}" '
+            f'{"" if k % 3 else f"lastViewedAt={chr(34)}{1500000000 + k}{chr(34)} "}rating="{k % 5 + 0.5}">'
+            f'<Media videoResolution="{"4k" if k % 2 else "1080"}" videoCodec="{"hevc" if k % 4 < 2 else "h264"}">'
+            f'<Part size="{k * 10 ** 10}"/></Media></Video>' for k in range(1, 13)
+        ) + '</MediaContainer>'
+    )
+    fields = ["ratingKey", "title", "year", "addedAt", "lastViewedAt", "rating", "Media__videoResolution",
+              "Media__videoCodec", "Media__Part__size"]
+    columns = ColumnReader(fields).read(data).columns(backend)
+    assert columns.size == 12
+
+    def keys(**kwargs):
+        return values(columns.filter(**kwargs)["ratingKey"])
+
+    assert keys(year__gte=2000, year__lte=2002) == [5, 6, 7]
+    assert keys(title__icontains="MOVIE 1") == [1, 10, 11, 12]
+    assert keys(title__regex=r"Movie \d$", Media__videoResolution="4k") == [1, 3, 5, 7, 9]
+    assert keys(Media__videoCodec__in=["hevc"], Media__Part__size__gt=4 * 10 ** 10) == [5, 8, 9, 12]
+    assert keys(lastViewedAt__exists=True) == [3, 6, 9, 12]
+    assert keys(lastViewedAt__lt=datetime.fromtimestamp(1500000007)) == [3, 6]
+    assert keys(addedAt__gte=1600000011) == [11, 12]
+    assert values(columns.sort("rating", reverse=True).take([0, 1])["ratingKey"]) == [4, 9]
+    assert values(columns.sort("lastViewedAt")["ratingKey"])[:5] == [3, 6, 9, 12, 1]
+    with pytest.raises(BadRequest):
+        columns.filter(unknown=1)
+
+    groups = columns.groupBy("Media__videoResolution", movies=("ratingKey", "count"), size=("Media__Part__size", "sum"),
+                             viewed=("lastViewedAt", "count"), rating=("rating", "max"))
+    assert groups["Media__videoResolution"].tolist() == ["4k", "1080"]
+    assert groups["movies"].tolist() == [6, 6]
+    assert groups["size"].tolist() == [36 * 10 ** 10, 42 * 10 ** 10]
+    assert groups["viewed"].tolist() == [2, 2]
+    assert groups["rating"].tolist() == [4.5, 4.5]
+    with pytest.raises(BadRequest):
+        columns.groupBy("Media__videoCodec", title=("title", "sum"))
@@ -34,6 +34,39 @@ def test_fetch_items_with_media_container(show):
     assert some_episodes.totalSize == len(all_episodes)
 
 
+def test_fetch_items_concurrent_pages(show):
+    key = f"{show.key}/allLeaves"
+    all_episodes = show.fetchItems(key, container_size=2)
+    concurrent_episodes = show.fetchItems(key, container_size=2, workers=4)
+    assert [e.ratingKey for e in concurrent_episodes] == [e.ratingKey for e in all_episodes]
+    assert concurrent_episodes.size == len(all_episodes)
+    assert concurrent_episodes.offset == 0
+    assert concurrent_episodes.totalSize == len(all_episodes)
+    some_episodes = show.fetchItems(key, container_size=2, maxresults=3, workers=4)
+    assert [e.ratingKey for e in some_episodes] == [e.ratingKey for e in all_episodes[:3]]
+    assert some_episodes.size == 3
+
+
+def test_iter_items(show):
+    key = f"{show.key}/allLeaves"
+    all_episodes = show.fetchItems(key)
+    episodes = show.iterItems(key, container_size=2)
+    assert not isinstance(episodes, list)
+    assert [e.ratingKey for e in episodes] == [e.ratingKey for e in all_episodes]
+    some_episodes = list(show.iterItems(key, container_size=2, maxresults=3))
+    assert [e.ratingKey for e in some_episodes] == [e.ratingKey for e in all_episodes[:3]]
+
+
+def test_stream_items(show):
+    key = f"{show.key}/allLeaves"
+    all_episodes = show.fetchItems(key)
+    episodes = show.streamItems(key, container_size=2)
+    assert not isinstance(episodes, list)
+    assert [e.ratingKey for e in episodes] == [e.ratingKey for e in all_episodes]
+    some_episodes = list(show.streamItems(key, container_size=2, maxresults=3))
+    assert [e.ratingKey for e in some_episodes] == [e.ratingKey for e in all_episodes[:3]]
+
+
 def test_find_items_empty_data(plex):
     result = plex.findItems(Element(""), rtag="foo")
     assert len(result) == 0
@@ -61,3 +94,256 @@ def test_build_query_key(plex):
     assert query_key.startswith(key_with_query)
     assert '&includeGuids=1' in query_key
     assert f'&{"&".join(query_params)}' in query_key
+
+
+def test_data_fields_lazy_decoding():
+    from plexapi import utils
+    from plexapi.video import Movie
+
+    data = utils.parseXMLString(
+        b'<Video ratingKey="1" key="/library/metadata/1" type="movie" title="Movie" '
+        b'addedAt="1600000000" originallyAvailableAt="2020-01-31" duration="5400000"/>'
+    )
+    movie = Movie(None, data, initpath="/library/metadata/1")
+    assert "ratingKey" not in movie.__dict__
+    assert movie.ratingKey == 1
+    assert movie.__dict__["ratingKey"] == 1
+    assert movie.titleSort == "Movie"
+    assert movie.viewCount == 0
+    assert movie.addedAt.year == 2020
+    assert movie.originallyAvailableAt.day == 31
+    assert "duration" in utils.toJson(movie)
+    assert movie.listType == "video"
+    assert '"listType": "video"' in utils.toJson(movie)
+    movie.title = "Renamed"
+    assert movie.title == "Renamed"
+    assert Movie(None, None).ratingKey is None
+
+
+def test_data_fields_partial_reload(requests_mock):
+    from plexapi.server import PlexServer
+
+    baseurl = "http://plexserver:32400"
+    requests_mock.get(f"{baseurl}/", text='<MediaContainer machineIdentifier="abc123" version="1.40.0"/>')
+    requests_mock.get(
+        f"{baseurl}/library/sections/1/all",
+        text='<MediaContainer size="1"><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+             'title="Movie" librarySectionTitle="Movies" year="2020"/></MediaContainer>',
+    )
+    requests_mock.get(
+        f"{baseurl}/library/metadata/1",
+        text='<MediaContainer size="1"><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+             'title="Movie (Full)" studio="Studio"/></MediaContainer>',
+    )
+    plex = PlexServer(baseurl, token="token")
+    movie = plex.fetchItem("/library/sections/1/all")
+    assert movie.title == "Movie"
+    assert movie.isPartialObject()
+    # Accessing a missing attribute reloads the full object
+    assert movie.studio == "Studio"
+    assert movie.title == "Movie (Full)"
+    # Attributes missing from the full object keep their partial value
+    assert movie.librarySectionTitle == "Movies"
+    assert movie.year == 2020
+
+
+def test_compact_partial_object(requests_mock):
+    from plexapi.server import PlexServer
+
+    baseurl = "http://plexserver:32400"
+    requests_mock.get(f"{baseurl}/", text='<MediaContainer machineIdentifier="abc123" version="1.40.0"/>')
+    requests_mock.get(
+        f"{baseurl}/library/sections/1/all",
+        text='<MediaContainer size="1"><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+             'title="Movie" contentRating="PG" year="2020"><Media videoCodec="h264"/></Video></MediaContainer>',
+    )
+    requests_mock.get(
+        f"{baseurl}/library/metadata/1",
+        text='<MediaContainer size="1"><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+             'title="Movie" studio="Studio"><Media videoCodec="hevc"/></Video></MediaContainer>',
+    )
+    plex = PlexServer(baseurl, token="token")
+    movie = plex.fetchItem("/library/sections/1/all").compact()
+    other = plex.fetchItem("/library/sections/1/all").compact()
+    assert movie._data is other._data
+    assert "title" not in movie.__dict__
+    assert movie.title == "Movie"
+    assert movie.contentRating is other.contentRating
+    assert movie.year == 2020
+    assert movie.isPartialObject()
+    assert requests_mock.call_count == 3
+    # Accessing a child element reloads the full object
+    assert movie.media[0].videoCodec == "hevc"
+    assert "_record" not in movie.__dict__
+    assert movie.studio == "Studio"
+    assert movie.year == 2020
+
+
+def test_compact_config(requests_mock, monkeypatch):
+    from plexapi import CONFIG
+    from plexapi.server import PlexServer
+
+    get = CONFIG.get
+    monkeypatch.setattr(CONFIG, "get", lambda key, *args: True if key == "plexapi.compact" else get(key, *args))
+    baseurl = "http://plexserver:32400"
+    movie = '<Video ratingKey="1" key="/library/metadata/1" type="movie" title="Movie"><Media videoCodec="h264"/></Video>'
+    requests_mock.get(f"{baseurl}/", text='<MediaContainer machineIdentifier="abc123" version="1.40.0"/>')
+    requests_mock.get(f"{baseurl}/library/sections/1/all", text=f'<MediaContainer size="1">{movie}</MediaContainer>')
+    requests_mock.get(f"{baseurl}/library/metadata/1", text=f'<MediaContainer size="1">{movie}</MediaContainer>')
+    plex = PlexServer(baseurl, token="token")
+    assert "_record" in plex.fetchItem("/library/sections/1/all").__dict__
+    # A full object is not compacted and does not reload its child elements
+    full = plex.fetchItem(plex.fetchItem("/library/sections/1/all")._details_key)
+    assert full.isFullObject() and "_record" not in full.__dict__
+    requests_mock.reset_mock()
+    assert full.media[0].videoCodec == "h264"
+    assert requests_mock.call_count == 0
+
+
+def test_compile_attrs():
+    from plexapi import utils
+    from plexapi.base import PlexObject
+
+    data = utils.parseXMLString(
+        b'<MediaContainer>'
+        b'<Video title="Alpha" year="1999" rating="7.5"><Media videoCodec="h264"><Part container="mkv"/></Media></Video>'
+        b'<Video title="Beta" year="2005"><Genre tag="Comedy"/><Media videoCodec="hevc"/></Video>'
+        b'</MediaContainer>'
+    )
+    obj = PlexObject(None, None)
+
+    def titles(**kwargs):
+        check = obj._compileAttrs(**kwargs)
+        return [elem.attrib["title"] for elem in data if check(elem)]
+
+    assert titles(year__gte=2000) == ["Beta"]
+    assert titles(year__gte=1990, year__lte=2000) == ["Alpha"]
+    assert titles(rating__gt=7) == ["Alpha"]
+    assert titles(rating=None) == ["Beta"]
+    assert titles(TITLE__iregex="^a") == ["Alpha"]
+    assert titles(Media__Part__container="mkv") == ["Alpha"]
+    assert titles(Genre__tag__icontains="com", etag="Video") == ["Beta"]
+    assert titles(Media__videoCodec__in=("h264", "hevc")) == ["Alpha", "Beta"]
+
+
+def test_reload_all(requests_mock):
+    from plexapi.base import reloadItems
+    from plexapi.server import PlexServer
+
+    baseurl = "http://plexserver:32400"
+    requests_mock.get(f"{baseurl}/", text='<MediaContainer machineIdentifier="abc123" version="1.40.0"/>')
+    requests_mock.get(
+        f"{baseurl}/library/sections/1/all",
+        text='<MediaContainer size="3">' + "".join(
+            f'<Video ratingKey="{i}" key="/library/metadata/{i}" type="movie" title="Movie {i}"/>' for i in (1, 2, 3)
+        ) + '</MediaContainer>',
+    )
+    for keys in ("1,2", "3"):
+        requests_mock.get(
+            f"{baseurl}/library/metadata/{keys}",
+            text='<MediaContainer>' + "".join(
+                f'<Video ratingKey="{i}" key="/library/metadata/{i}" type="movie" title="Movie {i}" studio="Studio {i}">'
+                f'<Chapter id="{i}" index="1"/></Video>' for i in keys.split(",")[::-1]
+            ) + '</MediaContainer>',
+        )
+    plex = PlexServer(baseurl, token="token")
+    movies = plex.fetchItems("/library/sections/1/all")
+    assert movies.reloadAll(chunksize=2) is movies
+    assert requests_mock.call_count == 4
+    assert "includeChapters=1" in requests_mock.request_history[-1].url
+    assert [movie.studio for movie in movies] == ["Studio 1", "Studio 2", "Studio 3"]
+    assert all(movie.isFullObject() for movie in movies)
+    assert [len(movie.chapters) for movie in movies] == [1, 1, 1]
+    assert requests_mock.call_count == 4
+    assert reloadItems(movies[2:], workers=2) == movies[2:]
+    assert requests_mock.call_count == 5
+
+
+def test_identity_map(requests_mock):
+    from plexapi.cache import IdentityMap
+    from plexapi.server import PlexServer
+
+    baseurl = "http://plexserver:32400"
+    requests_mock.get(f"{baseurl}/", text='<MediaContainer machineIdentifier="abc123" version="1.40.0"/>')
+    requests_mock.get(
+        f"{baseurl}/library/sections/1/all",
+        text='<MediaContainer size="1"><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+             'title="Movie" year="2020" userRating="8.0"/></MediaContainer>',
+    )
+    requests_mock.get(
+        f"{baseurl}/hubs/home/recentlyAdded",
+        text='<MediaContainer size="1"><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+             'title="Movie (Hub)" year="2020" viewCount="1"/></MediaContainer>',
+    )
+    requests_mock.get(
+        f"{baseurl}/library/metadata/1",
+        text='<MediaContainer size="1"><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+             'title="Movie (Full)" studio="Studio" year="2020" userRating="8.0"><Genre tag="Drama"/></Video>'
+             '</MediaContainer>',
+    )
+    plex = PlexServer(baseurl, token="token", identityMap=IdentityMap())
+    movie = plex.fetchItem("/library/sections/1/all")
+    hub = plex.fetchItem("/hubs/home/recentlyAdded")
+    # The partial object is reused and refreshed, the attributes missing from the new data are missing
+    assert hub is movie
+    assert movie._initpath == "/library/sections/1/all"
+    assert movie.title == "Movie (Hub)"
+    assert movie.viewCount == 1
+    assert requests_mock.call_count == 3
+    assert movie.studio == "Studio"
+    assert movie.isFullObject()
+    assert requests_mock.call_count == 4
+    # A full object is refreshed with the attributes of the partial data, keeping its child elements
+    initpath = movie._initpath
+    assert plex.fetchItem("/library/sections/1/all") is movie
+    assert movie._initpath == initpath and movie.isFullObject()
+    assert movie.title == "Movie"
+    assert movie.userRating == 8.0
+    assert movie.viewCount == 0
+    assert movie.studio == "Studio"
+    assert [genre.tag for genre in movie.genres] == ["Drama"]
+    assert plex.fetchItem("/hubs/home/recentlyAdded") is movie
+    assert movie.userRating is None and movie.viewCount == 1
+    assert requests_mock.call_count == 6
+    assert plex.fetchItem(1) is movie
+    assert movie.title == "Movie (Full)"
+    assert len(plex._identityMap) == 1
+    del movie, hub
+    assert len(plex._identityMap) == 0
+
+
+def test_identity_map_details_fetch(requests_mock):
+    from plexapi.cache import IdentityMap
+    from plexapi.server import PlexServer
+
+    baseurl = "http://plexserver:32400"
+    requests_mock.get(f"{baseurl}/", text='<MediaContainer machineIdentifier="abc123" version="1.40.0"/>')
+    requests_mock.get(
+        f"{baseurl}/library/sections/1/all",
+        text='<MediaContainer size="1"><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+             'title="Movie" year="2020"/></MediaContainer>',
+    )
+    requests_mock.get(
+        f"{baseurl}/library/metadata/1",
+        text='<MediaContainer size="1"><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+             'title="Movie" studio="Studio" year="2020"><Genre tag="Drama"/></Video></MediaContainer>',
+    )
+    requests_mock.get(
+        f"{baseurl}/playlists/2/items",
+        text='<MediaContainer size="1"><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+             'title="Movie" year="2020" playlistItemID="10"/></MediaContainer>',
+    )
+    plex = PlexServer(baseurl, token="token", identityMap=IdentityMap())
+    movie = plex.fetchItem("/library/sections/1/all")
+    # Fetching the details refreshes the listing object into a full object without reloading it again
+    assert plex.fetchItem(movie._details_key) is movie
+    assert movie._initpath == movie._details_key
+    assert movie.isFullObject()
+    assert movie.studio == "Studio"
+    assert [genre.tag for genre in movie.genres] == ["Drama"]
+    assert requests_mock.call_count == 3
+    # The items of a playlist are never shared
+    item = plex.fetchItem("/playlists/2/items")
+    assert item is not movie
+    assert item.playlistItemID == 10
+    assert "playlistItemID" not in movie._data.attrib
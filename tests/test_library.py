@@ -625,6 +625,14 @@ def test_library_MovieSection_advancedSearch(movies, movie):
     assert len(results) == 1
 
 
+def test_library_MovieSection_iterSearch(movies):
+    results = movies.iterSearch(sort="titleSort", container_size=1)
+    assert not isinstance(results, list)
+    assert [m.ratingKey for m in results] == [m.ratingKey for m in movies.search(sort="titleSort")]
+    results = list(movies.iterSearch(sort="titleSort", maxresults=2, container_size=1))
+    assert [m.ratingKey for m in results] == [m.ratingKey for m in movies.search(sort="titleSort", maxresults=2)]
+
+
 def test_library_ShowSection_search(tvshows, show):
     show.addLabel("test_search")
     show.addCollection("test_search")
@@ -980,3 +988,152 @@ def test_library_section_cache_invalidation(movies):
     after_id = id(after_locations)
     assert before_id != after_id, "Locations should have a new object ID after a reload"
     assert str(before_locations) == str(after_locations), "Locations should not have changed content after a library reload"
+
+
+def test_library_section_changesSince(requests_mock):
+    import re
+    from urllib.parse import parse_qs, urlsplit
+
+    from plexapi.server import PlexServer
+
+    baseurl = "http://plexserver:32400"
+    movies = {1: (1600000000, 1600000000), 2: (1600000000, 1600000001), 3: (1600000000, 1600000002)}
+
+    def listing(request, context):
+        params = {k: v[-1] for k, v in parse_qs(urlsplit(request.url).query).items()}
+        found = sorted(movies.items())
+        for field, index in (("addedAt>>", 0), ("updatedAt>>", 1)):
+            if field in params:
+                found = [(k, v) for k, v in found if v[index] > int(params[field])]
+        if "lastViewedAt>>" in params:
+            found = []
+        if request.headers.get("X-Plex-Container-Size") == "0":
+            return f'<MediaContainer size="0" totalSize="{len(found)}"/>'
+        return f'<MediaContainer size="{len(found)}" totalSize="{len(found)}">' + "".join(
+            f'<Video ratingKey="{k}" key="/library/metadata/{k}" type="movie" title="Movie {k}" '
+            f'addedAt="{added}" updatedAt="{updated}"/>' for k, (added, updated) in found
+        ) + "</MediaContainer>"
+
+    requests_mock.get(f"{baseurl}/", text='<MediaContainer machineIdentifier="abc123" version="1.40.0"/>')
+    requests_mock.get(f"{baseurl}/library", text='<MediaContainer title1="Plex Library"/>')
+    requests_mock.get(
+        f"{baseurl}/library/sections",
+        text='<MediaContainer><Directory key="1" type="movie" title="Movies" uuid="abc"/></MediaContainer>',
+    )
+    requests_mock.get(re.compile(re.escape(f"{baseurl}/library/sections/1/all")), text=listing)
+    section = PlexServer(baseurl, token="token").library.sectionByID(1)
+
+    changes = section.changesSince()
+    assert [movie.ratingKey for movie in changes.added] == [1, 2, 3]
+    assert changes.updated == changes.removed == []
+
+    movies[2] = (1600000000, 1600000100)
+    movies[4] = (1600000200, 1600000200)
+    del movies[3]
+    changes = section.changesSince(changes.checkpoint)
+    assert [movie.ratingKey for movie in changes.added] == [4]
+    assert [movie.ratingKey for movie in changes.updated] == [2]
+    assert changes.removed == [3]
+
+    requests_mock.reset_mock()
+    changes = section.changesSince(changes.checkpoint)
+    assert [movie.ratingKey for movie in changes.added] == [4]
+    assert changes.updated == changes.removed == []
+    assert requests_mock.call_count == 4  # addedAt, updatedAt and lastViewedAt changes, and the number of items
+
+    since = section.changesSince(datetime.fromtimestamp(1600000050))
+    assert [movie.ratingKey for movie in since.added + since.updated] == [4, 2]
+    assert since.removed == []
+    with pytest.raises(BadRequest):
+        section.changesSince(changes.checkpoint, libtype="show")
+    with pytest.raises(BadRequest):
+        section.changesSince("invalid")
+
+
+def test_library_searchSections(monkeypatch):
+    from plexapi.library import LibrarySection
+    from plexapi.server import PlexServer
+
+    from .synthetic import SyntheticPlexServer
+
+    # The synthetic server has no filter metadata to validate the sort and always sorts by ratingKey (addedAt)
+    monkeypatch.setattr(LibrarySection, "_validateSortFields", lambda self, sort, libtype=None: sort)
+    with SyntheticPlexServer(movies=30, shows=4, episodes=5, artists=4, tracks=3) as synthetic:
+        plex = PlexServer(synthetic.baseurl, token="token")
+        items = plex.library.all()
+        assert [item.ratingKey for item in plex.library.all(workers=3)] == [item.ratingKey for item in items]
+
+        episodes = plex.library.searchSections(libtype="episode", workers=3)
+        assert len(episodes) == 20 and {episode.type for episode in episodes} == {"episode"}
+
+        latest = plex.library.searchSections(sort="addedAt", maxresults=35, workers=3)
+        assert [item.ratingKey for item in latest] == sorted(item.ratingKey for item in items)[:35]
+
+        # The synthetic server returns the items by descending ratingKey with a descending sort
+        newest = sorted((item.ratingKey for item in items), reverse=True)[:5]
+        for workers in (1, 3):
+            latest = plex.library.searchSections(sort="addedAt:desc", maxresults=5, workers=workers)
+            assert [item.ratingKey for item in latest] == newest
+
+        requests = synthetic.requests
+        assert len(plex.library.searchSections(maxresults=10, workers=1)) == 10
+        assert synthetic.requests - requests == 1
+
+
+def test_library_section_guidIndex(requests_mock, tmp_path):
+    import re
+    from urllib.parse import parse_qs, urlsplit
+
+    from plexapi.server import PlexServer
+
+    baseurl = "http://plexserver:32400"
+    movies = {1: 1600000001, 2: 1600000002, 3: 1600000003}
+
+    def movie(k):
+        return (f'<Video ratingKey="{k}" key="/library/metadata/{k}" type="movie" title="Movie {k}" '
+                f'guid="plex://movie/{k}" addedAt="{movies[k]}" updatedAt="{movies[k]}">'
+                f'<Guid id="imdb://tt{k}"/><Guid id="tmdb://{k}"/></Video>')
+
+    def listing(request, context):
+        params = {k: v[-1] for k, v in parse_qs(urlsplit(request.url).query).items()}
+        since = params.get("addedAt>>") or params.get("updatedAt>>")
+        found = [k for k in sorted(movies) if "lastViewedAt>>" not in params and (since is None or movies[k] > int(since))]
+        if request.headers.get("X-Plex-Container-Size") == "0":
+            return f'<MediaContainer size="0" totalSize="{len(found)}"/>'
+        return f'<MediaContainer size="{len(found)}" totalSize="{len(found)}">{"".join(map(movie, found))}</MediaContainer>'
+
+    def metadata(request, context):
+        keys = [int(k) for k in urlsplit(request.url).path.rsplit("/", 1)[-1].split(",") if int(k) in movies]
+        return f'<MediaContainer size="{len(keys)}">{"".join(map(movie, keys))}</MediaContainer>'
+
+    requests_mock.get(f"{baseurl}/", text='<MediaContainer machineIdentifier="abc123" version="1.40.0"/>')
+    requests_mock.get(f"{baseurl}/library", text='<MediaContainer title1="Plex Library"/>')
+    requests_mock.get(
+        f"{baseurl}/library/sections",
+        text='<MediaContainer><Directory key="1" type="movie" title="Movies" uuid="abc"/></MediaContainer>',
+    )
+    requests_mock.get(re.compile(re.escape(f"{baseurl}/library/sections/1/all")), text=listing)
+    requests_mock.get(re.compile(re.escape(f"{baseurl}/library/metadata/")), text=metadata)
+    section = PlexServer(baseurl, token="token").library.sectionByID(1)
+    path = str(tmp_path / "guids.json")
+
+    requests_mock.reset_mock()
+    results = section.getGuids(["imdb://tt1", "tmdb://2", "plex://movie/3", "imdb://tt9"])
+    assert {guid: item.ratingKey for guid, item in results.items()} == {"imdb://tt1": 1, "tmdb://2": 2, "plex://movie/3": 3}
+    assert requests_mock.call_count == 2  # The listing of all the items and the items
+    assert section.getGuid("imdb://tt2").ratingKey == 2
+    assert requests_mock.call_count == 3
+
+    index = section.guidIndex(path)
+    assert len(index) == 3 and "tmdb://3" in index
+    movies[4] = 1600000004
+    del movies[1]
+    # A new section object loads the saved index and only requests the changes
+    section = PlexServer(baseurl, token="token").library.sectionByID(1)
+    requests_mock.reset_mock()
+    assert section.guidIndex(path).get("imdb://tt1") is None
+    assert section.getGuid("imdb://tt4").ratingKey == 4
+    # The changes, the number of items, the ratingKeys of the items after the removal and the item
+    assert requests_mock.call_count == 6
+    with pytest.raises(NotFound):
+        section.getGuid("imdb://tt1")
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+import pytest
+from plexapi import metrics
+from plexapi.exceptions import NotFound
+from plexapi.server import PlexServer
+
+BASEURL = "http://plexserver:32400"
+SERVER_XML = '<MediaContainer friendlyName="Test Server" machineIdentifier="abc123" version="1.40.0"/>'
+MOVIES_XML = (
+    '<MediaContainer size="2" totalSize="2" librarySectionID="1">'
+    '<Video ratingKey="1" type="movie" title="Movie 1"/>'
+    '<Video ratingKey="2" type="movie" title="Movie 2"/>'
+    '</MediaContainer>'
+)
+
+
+@pytest.fixture()
+def collector():
+    collector = metrics.MetricsCollector().install()
+    yield collector
+    collector.uninstall()
+
+
+def test_metrics_endpointTemplate():
+    assert metrics.endpointTemplate("/library/metadata/123/children?X=1") == "/library/metadata/{id}/children"
+    assert metrics.endpointTemplate("https://plex.tv/api/v2/user") == "plex.tv/api/v2/user"
+
+
+def test_metrics_collector(collector, requests_mock):
+    events = []
+    metrics.addListener(events.append)
+    try:
+        requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+        requests_mock.get(f"{BASEURL}/library/sections/1/all", text=MOVIES_XML)
+        requests_mock.get(f"{BASEURL}/library/sections/2/all", status_code=404)
+        plex = PlexServer(BASEURL, token="faketoken")
+        movies = plex.fetchItems("/library/sections/1/all")
+        with pytest.raises(NotFound):
+            plex.query("/library/sections/2/all")
+    finally:
+        metrics.removeListener(events.append)
+
+    assert [event.type for event in events] == ["query", "query", "fetch", "query"]
+    query, fetch, error = events[1:]
+    assert query.status == 200 and query.bytes == len(MOVIES_XML)
+    assert query.latency is not None and query.parseTime > 0
+    assert fetch.items == len(movies) == 2 and fetch.pages == 1
+    assert error.status == 404 and error.error == "NotFound"
+
+    stats = collector.snapshot()
+    endpoint = "/library/sections/{id}/all"
+    assert stats[("server", "GET", endpoint)]["count"] == 2
+    assert stats[("server", "GET", endpoint)]["errors"] == 1
+    assert stats[("server", "GET", endpoint)]["status"] == {200: 1, 404: 1}
+    assert stats[("server", "GET", endpoint)]["latency"]["count"] == 2
+    assert stats[("fetch", "GET", endpoint)]["items"] == 2
+    output = collector.toPrometheus()
+    assert f'plexapi_calls_total{{source="server",method="GET",endpoint="{endpoint}"}} 2' in output
+    # The samples of each metric family are grouped after its TYPE line
+    families = []
+    for line in output.splitlines():
+        if line.startswith("# TYPE "):
+            families.append(line.split()[2])
+        elif not line.startswith("#"):
+            name = line.split("{")[0]
+            assert name == families[-1] or name.rsplit("_", 1)[0] == families[-1]
+    assert len(families) == len(set(families))
+    assert "# TYPE plexapi_latency_seconds histogram" in output
+    assert "# TYPE plexapi_calls_total counter" in output
+
+
+def test_metrics_fetch_generators(requests_mock):
+    events = []
+    metrics.addListener(events.append)
+    try:
+        requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+        requests_mock.get(f"{BASEURL}/library/sections/1/all", text=MOVIES_XML)
+        plex = PlexServer(BASEURL, token="faketoken")
+        for movie in plex.iterItems("/library/sections/1/all"):
+            # Items fetched by the caller while iterating are not added to the event of the generator
+            plex.fetchItems("/library/sections/1/all")
+        streamed = list(plex.streamItems("/library/sections/1/all"))
+        first = next(plex.streamItems("/library/sections/1/all", maxresults=1))
+    finally:
+        metrics.removeListener(events.append)
+
+    fetches = [event for event in events if event.type == "fetch"]
+    assert [(event.items, event.pages) for event in fetches] == [(2, 1), (2, 1), (2, 1), (2, 1), (1, 1)]
+    assert all(event.endpoint == "/library/sections/{id}/all" and event.duration is not None for event in fetches)
+    assert len(streamed) == 2 and first.ratingKey == 1
+    assert not metrics._activeFetches()
+
+
+def test_metrics_histogram():
+    histogram = metrics.Histogram(buckets=(1, 2, 5))
+    for value in (0.5, 1, 1.5, 3, 10):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1, 1]
+    assert histogram.quantile(0.5) == 2
+    assert histogram.mean == 3.2
+
+
+def test_metrics_requestBudget(requests_mock):
+    import plexapi
+    from plexapi.exceptions import RequestBudgetExceeded
+
+    requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+    requests_mock.get(f"{BASEURL}/library/sections/1/all", text=MOVIES_XML)
+    plex = PlexServer(BASEURL, token="faketoken")
+    with plexapi.requestBudget(2) as budget:
+        plex.query("/library/sections/1/all")
+        plex.query("/library/sections/1/all")
+        with pytest.raises(RequestBudgetExceeded):
+            plex.query("/library/sections/1/all")
+    assert budget.requests == 2
+    assert requests_mock.call_count == 3
+    assert budget.endpoints == {"GET /library/sections/{id}/all": 2}
+    assert list(budget.callSites)[0].startswith(__file__)
+    assert "Top call sites:" in budget.report()
+
+    with plexapi.requestBudget(1, action="warn") as budget:
+        plex.query("/library/sections/1/all")
+        plex.query("/library/sections/1/all")
+    assert budget.requests == 2
+    plex.query("/library/sections/1/all")
+    assert budget.requests == 2
+
+
+def test_metrics_requestBudget_cache(requests_mock):
+    import plexapi
+    from plexapi.cache import ResponseCache
+    from plexapi.exceptions import RequestBudgetExceeded
+
+    requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+    requests_mock.get(f"{BASEURL}/library/sections/1/all", text=MOVIES_XML)
+    plex = PlexServer(BASEURL, token="faketoken", cache=ResponseCache(ttl=60))
+    with plexapi.requestBudget(1) as budget:
+        plex.query("/library/sections/1/all")
+        # The cached response is served without counting a request
+        plex.query("/library/sections/1/all")
+        with pytest.raises(RequestBudgetExceeded):
+            plex.query("/library/sections/1/all?type=1")
+    assert budget.requests == 1
+    assert requests_mock.call_count == 2
+
+
+def test_metrics_autoReloads(requests_mock):
+    from plexapi.exceptions import RequestBudgetExceeded
+
+    requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+    requests_mock.get(
+        f"{BASEURL}/library/sections/1/all",
+        text='<MediaContainer size="3">' + "".join(
+            f'<Video ratingKey="{i}" key="/library/metadata/{i}" type="movie" title="Movie {i}"/>' for i in (1, 2, 3)
+        ) + '</MediaContainer>',
+    )
+    requests_mock.get(
+        f"{BASEURL}/library/metadata/1",
+        text='<MediaContainer><Video ratingKey="1" key="/library/metadata/1" type="movie" studio="Studio"/>'
+             '</MediaContainer>',
+    )
+    plex = PlexServer(BASEURL, token="faketoken")
+    movies = plex.fetchItems("/library/sections/1/all")
+    metrics.resetAutoReloads()
+    metrics.setAutoReloadBudget(1, action="raise")
+    try:
+        studios = []
+        with pytest.raises(RequestBudgetExceeded):
+            for movie in movies:
+                studios.append(movie.studio)
+    finally:
+        metrics.setAutoReloadBudget(0)
+    assert studios == ["Studio"]
+    (site, count), = metrics.autoReloads().items()
+    assert site.startswith(__file__) and count == 2
@@ -0,0 +1,120 @@
+import re
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from plexapi.exceptions import BadRequest
+from plexapi.mirror import LibraryMirror
+from plexapi.server import PlexServer
+
+BASEURL = "http://plexserver:32400"
+
+
+def mock_server(requests_mock, movies):
+    """ Mocks a server with a single movie section listing the movies ``{ratingKey: updatedAt}``.
+        The updatedAt>>, addedAt>> and lastViewedAt>> filters are applied to the listing.
+        The details of the movies include their streams.
+    """
+    def listing(request, context):
+        params = {k: v[-1] for k, v in parse_qs(urlsplit(request.url).query).items()}
+        since = params.get("updatedAt>>")
+        found = [(k, v) for k, v in sorted(movies.items()) if since is None or v > int(since)]
+        if any(f"{field}>>" in params for field in ("addedAt", "lastViewedAt")):
+            found = []
+        if request.headers.get("X-Plex-Container-Size") == "0":
+            return f'<MediaContainer size="0" totalSize="{len(found)}"/>'
+        return f'<MediaContainer size="{len(found)}" totalSize="{len(found)}">' + "".join(
+            f'<Video ratingKey="{k}" key="/library/metadata/{k}" type="movie" title="Movie {k}" year="{2000 + k}" '
+            f'addedAt="1600000000" updatedAt="{v}"><Media id="{k}" videoResolution="1080"><Part id="{k}" '
+            f'file="/movies/{k}.mkv"/></Media><Genre tag="{"Drama" if k % 2 else "Comedy"}"/>'
+            f'<Guid id="imdb://tt{k:07d}"/></Video>' for k, v in found
+        ) + "</MediaContainer>"
+
+    def details(request, context):
+        ratingKeys = [int(k) for k in urlsplit(request.url).path.rsplit("/", 1)[-1].split(",")]
+        return f'<MediaContainer size="{len(ratingKeys)}">' + "".join(
+            f'<Video ratingKey="{k}" key="/library/metadata/{k}" type="movie" title="Movie {k}"><Media id="{k}" '
+            f'videoResolution="1080"><Part id="{k}" file="/movies/{k}.mkv"><Stream id="{k}0" streamType="1" '
+            f'codec="h264"/><Stream id="{k}1" streamType="2" codec="aac" languageCode="eng"/></Part></Media></Video>'
+            for k in ratingKeys
+        ) + "</MediaContainer>"
+
+    requests_mock.get(f"{BASEURL}/", text='<MediaContainer machineIdentifier="abc123" version="1.40.0"/>')
+    requests_mock.get(f"{BASEURL}/library", text='<MediaContainer title1="Plex Library"/>')
+    requests_mock.get(
+        f"{BASEURL}/library/sections",
+        text='<MediaContainer><Directory key="1" type="movie" title="Movies" '
+             'uuid="00000000-0000-0000-0000-000000000001"/></MediaContainer>',
+    )
+    requests_mock.get(re.compile(re.escape(f"{BASEURL}/library/sections/1/all")), text=listing)
+    requests_mock.get(re.compile(re.escape(f"{BASEURL}/library/metadata/")), text=details)
+
+
+def test_mirror_refresh(requests_mock, tmp_path):
+    movies = {1: 1600000000, 2: 1600000001, 3: 1600000002}
+    mock_server(requests_mock, movies)
+    plex = PlexServer(BASEURL, token="token")
+    path = str(tmp_path / "library.db")
+
+    with LibraryMirror(plex, path) as mirror:
+        assert mirror.refresh() == (3, 0)
+        assert mirror.count() == mirror.count("Movies") == mirror.count(libtype="movie") == 3
+        assert mirror.execute("SELECT count(*) FROM media")[0][0] == 3
+        assert mirror.execute("SELECT count(*) FROM streams")[0][0] == 6
+        assert mirror.execute("SELECT codec FROM streams WHERE ratingKey = 2 AND streamType = 2")[0]["codec"] == "aac"
+        assert mirror.execute("SELECT guid FROM guids WHERE ratingKey = 2")[0]["guid"] == "imdb://tt0000002"
+
+    # Only the updated item is downloaded again and the deleted item is removed
+    movies[2] = 1600000100
+    del movies[3]
+    with LibraryMirror(plex, path) as mirror:
+        requests_mock.reset_mock()
+        assert mirror.refresh() == (1, 1)
+        listed = [parse_qs(urlsplit(request.url).query) for request in requests_mock.request_history]
+        assert {"updatedAt>>": ["1600000001"]} in [{k: v for k, v in q.items() if k == "updatedAt>>"} for q in listed]
+        # Only the details of the updated item are requested
+        assert [r.path for r in requests_mock.request_history if r.path.startswith("/library/metadata/")] == [
+            "/library/metadata/2"
+        ]
+        assert [row["ratingKey"] for row in mirror.rows(orderBy="ratingKey")] == [1, 2]
+        assert mirror.execute("SELECT count(*) FROM parts")[0][0] == 2
+        assert mirror.execute("SELECT count(*) FROM streams")[0][0] == 4
+        assert mirror.refresh() == (1, 0)
+
+
+def test_mirror_queries(requests_mock):
+    mock_server(requests_mock, {k: 1600000000 for k in range(1, 7)})
+    plex = PlexServer(BASEURL, token="token")
+    mirror = LibraryMirror(plex)
+    mirror.refresh()
+    requests_mock.reset_mock()
+
+    assert [row["ratingKey"] for row in mirror.rows(genre="drama", orderBy="year DESC")] == [5, 3, 1]
+    assert mirror.count(year=[2002, 2003]) == 2
+    assert mirror.count(where="year > ?", params=(2004,)) == 2
+    movies = mirror.items("Movies", genre="Comedy", limit=2, orderBy="ratingKey")
+    assert [movie.title for movie in movies] == ["Movie 2", "Movie 4"]
+    assert movies[0].librarySectionID == 1
+    assert movies[0].media[0].parts[0].file == "/movies/2.mkv"
+    assert [genre.tag for genre in movies[0].genres] == ["Comedy"]
+    assert requests_mock.call_count == 0
+
+
+def test_mirror_without_streams(requests_mock):
+    mock_server(requests_mock, {k: 1600000000 for k in range(1, 4)})
+    plex = PlexServer(BASEURL, token="token")
+    mirror = LibraryMirror(plex, includeStreams=False)
+    mirror.refresh()
+    assert mirror.execute("SELECT count(*) FROM streams")[0][0] == 0
+
+
+def test_mirror_order_by(requests_mock):
+    mock_server(requests_mock, {k: 1600000000 for k in range(1, 4)})
+    plex = PlexServer(BASEURL, token="token")
+    mirror = LibraryMirror(plex, includeStreams=False)
+    mirror.refresh()
+    assert [row["ratingKey"] for row in mirror.rows(orderBy="year desc")] == [3, 2, 1]
+    assert [row["ratingKey"] for row in mirror.rows(orderBy='type, "index", ratingKey DESC')] == [3, 2, 1]
+    for orderBy in ("unknown", "year DESC; DROP TABLE items", "year UP", "(SELECT 1)", ""):
+        with pytest.raises(BadRequest, match="Invalid orderBy"):
+            mirror.rows(orderBy=orderBy)
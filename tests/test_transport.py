@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from plexapi.server import PlexServer
+from plexapi.transport import TransportConfig, _parseTimeouts
+
+from .synthetic import SyntheticPlexServer
+
+BASEURL = "http://plexserver:32400"
+SERVER_XML = '<MediaContainer friendlyName="Test Server" machineIdentifier="abc123" version="1.40.0"/>'
+
+
+def test_transport_session():
+    transport = TransportConfig(pool_connections=2, pool_maxsize=32, max_retries=3, keep_alive=False)
+    session = transport.session()
+    adapter = session.get_adapter(BASEURL)
+    assert adapter is transport.adapter()
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 3
+    assert "GET" in adapter.max_retries.allowed_methods
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert session.headers["Connection"] == "close"
+
+
+def test_transport_read_timeout():
+    import socket
+
+    # A server accepting the connections without ever answering
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        url = f"http://127.0.0.1:{listener.getsockname()[1]}/"
+        session = TransportConfig(max_retries=0).session()
+        assert session.get_adapter(url).max_retries.read is False
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            session.get(url, timeout=0.2)
+
+
+def test_transport_mount_session():
+    session = requests.Session()
+    transport = TransportConfig(pool_maxsize=16)
+    transport.mount(session)
+    assert session.get_adapter("https://plex.tv") is transport.adapter()
+
+
+def test_transport_endpoint_timeouts(requests_mock):
+    requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+    requests_mock.get(f"{BASEURL}/library/sections/1/all", text=SERVER_XML)
+    transport = TransportConfig(timeouts={r"/library/sections/\d+/all": 120})
+    plex = PlexServer(BASEURL, token="faketoken", timeout=10, transport=transport)
+    plex.query("/library/sections/1/all")
+    assert requests_mock.last_request.timeout == 120
+    plex.query("/")
+    assert requests_mock.last_request.timeout == 10
+    plex.query("/library/sections/1/all", timeout=5)
+    assert requests_mock.last_request.timeout == 5
+
+
+def test_transport_parse_timeouts():
+    assert _parseTimeouts("") == {}
+    assert _parseTimeouts(r"/library/sections/\d+/all=120; /butler=5") == {
+        r"/library/sections/\d+/all": 120,
+        "/butler": 5,
+    }
+
+
+def test_transport_coalesce_requests(requests_mock):
+    calls = []
+    started = threading.Event()
+
+    def sections(request, context):
+        calls.append(request)
+        started.set()
+        time.sleep(0.2)
+        return SERVER_XML
+
+    requests_mock.get(f"{BASEURL}/", text=SERVER_XML)
+    requests_mock.get(f"{BASEURL}/library/sections", text=sections)
+    plex = PlexServer(BASEURL, token="faketoken", transport=TransportConfig(coalesce=True))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(plex.query, "/library/sections")
+        started.wait()
+        results = [executor.submit(plex.query, "/library/sections") for _ in range(3)]
+        data = [leader.result()] + [future.result() for future in results]
+    assert len(calls) == 1
+    assert all(d is data[0] for d in data)
+    plex.query("/library/sections")
+    assert len(calls) == 2
+
+
+def test_transport_coalesce_disabled():
+    assert TransportConfig().singleflight is None
+    assert TransportConfig(coalesce=False).singleflight is None
+
+
+def test_transport_record_replay(tmp_path):
+    with SyntheticPlexServer(movies=120, shows=3, episodes=5) as synthetic:
+        plex = PlexServer(synthetic.baseurl, token="token1", transport=TransportConfig(record=str(tmp_path)))
+        movies = plex.library.section("Movies").all(container_size=50)
+        episodes = plex.library.section("TV Shows").get("Show 2").episodes()
+        requests_sent = synthetic.requests
+    assert len(movies) == 120
+    assert len(episodes) == 5
+    assert len(list(tmp_path.glob("*.json"))) <= requests_sent
+
+    # Replay with another token once the server is stopped
+    plex = PlexServer(synthetic.baseurl, token="token2", transport=TransportConfig(replay=str(tmp_path)))
+    assert plex.friendlyName == "Synthetic Plex Server"
+    replayed = plex.library.section("Movies").all(container_size=50)
+    assert [(m.ratingKey, m.title, m.media[0].parts[0].file) for m in replayed] == \
+        [(m.ratingKey, m.title, m.media[0].parts[0].file) for m in movies]
+    assert plex.library.section("TV Shows").get("Show 2").episodes() == episodes
+    with pytest.raises(requests.exceptions.ConnectionError):
+        plex.library.section("Music").all()
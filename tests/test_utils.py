@@ -1,10 +1,12 @@
 import time
+import tracemalloc
 
 import pytest
 
 import plexapi
 import plexapi.utils as utils
 from plexapi.exceptions import NotFound
+from plexapi.video import Movie
 
 
 def test_utils_toDatetime():
@@ -146,3 +148,84 @@ def test_millisecondToHumanstr():
 
 def test_toJson(movie):
     assert utils.toJson(movie)
+
+
+@pytest.fixture(params=utils.XML_PARSERS)
+def xml_parser(request):
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    original = utils.XML_PARSER
+    yield utils.setXMLParser(request.param)
+    utils.setXMLParser(original)
+
+
+def test_utils_parseXMLString(xml_parser):
+    assert utils.parseXMLString("") is None
+    assert utils.parseXMLString(b" \n") is None
+    assert utils.parseXMLString('<Video title="Amélie"/>').attrib["title"] == "Amélie"
+    assert utils.parseXMLString('<Video title="Amélie"/>'.encode("utf-8")).attrib["title"] == "Amélie"
+    # Illegal XML characters are only cleaned when the first parse fails
+    assert utils.parseXMLString(b'<Video title="A\x01B"/>').attrib["title"] == "AB"
+
+
+def test_utils_parseXMLString_bytes_allocations():
+    videos = "".join(
+        f'<Video ratingKey="{i}" title="Movie {i}" summary="{"x" * 200}"/>' for i in range(2000)
+    )
+    content = f'<MediaContainer size="2000">{videos}</MediaContainer>'.encode("utf-8")
+
+    def peak(func):
+        tracemalloc.start()
+        try:
+            func()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # Previous path: decode the response to text, then encode it again before parsing
+    text_peak = peak(lambda: utils.parseXMLString(content.decode("utf-8")))
+    bytes_peak = peak(lambda: utils.parseXMLString(content))
+    assert bytes_peak < text_peak - len(content)
+
+
+def test_utils_iterXMLElements(xml_parser):
+    content = (
+        b'<MediaContainer size="2"><Video ratingKey="1"><Media id="2"/></Video>'
+        b'<Directory ratingKey="3"/></MediaContainer>'
+    )
+    chunks = [content[i:i + 7] for i in range(0, len(content), 7)]
+    root, video, directory = utils.iterXMLElements(chunks)
+    assert root.tag == "MediaContainer" and root.attrib["size"] == "2"
+    assert len(root) == 0
+    assert video.attrib["ratingKey"] == "1" and video[0].attrib["id"] == "2"
+    assert directory.tag == "Directory"
+    assert list(utils.iterXMLElements([])) == []
+    with pytest.raises(utils.XMLParseError):
+        list(utils.iterXMLElements([b'<MediaContainer><Video title="A\x01B"/></MediaContainer>']))
+    root, video = utils.iterXMLElements([b'<MediaContainer><Video title="A\x01B"/></MediaContainer>'], clean=True)
+    assert video.attrib["title"] == "AB"
+
+
+def test_utils_setXMLParser(xml_parser):
+    assert utils.XML_PARSER == xml_parser
+    content = (
+        b'<!-- comment --><MediaContainer size="1"><!-- comment -->'
+        b'<Video ratingKey="1" type="movie" title="Am\xc3\xa9lie" addedAt="1600000000">'
+        b'<Media id="2"><Part id="3" file="/movies/amelie.mkv"/></Media><Genre tag="Romance"/>'
+        b'</Video></MediaContainer>'
+    )
+    data = utils.parseXMLString(content)
+    assert len(data) == 1
+    movie = Movie(None, data[0], "/library/sections/1/all")
+    assert movie.title == "Amélie"
+    assert movie.media[0].parts[0].file == "/movies/amelie.mkv"
+    assert [genre.tag for genre in movie.genres] == ["Romance"]
+    assert [elem.tag for elem in utils.iterXMLBFS(data, "Part")] == ["Part"]
+
+
+def test_utils_setXMLParser_invalid():
+    original = utils.XML_PARSER
+    try:
+        assert utils.setXMLParser("invalid") == "etree"
+    finally:
+        utils.setXMLParser(original)
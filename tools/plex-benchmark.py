@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Plex-Benchmark times the hot paths of building Plex objects from server responses
+on synthetic payloads, from parsing the XML to paginating fetchItems against a
+local synthetic server (tests/synthetic.py). No Plex server is required.
+
+The results are saved to a JSON file per plexapi version and compared with the
+previous results to show regressions between releases:
+
+    python tools/plex-benchmark.py --count 1000 10000 100000
+    python tools/plex-benchmark.py --case parseXMLString findItems --compare results.json
+
+The XML parser backends (see the plexapi.xml_parser config) are compared by running
+the parsing cases with each parser, the results of each parser are saved to their own file:
+
+    python tools/plex-benchmark.py --case parseXMLString findItems --parser etree
+    python tools/plex-benchmark.py --case parseXMLString findItems --parser lxml \
+        --compare ~/.cache/plexapi/benchmarks/<version>-py<python>-etree.json
+
+The memory retained per item by the objects of a listing, with and without compact mode,
+is measured with --memory:
+
+    python tools/plex-benchmark.py --memory --count 100000
+"""
+import argparse
+import gc
+import glob
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # for tests.synthetic
+
+from plexapi import utils  # noqa: E402
+from plexapi.audio import Track  # noqa: E402
+from plexapi.base import MediaContainer  # noqa: E402
+from plexapi.columns import ColumnReader  # noqa: E402
+from plexapi.const import __version__  # noqa: E402
+from plexapi.server import PlexServer  # noqa: E402
+from plexapi.video import Episode, Movie  # noqa: E402
+from tests.synthetic import SyntheticPlexServer  # noqa: E402
+
+RESULTS_PATH = os.path.join('~', '.cache', 'plexapi', 'benchmarks')
+PAGE_SIZE = 100
+
+
+def timeit(func, repeat):
+    """ Returns the best time in seconds of calling func repeat times. """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class Payloads:
+    """ Synthetic responses of count movies, episodes and tracks, generated by the synthetic server. """
+
+    def __init__(self, count):
+        self.count = count
+        self.server = SyntheticPlexServer(
+            movies=count, shows=max(count // 10, 1), episodes=10, artists=max(count // 10, 1), tracks=10, history=0,
+        )
+        self.content = {}
+        self.data = {}
+        for libtype, path in (('movie', '/library/sections/1/all'), ('episode', '/library/sections/2/all?type=4'),
+                              ('track', '/library/sections/3/all?type=10')):
+            self.content[libtype] = self.server.respond(path)[1]
+            self.data[libtype] = utils.parseXMLString(self.content[libtype])
+        self.builder = MediaContainer(None, utils.parseXMLString(b'<MediaContainer/>'))
+
+    def close(self):
+        self.server.stop()
+
+
+def benchParseXMLString(payloads):
+    content = payloads.content['movie']
+    return lambda: utils.parseXMLString(content)
+
+
+def benchFindItems(payloads):
+    data, builder = payloads.data['movie'], payloads.builder
+    return lambda: builder.findItems(data, initpath='/library/sections/1/all')
+
+
+def benchFindItemsFiltered(payloads):
+    data, builder = payloads.data['movie'], payloads.builder
+    return lambda: builder.findItems(data, initpath='/library/sections/1/all', Genre__tag='Drama', year__gte=2000)
+
+
+def benchBuildItem(payloads):
+    data, builder = payloads.data['movie'], payloads.builder
+    return lambda: [builder._buildItem(elem, initpath='/library/sections/1/all') for elem in data]
+
+
+def benchCheckAttrs(payloads):
+    data, builder = payloads.data['movie'], payloads.builder
+    return lambda: [builder._checkAttrs(elem, type='movie', contentRating__in=('PG', 'PG-13'), Media__videoCodec='h264')
+                    for elem in data]
+
+
+def _benchLoadData(cls, libtype):
+    def bench(payloads):
+        data = payloads.data[libtype]
+        return lambda: [cls(None, elem, '/library/sections/all') for elem in data]
+    return bench
+
+
+def benchExtend(payloads):
+    data, builder = payloads.data['movie'], payloads.builder
+    items = builder.findItems(data, initpath='/library/sections/1/all')
+    pages = []
+    for start in range(0, len(items), PAGE_SIZE):
+        page = MediaContainer(None, data, items[start:start + PAGE_SIZE])
+        page.size, page.offset = len(page), start
+        pages.append(page)
+
+    def extend():
+        results = MediaContainer(None, data)
+        for page in pages:
+            results.extend(page)
+        return results
+    return extend
+
+
+def benchToColumns(payloads):
+    data = payloads.data['movie']
+    fields = ['ratingKey', 'title', 'year', 'duration', 'addedAt', 'viewCount', 'Media__videoResolution', 'Media__Part__size']
+    return lambda: ColumnReader(fields).read(data).columns('numpy')
+
+
+def benchColumnsFilter(payloads):
+    fields = ['ratingKey', 'title', 'year', 'contentRating', 'Media__videoResolution', 'Media__videoCodec']
+    columns = ColumnReader(fields).read(payloads.data['movie']).columns('numpy')
+    return lambda: columns.filter(contentRating__in=('PG', 'PG-13'), Media__videoCodec='h264', year__gte=2000)
+
+
+def benchFetchItems(payloads):
+    baseurl = payloads.server.start()
+    plex = PlexServer(baseurl, token='benchmark')
+    return lambda: plex.fetchItems('/library/sections/1/all', container_size=PAGE_SIZE)
+
+
+CASES = {
+    'parseXMLString': benchParseXMLString,
+    'findItems': benchFindItems,
+    'findItems.filtered': benchFindItemsFiltered,
+    '_buildItem': benchBuildItem,
+    '_checkAttrs': benchCheckAttrs,
+    'Movie._loadData': _benchLoadData(Movie, 'movie'),
+    'Episode._loadData': _benchLoadData(Episode, 'episode'),
+    'Track._loadData': _benchLoadData(Track, 'track'),
+    'MediaContainer.extend': benchExtend,
+    'toColumns': benchToColumns,
+    'Columns.filter': benchColumnsFilter,
+    'fetchItems': benchFetchItems,
+}
+
+
+def run(cases, counts, repeat):
+    """ Returns the best time of each case for each count as a dictionary ``{case: {count: seconds}}``. """
+    results = {case: {} for case in cases}
+    print(f'{"case":<24} {"items":>8} {"ms":>10} {"us/item":>10}')
+    for count in counts:
+        payloads = Payloads(count)
+        try:
+            for case in cases:
+                seconds = timeit(CASES[case](payloads), repeat)
+                results[case][str(count)] = seconds
+                print(f'{case:<24} {count:>8} {seconds * 1000:>10.1f} {seconds / count * 1e6:>10.2f}')
+        finally:
+            payloads.close()
+    return results
+
+
+def retained(content, cls, compact):
+    """ Returns the memory in bytes retained by the objects built from the content and the number of objects. """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        data = utils.parseXMLString(content)
+        items = [cls(None, elem, '/library/sections/all') for elem in data]
+        if compact:
+            items = [item.compact() for item in items]
+        del data
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0], len(items)
+    finally:
+        tracemalloc.stop()
+
+
+def memory(counts):
+    """ Prints the memory retained per object of a listing, with and without compact mode. """
+    print(f'{"class":<24} {"items":>8} {"bytes/item":>12} {"compact":>12} {"change":>8}')
+    for count in counts:
+        payloads = Payloads(count)
+        try:
+            for cls, libtype in ((Movie, 'movie'), (Episode, 'episode'), (Track, 'track')):
+                before, items = retained(payloads.content[libtype], cls, compact=False)
+                after, _ = retained(payloads.content[libtype], cls, compact=True)
+                print(f'{cls.__name__:<24} {count:>8} {before // items:>12} {after // items:>12} '
+                      f'{after / before - 1:>+8.1%}')
+        finally:
+            payloads.close()
+
+
+def resultsFile(path):
+    """ Returns the path of the results file of the current plexapi version, Python version and XML parser. """
+    python = '.'.join(platform.python_version_tuple()[:2])
+    return os.path.join(path, f'{__version__}-py{python}-{utils.XML_PARSER}.json')
+
+
+def previousResults(path, current):
+    """ Returns the path of the most recent results file other than current, or None. """
+    suffix = current.split('-py', 1)[1]
+    paths = [p for p in glob.glob(os.path.join(path, f'*-py{suffix}')) if p != current]
+    return max(paths, key=os.path.getmtime) if paths else None
+
+
+def compare(results, previous, threshold):
+    """ Prints the change of each result from the previous results. Returns the number of
+        results slower than the previous ones by more than threshold (a ratio).
+    """
+    regressions = 0
+    print(f'\nCompared to plexapi {previous["version"]} ({previous["date"]})')
+    print(f'{"case":<24} {"items":>8} {"before ms":>10} {"after ms":>10} {"change":>8}')
+    for case, counts in results.items():
+        for count, seconds in counts.items():
+            before = previous['results'].get(case, {}).get(count)
+            if not before:
+                continue
+            change = seconds / before - 1
+            regression = change > threshold
+            regressions += regression
+            flag = ' REGRESSION' if regression else ''
+            print(f'{case:<24} {count:>8} {before * 1000:>10.1f} {seconds * 1000:>10.1f} {change:>+8.1%}{flag}')
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-c', '--count', type=int, nargs='+', default=[1000, 10000, 100000], help='Number of items')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='Number of runs, the best is reported')
+    parser.add_argument('--case', nargs='+', choices=list(CASES), default=list(CASES), help='Cases to run')
+    parser.add_argument('--parser', choices=utils.XML_PARSERS, default=utils.XML_PARSER, help='XML parser backend')
+    parser.add_argument('--path', default=RESULTS_PATH, help='Directory to save the results to')
+    parser.add_argument('--compare', help='Results file to compare with (default: the previous results in path)')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Slowdown ratio reported as a regression (default 0.1); exits with status 1 if any')
+    parser.add_argument('--no-save', action='store_true', help='Do not save the results')
+    parser.add_argument('--memory', action='store_true', help='Measure the memory per item instead of the time')
+    opts = parser.parse_args()
+
+    utils.setXMLParser(opts.parser)
+    if opts.memory:
+        memory(opts.count)
+        sys.exit(0)
+    path = os.path.expanduser(opts.path)
+    current = resultsFile(path)
+    results = run(opts.case, opts.count, opts.repeat)
+    previous = opts.compare or previousResults(path, current)
+    regressions = 0
+    if previous:
+        with open(previous, encoding='utf-8') as handle:
+            regressions = compare(results, json.load(handle), opts.threshold)
+    if not opts.no_save:
+        os.makedirs(path, exist_ok=True)
+        saved = {}
+        if os.path.exists(current):
+            with open(current, encoding='utf-8') as handle:
+                saved = json.load(handle)['results']
+        for case, counts in results.items():
+            saved.setdefault(case, {}).update(counts)
+        with open(current, 'w', encoding='utf-8') as handle:
+            json.dump({
+                'version': __version__,
+                'python': platform.python_version(),
+                'parser': utils.XML_PARSER,
+                'platform': platform.platform(),
+                'date': datetime.now().isoformat(timespec='seconds'),
+                'results': saved,
+            }, handle, indent=2)
+        print(f'\nResults saved to {current}')
+    sys.exit(1 if regressions else 0)